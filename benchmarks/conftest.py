@@ -0,0 +1,16 @@
+"""
+Shared configuration for the benchmark suite.
+
+Every module benchmarks one type: the Temporal operation and, where one
+exists, the equivalent stdlib ``datetime`` operation share a benchmark group
+(``"<Type>.<operation>"``) so the baseline is reported side by side.
+
+Run with ``make test-benchmark`` (writes ``benchmark-results.json``), or save
+and compare runs between commits with ``make benchmark-save`` and
+``make benchmark-compare``.
+"""
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    collect_ignore_glob = ["test_*.py"]
@@ -0,0 +1,74 @@
+"""
+Benchmarks for InstantArray and PlainDateArray over 100k rows, with per-object loops as the baseline.
+"""
+
+import pytest
+
+from temporal import Duration, Instant, PlainDate, TimeZone
+
+numpy = pytest.importorskip("numpy")
+
+from temporal.arrays import InstantArray, PlainDateArray  # noqa: E402
+
+ROWS = 100_000
+RANDOM = numpy.random.default_rng(0)
+
+INSTANT_ARRAY = InstantArray(RANDOM.integers(0, 2_000_000_000_000_000_000, ROWS))
+INSTANTS = INSTANT_ARRAY.to_instants()
+INSTANT_STRINGS = INSTANT_ARRAY.to_strings()
+DELTA = Duration(hours=12, microseconds=5)
+PIVOT = Instant.from_epoch_nanoseconds(1_000_000_000_000_000_000)
+QUARTER_HOUR = {"smallestUnit": "minutes", "roundingIncrement": 15}
+NEW_YORK = TimeZone("America/New_York")
+
+DATE_ARRAY = PlainDateArray(RANDOM.integers(0, 20_000, ROWS))
+DATES = DATE_ARRAY.to_dates()
+MONTH = Duration(months=1)
+DATE_PIVOT = PlainDate(2000, 1, 1)
+
+# Keys are "<Type>.<operation>", which is also the benchmark group
+TEMPORAL = {
+    "InstantArray.add": lambda: INSTANT_ARRAY.add(DELTA),
+    "InstantArray.round": lambda: INSTANT_ARRAY.round("seconds"),
+    "InstantArray.floor": lambda: INSTANT_ARRAY.floor(QUARTER_HOUR),
+    "InstantArray.floor_zoned_days": lambda: INSTANT_ARRAY.floor("days", NEW_YORK),
+    "InstantArray.compare": lambda: INSTANT_ARRAY < PIVOT,
+    "InstantArray.min": lambda: INSTANT_ARRAY.min(),
+    "InstantArray.argsort": lambda: INSTANT_ARRAY.argsort(),
+    "InstantArray.to_strings": lambda: INSTANT_ARRAY.to_strings(),
+    "InstantArray.from_strings": lambda: InstantArray.from_strings(INSTANT_STRINGS),
+    "PlainDateArray.month": lambda: DATE_ARRAY.month,
+    "PlainDateArray.week_of_year": lambda: DATE_ARRAY.week_of_year,
+    "PlainDateArray.add_months": lambda: DATE_ARRAY.add(MONTH),
+    "PlainDateArray.compare": lambda: DATE_ARRAY < DATE_PIVOT,
+    "PlainDateArray.to_strings": lambda: DATE_ARRAY.to_strings(),
+}
+
+SCALAR = {
+    "InstantArray.add": lambda: [instant.add(DELTA) for instant in INSTANTS],
+    "InstantArray.round": lambda: [instant.round("seconds") for instant in INSTANTS],
+    "InstantArray.floor": lambda: [instant.floor(QUARTER_HOUR) for instant in INSTANTS],
+    "InstantArray.floor_zoned_days": lambda: [instant.to_zoned_date_time(NEW_YORK).floor("days") for instant in INSTANTS],
+    "InstantArray.compare": lambda: [instant < PIVOT for instant in INSTANTS],
+    "InstantArray.min": lambda: min(INSTANTS),
+    "InstantArray.argsort": lambda: sorted(range(ROWS), key=INSTANTS.__getitem__),
+    "InstantArray.to_strings": lambda: [str(instant) for instant in INSTANTS],
+    "InstantArray.from_strings": lambda: [Instant.from_string(text) for text in INSTANT_STRINGS],
+    "PlainDateArray.month": lambda: [date.month for date in DATES],
+    "PlainDateArray.week_of_year": lambda: [date.week_of_year for date in DATES],
+    "PlainDateArray.add_months": lambda: [date.add(MONTH) for date in DATES],
+    "PlainDateArray.compare": lambda: [date < DATE_PIVOT for date in DATES],
+    "PlainDateArray.to_strings": lambda: [str(date) for date in DATES],
+}
+
+
+@pytest.mark.parametrize("operation", TEMPORAL)
+def test_temporal(benchmark, operation):
+    benchmark.group = operation
+    benchmark(TEMPORAL[operation])
+
+
+@pytest.mark.parametrize("operation", SCALAR)
+def test_scalar(benchmark, operation):
+    benchmark.group = operation
+    benchmark(SCALAR[operation])
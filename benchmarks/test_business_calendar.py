@@ -0,0 +1,53 @@
+"""
+Benchmarks for BusinessCalendar, with a day-stepping ``datetime.date`` baseline.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from temporal import BusinessCalendar, PlainDate
+
+# Fixed holidays on every 1 January and 25 December for two centuries
+HOLIDAYS = [PlainDate(year, month, day) for year in range(1900, 2100) for month, day in ((1, 1), (12, 25))]
+CALENDAR = BusinessCalendar(holidays=HOLIDAYS)
+TRADE = PlainDate(2023, 12, 22)
+LATER = PlainDate(2025, 6, 30)
+
+STD_HOLIDAYS = {date(h.year, h.month, h.day) for h in HOLIDAYS}
+STD_TRADE = date(2023, 12, 22)
+ONE_DAY = timedelta(days=1)
+
+
+def std_add_business_days(start: date, days: int) -> date:
+    current = start
+    while days:
+        current += ONE_DAY
+        if current.isoweekday() < 6 and current not in STD_HOLIDAYS:
+            days -= 1
+    return current
+
+
+TEMPORAL = {
+    "add_business_days_2": lambda: CALENDAR.add_business_days(TRADE, 2),
+    "add_business_days_250": lambda: CALENDAR.add_business_days(TRADE, 250),
+    "business_days_between": lambda: CALENDAR.business_days_between(TRADE, LATER),
+    "is_business_day": lambda: CALENDAR.is_business_day(TRADE),
+}
+
+STDLIB = {
+    "add_business_days_2": lambda: std_add_business_days(STD_TRADE, 2),
+    "add_business_days_250": lambda: std_add_business_days(STD_TRADE, 250),
+}
+
+
+@pytest.mark.parametrize("operation", TEMPORAL)
+def test_temporal(benchmark, operation):
+    benchmark.group = f"BusinessCalendar.{operation}"
+    benchmark(TEMPORAL[operation])
+
+
+@pytest.mark.parametrize("operation", STDLIB)
+def test_stdlib(benchmark, operation):
+    benchmark.group = f"BusinessCalendar.{operation}"
+    benchmark(STDLIB[operation])
@@ -0,0 +1,30 @@
+"""
+Benchmarks for CronExpression: single fire times and one tick of a scheduler with many expressions.
+"""
+
+import pytest
+
+from temporal import CronExpression, TimeZone, ZonedDateTime
+
+TZ = TimeZone("America/New_York")
+NOW = ZonedDateTime(2026, 10, 17, 12, 34, 56, timezone=TZ)
+WEEKDAYS = CronExpression("30 9 * * MON-FRI")
+SPARSE = CronExpression("0 0 29 2 MON")
+NTH_WEEKDAY = CronExpression("0 3 * * SUN#2")
+SCHEDULE = [f"{minute % 60} {minute % 24} * * *" if minute % 3 else f"*/{minute % 7 + 1} * * * *" for minute in range(1000)]
+COMPILED = [CronExpression(expression) for expression in SCHEDULE]
+
+TEMPORAL = {
+    "weekdays_next_after": lambda: WEEKDAYS.next_after(NOW),
+    "weekdays_previous_before": lambda: WEEKDAYS.previous_before(NOW),
+    "sparse_next_after": lambda: SPARSE.next_after(NOW),
+    "nth_weekday_next_after": lambda: NTH_WEEKDAY.next_after(NOW),
+    "next_after_many_1k": lambda: CronExpression.next_after_many(COMPILED, NOW, output="array"),
+    "parse": lambda: CronExpression("*/15 9-17 1,15,L * MON-FRI"),
+}
+
+
+@pytest.mark.parametrize("operation", TEMPORAL)
+def test_temporal(benchmark, operation):
+    benchmark.group = f"CronExpression.{operation}"
+    benchmark(TEMPORAL[operation])
@@ -0,0 +1,57 @@
+"""
+Benchmarks for Duration, with ``datetime.timedelta`` baselines.
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from temporal import Duration, PlainDate
+
+DURATION = Duration(days=1, hours=2, minutes=30, seconds=45, microseconds=500)
+OTHER = Duration(hours=5, minutes=15)
+CALENDAR = Duration(years=1, months=2, days=3)
+START = PlainDate(2023, 6, 15)
+ANCHORS = [START.add(Duration(days=offset)) for offset in range(100)]
+
+STD_DURATION = timedelta(days=1, hours=2, minutes=30, seconds=45, microseconds=500)
+STD_OTHER = timedelta(hours=5, minutes=15)
+
+TEMPORAL = {
+    "construct": lambda: Duration(days=1, hours=2, minutes=30, seconds=45, microseconds=500),
+    "from_string": lambda: Duration.from_string("P1DT2H30M45.0005S"),
+    "str": lambda: str(DURATION),
+    "add": lambda: DURATION.add(OTHER),
+    "subtract": lambda: DURATION.subtract(OTHER),
+    "negated": lambda: DURATION.negated(),
+    "compare": lambda: Duration.compare(DURATION, OTHER),
+    "hash": lambda: hash(DURATION),
+    "round": lambda: DURATION.round("hours"),
+    "total_seconds": lambda: DURATION.total("seconds"),
+    "total_relative_months": lambda: CALENDAR.total("months", START),
+    "compare_relative": lambda: Duration.compare(CALENDAR, OTHER, START),
+    "total_many_months_100": lambda: CALENDAR.total_many("months", ANCHORS),
+}
+
+STDLIB = {
+    "construct": lambda: timedelta(days=1, hours=2, minutes=30, seconds=45, microseconds=500),
+    "str": lambda: str(STD_DURATION),
+    "add": lambda: STD_DURATION + STD_OTHER,
+    "subtract": lambda: STD_DURATION - STD_OTHER,
+    "negated": lambda: -STD_DURATION,
+    "compare": lambda: STD_DURATION < STD_OTHER,
+    "hash": lambda: hash(STD_DURATION),
+    "total_seconds": lambda: STD_DURATION.total_seconds(),
+}
+
+
+@pytest.mark.parametrize("operation", TEMPORAL)
+def test_temporal(benchmark, operation):
+    benchmark.group = f"Duration.{operation}"
+    benchmark(TEMPORAL[operation])
+
+
+@pytest.mark.parametrize("operation", STDLIB)
+def test_stdlib(benchmark, operation):
+    benchmark.group = f"Duration.{operation}"
+    benchmark(STDLIB[operation])
@@ -0,0 +1,65 @@
+"""
+Benchmarks for Instant, with UTC ``datetime.datetime`` baselines.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from temporal import Duration, Instant, TimeZone
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    from backports.zoneinfo import ZoneInfo
+
+INSTANT = Instant.from_epoch_nanoseconds(1_686_839_445_123_456_789)
+OTHER = Instant.from_epoch_nanoseconds(1_709_198_100_000_000_000)
+DELTA = Duration(hours=12, microseconds=5)
+TZ = TimeZone("America/New_York")
+
+STD_INSTANT = datetime(2023, 6, 15, 14, 30, 45, 123456, tzinfo=timezone.utc)
+STD_OTHER = datetime(2024, 2, 29, 9, 15, tzinfo=timezone.utc)
+STD_DELTA = timedelta(hours=12, microseconds=5)
+STD_TZ = ZoneInfo("America/New_York")
+
+TEMPORAL = {
+    "construct": lambda: Instant.from_epoch_nanoseconds(1_686_839_445_123_456_789),
+    "from_epoch_seconds": lambda: Instant.from_epoch_seconds(1_686_839_445.123456),
+    "from_string": lambda: Instant.from_string("2023-06-15T14:30:45.123456Z"),
+    "str": lambda: str(INSTANT),
+    "add": lambda: INSTANT.add(DELTA),
+    "subtract_instant": lambda: INSTANT.subtract(OTHER),
+    "compare": lambda: INSTANT < OTHER,
+    "hash": lambda: hash(INSTANT),
+    "round": lambda: INSTANT.round("seconds"),
+    "until": lambda: INSTANT.until(OTHER),
+    "since": lambda: INSTANT.since(OTHER),
+    "to_zoned_date_time": lambda: INSTANT.to_zoned_date_time(TZ),
+    "offset_for": lambda: TZ.get_offset_nanoseconds_for(INSTANT),
+}
+
+STDLIB = {
+    "construct": lambda: datetime(2023, 6, 15, 14, 30, 45, 123456, tzinfo=timezone.utc),
+    "from_epoch_seconds": lambda: datetime.fromtimestamp(1_686_839_445.123456, tz=timezone.utc),
+    "from_string": lambda: datetime.fromisoformat("2023-06-15T14:30:45.123456+00:00"),
+    "str": lambda: STD_INSTANT.isoformat(),
+    "add": lambda: STD_INSTANT + STD_DELTA,
+    "subtract_instant": lambda: STD_INSTANT - STD_OTHER,
+    "compare": lambda: STD_INSTANT < STD_OTHER,
+    "hash": lambda: hash(STD_INSTANT),
+    "to_zoned_date_time": lambda: STD_INSTANT.astimezone(STD_TZ),
+    "offset_for": lambda: STD_TZ.utcoffset(STD_INSTANT.replace(tzinfo=None)),
+}
+
+
+@pytest.mark.parametrize("operation", TEMPORAL)
+def test_temporal(benchmark, operation):
+    benchmark.group = f"Instant.{operation}"
+    benchmark(TEMPORAL[operation])
+
+
+@pytest.mark.parametrize("operation", STDLIB)
+def test_stdlib(benchmark, operation):
+    benchmark.group = f"Instant.{operation}"
+    benchmark(STDLIB[operation])
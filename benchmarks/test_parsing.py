@@ -0,0 +1,126 @@
+"""
+Benchmarks for the ISO 8601 parsing fast paths.
+
+Each fast path is measured next to the general regex grammar it falls back to,
+so the speedup can be read directly from a benchmark group.
+
+Run with: pytest benchmarks/ --benchmark-only
+"""
+
+import pytest
+
+from temporal import (
+    PlainDate,
+    PlainDateTime,
+    PlainMonthDay,
+    PlainTime,
+    PlainYearMonth,
+    disable_parse_cache,
+    enable_parse_cache,
+)
+from temporal.utils import (
+    _regex_date,
+    _regex_datetime,
+    _regex_time,
+    check_date_range,
+    check_time_range,
+    parse_iso_date,
+    parse_iso_datetime,
+    parse_iso_time,
+)
+
+DATE = "2023-06-15"
+TIME = "14:30:45.123456"
+DATETIME = "2023-06-15T14:30:45.123456"
+DATETIME_NS = "2023-06-15T14:30:45.123456789"
+
+
+def regex_date(text):
+    fields = _regex_date(text)
+    check_date_range(*fields)
+    return fields
+
+
+def regex_time(text):
+    fields = _regex_time(text)
+    check_time_range(*fields)
+    return fields
+
+
+def regex_datetime(text):
+    fields = _regex_datetime(text)
+    check_date_range(fields[0], fields[1], fields[2])
+    check_time_range(fields[3], fields[4], fields[5], fields[6])
+    return fields
+
+
+@pytest.mark.benchmark(group="parse_iso_date")
+def test_parse_iso_date_fast(benchmark):
+    assert benchmark(parse_iso_date, DATE) == (2023, 6, 15)
+
+
+@pytest.mark.benchmark(group="parse_iso_date")
+def test_parse_iso_date_regex(benchmark):
+    assert benchmark(regex_date, DATE) == (2023, 6, 15)
+
+
+@pytest.mark.benchmark(group="parse_iso_time")
+def test_parse_iso_time_fast(benchmark):
+    assert benchmark(parse_iso_time, TIME) == (14, 30, 45, 123456)
+
+
+@pytest.mark.benchmark(group="parse_iso_time")
+def test_parse_iso_time_regex(benchmark):
+    assert benchmark(regex_time, TIME) == (14, 30, 45, 123456)
+
+
+@pytest.mark.benchmark(group="parse_iso_datetime")
+@pytest.mark.parametrize("text", [DATETIME, DATETIME_NS])
+def test_parse_iso_datetime_fast(benchmark, text):
+    assert benchmark(parse_iso_datetime, text) == (2023, 6, 15, 14, 30, 45, 123456)
+
+
+@pytest.mark.benchmark(group="parse_iso_datetime")
+@pytest.mark.parametrize("text", [DATETIME, DATETIME_NS])
+def test_parse_iso_datetime_regex(benchmark, text):
+    assert benchmark(regex_datetime, text) == (2023, 6, 15, 14, 30, 45, 123456)
+
+
+@pytest.mark.benchmark(group="from_string")
+@pytest.mark.parametrize(
+    "cls, text",
+    [
+        (PlainDate, DATE),
+        (PlainTime, TIME),
+        (PlainDateTime, DATETIME),
+        (PlainYearMonth, "2023-06"),
+        (PlainMonthDay, "--06-15"),
+    ],
+    ids=lambda value: value.__name__ if isinstance(value, type) else value,
+)
+def test_from_string(benchmark, cls, text):
+    benchmark(cls.from_string, text)
+
+
+DATES = [f"{2000 + i % 24:04d}-{1 + i % 12:02d}-{1 + i % 28:02d}" for i in range(10_000)]
+
+
+@pytest.mark.benchmark(group="parse_many")
+def test_from_string_loop(benchmark):
+    benchmark(lambda: [PlainDate.from_string(text) for text in DATES])
+
+
+@pytest.mark.benchmark(group="parse_many")
+def test_from_string_loop_cached(benchmark):
+    # DATES repeats with a period of 168, like a date column in an access log
+    enable_parse_cache()
+    try:
+        benchmark(lambda: [PlainDate.from_string(text) for text in DATES])
+    finally:
+        disable_parse_cache()
+
+
+@pytest.mark.benchmark(group="parse_many")
+@pytest.mark.parametrize("output", ["objects", "array"])
+def test_parse_many(benchmark, output):
+    benchmark(PlainDate.parse_many, DATES, output=output)
@@ -0,0 +1,59 @@
+"""
+Benchmarks for PlainDate, with ``datetime.date`` baselines.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from temporal import Duration, PlainDate, TimeZone
+
+DATE = PlainDate(2023, 6, 15)
+OTHER = PlainDate(2024, 2, 29)
+DAYS = Duration(days=45)
+MONTHS = Duration(months=3, days=2)
+TZ = TimeZone("America/New_York")
+
+STD_DATE = date(2023, 6, 15)
+STD_OTHER = date(2024, 2, 29)
+STD_DAYS = timedelta(days=45)
+
+TEMPORAL = {
+    "construct": lambda: PlainDate(2023, 6, 15),
+    "from_string": lambda: PlainDate.from_string("2023-06-15"),
+    "str": lambda: str(DATE),
+    "add_days": lambda: DATE.add(DAYS),
+    "add_months": lambda: DATE.add(MONTHS),
+    "subtract_date": lambda: DATE.subtract(OTHER),
+    "compare": lambda: DATE < OTHER,
+    "hash": lambda: hash(DATE),
+    "until": lambda: DATE.until(OTHER),
+    "since": lambda: DATE.since(OTHER),
+    "day_of_week": lambda: DATE.day_of_week,
+    "week_of_year": lambda: DATE.week_of_year,
+    "to_zoned_date_time": lambda: DATE.to_zoned_date_time(TZ),
+}
+
+STDLIB = {
+    "construct": lambda: date(2023, 6, 15),
+    "from_string": lambda: date.fromisoformat("2023-06-15"),
+    "str": lambda: str(STD_DATE),
+    "add_days": lambda: STD_DATE + STD_DAYS,
+    "subtract_date": lambda: STD_DATE - STD_OTHER,
+    "compare": lambda: STD_DATE < STD_OTHER,
+    "hash": lambda: hash(STD_DATE),
+    "day_of_week": lambda: STD_DATE.isoweekday(),
+    "week_of_year": lambda: STD_DATE.isocalendar()[1],
+}
+
+
+@pytest.mark.parametrize("operation", TEMPORAL)
+def test_temporal(benchmark, operation):
+    benchmark.group = f"PlainDate.{operation}"
+    benchmark(TEMPORAL[operation])
+
+
+@pytest.mark.parametrize("operation", STDLIB)
+def test_stdlib(benchmark, operation):
+    benchmark.group = f"PlainDate.{operation}"
+    benchmark(STDLIB[operation])
@@ -0,0 +1,63 @@
+"""
+Benchmarks for PlainDateTime, with naive ``datetime.datetime`` baselines.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from temporal import Duration, PlainDateTime, TimeZone
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    from backports.zoneinfo import ZoneInfo
+
+DATETIME = PlainDateTime(2023, 6, 15, 14, 30, 45, 123456)
+OTHER = PlainDateTime(2024, 2, 29, 9, 15)
+DELTA = Duration(days=2, hours=12, microseconds=5)
+MONTHS = Duration(months=1, hours=1)
+TZ = TimeZone("America/New_York")
+
+STD_DATETIME = datetime(2023, 6, 15, 14, 30, 45, 123456)
+STD_OTHER = datetime(2024, 2, 29, 9, 15)
+STD_DELTA = timedelta(days=2, hours=12, microseconds=5)
+STD_TZ = ZoneInfo("America/New_York")
+
+TEMPORAL = {
+    "construct": lambda: PlainDateTime(2023, 6, 15, 14, 30, 45, 123456),
+    "from_string": lambda: PlainDateTime.from_string("2023-06-15T14:30:45.123456"),
+    "str": lambda: str(DATETIME),
+    "add": lambda: DATETIME.add(DELTA),
+    "add_months": lambda: DATETIME.add(MONTHS),
+    "subtract_datetime": lambda: DATETIME.subtract(OTHER),
+    "compare": lambda: DATETIME < OTHER,
+    "hash": lambda: hash(DATETIME),
+    "round": lambda: DATETIME.round("minutes"),
+    "until": lambda: DATETIME.until(OTHER),
+    "since": lambda: DATETIME.since(OTHER),
+    "to_zoned_date_time": lambda: DATETIME.to_zoned_date_time(TZ),
+}
+
+STDLIB = {
+    "construct": lambda: datetime(2023, 6, 15, 14, 30, 45, 123456),
+    "from_string": lambda: datetime.fromisoformat("2023-06-15T14:30:45.123456"),
+    "str": lambda: STD_DATETIME.isoformat(),
+    "add": lambda: STD_DATETIME + STD_DELTA,
+    "subtract_datetime": lambda: STD_DATETIME - STD_OTHER,
+    "compare": lambda: STD_DATETIME < STD_OTHER,
+    "hash": lambda: hash(STD_DATETIME),
+    "to_zoned_date_time": lambda: STD_DATETIME.replace(tzinfo=STD_TZ),
+}
+
+
+@pytest.mark.parametrize("operation", TEMPORAL)
+def test_temporal(benchmark, operation):
+    benchmark.group = f"PlainDateTime.{operation}"
+    benchmark(TEMPORAL[operation])
+
+
+@pytest.mark.parametrize("operation", STDLIB)
+def test_stdlib(benchmark, operation):
+    benchmark.group = f"PlainDateTime.{operation}"
+    benchmark(STDLIB[operation])
@@ -0,0 +1,54 @@
+"""
+Benchmarks for PlainTime, with ``datetime.time`` baselines.
+"""
+
+from datetime import datetime, time, timedelta
+
+import pytest
+
+from temporal import Duration, PlainTime
+
+TIME = PlainTime(14, 30, 45, 123456)
+OTHER = PlainTime(9, 15)
+DELTA = Duration(hours=3, minutes=20, microseconds=5)
+
+STD_TIME = time(14, 30, 45, 123456)
+STD_OTHER = time(9, 15)
+STD_DELTA = timedelta(hours=3, minutes=20, microseconds=5)
+STD_DAY = datetime(2000, 1, 1)
+
+TEMPORAL = {
+    "construct": lambda: PlainTime(14, 30, 45, 123456),
+    "from_string": lambda: PlainTime.from_string("14:30:45.123456"),
+    "str": lambda: str(TIME),
+    "add": lambda: TIME.add(DELTA),
+    "subtract_time": lambda: TIME.subtract(OTHER),
+    "compare": lambda: TIME < OTHER,
+    "hash": lambda: hash(TIME),
+    "round": lambda: TIME.round("minutes"),
+    "until": lambda: TIME.until(OTHER),
+    "since": lambda: TIME.since(OTHER),
+}
+
+STDLIB = {
+    "construct": lambda: time(14, 30, 45, 123456),
+    "from_string": lambda: time.fromisoformat("14:30:45.123456"),
+    "str": lambda: str(STD_TIME),
+    # datetime.time has no arithmetic; the stdlib idiom goes through a datetime
+    "add": lambda: (datetime.combine(STD_DAY, STD_TIME) + STD_DELTA).time(),
+    "subtract_time": lambda: datetime.combine(STD_DAY, STD_TIME) - datetime.combine(STD_DAY, STD_OTHER),
+    "compare": lambda: STD_TIME < STD_OTHER,
+    "hash": lambda: hash(STD_TIME),
+}
+
+
+@pytest.mark.parametrize("operation", TEMPORAL)
+def test_temporal(benchmark, operation):
+    benchmark.group = f"PlainTime.{operation}"
+    benchmark(TEMPORAL[operation])
+
+
+@pytest.mark.parametrize("operation", STDLIB)
+def test_stdlib(benchmark, operation):
+    benchmark.group = f"PlainTime.{operation}"
+    benchmark(STDLIB[operation])
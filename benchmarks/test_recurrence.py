@@ -0,0 +1,35 @@
+"""
+Benchmarks for RecurrenceRule: the next few occurrences of long-running series.
+"""
+
+from itertools import islice
+
+import pytest
+
+from temporal import PlainDate, PlainDateTime, RecurrenceRule, TimeZone, ZonedDateTime
+
+TZ = TimeZone("America/New_York")
+WEEKLY = RecurrenceRule.from_string("FREQ=WEEKLY;BYDAY=MO,WE,FR")
+MONTH_END = RecurrenceRule.from_string("FREQ=MONTHLY;BYDAY=MO,TU,WE,TH,FR;BYSETPOS=-1")
+HOURLY = RecurrenceRule.from_string("FREQ=HOURLY;INTERVAL=4;BYDAY=SA,SU")
+
+DATE_START = PlainDate(2001, 1, 1)
+DATETIME_START = PlainDateTime(2001, 1, 1, 9)
+ZONED_START = ZonedDateTime(2001, 1, 1, 9, timezone=TZ)
+DATE_NOW = PlainDate(2026, 10, 17)
+DATETIME_NOW = PlainDateTime(2026, 10, 17, 12)
+ZONED_NOW = ZonedDateTime(2026, 10, 17, 12, timezone=TZ)
+
+TEMPORAL = {
+    "weekly_next_5": lambda: list(islice(WEEKLY.occurrences(DATETIME_START, after=DATETIME_NOW), 5)),
+    "weekly_zoned_next_5": lambda: list(islice(WEEKLY.occurrences(ZONED_START, after=ZONED_NOW), 5)),
+    "month_end_next_5": lambda: list(islice(MONTH_END.occurrences(DATE_START, after=DATE_NOW), 5)),
+    "hourly_weekends_next_5": lambda: list(islice(HOURLY.occurrences(DATETIME_START, after=DATETIME_NOW), 5)),
+    "from_string": lambda: RecurrenceRule.from_string("FREQ=MONTHLY;INTERVAL=2;BYDAY=-1FR;COUNT=12"),
+}
+
+
+@pytest.mark.parametrize("operation", TEMPORAL)
+def test_temporal(benchmark, operation):
+    benchmark.group = f"RecurrenceRule.{operation}"
+    benchmark(TEMPORAL[operation])
@@ -0,0 +1,77 @@
+"""
+Benchmarks for TimeZone and Calendar, with ``zoneinfo`` baselines.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from temporal import Calendar, Instant, PlainDateTime, TimeZone
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    from backports.zoneinfo import ZoneInfo
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+TZ = TimeZone("America/New_York")
+INSTANT = Instant.from_epoch_nanoseconds(1_686_839_445_123_456_789)
+FAR_INSTANT = Instant.from_epoch_nanoseconds(4_102_444_800_000_000_000)
+LOCAL = PlainDateTime(2023, 6, 15, 14, 30, 45)
+FOLD = PlainDateTime(2023, 11, 5, 1, 30)
+
+STD_TZ = ZoneInfo("America/New_York")
+STD_UTC = datetime(2023, 6, 15, 14, 30, 45, 123456, tzinfo=timezone.utc)
+STD_FAR = datetime(2100, 1, 1, tzinfo=timezone.utc)
+STD_LOCAL = datetime(2023, 6, 15, 14, 30, 45)
+STD_FOLD = datetime(2023, 11, 5, 1, 30)
+
+TEMPORAL = {
+    "TimeZone.construct": lambda: TimeZone("America/New_York"),
+    "TimeZone.offset_for": lambda: TZ.get_offset_nanoseconds_for(INSTANT),
+    "TimeZone.offset_for_posix_rule": lambda: TZ.get_offset_nanoseconds_for(FAR_INSTANT),
+    "TimeZone.possible_instants": lambda: TZ.get_possible_instants_for(LOCAL),
+    "TimeZone.possible_instants_fold": lambda: TZ.get_possible_instants_for(FOLD),
+    "Calendar.construct": lambda: Calendar("iso8601"),
+}
+
+STDLIB = {
+    "TimeZone.construct": lambda: ZoneInfo("America/New_York"),
+    "TimeZone.offset_for": lambda: STD_UTC.astimezone(STD_TZ).utcoffset(),
+    "TimeZone.offset_for_posix_rule": lambda: STD_FAR.astimezone(STD_TZ).utcoffset(),
+    "TimeZone.possible_instants": lambda: STD_LOCAL.replace(tzinfo=STD_TZ).astimezone(timezone.utc),
+    "TimeZone.possible_instants_fold": lambda: [
+        STD_FOLD.replace(tzinfo=STD_TZ, fold=fold).astimezone(timezone.utc) for fold in (0, 1)
+    ],
+}
+
+
+if numpy is not None:
+    # One day of events, in epoch nanoseconds and as wall-clock nanoseconds
+    COLUMN = numpy.random.default_rng(0).integers(1_699_142_400_000_000_000, 1_699_228_800_000_000_000, 100_000)
+    LOCAL_COLUMN = TZ.to_local_many(COLUMN)
+    STD_SECONDS = (COLUMN // 10**9).tolist()
+    STD_LOCAL_COLUMN = [datetime.fromtimestamp(seconds, STD_TZ).replace(tzinfo=None) for seconds in STD_SECONDS]
+
+    TEMPORAL["TimeZone.to_local_many_100k"] = lambda: TZ.to_local_many(COLUMN)
+    TEMPORAL["TimeZone.to_utc_many_100k"] = lambda: TZ.to_utc_many(LOCAL_COLUMN)
+    STDLIB["TimeZone.to_local_many_100k"] = lambda: [datetime.fromtimestamp(seconds, STD_TZ) for seconds in STD_SECONDS]
+    STDLIB["TimeZone.to_utc_many_100k"] = lambda: [
+        local.replace(tzinfo=STD_TZ).astimezone(timezone.utc) for local in STD_LOCAL_COLUMN
+    ]
+
+
+@pytest.mark.parametrize("operation", TEMPORAL)
+def test_temporal(benchmark, operation):
+    benchmark.group = operation
+    benchmark(TEMPORAL[operation])
+
+
+@pytest.mark.parametrize("operation", STDLIB)
+def test_stdlib(benchmark, operation):
+    benchmark.group = operation
+    benchmark(STDLIB[operation])
@@ -0,0 +1,59 @@
+"""
+Benchmarks for PlainYearMonth and PlainMonthDay.
+
+The stdlib has no equivalent types; the nearest ``datetime.date`` idioms are
+used as baselines.
+"""
+
+from datetime import date
+
+import pytest
+
+from temporal import Duration, PlainMonthDay, PlainYearMonth
+
+YEAR_MONTH = PlainYearMonth(2023, 6)
+OTHER_YEAR_MONTH = PlainYearMonth(2025, 2)
+MONTHS = Duration(months=14)
+MONTH_DAY = PlainMonthDay(2, 29)
+OTHER_MONTH_DAY = PlainMonthDay(12, 25)
+
+STD_YEAR_MONTH = date(2023, 6, 1)
+STD_OTHER_YEAR_MONTH = date(2025, 2, 1)
+
+TEMPORAL = {
+    "PlainYearMonth.construct": lambda: PlainYearMonth(2023, 6),
+    "PlainYearMonth.from_string": lambda: PlainYearMonth.from_string("2023-06"),
+    "PlainYearMonth.str": lambda: str(YEAR_MONTH),
+    "PlainYearMonth.add": lambda: YEAR_MONTH.add(MONTHS),
+    "PlainYearMonth.compare": lambda: PlainYearMonth.compare(YEAR_MONTH, OTHER_YEAR_MONTH),
+    "PlainYearMonth.hash": lambda: hash(YEAR_MONTH),
+    "PlainYearMonth.until": lambda: YEAR_MONTH.until(OTHER_YEAR_MONTH),
+    "PlainYearMonth.since": lambda: YEAR_MONTH.since(OTHER_YEAR_MONTH),
+    "PlainMonthDay.construct": lambda: PlainMonthDay(2, 29),
+    "PlainMonthDay.from_string": lambda: PlainMonthDay.from_string("--02-29"),
+    "PlainMonthDay.str": lambda: str(MONTH_DAY),
+    "PlainMonthDay.compare": lambda: PlainMonthDay.compare(MONTH_DAY, OTHER_MONTH_DAY),
+    "PlainMonthDay.hash": lambda: hash(MONTH_DAY),
+    "PlainMonthDay.to_plain_date": lambda: MONTH_DAY.to_plain_date(2024),
+}
+
+STDLIB = {
+    "PlainYearMonth.construct": lambda: date(2023, 6, 1),
+    "PlainYearMonth.from_string": lambda: date.fromisoformat("2023-06-01"),
+    "PlainYearMonth.str": lambda: STD_YEAR_MONTH.strftime("%Y-%m"),
+    "PlainYearMonth.compare": lambda: STD_YEAR_MONTH < STD_OTHER_YEAR_MONTH,
+    "PlainYearMonth.hash": lambda: hash(STD_YEAR_MONTH),
+    "PlainMonthDay.to_plain_date": lambda: date(2024, 2, 29),
+}
+
+
+@pytest.mark.parametrize("operation", TEMPORAL)
+def test_temporal(benchmark, operation):
+    benchmark.group = operation
+    benchmark(TEMPORAL[operation])
+
+
+@pytest.mark.parametrize("operation", STDLIB)
+def test_stdlib(benchmark, operation):
+    benchmark.group = operation
+    benchmark(STDLIB[operation])
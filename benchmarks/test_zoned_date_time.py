@@ -0,0 +1,68 @@
+"""
+Benchmarks for ZonedDateTime, with aware ``datetime.datetime`` baselines.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from temporal import Duration, TimeZone, ZonedDateTime
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    from backports.zoneinfo import ZoneInfo
+
+TZ = TimeZone("America/New_York")
+OTHER_TZ = TimeZone("Asia/Tokyo")
+ZONED = ZonedDateTime(2023, 6, 15, 14, 30, 45, 123456, TZ)
+OTHER = ZonedDateTime(2024, 2, 29, 9, 15, 0, 0, OTHER_TZ)
+DELTA = Duration(days=2, hours=12, microseconds=5)
+
+STD_TZ = ZoneInfo("America/New_York")
+STD_OTHER_TZ = ZoneInfo("Asia/Tokyo")
+STD_ZONED = datetime(2023, 6, 15, 14, 30, 45, 123456, tzinfo=STD_TZ)
+STD_OTHER = datetime(2024, 2, 29, 9, 15, tzinfo=STD_OTHER_TZ)
+STD_DELTA = timedelta(days=2, hours=12, microseconds=5)
+
+TEMPORAL = {
+    "construct": lambda: ZonedDateTime(2023, 6, 15, 14, 30, 45, 123456, TZ),
+    "from_string": lambda: ZonedDateTime.from_string("2023-06-15T14:30:45.123456-04:00"),
+    "str": lambda: str(ZONED),
+    "add": lambda: ZONED.add(DELTA),
+    "subtract_zoned": lambda: ZONED.subtract(OTHER),
+    "compare": lambda: ZONED < OTHER,
+    "hash": lambda: hash(ZONED),
+    "round": lambda: ZONED.round("seconds"),
+    "until": lambda: ZONED.until(OTHER),
+    "since": lambda: ZONED.since(OTHER),
+    "offset_seconds": lambda: ZONED.offset_seconds,
+    "with_timezone": lambda: ZONED.with_timezone(OTHER_TZ),
+    "to_instant": lambda: ZONED.to_instant(),
+}
+
+STDLIB = {
+    "construct": lambda: datetime(2023, 6, 15, 14, 30, 45, 123456, tzinfo=STD_TZ),
+    "from_string": lambda: datetime.fromisoformat("2023-06-15T14:30:45.123456-04:00"),
+    "str": lambda: STD_ZONED.isoformat(),
+    # Wall-clock addition, like ZonedDateTime.add with a time-only duration
+    "add": lambda: STD_ZONED + STD_DELTA,
+    "subtract_zoned": lambda: STD_ZONED - STD_OTHER,
+    "compare": lambda: STD_ZONED < STD_OTHER,
+    "hash": lambda: hash(STD_ZONED),
+    "offset_seconds": lambda: STD_ZONED.utcoffset(),
+    "with_timezone": lambda: STD_ZONED.astimezone(STD_OTHER_TZ),
+    "to_instant": lambda: STD_ZONED.astimezone(timezone.utc),
+}
+
+
+@pytest.mark.parametrize("operation", TEMPORAL)
+def test_temporal(benchmark, operation):
+    benchmark.group = f"ZonedDateTime.{operation}"
+    benchmark(TEMPORAL[operation])
+
+
+@pytest.mark.parametrize("operation", STDLIB)
+def test_stdlib(benchmark, operation):
+    benchmark.group = f"ZonedDateTime.{operation}"
+    benchmark(STDLIB[operation])
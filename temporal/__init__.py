@@ -5,15 +5,20 @@ This package provides temporal objects for working with dates, times, and durati
 in a more intuitive and reliable way than the standard datetime module.
 """
 
+from .business_calendar import BusinessCalendar
 from .calendar import Calendar
+from .cron import CronExpression
 from .duration import Duration
 from .exceptions import InvalidArgumentError, RangeError, TemporalError, TemporalTypeError
 from .instant import Instant
+from .parse_cache import ParseCache, disable_parse_cache, enable_parse_cache, get_parse_cache
 from .plain_date import PlainDate
 from .plain_date_time import PlainDateTime
 from .plain_month_day import PlainMonthDay
 from .plain_time import PlainTime
 from .plain_year_month import PlainYearMonth
+from .ranges import InstantRange, PlainDateRange, PlainDateTimeRange, PlainYearMonthRange, TemporalRange
+from .recurrence import RecurrenceRule
 from .timezone import TimeZone
 from .zoned_date_time import ZonedDateTime
 
@@ -28,7 +33,19 @@ __all__ = [
     "Duration",
     "Instant",
     "Calendar",
+    "BusinessCalendar",
     "TimeZone",
+    "RecurrenceRule",
+    "CronExpression",
+    "TemporalRange",
+    "PlainDateRange",
+    "PlainDateTimeRange",
+    "InstantRange",
+    "PlainYearMonthRange",
+    "ParseCache",
+    "enable_parse_cache",
+    "disable_parse_cache",
+    "get_parse_cache",
     "TemporalError",
     "RangeError",
     "TemporalTypeError",
@@ -0,0 +1,731 @@
+"""
+Columnar arrays of temporal values for the Temporal API.
+
+This module requires NumPy, which is an optional dependency, and is not
+imported by ``temporal`` itself: ``from temporal.arrays import InstantArray``.
+"""
+
+import operator
+from abc import ABCMeta, abstractmethod
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    import numpy
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError("temporal.arrays requires NumPy to be installed") from e
+
+from .calendar import ISO_CALENDAR
+from .duration import Duration
+from .exceptions import InvalidArgumentError, RangeError, TemporalError
+from .instant import Instant
+from .plain_date import PlainDate
+from .timezone import TimeZone
+from .utils import (
+    INSTANT_ROUNDING_UNITS,
+    MAX_EPOCH_DAYS,
+    MIN_EPOCH_DAYS,
+    MISSING_INT64,
+    NS_PER_DAY,
+    Immutable,
+    bucket_unit,
+    rounding_increment_nanoseconds,
+)
+
+_INT64_MAX = 2**63 - 1
+
+# Missing-row placeholder for int32 columns, the int32 minimum like MISSING_INT64
+MISSING_INT32 = -(2**31)
+
+# Days from 0001-01-01 to 1970-01-01
+_EPOCH_DAYS_OF_YEAR_1 = 719162
+
+_DAYS_IN_MONTH = numpy.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=numpy.int32)
+
+
+def _integer_column(values: Any, name: str, datetime_unit: str) -> Any:
+    """Copy integer, or datetime64 counted in ``datetime_unit``, array-like values into a 1-D int64 array."""
+    column = numpy.asarray(values)
+    if column.dtype.kind == "M":
+        column = column.astype(f"datetime64[{datetime_unit}]").view(numpy.int64)
+    elif column.size == 0:
+        column = column.astype(numpy.int64)
+    elif column.dtype.kind not in "iu":
+        raise InvalidArgumentError(f"{name} must be integers, got dtype {column.dtype}")
+    if column.ndim != 1:
+        raise InvalidArgumentError(f"{name} must be one-dimensional")
+    return numpy.array(column, dtype=numpy.int64)
+
+
+def _is_leap_year(year: Any) -> Any:
+    """Check which years of an integer array are Gregorian leap years."""
+    return (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+
+
+def _epoch_days_of_january_1(year: Any) -> Any:
+    """Get the days since 1970-01-01 of January 1st of each year in an integer array."""
+    previous = year - 1
+    return previous * 365 + previous // 4 - previous // 100 + previous // 400 - _EPOCH_DAYS_OF_YEAR_1
+
+
+def _civil_from_days(days: Any) -> Any:
+    """Convert an int32 array of days since 1970-01-01 to (year, month, day) arrays.
+
+    The same closed-form eras-of-400-years conversion as ``utils.civil_from_days``,
+    over whole arrays.
+    """
+    days = days + 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    # Months are counted from March, so January and February belong to the next year
+    next_year = shifted_month >= 10
+    month = shifted_month + 3
+    month[next_year] -= 12
+    return year_of_era + era * 400 + next_year, month, day
+
+
+def _days_from_civil(year: Any, month: Any, day: Any) -> Any:
+    """Convert (year, month, day) arrays to days since 1970-01-01, like ``utils.days_from_civil``."""
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * numpy.where(month > 2, month - 3, month + 9) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def _calendar_bucket(days: Any, unit: str, increment: int) -> Tuple[Any, Any]:
+    """Get the first day of every row's calendar bucket and of the bucket after it, like ``utils.calendar_bucket``."""
+    if unit == "days":
+        return days, days + 1
+    if unit == "weeks":
+        # 1970-01-01 was a Thursday
+        start = days - (days + 3) % 7
+        return start, start + 7
+    year, month, _ = _civil_from_days(days)
+    if unit == "years":
+        year -= year % increment
+        return _epoch_days_of_january_1(year), _epoch_days_of_january_1(year + increment)
+    month_index = year * 12 + (month - 1)
+    month_index -= month_index % increment
+    end_index = month_index + increment
+    return (
+        _days_from_civil(month_index // 12, month_index % 12 + 1, 1),
+        _days_from_civil(end_index // 12, end_index % 12 + 1, 1),
+    )
+
+
+def _start_of_local_days(timezone: TimeZone, local: Any) -> Any:
+    """Get the first instant of every wall-clock day whose midnight is in ``local``, like ``ZonedDateTime.start_of_day``.
+
+    That is the earlier instant at midnight, or the end of the gap when midnight is skipped.
+    """
+    transitions, offsets = timezone._int64_columns(numpy)
+    start = timezone.to_utc_many(local)
+    index = numpy.searchsorted(transitions, start, side="right")
+    skipped = start + offsets[index] != local
+    if skipped.any():
+        # A skipped midnight resolves past the transition that skipped it
+        start[skipped] = transitions[index[skipped] - 1]
+    return start
+
+
+class _TemporalArray(Immutable, metaclass=ABCMeta):
+    """A read-only one-dimensional integer column with a placeholder value for missing rows.
+
+    Subclasses set the placeholder, and convert between
+    stored integers and scalar objects; selection, comparison, ordering and
+    formatting are shared here.
+    """
+
+    __slots__ = ("_values",)
+
+    _missing: int = MISSING_INT64
+
+    @classmethod
+    def _from_values(cls, values: Any) -> Any:
+        """Create an array that takes ownership of a column of the right dtype without copying it."""
+        array = object.__new__(cls)
+        values.flags.writeable = False
+        object.__setattr__(array, "_values", values)
+        return array
+
+    @abstractmethod
+    def _scalar(self, value: int) -> Any:
+        """Get the scalar object for a stored integer that is not missing."""
+
+    @abstractmethod
+    def _scalar_value(self, other: Any) -> Any:
+        """Get the stored integer for a scalar object, or NotImplemented for other types."""
+
+    @abstractmethod
+    def _format(self, values: Any) -> Any:
+        """Format a column as an array of ISO 8601 strings; missing rows may hold anything."""
+
+    def _missing_mask(self) -> Any:
+        """Get a boolean array that is True on missing rows."""
+        return self._values == self._missing
+
+    def has_missing(self) -> bool:
+        """Check whether any row is missing."""
+        return bool(self._missing_mask().any())
+
+    def _to_objects(self) -> List[Any]:
+        """Convert to a list of scalar objects, with None for missing rows."""
+        scalar = self._scalar
+        missing = self._missing
+        return [None if value == missing else scalar(value) for value in self._values.tolist()]
+
+    def to_strings(self) -> List[Optional[str]]:
+        """Format every row as an ISO 8601 string, exactly as ``str()`` of the row would, with None for missing rows."""
+        strings = self._format(self._values).tolist()
+        missing = self._missing_mask()
+        if missing.any():
+            for index in numpy.flatnonzero(missing).tolist():
+                strings[index] = None
+        return strings
+
+    def _present(self, operation: str) -> Any:
+        """Get the rows that are not missing, raising if there are none."""
+        values = self._values
+        missing = self._missing_mask()
+        if missing.any():
+            values = values[~missing]
+        if not values.size:
+            raise InvalidArgumentError(f"{operation}() of a {type(self).__name__} with no present rows")
+        return values
+
+    def min(self) -> Any:
+        """Get the earliest row, ignoring missing rows."""
+        return self._scalar(int(self._present("min").min()))
+
+    def max(self) -> Any:
+        """Get the latest row, ignoring missing rows."""
+        return self._scalar(int(self._present("max").max()))
+
+    def argsort(self) -> Any:
+        """Get the indices that sort the rows in time order, stably, with missing rows last."""
+        order = numpy.argsort(self._values, kind="stable")
+        # The placeholder is the dtype minimum, so missing rows sort first; rotate them to the end
+        missing_count = int(numpy.count_nonzero(self._missing_mask()))
+        if missing_count:
+            order = numpy.concatenate((order[missing_count:], order[:missing_count]))
+        return order
+
+    def sort(self) -> Any:
+        """Get a copy sorted in time order, with missing rows last."""
+        values = numpy.sort(self._values, kind="stable")
+        missing_count = int(numpy.count_nonzero(values == self._missing))
+        if missing_count:
+            values = numpy.concatenate((values[missing_count:], values[:missing_count]))
+        return self._from_values(values)
+
+    def equals(self, other: Any) -> bool:
+        """Check whether two arrays hold the same rows in the same order."""
+        if type(other) is not type(self):
+            raise InvalidArgumentError(f"Expected {type(self).__name__}")
+        return bool(numpy.array_equal(self._values, other._values))
+
+    def _compare(self, other: Any, compare: Callable[[Any, Any], Any]) -> Any:
+        """Compare every row with a scalar or a same-length array; missing rows only satisfy ``!=``."""
+        if type(other) is type(self):
+            if len(other) != len(self):
+                raise InvalidArgumentError(f"Cannot compare {type(self).__name__}s of lengths {len(self)} and {len(other)}")
+            operand = other._values
+            missing = self._missing_mask() | other._missing_mask()
+        else:
+            operand = self._scalar_value(other)
+            if operand is NotImplemented:
+                return NotImplemented
+            missing = self._missing_mask()
+        result = compare(self._values, operand)
+        if missing.any():
+            result[missing] = compare is operator.ne
+        return result
+
+    def __eq__(self, other: Any) -> Any:
+        """Compare rows for equality, returning a boolean array."""
+        return self._compare(other, operator.eq)
+
+    def __ne__(self, other: Any) -> Any:
+        """Compare rows for inequality, returning a boolean array."""
+        return self._compare(other, operator.ne)
+
+    def __lt__(self, other: Any) -> Any:
+        """Check which rows are before ``other``, returning a boolean array."""
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other: Any) -> Any:
+        """Check which rows are before or equal to ``other``, returning a boolean array."""
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other: Any) -> Any:
+        """Check which rows are after ``other``, returning a boolean array."""
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other: Any) -> Any:
+        """Check which rows are after or equal to ``other``, returning a boolean array."""
+        return self._compare(other, operator.ge)
+
+    # Elementwise __eq__ makes arrays unhashable, as with NumPy arrays
+    __hash__ = None  # type: ignore[assignment]
+
+    def __len__(self) -> int:
+        """Get the number of rows."""
+        return len(self._values)
+
+    def __getitem__(self, key: Any) -> Any:
+        """Get one row as a scalar object (None if missing), or a selection of rows as an array.
+
+        Slices, integer index arrays and boolean masks select rows as NumPy does.
+        """
+        if isinstance(key, (int, numpy.integer)):
+            value = int(self._values[key])
+            return None if value == self._missing else self._scalar(value)
+        return self._from_values(self._values[key])
+
+    def __iter__(self):
+        """Iterate over the rows as scalar objects, with None for missing rows."""
+        return iter(self._to_objects())
+
+    def __reduce__(self):
+        return (type(self), (self._values,))
+
+    def __repr__(self) -> str:
+        """Return detailed string representation."""
+        name = type(self).__name__
+        if len(self) <= 6:
+            return f"{name}({self.to_strings()!r})"
+        rows = [repr(text) for text in self[:3].to_strings()] + ["..."] + [repr(text) for text in self[-3:].to_strings()]
+        return f"{name}([{', '.join(rows)}], length={len(self)})"
+
+
+class InstantArray(_TemporalArray):
+    """A column of exact points in time stored as int64 nanoseconds since the Unix epoch.
+
+    Every operation runs over the whole column in NumPy, so no Instant objects
+    are created until they are asked for. Rows equal to MISSING_INT64 (NumPy's
+    NaT) are missing: they stay missing through arithmetic and rounding, compare
+    unequal to everything, sort last, and become None in object outputs.
+
+    The int64 representation covers 1677-09-21 to 2262-04-11.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, epoch_nanoseconds: Iterable[int]):
+        """Initialize an InstantArray.
+
+        Args:
+            epoch_nanoseconds: Integer nanoseconds since the Unix epoch, as a sequence or
+                array, or a NumPy datetime64 array; the values are copied
+        """
+        values = _integer_column(epoch_nanoseconds, "epoch_nanoseconds", "ns")
+        values.flags.writeable = False
+        object.__setattr__(self, "_values", values)
+
+    @classmethod
+    def from_instants(cls, instants: Iterable[Optional[Instant]]) -> "InstantArray":
+        """Create an InstantArray from Instant objects, with None for missing rows."""
+        values = []
+        append = values.append
+        for instant in instants:
+            if instant is None:
+                append(MISSING_INT64)
+            elif isinstance(instant, Instant):
+                append(instant._epoch_nanoseconds)
+            else:
+                raise InvalidArgumentError("Expected Instant object or None")
+        return cls._from_values(numpy.array(values, dtype=numpy.int64))
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str], errors: Optional[Dict[int, TemporalError]] = None) -> "InstantArray":
+        """Parse ISO 8601 instant strings into an InstantArray.
+
+        Args:
+            strings: ISO 8601 instant strings
+            errors: If given, failed rows are recorded here as ``{index: error}`` and left
+                missing instead of raising
+
+        Returns:
+            An InstantArray aligned with the input strings
+        """
+        return cls._from_values(numpy.array(Instant.parse_many(strings, output="numpy", errors=errors)))
+
+    @property
+    def epoch_nanoseconds(self) -> Any:
+        """Get the read-only int64 array of nanoseconds since the Unix epoch."""
+        return self._values
+
+    def to_instants(self) -> List[Optional[Instant]]:
+        """Convert to a list of Instant objects, with None for missing rows."""
+        return self._to_objects()
+
+    def _scalar(self, value: int) -> Instant:
+        return Instant._from_epoch_nanoseconds(value)
+
+    def _scalar_value(self, other: Any) -> Any:
+        if not isinstance(other, Instant):
+            return NotImplemented
+        if not -_INT64_MAX <= other._epoch_nanoseconds <= _INT64_MAX:
+            raise RangeError("Instant is outside the int64 nanosecond range of InstantArray")
+        return other._epoch_nanoseconds
+
+    def _format(self, values: Any) -> Any:
+        # Full nanosecond precision, then trailing fraction zeros and a bare decimal point removed
+        strings = numpy.datetime_as_string(values.view("datetime64[ns]"), unit="ns")
+        return numpy.char.add(numpy.char.rstrip(numpy.char.rstrip(strings, "0"), "."), "Z")
+
+    def _shifted(self, nanoseconds: int) -> "InstantArray":
+        """Get a copy with every present row moved by a nanosecond count."""
+        values = self._values
+        missing = self._missing_mask()
+        has_missing = bool(missing.any())
+        present = values[~missing] if has_missing else values
+        if not present.size or nanoseconds == 0:
+            return self
+        if not (-_INT64_MAX <= int(present.min()) + nanoseconds and int(present.max()) + nanoseconds <= _INT64_MAX):
+            raise RangeError("Result is outside the int64 nanosecond range of InstantArray")
+        # A valid shift can span the whole int64 range; two halves keep each step representable
+        half = nanoseconds // 2
+        shifted = values + numpy.int64(half)
+        shifted += numpy.int64(nanoseconds - half)
+        if has_missing:
+            shifted[missing] = MISSING_INT64
+        return self._from_values(shifted)
+
+    def add(self, duration: Duration) -> "InstantArray":
+        """Add a duration to every row."""
+        if not isinstance(duration, Duration):
+            raise InvalidArgumentError("Expected Duration object")
+        if duration.years != 0 or duration.months != 0:
+            raise InvalidArgumentError("Cannot add years or months to Instant")
+        return self._shifted(duration._total_nanoseconds())
+
+    def subtract(self, duration: Duration) -> "InstantArray":
+        """Subtract a duration from every row."""
+        if not isinstance(duration, Duration):
+            raise InvalidArgumentError("Expected Duration object")
+        if duration.years != 0 or duration.months != 0:
+            raise InvalidArgumentError("Cannot subtract years or months from Instant")
+        return self._shifted(-duration._total_nanoseconds())
+
+    def round(self, options: Union[str, dict]) -> "InstantArray":
+        """Round every row to a specified increment, ties to even, as ``Instant.round`` does.
+
+        Like ``Instant.round``, only seconds and smaller units are accepted; use
+        ``floor()``, ``ceil()`` or ``bucket()`` for minutes and longer.
+
+        Args:
+            options: Either a string unit name (seconds, milliseconds, microseconds or nanoseconds)
+                or dict with 'smallestUnit' and optional 'roundingIncrement'
+
+        Returns:
+            A new rounded InstantArray
+        """
+        increment = rounding_increment_nanoseconds(options, INSTANT_ROUNDING_UNITS, "nanoseconds")
+        if increment == 1:
+            return self
+        if increment > _INT64_MAX // 2:
+            raise RangeError("roundingIncrement is too large for InstantArray")
+        values = self._values
+        missing = self._missing_mask()
+        quotient, remainder = numpy.divmod(values, numpy.int64(increment))
+        twice = remainder * 2
+        quotient += (twice > increment) | ((twice == increment) & (quotient % 2 == 1))
+        quotient[missing] = 0
+        limit = _INT64_MAX // increment
+        if quotient.size and (int(quotient.max()) > limit or int(quotient.min()) < -limit):
+            raise RangeError("Result is outside the int64 nanosecond range of InstantArray")
+        rounded = quotient * numpy.int64(increment)
+        rounded[missing] = MISSING_INT64
+        return self._from_values(rounded)
+
+    def _bucket_bounds(self, options: Union[str, dict], timezone: Optional[TimeZone]) -> Tuple[Any, Any]:
+        """Get the start and end of every row's bucket as int64 arrays, with missing rows missing in both."""
+        unit, increment = bucket_unit(options)
+        if timezone is not None and not isinstance(timezone, TimeZone):
+            raise InvalidArgumentError("Expected TimeZone object")
+        values = self._values
+        missing = self._missing_mask()
+        has_missing = bool(missing.any())
+        if has_missing:
+            if missing.all():
+                return values.copy(), values.copy()
+            # Fill missing rows with a present row so they do not widen the span of days below
+            values = numpy.where(missing, values[numpy.argmin(missing)], values)
+        if not values.size:
+            return values.copy(), values.copy()
+        if timezone is None:
+            local = values
+        else:
+            transitions, offsets = timezone._int64_columns(numpy)
+            index = numpy.searchsorted(transitions, values, side="right")
+            local = values + offsets[index]
+
+        if unit == "nanoseconds":
+            if int(local.min()) - increment < -_INT64_MAX or int(local.max()) + increment > _INT64_MAX:
+                raise RangeError("Result is outside the int64 nanosecond range of InstantArray")
+            start = local - local % increment
+            end = start + increment
+            if timezone is not None:
+                # Follow the wall clock at each row's offset, cut short at offset transitions
+                offset = local - values
+                start -= offset
+                end -= offset
+                bounds = numpy.concatenate(([MISSING_INT64], transitions, [_INT64_MAX]))
+                numpy.maximum(start, bounds[index], out=start)
+                numpy.minimum(end, bounds[index + 1], out=end)
+        else:
+            days = local // NS_PER_DAY
+            first = int(days.min())
+            span = int(days.max()) - first + 1
+            # Rows usually cover far fewer days than there are rows: bucket each day once, then look rows up
+            lookup = span <= len(days)
+            if lookup:
+                rows = days - first
+                days = numpy.arange(first, first + span, dtype=numpy.int64)
+            start, end = _calendar_bucket(days, unit, increment)
+            if int(start.min()) * NS_PER_DAY < -_INT64_MAX or int(end.max()) * NS_PER_DAY > _INT64_MAX:
+                raise RangeError("Result is outside the int64 nanosecond range of InstantArray")
+            start = start * NS_PER_DAY
+            end = end * NS_PER_DAY
+            if timezone is not None:
+                start = _start_of_local_days(timezone, start)
+                end = _start_of_local_days(timezone, end)
+            if lookup:
+                start = start[rows]
+                end = end[rows]
+        if has_missing:
+            start[missing] = MISSING_INT64
+            end[missing] = MISSING_INT64
+        return start, end
+
+    def floor(self, options: Union[str, dict], timezone: Optional[TimeZone] = None) -> "InstantArray":
+        """Round every row down to the start of its bucket, as ``Instant.floor`` does.
+
+        Args:
+            options: Either a string unit name or dict with 'smallestUnit' and optional 'roundingIncrement'
+            timezone: If given, bucket on this zone's wall clock, as ``ZonedDateTime.floor`` does
+
+        Returns:
+            A new InstantArray of bucket starts
+        """
+        return self._from_values(self._bucket_bounds(options, timezone)[0])
+
+    def ceil(self, options: Union[str, dict], timezone: Optional[TimeZone] = None) -> "InstantArray":
+        """Round every row up to the next bucket boundary, leaving rows on a boundary unchanged, as ``Instant.ceil`` does.
+
+        Args:
+            options: Either a string unit name or dict with 'smallestUnit' and optional 'roundingIncrement'
+            timezone: If given, bucket on this zone's wall clock, as ``ZonedDateTime.ceil`` does
+
+        Returns:
+            A new InstantArray of bucket boundaries
+        """
+        start, end = self._bucket_bounds(options, timezone)
+        return self._from_values(numpy.where(start == self._values, start, end))
+
+    def bucket(self, options: Union[str, dict], timezone: Optional[TimeZone] = None) -> Tuple["InstantArray", "InstantArray"]:
+        """Get the bucket containing every row, as ``Instant.bucket`` does.
+
+        Args:
+            options: Either a string unit name or dict with 'smallestUnit' and optional 'roundingIncrement'
+            timezone: If given, bucket on this zone's wall clock, as ``ZonedDateTime.bucket`` does
+
+        Returns:
+            The half-open ``(starts, ends)`` intervals as two InstantArrays
+        """
+        start, end = self._bucket_bounds(options, timezone)
+        return self._from_values(start), self._from_values(end)
+
+
+class PlainDateArray(_TemporalArray):
+    """A column of ISO calendar dates stored as int32 days since 1970-01-01.
+
+    Field properties decode the whole column with the closed-form
+    civil-from-days conversion, without creating PlainDate objects. Rows
+    equal to MISSING_INT32 are missing: their fields are 0, they stay missing
+    through arithmetic, compare unequal to everything, sort last, and become
+    None in object outputs.
+    """
+
+    __slots__ = ()
+
+    _missing = MISSING_INT32
+
+    def __init__(self, epoch_days: Iterable[int]):
+        """Initialize a PlainDateArray.
+
+        Args:
+            epoch_days: Integer days since 1970-01-01, as a sequence or array, or a NumPy
+                datetime64 array; MISSING_INT32 or MISSING_INT64 marks a missing row,
+                and the values are copied
+
+        Raises:
+            RangeError: If a date is outside years 1-9999
+        """
+        values = _integer_column(epoch_days, "epoch_days", "D")
+        missing = (values == MISSING_INT64) | (values == MISSING_INT32)
+        present = values[~missing]
+        if present.size and (int(present.min()) < MIN_EPOCH_DAYS or int(present.max()) > MAX_EPOCH_DAYS):
+            raise RangeError("Date is out of range (years 1-9999)")
+        values = values.astype(numpy.int32)
+        values[missing] = MISSING_INT32
+        values.flags.writeable = False
+        object.__setattr__(self, "_values", values)
+
+    @classmethod
+    def from_dates(cls, dates: Iterable[Optional[PlainDate]]) -> "PlainDateArray":
+        """Create a PlainDateArray from PlainDate objects, with None for missing rows."""
+        values = []
+        append = values.append
+        for date in dates:
+            if date is None:
+                append(MISSING_INT32)
+            elif isinstance(date, PlainDate):
+                append(date._epoch_days)
+            else:
+                raise InvalidArgumentError("Expected PlainDate object or None")
+        return cls._from_values(numpy.array(values, dtype=numpy.int32))
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str], errors: Optional[Dict[int, TemporalError]] = None) -> "PlainDateArray":
+        """Parse ISO 8601 date strings into a PlainDateArray.
+
+        Args:
+            strings: ISO 8601 date strings
+            errors: If given, failed rows are recorded here as ``{index: error}`` and left
+                missing instead of raising
+
+        Returns:
+            A PlainDateArray aligned with the input strings
+        """
+        values = PlainDate.parse_many(strings, output="numpy", errors=errors)
+        missing = values == MISSING_INT64
+        values = values.astype(numpy.int32)
+        values[missing] = MISSING_INT32
+        return cls._from_values(values)
+
+    @property
+    def epoch_days(self) -> Any:
+        """Get the read-only int32 array of days since 1970-01-01."""
+        return self._values
+
+    def to_dates(self) -> List[Optional[PlainDate]]:
+        """Convert to a list of PlainDate objects, with None for missing rows."""
+        return self._to_objects()
+
+    def _scalar(self, value: int) -> PlainDate:
+        return PlainDate._from_epoch_days(value, ISO_CALENDAR)
+
+    def _scalar_value(self, other: Any) -> Any:
+        if not isinstance(other, PlainDate):
+            return NotImplemented
+        return other._epoch_days
+
+    def _format(self, values: Any) -> Any:
+        return numpy.datetime_as_string(values.astype("datetime64[D]"))
+
+    def _filled(self) -> Any:
+        """Get the column with missing rows set to day 0, and the missing mask (None when no row is missing)."""
+        missing = self._missing_mask()
+        if not missing.any():
+            return self._values, None
+        return numpy.where(missing, 0, self._values), missing
+
+    @staticmethod
+    def _zero_missing(field: Any, missing: Any) -> Any:
+        """Set a decoded field to 0 on missing rows."""
+        if missing is not None:
+            field[missing] = 0
+        return field
+
+    @property
+    def year(self) -> Any:
+        """Get the year of every row as an int32 array."""
+        values, missing = self._filled()
+        return self._zero_missing(_civil_from_days(values)[0], missing)
+
+    @property
+    def month(self) -> Any:
+        """Get the month (1-12) of every row as an int32 array."""
+        values, missing = self._filled()
+        return self._zero_missing(_civil_from_days(values)[1], missing)
+
+    @property
+    def day(self) -> Any:
+        """Get the day of the month of every row as an int32 array."""
+        values, missing = self._filled()
+        return self._zero_missing(_civil_from_days(values)[2], missing)
+
+    @property
+    def day_of_week(self) -> Any:
+        """Get the day of the week (1=Monday, 7=Sunday) of every row as an int32 array."""
+        values, missing = self._filled()
+        # 1970-01-01 was a Thursday
+        return self._zero_missing((values + 3) % 7 + 1, missing)
+
+    @property
+    def day_of_year(self) -> Any:
+        """Get the day of the year (1-366) of every row as an int32 array."""
+        values, missing = self._filled()
+        year = _civil_from_days(values)[0]
+        return self._zero_missing(values - _epoch_days_of_january_1(year) + 1, missing)
+
+    @property
+    def week_of_year(self) -> Any:
+        """Get the ISO week number of every row as an int32 array."""
+        values, missing = self._filled()
+        # An ISO week belongs to the year of its Thursday, and counts from that year's first Thursday
+        thursday = values - (values + 3) % 7 + 3
+        year = _civil_from_days(thursday)[0]
+        return self._zero_missing((thursday - _epoch_days_of_january_1(year)) // 7 + 1, missing)
+
+    def add(self, duration: Duration) -> "PlainDateArray":
+        """Add a duration to every row, as ``PlainDate.add`` does.
+
+        Years and months move each date by whole months first, clamping the day
+        to the end of the target month; days are then added as an ordinal offset.
+
+        Raises:
+            RangeError: If a result is outside years 1-9999
+        """
+        if not isinstance(duration, Duration):
+            raise InvalidArgumentError("Expected Duration object")
+        months = duration.years * 12 + duration.months
+        days = duration.days
+        values, missing = self._filled()
+        if (not months and not days) or (missing is not None and missing.all()):
+            return self
+        # No shift this large keeps any valid date within years 1-9999
+        if abs(months) >= 12 * 9999 or abs(days) > MAX_EPOCH_DAYS - MIN_EPOCH_DAYS:
+            raise RangeError("Date is out of range (years 1-9999)")
+
+        if months:
+            year, month, day = _civil_from_days(values)
+            year, month_index = numpy.divmod(year * 12 + (month - 1) + months, 12)
+            if missing is not None:
+                year[missing] = 1970
+            if int(year.min()) < 1 or int(year.max()) > 9999:
+                raise RangeError("Date is out of range (years 1-9999)")
+            days_in_month = _DAYS_IN_MONTH[month_index] + ((month_index == 1) & _is_leap_year(year))
+            values = _days_from_civil(year, month_index + 1, numpy.minimum(day, days_in_month))
+        result = values.astype(numpy.int64) + days
+        if missing is not None:
+            result[missing] = 0
+        if int(result.min()) < MIN_EPOCH_DAYS or int(result.max()) > MAX_EPOCH_DAYS:
+            raise RangeError("Date is out of range (years 1-9999)")
+        result = result.astype(numpy.int32)
+        if missing is not None:
+            result[missing] = MISSING_INT32
+        return self._from_values(result)
+
+    def subtract(self, duration: Duration) -> "PlainDateArray":
+        """Subtract a duration from every row, as ``PlainDate.subtract`` does."""
+        if not isinstance(duration, Duration):
+            raise InvalidArgumentError("Expected Duration object")
+        return self.add(duration.negated())
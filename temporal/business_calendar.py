@@ -0,0 +1,176 @@
+"""
+Business-day calendar for the Temporal API.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Tuple, Union
+
+from .calendar import ISO_CALENDAR
+from .exceptions import InvalidArgumentError
+from .plain_date import PlainDate
+from .utils import Immutable
+
+# Offset that makes (epoch_days + _MONDAY_SHIFT) % 7 == 0 on Mondays; 1970-01-01 was a Thursday
+_MONDAY_SHIFT = 3
+
+
+class BusinessCalendar(Immutable):
+    """Business-day arithmetic over PlainDate with a weekend mask and a holiday set.
+
+    Every query reduces to a rank: the number of business days before a date.
+    Ranks come from a per-weekday prefix count over the repeating weekly cycle
+    minus a binary search over the sorted holiday ordinals, so no query steps
+    day by day.
+    """
+
+    __slots__ = (
+        "_weekend",
+        "_workday_mask",
+        "_week_prefix",
+        "_week_select",
+        "_holidays",
+        "_holiday_ranks",
+        "_holiday_set",
+    )
+
+    def __init__(self, weekend: Iterable[int] = (6, 7), holidays: Iterable[Union[PlainDate, str]] = ()):
+        """Initialize a business calendar.
+
+        Args:
+            weekend: ISO days of the week (1=Monday, 7=Sunday) that are never business days
+            holidays: Dates, or ISO 8601 date strings, that are not business days;
+                holidays falling on a weekend are ignored
+        """
+        weekend_days = set()
+        for day in weekend:
+            if type(day) is not int or not 1 <= day <= 7:
+                raise InvalidArgumentError(f"Weekend days must be integers 1-7, got {day!r}")
+            weekend_days.add(day)
+        if len(weekend_days) == 7:
+            raise InvalidArgumentError("weekend must leave at least one business day per week")
+
+        workday_mask = tuple(day not in weekend_days for day in range(1, 8))
+        # _week_prefix[i]: workdays among the first i days of a Monday-based week
+        # _week_select[i]: offset from Monday of the i-th workday of the week
+        week_prefix = [0]
+        for is_workday in workday_mask:
+            week_prefix.append(week_prefix[-1] + is_workday)
+        week_select = tuple(offset for offset, is_workday in enumerate(workday_mask) if is_workday)
+
+        holiday_days = set()
+        for holiday in holidays:
+            if isinstance(holiday, str):
+                holiday = PlainDate.from_string(holiday)
+            elif not isinstance(holiday, PlainDate):
+                raise InvalidArgumentError("Expected PlainDate object or ISO date string for holiday")
+            epoch_days = holiday._epoch_days
+            if workday_mask[(epoch_days + _MONDAY_SHIFT) % 7]:
+                holiday_days.add(epoch_days)
+
+        per_week = week_prefix[7]
+        sorted_holidays = tuple(sorted(holiday_days))
+        # _holiday_ranks[i]: business days before the i-th holiday, its workday count minus the earlier holidays
+        holiday_ranks = []
+        for index, epoch_days in enumerate(sorted_holidays):
+            weeks, offset = divmod(epoch_days + _MONDAY_SHIFT, 7)
+            holiday_ranks.append(weeks * per_week + week_prefix[offset] - index)
+
+        object.__setattr__(self, "_weekend", tuple(sorted(weekend_days)))
+        object.__setattr__(self, "_workday_mask", workday_mask)
+        object.__setattr__(self, "_week_prefix", tuple(week_prefix))
+        object.__setattr__(self, "_week_select", week_select)
+        object.__setattr__(self, "_holidays", sorted_holidays)
+        object.__setattr__(self, "_holiday_ranks", tuple(holiday_ranks))
+        object.__setattr__(self, "_holiday_set", frozenset(holiday_days))
+
+    @property
+    def weekend(self) -> Tuple[int, ...]:
+        """Get the weekend days (1=Monday, 7=Sunday)."""
+        return self._weekend
+
+    @property
+    def holidays(self) -> Tuple[PlainDate, ...]:
+        """Get the holidays that fall on working weekdays, in order."""
+        return tuple(PlainDate._from_epoch_days(epoch_days, ISO_CALENDAR) for epoch_days in self._holidays)
+
+    def _rank(self, epoch_days: int) -> int:
+        """Get the number of business days before a day, counted from an arbitrary fixed origin."""
+        weeks, offset = divmod(epoch_days + _MONDAY_SHIFT, 7)
+        return weeks * self._week_prefix[7] + self._week_prefix[offset] - bisect_left(self._holidays, epoch_days)
+
+    def _select(self, rank: int) -> int:
+        """Get the business day whose rank is ``rank``; the inverse of ``_rank`` on business days."""
+        # A holiday precedes the answer exactly when at most ``rank`` business days come before it,
+        # and each one that does shifts the answer one workday later
+        skipped = bisect_right(self._holiday_ranks, rank)
+        weeks, index = divmod(rank + skipped, self._week_prefix[7])
+        return weeks * 7 + self._week_select[index] - _MONDAY_SHIFT
+
+    def is_business_day(self, date: PlainDate) -> bool:
+        """Check whether a date is neither a weekend day nor a holiday."""
+        if not isinstance(date, PlainDate):
+            raise InvalidArgumentError("Expected PlainDate object")
+        epoch_days = date._epoch_days
+        return self._workday_mask[(epoch_days + _MONDAY_SHIFT) % 7] and epoch_days not in self._holiday_set
+
+    def add_business_days(self, date: PlainDate, days: int) -> PlainDate:
+        """Move a date by a number of business days.
+
+        Args:
+            date: The starting date, which need not be a business day
+            days: Business days to move; positive moves forward, negative backward,
+                and zero rolls a non-business day forward to the next business day
+
+        Returns:
+            The resulting business day
+
+        Raises:
+            RangeError: If the result is outside years 1-9999
+        """
+        if not isinstance(date, PlainDate):
+            raise InvalidArgumentError("Expected PlainDate object")
+        if type(days) is not int:
+            raise InvalidArgumentError("days must be an integer")
+        epoch_days = date._epoch_days
+        if days > 0:
+            rank = self._rank(epoch_days + 1) + days - 1
+        elif days < 0:
+            rank = self._rank(epoch_days) + days
+        else:
+            # The first business day on or after the date
+            rank = self._rank(epoch_days)
+        return PlainDate._from_epoch_days(self._select(rank), date._calendar)
+
+    def next_business_day(self, date: PlainDate) -> PlainDate:
+        """Get the first business day after a date."""
+        return self.add_business_days(date, 1)
+
+    def previous_business_day(self, date: PlainDate) -> PlainDate:
+        """Get the last business day before a date."""
+        return self.add_business_days(date, -1)
+
+    def business_days_between(self, start: PlainDate, end: PlainDate) -> int:
+        """Count the business days from ``start`` up to, but not including, ``end``.
+
+        The count is negative when ``end`` is before ``start``.
+        """
+        if not isinstance(start, PlainDate) or not isinstance(end, PlainDate):
+            raise InvalidArgumentError("Expected PlainDate object")
+        return self._rank(end._epoch_days) - self._rank(start._epoch_days)
+
+    def __eq__(self, other: object) -> bool:
+        """Check equality with another business calendar."""
+        if not isinstance(other, BusinessCalendar):
+            return False
+        return self._weekend == other._weekend and self._holidays == other._holidays
+
+    def __hash__(self) -> int:
+        """Hash function for BusinessCalendar."""
+        return hash((self._weekend, len(self._holidays)))
+
+    def __reduce__(self):
+        return (type(self), (self._weekend, self.holidays))
+
+    def __repr__(self) -> str:
+        """Return detailed string representation."""
+        return f"BusinessCalendar(weekend={self._weekend}, holidays={len(self._holidays)})"
@@ -5,16 +5,40 @@ Calendar system implementation for the Temporal API.
 from typing import Any, Dict
 
 from .exceptions import InvalidArgumentError
+from .utils import Immutable
 
+# Shared instances of every supported calendar, keyed by identifier
+_calendars: Dict[str, "Calendar"] = {}
 
-class Calendar:
-    """Represents a calendar system."""
 
-    def __init__(self, identifier: str = "iso8601"):
-        """Initialize a Calendar with the given identifier."""
-        if identifier not in ["iso8601"]:
+class Calendar(Immutable):
+    """Represents a calendar system.
+
+    Calendars are immutable singletons: ``Calendar("iso8601")`` always returns
+    the same shared instance, so value types can compare calendars by identity.
+    """
+
+    __slots__ = ("_identifier",)
+
+    def __new__(cls, identifier: str = "iso8601") -> "Calendar":
+        """Return the shared Calendar for the given identifier."""
+        if not isinstance(identifier, str):
+            raise InvalidArgumentError("Calendar identifier must be a string")
+        calendar = _calendars.get(identifier)
+        if calendar is None:
             raise InvalidArgumentError(f"Unsupported calendar: {identifier}")
-        self._identifier = identifier
+        return calendar
+
+    @classmethod
+    def _create(cls, identifier: str) -> "Calendar":
+        """Create and register the singleton for a supported calendar."""
+        calendar = super().__new__(cls)
+        object.__setattr__(calendar, "_identifier", identifier)
+        _calendars[identifier] = calendar
+        return calendar
+
+    def __reduce__(self):
+        return (Calendar, (self._identifier,))
 
     @property
     def id(self) -> str:
@@ -31,6 +55,8 @@ class Calendar:
 
     def __eq__(self, other: object) -> bool:
         """Check equality with another calendar."""
+        if self is other:
+            return True
         if not isinstance(other, Calendar):
             return False
         return self._identifier == other._identifier
@@ -43,3 +69,6 @@ class Calendar:
     def from_string(cls, calendar_string: str) -> "Calendar":
         """Create a Calendar from a string identifier."""
         return cls(calendar_string)
+
+
+ISO_CALENDAR = Calendar._create("iso8601")
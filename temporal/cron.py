@@ -0,0 +1,532 @@
+"""
+Cron expressions for the Temporal API.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .exceptions import InvalidArgumentError
+from .plain_date_time import PlainDateTime
+from .utils import (
+    MISSING_INT64,
+    NS_PER_DAY,
+    NS_PER_SECOND,
+    Immutable,
+    check_batch_output,
+    civil_from_days,
+    days_from_civil,
+    get_days_in_month,
+    import_numpy,
+)
+from .zoned_date_time import ZonedDateTime, _resolve_local_nanoseconds
+
+_MONTH_NAMES = ("JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC")
+_WEEKDAY_NAMES = ("SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT")
+
+# Years searched before concluding that an expression never fires; the Gregorian calendar repeats every 400
+_SEARCH_YEARS = 400
+
+Fields = Tuple[int, int, int, int, int, int]
+
+
+def _parse_value(text: str, low: int, high: int, names: Sequence[str] = (), name_base: int = 0) -> int:
+    """Parse a single number or name within ``low..high``."""
+    upper = text.upper()
+    if upper in names:
+        return names.index(upper) + name_base
+    if not text.isdigit():
+        raise InvalidArgumentError(f"Invalid cron value: {text!r}")
+    value = int(text)
+    if not low <= value <= high:
+        raise InvalidArgumentError(f"Cron value {value} is out of range ({low}-{high})")
+    return value
+
+
+def _parse_field(text: str, low: int, high: int, names: Sequence[str] = (), name_base: int = 0) -> Tuple[int, ...]:
+    """Parse a list of values, ranges (``a-b``) and steps (``*/n``, ``a-b/n``, ``a/n``) into sorted values."""
+    values = set()
+    for part in text.split(","):
+        spec, _, step_text = part.partition("/")
+        step = _parse_value(step_text, 1, high - low + 1) if step_text else 1
+        if spec in ("*", "?"):
+            first, last = low, high
+        elif "-" in spec:
+            first_text, _, last_text = spec.partition("-")
+            first = _parse_value(first_text, low, high, names, name_base)
+            last = _parse_value(last_text, low, high, names, name_base)
+            if last < first:
+                raise InvalidArgumentError(f"Invalid cron range: {spec!r}")
+        else:
+            first = _parse_value(spec, low, high, names, name_base)
+            last = high if step_text else first
+        values.update(range(first, last + 1, step))
+    return tuple(sorted(values))
+
+
+def _split_fields(year: int, month: int, day: int, nanosecond_of_day: int) -> Fields:
+    """Get (year, month, day, hour, minute, second) from a date and a nanosecond of the day."""
+    second_of_day = nanosecond_of_day // NS_PER_SECOND
+    return year, month, day, second_of_day // 3600, second_of_day // 60 % 60, second_of_day % 60
+
+
+def _fields_of_wall(wall: int) -> Fields:
+    """Get (year, month, day, hour, minute, second) of wall-clock nanoseconds since 1970-01-01T00:00."""
+    days, nanosecond_of_day = divmod(wall, NS_PER_DAY)
+    return _split_fields(*civil_from_days(days), nanosecond_of_day)
+
+
+def _wall_of_fields(fields: Fields) -> int:
+    """Get wall-clock nanoseconds since 1970-01-01T00:00 of (year, month, day, hour, minute, second)."""
+    year, month, day, hour, minute, second = fields
+    return days_from_civil(year, month, day) * NS_PER_DAY + ((hour * 60 + minute) * 60 + second) * NS_PER_SECOND
+
+
+class CronExpression(Immutable):
+    """A cron schedule evaluated on the wall clock of a time zone.
+
+    Accepts the classic five fields (minute, hour, day of month, month, day of
+    week) or six with a leading seconds field, with names, lists, ranges,
+    steps and the ``L``, ``W`` and ``#`` extensions. As in Vixie cron, when
+    neither day field starts with ``*`` a day matching either field fires;
+    otherwise a day must match both.
+
+    Fire times are found by field-wise carry: the first allowed month, then
+    day, hour, minute and second, moving to the next unit whenever a field runs
+    out. Wall-clock times are resolved like ZonedDateTime: a time skipped by a
+    forward transition fires at the same wall time after the gap, and a job with a
+    fixed minute and hour fires once in the hour a backward transition repeats,
+    while interval jobs (``*/15 * * * *``) keep firing through both passes, as
+    in Vixie cron.
+    """
+
+    __slots__ = (
+        "_expression",
+        "_seconds",
+        "_minutes",
+        "_hours",
+        "_months",
+        "_month_days",
+        "_last_day",
+        "_nearest_weekdays",
+        "_last_weekday_of_month",
+        "_weekdays",
+        "_last_weekdays",
+        "_nth_weekdays",
+        "_day_star",
+        "_weekday_star",
+        "_every_day",
+        "_fixed_time",
+        "_month_cache",
+    )
+
+    def __init__(self, expression: str):
+        """Initialize a cron expression from its 5- or 6-field text (e.g. ``"30 9 * * MON-FRI"``)."""
+        if not isinstance(expression, str):
+            raise InvalidArgumentError("Expected string")
+        fields = expression.split()
+        if len(fields) == 5:
+            fields.insert(0, "0")
+        elif len(fields) != 6:
+            raise InvalidArgumentError(f"Cron expressions have 5 or 6 fields: {expression!r}")
+        second, minute, hour, day, month, weekday = fields
+
+        set_slot = object.__setattr__
+        set_slot(self, "_expression", " ".join(expression.split()))
+        set_slot(self, "_seconds", _parse_field(second, 0, 59))
+        set_slot(self, "_minutes", _parse_field(minute, 0, 59))
+        set_slot(self, "_hours", _parse_field(hour, 0, 23))
+        set_slot(self, "_months", _parse_field(month, 1, 12, _MONTH_NAMES, 1))
+        self._parse_day_of_month(day)
+        self._parse_day_of_week(weekday)
+        set_slot(self, "_every_day", day in ("*", "?") and weekday in ("*", "?"))
+        set_slot(self, "_fixed_time", minute.isdigit() and hour.isdigit())
+        set_slot(self, "_month_cache", None)
+
+    def _parse_day_of_month(self, text: str) -> None:
+        """Parse the day-of-month field, including ``L``, ``LW`` and ``nW``."""
+        month_days: List[int] = []
+        nearest: List[int] = []
+        last_day = last_weekday = False
+        for part in text.split(","):
+            upper = part.upper()
+            if upper == "L":
+                last_day = True
+            elif upper == "LW":
+                last_weekday = True
+            elif upper.endswith("W"):
+                nearest.append(_parse_value(upper[:-1], 1, 31))
+            else:
+                month_days.extend(_parse_field(part, 1, 31))
+        object.__setattr__(self, "_month_days", tuple(sorted(set(month_days))))
+        object.__setattr__(self, "_nearest_weekdays", tuple(sorted(set(nearest))))
+        object.__setattr__(self, "_last_day", last_day)
+        object.__setattr__(self, "_last_weekday_of_month", last_weekday)
+        object.__setattr__(self, "_day_star", text[0] in "*?")
+
+    def _parse_day_of_week(self, text: str) -> None:
+        """Parse the day-of-week field (0 or 7 = Sunday), including ``nL`` and ``n#k``; stores ISO weekdays."""
+        weekdays: List[int] = []
+        last: List[int] = []
+        nth: List[Tuple[int, int]] = []
+        for part in text.split(","):
+            upper = part.upper()
+            if "#" in upper:
+                weekday_text, _, ordinal_text = upper.partition("#")
+                weekday = _parse_value(weekday_text, 0, 7, _WEEKDAY_NAMES)
+                nth.append((weekday % 7 or 7, _parse_value(ordinal_text, 1, 5)))
+            elif len(upper) > 1 and upper.endswith("L"):
+                last.append(_parse_value(upper[:-1], 0, 7, _WEEKDAY_NAMES) % 7 or 7)
+            else:
+                weekdays.extend(value % 7 or 7 for value in _parse_field(part, 0, 7, _WEEKDAY_NAMES))
+        object.__setattr__(self, "_weekdays", frozenset(weekdays))
+        object.__setattr__(self, "_last_weekdays", frozenset(last))
+        object.__setattr__(self, "_nth_weekdays", tuple(sorted(set(nth))))
+        object.__setattr__(self, "_weekday_star", text[0] in "*?")
+
+    @property
+    def expression(self) -> str:
+        """Get the expression text."""
+        return self._expression
+
+    def _days_of_month(self, year: int, month: int) -> Sequence[int]:
+        """Get the sorted days of a month on which the expression fires."""
+        cached = self._month_cache
+        if cached is not None and cached[0] == year and cached[1] == month:
+            return cached[2]
+        length = get_days_in_month(year, month)
+        if self._every_day:
+            days: Sequence[int] = range(1, length + 1)
+        else:
+            # ISO weekday of the first of the month; 1970-01-01 was a Thursday
+            first_weekday = (days_from_civil(year, month, 1) + 3) % 7 + 1
+            month_days = {day for day in self._month_days if day <= length}
+            if self._last_day:
+                month_days.add(length)
+            if self._last_weekday_of_month:
+                weekday = (first_weekday + length - 2) % 7 + 1
+                month_days.add(length - max(0, weekday - 5))
+            for day in self._nearest_weekdays:
+                if day <= length:
+                    month_days.add(self._nearest_weekday(day, length, (first_weekday + day - 2) % 7 + 1))
+            weekdays = {day for day in range(1, length + 1) if (first_weekday + day - 2) % 7 + 1 in self._weekdays}
+            for weekday in self._last_weekdays:
+                weekdays.add(length - (first_weekday + length - 1 - weekday) % 7)
+            for weekday, ordinal in self._nth_weekdays:
+                day = 1 + (weekday - first_weekday) % 7 + 7 * (ordinal - 1)
+                if day <= length:
+                    weekdays.add(day)
+            # Vixie cron: a day field starting with "*" narrows the other; two restricted fields widen each other
+            if self._day_star or self._weekday_star:
+                days = tuple(sorted(month_days & weekdays))
+            else:
+                days = tuple(sorted(month_days | weekdays))
+        object.__setattr__(self, "_month_cache", (year, month, days))
+        return days
+
+    @staticmethod
+    def _nearest_weekday(day: int, length: int, weekday: int) -> int:
+        """Get the weekday (Monday-Friday) nearest to a day without leaving its month."""
+        if weekday == 6:
+            return day - 1 if day > 1 else day + 2
+        if weekday == 7:
+            return day + 1 if day < length else day - 2
+        return day
+
+    def _next_fields(self, fields: Fields) -> Optional[Fields]:
+        """Get the first firing wall-clock fields at or after the given ones, carrying into larger units."""
+        year, month, day, hour, minute, second = fields
+        months, hours, minutes, seconds = self._months, self._hours, self._minutes, self._seconds
+        last_year = min(year + _SEARCH_YEARS, 9999)
+        while year <= last_year:
+            index = bisect_left(months, month)
+            if index == len(months):
+                year, month, day, hour, minute, second = year + 1, 1, 1, 0, 0, 0
+                continue
+            if months[index] != month:
+                month, day, hour, minute, second = months[index], 1, 0, 0, 0
+            days = self._days_of_month(year, month)
+            index = bisect_left(days, day)
+            if index == len(days):
+                if month == 12:
+                    year, month = year + 1, 1
+                else:
+                    month += 1
+                day, hour, minute, second = 1, 0, 0, 0
+                continue
+            if days[index] != day:
+                day, hour, minute, second = days[index], 0, 0, 0
+            index = bisect_left(hours, hour)
+            if index == len(hours):
+                day, hour, minute, second = day + 1, 0, 0, 0
+                continue
+            if hours[index] != hour:
+                hour, minute, second = hours[index], 0, 0
+            index = bisect_left(minutes, minute)
+            if index == len(minutes):
+                hour, minute, second = hour + 1, 0, 0
+                continue
+            if minutes[index] != minute:
+                minute, second = minutes[index], 0
+            index = bisect_left(seconds, second)
+            if index == len(seconds):
+                minute, second = minute + 1, 0
+                continue
+            return year, month, day, hour, minute, seconds[index]
+        return None
+
+    def _previous_fields(self, fields: Fields) -> Optional[Fields]:
+        """Get the last firing wall-clock fields at or before the given ones, borrowing from larger units."""
+        year, month, day, hour, minute, second = fields
+        months, hours, minutes, seconds = self._months, self._hours, self._minutes, self._seconds
+        first_year = max(year - _SEARCH_YEARS, 1)
+        while year >= first_year:
+            index = bisect_right(months, month) - 1
+            if index < 0:
+                year, month, day, hour, minute, second = year - 1, 12, 31, 23, 59, 59
+                continue
+            if months[index] != month:
+                month, day, hour, minute, second = months[index], 31, 23, 59, 59
+            days = self._days_of_month(year, month)
+            index = bisect_right(days, day) - 1
+            if index < 0:
+                if month == 1:
+                    year, month = year - 1, 12
+                else:
+                    month -= 1
+                day, hour, minute, second = 31, 23, 59, 59
+                continue
+            if days[index] != day:
+                day, hour, minute, second = days[index], 23, 59, 59
+            index = bisect_right(hours, hour) - 1
+            if index < 0:
+                day, hour, minute, second = day - 1, 23, 59, 59
+                continue
+            if hours[index] != hour:
+                hour, minute, second = hours[index], 59, 59
+            index = bisect_right(minutes, minute) - 1
+            if index < 0:
+                hour, minute, second = hour - 1, 59, 59
+                continue
+            if minutes[index] != minute:
+                minute, second = minutes[index], 59
+            index = bisect_right(seconds, second) - 1
+            if index < 0:
+                minute, second = minute - 1, 59
+                continue
+            return year, month, day, hour, minute, seconds[index]
+        return None
+
+    def _next_wall(self, fields: Fields, table: Any, exact: int) -> Optional[int]:
+        """Get the first firing time at or after wall-clock fields, as exact nanoseconds when ``table`` is given."""
+        while True:
+            found = self._next_fields(fields)
+            if found is None:
+                return None
+            wall = _wall_of_fields(found)
+            if table is None:
+                return wall
+            resolved = _resolve_local_nanoseconds(wall, table)
+            if resolved > exact:
+                break
+            # After a backward transition the wall clock repeats; fixed-time jobs already fired on the first pass
+            if not self._fixed_time:
+                later = [candidate for candidate in table.possible_epoch_nanoseconds(wall) if candidate > exact]
+                if later:
+                    return later[0]
+            fields = _fields_of_wall(wall + NS_PER_SECOND)
+        if self._fixed_time:
+            return resolved
+        # Interval jobs run again through the repeated hour, which the wall-clock search above steps past
+        transition = table.transition_bounds(exact)[1]
+        if transition is None or transition >= resolved:
+            return resolved
+        offset = table.offset_nanoseconds_at(transition)
+        if offset >= table.offset_nanoseconds_at(transition - 1):
+            return resolved
+        found = self._next_fields(_fields_of_wall(transition + offset))
+        if found is not None:
+            repeated = _wall_of_fields(found) - offset
+            if repeated < resolved and table.offset_nanoseconds_at(repeated) == offset:
+                return repeated
+        return resolved
+
+    def _previous_wall(self, fields: Fields, table: Any, exact: int) -> Optional[int]:
+        """Get the last firing time at or before wall-clock fields, as exact nanoseconds when ``table`` is given."""
+        while True:
+            found = self._previous_fields(fields)
+            if found is None:
+                return None
+            wall = _wall_of_fields(found)
+            if table is None:
+                return wall
+            if not self._fixed_time:
+                # Interval jobs fire on both passes through a repeated hour; take the later one that has passed
+                earlier = [candidate for candidate in table.possible_epoch_nanoseconds(wall) if candidate < exact]
+                if earlier:
+                    resolved = earlier[-1]
+                    break
+            resolved = _resolve_local_nanoseconds(wall, table)
+            # Wall times inside a forward gap resolve to after it, possibly past the bound
+            if resolved < exact:
+                break
+            fields = _fields_of_wall(wall - NS_PER_SECOND)
+        if self._fixed_time:
+            return resolved
+        # The first pass through a repeated hour lies at wall times after those the search above stepped back from
+        transition = table.transition_bounds(exact)[0]
+        if transition is None or transition <= resolved:
+            return resolved
+        offset = table.offset_nanoseconds_at(transition - 1)
+        if offset <= table.offset_nanoseconds_at(transition):
+            return resolved
+        found = self._previous_fields(_fields_of_wall(transition + offset - NS_PER_SECOND))
+        if found is not None:
+            repeated = _wall_of_fields(found) - offset
+            if repeated > resolved and table.offset_nanoseconds_at(repeated) == offset:
+                return repeated
+        return resolved
+
+    @staticmethod
+    def _reference(value: Union[ZonedDateTime, PlainDateTime], forward: bool) -> Tuple[Fields, Any, int]:
+        """Get the wall-clock fields to search from, the transition table (or None) and the exact nanoseconds of a value."""
+        if isinstance(value, ZonedDateTime):
+            table = value._timezone.transition_table
+            exact = value._epoch_nanoseconds
+            wall = exact + table.offset_nanoseconds_at(exact)
+        elif isinstance(value, PlainDateTime):
+            table = None
+            exact = wall = days_from_civil(value._year, value._month, value._day) * NS_PER_DAY + value._nanosecond_of_day()
+        else:
+            raise InvalidArgumentError("Expected ZonedDateTime or PlainDateTime object")
+        # Fire times are whole seconds; search from the first one strictly after (or last strictly before) the value
+        if forward:
+            wall = (wall // NS_PER_SECOND + 1) * NS_PER_SECOND
+        else:
+            wall = -(-wall // NS_PER_SECOND) * NS_PER_SECOND - NS_PER_SECOND
+        return _fields_of_wall(wall), table, exact
+
+    def _evaluate(self, value: Union[ZonedDateTime, PlainDateTime], forward: bool) -> Optional[int]:
+        """Get the next or previous fire time around a value, as nanoseconds in the value's terms."""
+        fields, table, exact = self._reference(value, forward)
+        return self._next_wall(fields, table, exact) if forward else self._previous_wall(fields, table, exact)
+
+    @staticmethod
+    def _build(value: Union[ZonedDateTime, PlainDateTime], result: Optional[int]) -> Any:
+        """Create a result of the same type (and zone) as the reference value."""
+        if result is None:
+            return None
+        if isinstance(value, ZonedDateTime):
+            return ZonedDateTime._from_epoch_nanoseconds(result, value._timezone, value._calendar)
+        return PlainDateTime._from_epoch_days_and_nanoseconds(0, result, value._calendar)
+
+    def next_after(self, value: Union[ZonedDateTime, PlainDateTime]) -> Optional[Union[ZonedDateTime, PlainDateTime]]:
+        """Get the first fire time strictly after a value.
+
+        Args:
+            value: A ZonedDateTime (evaluated on its zone's wall clock) or a PlainDateTime
+
+        Returns:
+            A value of the same type and zone, or None if the expression never fires within 400 years
+        """
+        return self._build(value, self._evaluate(value, True))
+
+    def previous_before(self, value: Union[ZonedDateTime, PlainDateTime]) -> Optional[Union[ZonedDateTime, PlainDateTime]]:
+        """Get the last fire time strictly before a value.
+
+        Args:
+            value: A ZonedDateTime (evaluated on its zone's wall clock) or a PlainDateTime
+
+        Returns:
+            A value of the same type and zone, or None if the expression never fired within 400 years
+        """
+        return self._build(value, self._evaluate(value, False))
+
+    @classmethod
+    def next_after_many(
+        cls,
+        expressions: Iterable[Union["CronExpression", str]],
+        value: Union[ZonedDateTime, PlainDateTime],
+        *,
+        output: str = "objects",
+    ) -> Union[List[Any], Any]:
+        """Get the first fire time after one value for many expressions.
+
+        The reference value is decomposed once and shared by every expression.
+
+        Args:
+            expressions: CronExpression objects or expression strings
+            value: The reference ZonedDateTime or PlainDateTime
+            output: ``"objects"`` for a list of values (None where an expression never fires),
+                ``"array"`` for an ``array('q')`` or ``"numpy"`` for a NumPy int64 array of epoch
+                nanoseconds (wall-clock nanoseconds for a PlainDateTime), with ``MISSING_INT64``
+                where an expression never fires
+
+        Returns:
+            A list or column aligned with ``expressions``
+        """
+        return cls._evaluate_many(expressions, value, output, True)
+
+    @classmethod
+    def previous_before_many(
+        cls,
+        expressions: Iterable[Union["CronExpression", str]],
+        value: Union[ZonedDateTime, PlainDateTime],
+        *,
+        output: str = "objects",
+    ) -> Union[List[Any], Any]:
+        """Get the last fire time before one value for many expressions; see ``next_after_many``."""
+        return cls._evaluate_many(expressions, value, output, False)
+
+    @classmethod
+    def _evaluate_many(
+        cls,
+        expressions: Iterable[Union["CronExpression", str]],
+        value: Union[ZonedDateTime, PlainDateTime],
+        output: str,
+        forward: bool,
+    ) -> Union[List[Any], Any]:
+        """Evaluate many expressions against one value."""
+        check_batch_output(output)
+        fields, table, exact = cls._reference(value, forward)
+
+        columnar = output != "objects"
+        results: Any = array("q") if columnar else []
+        append = results.append
+        for expression in expressions:
+            if not isinstance(expression, CronExpression):
+                expression = cls(expression)
+            if forward:
+                result = expression._next_wall(fields, table, exact)
+            else:
+                result = expression._previous_wall(fields, table, exact)
+            if columnar:
+                append(MISSING_INT64 if result is None else result)
+            else:
+                append(cls._build(value, result))
+
+        if output == "numpy":
+            numpy = import_numpy()
+            return numpy.frombuffer(results, dtype=numpy.int64)
+        return results
+
+    def __eq__(self, other: object) -> bool:
+        """Check equality with another cron expression."""
+        if not isinstance(other, CronExpression):
+            return False
+        return self._expression == other._expression
+
+    def __hash__(self) -> int:
+        """Hash function for CronExpression."""
+        return hash(self._expression)
+
+    def __reduce__(self):
+        return (type(self), (self._expression,))
+
+    def __str__(self) -> str:
+        """Return the expression text."""
+        return self._expression
+
+    def __repr__(self) -> str:
+        """Return detailed string representation."""
+        return f"CronExpression({self._expression!r})"
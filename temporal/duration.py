@@ -3,13 +3,114 @@ Duration implementation for the Temporal API.
 """
 
 import re
-from typing import Optional, Union
-
-from .exceptions import InvalidArgumentError, RangeError
-
-
-class Duration:
-    """Represents a duration of time."""
+from array import array
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple, Union
+
+from .exceptions import InvalidArgumentError
+from .utils import (
+    NS_PER_DAY,
+    NS_PER_MICROSECOND,
+    NS_PER_SECOND,
+    Immutable,
+    add_months,
+    check_batch_output,
+    days_from_civil,
+    import_numpy,
+)
+
+if TYPE_CHECKING:
+    from .tzif import TransitionTable
+
+# Constructor argument names, in positional order
+_FIELD_NAMES = ("years", "months", "weeks", "days", "hours", "minutes", "seconds", "microseconds")
+
+# Exact lengths of the units that do not depend on a calendar
+_UNIT_NANOSECONDS = {
+    "weeks": 7 * NS_PER_DAY,
+    "days": NS_PER_DAY,
+    "hours": 3600 * NS_PER_SECOND,
+    "minutes": 60 * NS_PER_SECOND,
+    "seconds": NS_PER_SECOND,
+    "microseconds": NS_PER_MICROSECOND,
+}
+
+# Calendar units as (months, days) steps, with their average length in days as a fraction
+_CALENDAR_UNIT_STEPS = {"years": (12, 0), "months": (1, 0), "weeks": (0, 7), "days": (0, 1)}
+_AVERAGE_UNIT_DAYS = {"years": (146097, 400), "months": (146097, 4800), "weeks": (7, 1), "days": (1, 1)}
+
+
+# ISO 8601 duration, matched against the upper-cased string
+_DURATION_PATTERN = re.compile(
+    r"^P(?:(\d+)Y)?(?:(\d+)M)?(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?)?$"
+)
+
+
+def _parse_duration(text: str) -> Optional[Tuple[int, ...]]:
+    """Parse an upper-cased ISO 8601 duration into ``Duration._from_fields`` arguments, or None if it does not match."""
+    match = _DURATION_PATTERN.match(text)
+    if match is None:
+        return None
+
+    years, months, weeks, days, hours, minutes, seconds = match.groups()
+
+    # Handle fractional seconds
+    if seconds:
+        seconds_float = float(seconds)
+        seconds_int = int(seconds_float)
+        microseconds = int((seconds_float - seconds_int) * 1000000)
+    else:
+        seconds_int = 0
+        microseconds = 0
+
+    return (
+        int(years) if years else 0,
+        int(months) if months else 0,
+        int(weeks) if weeks else 0,
+        int(days) if days else 0,
+        int(hours) if hours else 0,
+        int(minutes) if minutes else 0,
+        seconds_int,
+        microseconds,
+    )
+
+
+def _time_nanoseconds(hours: int, minutes: int, seconds: int, microseconds: int) -> int:
+    """Get the exact nanosecond length of the time fields."""
+    return ((hours * 60 + minutes) * 60 + seconds) * NS_PER_SECOND + microseconds * NS_PER_MICROSECOND
+
+
+def _checked_fields(values: Tuple[Union[int, float], ...]) -> Tuple[int, ...]:
+    """Check constructor arguments and truncate floats to int, warning when precision is lost."""
+    fields = []
+    for name, value in zip(_FIELD_NAMES, values):
+        if not isinstance(value, (int, float)):
+            raise InvalidArgumentError(f"{name} must be a number")
+        # Warn about precision loss when converting floats to ints
+        if isinstance(value, float) and value != int(value):
+            import warnings
+
+            warnings.warn(
+                f"Converting {name} from float {value} to int {int(value)} - precision may be lost",
+                UserWarning,
+                stacklevel=3,
+            )
+        fields.append(int(value))
+    return tuple(fields)
+
+
+class Duration(Immutable):
+    """Represents a duration of time.
+
+    The canonical state is three integers: total months, days, and exact
+    nanoseconds, so arithmetic, comparison and hashing are integer operations.
+    The years component is kept alongside so that months are never balanced
+    into years (``Duration(months=14)`` stays ``P14M``). Whole days in the
+    nanosecond part are carried into days on construction; hours, minutes,
+    seconds and microseconds are balanced out of the nanosecond count when
+    they are read or formatted.
+    """
+
+    __slots__ = ("_months", "_days", "_nanoseconds", "_years")
 
     def __init__(
         self,
@@ -23,71 +124,63 @@ class Duration:
         microseconds: int = 0,
     ):
         """Initialize a Duration with time components."""
-        # Validate inputs
-        for name, value in [
-            ("years", years),
-            ("months", months),
-            ("weeks", weeks),
-            ("days", days),
-            ("hours", hours),
-            ("minutes", minutes),
-            ("seconds", seconds),
-            ("microseconds", microseconds),
-        ]:
-            if not isinstance(value, (int, float)):
-                raise InvalidArgumentError(f"{name} must be a number")
-            # Warn about precision loss when converting floats to ints
-            if isinstance(value, float) and value != int(value):
-                import warnings
-
-                warnings.warn(
-                    f"Converting {name} from float {value} to int {int(value)} - precision may be lost",
-                    UserWarning,
-                    stacklevel=2,
-                )
-
-        self._years = int(years)
-        self._months = int(months)
-        self._weeks = int(weeks)
-        self._days = int(days)
-        self._hours = int(hours)
-        self._minutes = int(minutes)
-        self._seconds = int(seconds)
-        self._microseconds = int(microseconds)
-
-        # Normalize the duration
-        self._normalize()
-
-    def _normalize(self) -> None:
-        """Normalize the duration components."""
-        # Normalize microseconds to seconds
-        if abs(self._microseconds) >= 1000000:
-            extra_seconds = self._microseconds // 1000000
-            self._seconds += extra_seconds
-            self._microseconds -= extra_seconds * 1000000
-
-        # Normalize seconds to minutes
-        if abs(self._seconds) >= 60:
-            extra_minutes = self._seconds // 60
-            self._minutes += extra_minutes
-            self._seconds -= extra_minutes * 60
-
-        # Normalize minutes to hours
-        if abs(self._minutes) >= 60:
-            extra_hours = self._minutes // 60
-            self._hours += extra_hours
-            self._minutes -= extra_hours * 60
-
-        # Normalize hours to days
-        if abs(self._hours) >= 24:
-            extra_days = self._hours // 24
-            self._days += extra_days
-            self._hours -= extra_days * 24
-
-        # Normalize weeks to days
-        if self._weeks != 0:
-            self._days += self._weeks * 7
-            self._weeks = 0
+        if not (
+            type(years) is type(months) is type(weeks) is type(days) is int
+            and type(hours) is type(minutes) is type(seconds) is type(microseconds) is int
+        ):
+            years, months, weeks, days, hours, minutes, seconds, microseconds = _checked_fields(
+                (years, months, weeks, days, hours, minutes, seconds, microseconds)
+            )
+
+        _assign(self, years * 12 + months, weeks * 7 + days, _time_nanoseconds(hours, minutes, seconds, microseconds), years)
+
+    @classmethod
+    def _from_fields(
+        cls,
+        years: int = 0,
+        months: int = 0,
+        weeks: int = 0,
+        days: int = 0,
+        hours: int = 0,
+        minutes: int = 0,
+        seconds: int = 0,
+        microseconds: int = 0,
+    ) -> "Duration":
+        """Create a Duration from integer components the library computed, skipping the input checks."""
+        return cls._from_parts(
+            years * 12 + months, weeks * 7 + days, _time_nanoseconds(hours, minutes, seconds, microseconds), years
+        )
+
+    @classmethod
+    def _from_parts(cls, months: int, days: int, nanoseconds: int, years: int = 0) -> "Duration":
+        """Create a Duration from total months (of which ``years`` whole years), days and nanoseconds without validation."""
+        duration = object.__new__(cls)
+        _assign(duration, months, days, nanoseconds, years)
+        return duration
+
+    @classmethod
+    def _from_nanoseconds(cls, nanoseconds: int) -> "Duration":
+        """Create a Duration from an exact nanosecond count, truncated toward zero to whole microseconds."""
+        if nanoseconds < 0:
+            return cls._from_parts(0, 0, -(-nanoseconds // NS_PER_MICROSECOND * NS_PER_MICROSECOND))
+        return cls._from_parts(0, 0, nanoseconds // NS_PER_MICROSECOND * NS_PER_MICROSECOND)
+
+    def __reduce__(self):
+        return (type(self)._from_parts, (self._months, self._days, self._nanoseconds, self._years))
+
+    def _fields(self) -> Tuple[int, int, int, int, int, int, int, int]:
+        """Get (years, months, weeks, days, hours, minutes, seconds, microseconds), each carrying its part's sign."""
+        years = self._years
+        months = self._months - 12 * years
+
+        second_of_time, nanosecond = divmod(abs(self._nanoseconds), NS_PER_SECOND)
+        minute_of_time, second = divmod(second_of_time, 60)
+        hour, minute = divmod(minute_of_time, 60)
+        microsecond = nanosecond // NS_PER_MICROSECOND
+        if self._nanoseconds < 0:
+            hour, minute, second, microsecond = -hour, -minute, -second, -microsecond
+
+        return years, months, 0, self._days, hour, minute, second, microsecond
 
     @property
     def years(self) -> int:
@@ -97,12 +190,12 @@ class Duration:
     @property
     def months(self) -> int:
         """Get the months component."""
-        return self._months
+        return self._months - 12 * self._years
 
     @property
     def weeks(self) -> int:
-        """Get the weeks component."""
-        return self._weeks
+        """Get the weeks component (weeks are always balanced into days)."""
+        return 0
 
     @property
     def days(self) -> int:
@@ -112,41 +205,41 @@ class Duration:
     @property
     def hours(self) -> int:
         """Get the hours component."""
-        return self._hours
+        return self._fields()[4]
 
     @property
     def minutes(self) -> int:
         """Get the minutes component."""
-        return self._minutes
+        return self._fields()[5]
 
     @property
     def seconds(self) -> int:
         """Get the seconds component."""
-        return self._seconds
+        return self._fields()[6]
 
     @property
     def microseconds(self) -> int:
         """Get the microseconds component."""
-        return self._microseconds
+        return self._fields()[7]
 
     def total_seconds(self) -> float:
         """Get the total duration in seconds (excluding years and months)."""
-        return self._days * 24 * 3600 + self._hours * 3600 + self._minutes * 60 + self._seconds + self._microseconds / 1000000
+        return self._total_nanoseconds() / NS_PER_SECOND
+
+    def _total_nanoseconds(self) -> int:
+        """Get the exact total duration in nanoseconds (excluding years and months)."""
+        return self._days * NS_PER_DAY + self._nanoseconds
 
     def add(self, other: "Duration") -> "Duration":
         """Add another duration to this one."""
         if not isinstance(other, Duration):
             raise InvalidArgumentError("Expected Duration object")
 
-        return Duration(
-            years=self._years + other._years,
-            months=self._months + other._months,
-            weeks=self._weeks + other._weeks,
-            days=self._days + other._days,
-            hours=self._hours + other._hours,
-            minutes=self._minutes + other._minutes,
-            seconds=self._seconds + other._seconds,
-            microseconds=self._microseconds + other._microseconds,
+        return Duration._from_parts(
+            self._months + other._months,
+            self._days + other._days,
+            self._nanoseconds + other._nanoseconds,
+            self._years + other._years,
         )
 
     def subtract(self, other: "Duration") -> "Duration":
@@ -154,42 +247,22 @@ class Duration:
         if not isinstance(other, Duration):
             raise InvalidArgumentError("Expected Duration object")
 
-        return Duration(
-            years=self._years - other._years,
-            months=self._months - other._months,
-            weeks=self._weeks - other._weeks,
-            days=self._days - other._days,
-            hours=self._hours - other._hours,
-            minutes=self._minutes - other._minutes,
-            seconds=self._seconds - other._seconds,
-            microseconds=self._microseconds - other._microseconds,
+        return Duration._from_parts(
+            self._months - other._months,
+            self._days - other._days,
+            self._nanoseconds - other._nanoseconds,
+            self._years - other._years,
         )
 
     def negated(self) -> "Duration":
         """Return a negated copy of this duration."""
-        return Duration(
-            years=-self._years,
-            months=-self._months,
-            weeks=-self._weeks,
-            days=-self._days,
-            hours=-self._hours,
-            minutes=-self._minutes,
-            seconds=-self._seconds,
-            microseconds=-self._microseconds,
-        )
+        return Duration._from_parts(-self._months, -self._days, -self._nanoseconds, -self._years)
 
     def abs(self) -> "Duration":
         """Return an absolute (positive) copy of this duration."""
-        return Duration(
-            years=abs(self._years),
-            months=abs(self._months),
-            weeks=abs(self._weeks),
-            days=abs(self._days),
-            hours=abs(self._hours),
-            minutes=abs(self._minutes),
-            seconds=abs(self._seconds),
-            microseconds=abs(self._microseconds),
-        )
+        years = abs(self._years)
+        months = years * 12 + abs(self._months - 12 * self._years)
+        return Duration._from_parts(months, abs(self._days), abs(self._nanoseconds), years)
 
     def with_fields(
         self,
@@ -204,84 +277,62 @@ class Duration:
         microseconds: Optional[int] = None,
     ) -> "Duration":
         """Return a new Duration with specified fields replaced."""
+        fields = self._fields()
         return Duration(
-            years=years if years is not None else self._years,
-            months=months if months is not None else self._months,
-            weeks=weeks if weeks is not None else self._weeks,
-            days=days if days is not None else self._days,
-            hours=hours if hours is not None else self._hours,
-            minutes=minutes if minutes is not None else self._minutes,
-            seconds=seconds if seconds is not None else self._seconds,
-            microseconds=microseconds if microseconds is not None else self._microseconds,
+            years=years if years is not None else fields[0],
+            months=months if months is not None else fields[1],
+            weeks=weeks if weeks is not None else fields[2],
+            days=days if days is not None else fields[3],
+            hours=hours if hours is not None else fields[4],
+            minutes=minutes if minutes is not None else fields[5],
+            seconds=seconds if seconds is not None else fields[6],
+            microseconds=microseconds if microseconds is not None else fields[7],
         )
 
-    def _format_date_components(self) -> list:
-        """Format date components for ISO 8601 string."""
-        parts = []
-        if self._years:
-            parts.append(f"{self._years}Y")
-        if self._months:
-            parts.append(f"{self._months}M")
-        if self._weeks:
-            parts.append(f"{self._weeks}W")
-        if self._days:
-            parts.append(f"{self._days}D")
-        return parts
-
-    def _format_time_components(self) -> list:
-        """Format time components for ISO 8601 string."""
-        time_parts = []
-        if self._hours:
-            time_parts.append(f"{self._hours}H")
-        if self._minutes:
-            time_parts.append(f"{self._minutes}M")
-        if self._seconds or self._microseconds:
-            if self._microseconds:
-                # Handle case where seconds is 0 but microseconds is not
-                total_seconds = self._seconds + self._microseconds / 1000000
-                seconds_str = f"{total_seconds:.6f}".rstrip("0").rstrip(".")
-                time_parts.append(f"{seconds_str}S")
-            else:
-                time_parts.append(f"{self._seconds}S")
-        return time_parts
-
     def __str__(self) -> str:
         """Return ISO 8601 duration string representation."""
         if self._is_zero():
             return "PT0S"
 
-        parts = self._format_date_components()
-        time_parts = self._format_time_components()
-
-        result = "P" + "".join(parts)
-        if time_parts:
-            result += "T" + "".join(time_parts)
+        years, months, _, days, hours, minutes, seconds, microseconds = self._fields()
+        result = "P"
+        if years:
+            result += f"{years}Y"
+        if months:
+            result += f"{months}M"
+        if days:
+            result += f"{days}D"
+
+        if hours or minutes or seconds or microseconds:
+            result += "T"
+            if hours:
+                result += f"{hours}H"
+            if minutes:
+                result += f"{minutes}M"
+            if microseconds:
+                # Handle case where seconds is 0 but microseconds is not
+                total_seconds = seconds + microseconds / 1000000
+                result += f"{total_seconds:.6f}".rstrip("0").rstrip(".") + "S"
+            elif seconds:
+                result += f"{seconds}S"
 
         return result
 
     def __repr__(self) -> str:
         """Return detailed string representation."""
+        years, months, weeks, days, hours, minutes, seconds, microseconds = self._fields()
         return (
-            f"Duration(years={self._years}, months={self._months}, "
-            f"weeks={self._weeks}, days={self._days}, hours={self._hours}, "
-            f"minutes={self._minutes}, seconds={self._seconds}, "
-            f"microseconds={self._microseconds})"
+            f"Duration(years={years}, months={months}, "
+            f"weeks={weeks}, days={days}, hours={hours}, "
+            f"minutes={minutes}, seconds={seconds}, "
+            f"microseconds={microseconds})"
         )
 
     def __eq__(self, other: object) -> bool:
         """Check equality with another Duration."""
         if not isinstance(other, Duration):
             return False
-        return (
-            self._years == other._years
-            and self._months == other._months
-            and self._weeks == other._weeks
-            and self._days == other._days
-            and self._hours == other._hours
-            and self._minutes == other._minutes
-            and self._seconds == other._seconds
-            and self._microseconds == other._microseconds
-        )
+        return self._nanoseconds == other._nanoseconds and self._days == other._days and self._months == other._months
 
     def __add__(self, other: "Duration") -> "Duration":
         """Add operator."""
@@ -301,34 +352,16 @@ class Duration:
 
     def __hash__(self) -> int:
         """Hash function for Duration."""
-        return hash(
-            (self._years, self._months, self._weeks, self._days, self._hours, self._minutes, self._seconds, self._microseconds)
-        )
+        return hash((self._months, self._days, self._nanoseconds))
 
     @property
     def sign(self) -> int:
         """Get the sign of the duration (-1, 0, or 1)."""
-        non_zero_components = [
-            self._years,
-            self._months,
-            self._weeks,
-            self._days,
-            self._hours,
-            self._minutes,
-            self._seconds,
-            self._microseconds,
-        ]
-
-        # Check if all components are zero
-        if all(x == 0 for x in non_zero_components):
-            return 0
-
-        # Check if any component is negative
-        if any(x < 0 for x in non_zero_components):
+        if self._months < 0 or self._days < 0 or self._nanoseconds < 0:
             return -1
-
-        # All components are positive
-        return 1
+        if self._months or self._days or self._nanoseconds:
+            return 1
+        return 0
 
     @property
     def blank(self) -> bool:
@@ -344,57 +377,68 @@ class Duration:
         if unit in ["years", "months"] and relative_to is None:
             raise InvalidArgumentError(f"relative_to is required for unit '{unit}'")
 
-    def _calculate_time_unit_total(self, unit: str, total_seconds: float) -> float:
-        """Calculate total for time-based units."""
-        unit_conversions = {
-            "microseconds": 1000000,
-            "seconds": 1,
-            "minutes": 1 / 60,
-            "hours": 1 / 3600,
-            "days": 1 / (24 * 3600),
-            "weeks": 1 / (7 * 24 * 3600),
-        }
-        if unit in unit_conversions:
-            return total_seconds * unit_conversions[unit]
-        return 0.0
-
-    def _calculate_calendar_unit_total(self, unit: str, total_seconds: float, relative_to: object) -> float:
-        """Calculate total for calendar-based units (months, years)."""
-        if unit == "months":
-            # This is complex and depends on the reference date
-            # For now, approximate as 30.44 days per month
-            if relative_to:
-                # Could implement proper calculation based on reference date
-                pass
-            return (total_seconds / (24 * 3600)) / 30.44 + self._months + self._years * 12
-        elif unit == "years":
-            # This is complex and depends on the reference date
-            # For now, approximate as 365.25 days per year
-            if relative_to:
-                # Could implement proper calculation based on reference date
-                pass
-            return (total_seconds / (24 * 3600)) / 365.25 + self._years + self._months / 12
-        return 0.0
+    def _relative_total(self, unit: str, anchor: Tuple[Any, ...]) -> float:
+        """Calculate the total in a unit for a duration added to an anchor from ``_relative_anchor``."""
+        start = anchor[4]
+        end = _shifted(anchor, self._months, self._days) + self._nanoseconds
+        if unit in _UNIT_NANOSECONDS and (anchor[5] is None or unit not in ("weeks", "days")):
+            # Plain days are always 24 hours, and time units are exact on every anchor
+            return (end - start) / _UNIT_NANOSECONDS[unit]
+        return _count_calendar_units(anchor, unit, start, end)
 
     def total(self, unit: str, relative_to: object = None) -> float:
         """Calculate the total duration in the specified unit.
 
+        With ``relative_to`` the duration is added to that date or datetime and the
+        elapsed time is measured in real calendar units: months and years have their
+        actual lengths, and days in a ZonedDateTime's zone may be 23 or 25 hours.
+
         Args:
             unit: The unit to calculate total in ('years', 'months', 'weeks', 'days', 'hours', 'minutes', 'seconds', 'microseconds')
-            relative_to: Reference temporal object for calendar calculations (required for years/months)
+            relative_to: A PlainDate, PlainDateTime or ZonedDateTime to measure from (required for years/months)
 
         Returns:
             Total duration in the specified unit
         """
         self._validate_total_unit(unit, relative_to)
 
-        # Convert everything to seconds first (excluding years/months)
-        total_seconds = self.total_seconds()
+        if relative_to is None:
+            # Without an anchor, days are 24 hours and years/months are not counted
+            return self._total_nanoseconds() / _UNIT_NANOSECONDS[unit]
+        return self._relative_total(unit, _relative_anchor(relative_to))
 
-        if unit in ["years", "months"]:
-            return self._calculate_calendar_unit_total(unit, total_seconds, relative_to)
-        else:
-            return self._calculate_time_unit_total(unit, total_seconds)
+    def total_many(self, unit: str, relative_to: Iterable[Any], *, output: str = "objects") -> Union[List[float], Any]:
+        """Calculate the total of this duration in one unit against many anchors.
+
+        Args:
+            unit: The unit to calculate totals in, as for ``total()``
+            relative_to: The PlainDate, PlainDateTime or ZonedDateTime anchors
+            output: ``"objects"`` for a list of floats, ``"array"`` for an ``array('d')``, or
+                ``"numpy"`` for a NumPy float64 array
+
+        Returns:
+            The totals, aligned with ``relative_to``
+        """
+        self._validate_total_unit(unit, relative_to)
+        check_batch_output(output)
+
+        totals: Any = array("d") if output != "objects" else []
+        append = totals.append
+        fixed_total = None
+        for value in relative_to:
+            anchor = _relative_anchor(value)
+            if anchor[5] is None and not self._months and unit in _UNIT_NANOSECONDS:
+                # On plain anchors the total only depends on the anchor through months
+                if fixed_total is None:
+                    fixed_total = self._relative_total(unit, anchor)
+                append(fixed_total)
+            else:
+                append(self._relative_total(unit, anchor))
+
+        if output == "numpy":
+            numpy = import_numpy()
+            return numpy.frombuffer(totals, dtype=numpy.float64)
+        return totals
 
     def _parse_round_options(self, options: Union[str, dict]) -> tuple:
         """Parse rounding options to extract smallest unit and increment."""
@@ -409,59 +453,59 @@ class Duration:
 
     def _round_to_years(self, rounding_increment: int) -> "Duration":
         """Round duration to years."""
-        return Duration(years=round(self._years / rounding_increment) * rounding_increment)
+        return Duration(years=round(self.years / rounding_increment) * rounding_increment)
 
     def _round_to_months(self, rounding_increment: int) -> "Duration":
         """Round duration to months."""
-        return Duration(years=self._years, months=round(self._months / rounding_increment) * rounding_increment)
+        return Duration(years=self.years, months=round(self.months / rounding_increment) * rounding_increment)
 
     def _round_to_weeks(self, rounding_increment: int) -> "Duration":
         """Round duration to weeks."""
-        total_weeks = self._weeks + self._days / 7
+        total_weeks = self.weeks + self._days / 7
         rounded_weeks = round(total_weeks / rounding_increment) * rounding_increment
-        return Duration(years=self._years, months=self._months, weeks=rounded_weeks)
+        return Duration(years=self.years, months=self.months, weeks=rounded_weeks)
 
     def _round_to_days(self, rounding_increment: int) -> "Duration":
         """Round duration to days."""
-        total_days = self._days + self._hours / 24
+        total_days = self._days + self.hours / 24
         rounded_days = round(total_days / rounding_increment) * rounding_increment
-        return Duration(years=self._years, months=self._months, days=rounded_days)
+        return Duration(years=self.years, months=self.months, days=rounded_days)
 
     def _round_to_hours(self, rounding_increment: int) -> "Duration":
         """Round duration to hours."""
-        total_hours = self._hours + self._minutes / 60
+        total_hours = self.hours + self.minutes / 60
         rounded_hours = round(total_hours / rounding_increment) * rounding_increment
-        return Duration(years=self._years, months=self._months, days=self._days, hours=rounded_hours)
+        return Duration(years=self.years, months=self.months, days=self._days, hours=rounded_hours)
 
     def _round_to_minutes(self, rounding_increment: int) -> "Duration":
         """Round duration to minutes."""
-        total_minutes = self._minutes + self._seconds / 60
+        total_minutes = self.minutes + self.seconds / 60
         rounded_minutes = round(total_minutes / rounding_increment) * rounding_increment
-        return Duration(years=self._years, months=self._months, days=self._days, hours=self._hours, minutes=rounded_minutes)
+        return Duration(years=self.years, months=self.months, days=self._days, hours=self.hours, minutes=rounded_minutes)
 
     def _round_to_seconds(self, rounding_increment: int) -> "Duration":
         """Round duration to seconds."""
-        total_seconds = self._seconds + self._microseconds / 1000000
+        total_seconds = self.seconds + self.microseconds / 1000000
         rounded_seconds = round(total_seconds / rounding_increment) * rounding_increment
         return Duration(
-            years=self._years,
-            months=self._months,
+            years=self.years,
+            months=self.months,
             days=self._days,
-            hours=self._hours,
-            minutes=self._minutes,
+            hours=self.hours,
+            minutes=self.minutes,
             seconds=rounded_seconds,
         )
 
     def _round_to_microseconds(self, rounding_increment: int) -> "Duration":
         """Round duration to microseconds."""
-        rounded_microseconds = round(self._microseconds / rounding_increment) * rounding_increment
+        rounded_microseconds = round(self.microseconds / rounding_increment) * rounding_increment
         return Duration(
-            years=self._years,
-            months=self._months,
+            years=self.years,
+            months=self.months,
             days=self._days,
-            hours=self._hours,
-            minutes=self._minutes,
-            seconds=self._seconds,
+            hours=self.hours,
+            minutes=self.minutes,
+            seconds=self.seconds,
             microseconds=rounded_microseconds,
         )
 
@@ -491,16 +535,7 @@ class Duration:
         if smallest_unit in round_methods:
             return round_methods[smallest_unit](rounding_increment)
         # Fallback - return a copy
-        return Duration(
-            years=self._years,
-            months=self._months,
-            weeks=self._weeks,
-            days=self._days,
-            hours=self._hours,
-            minutes=self._minutes,
-            seconds=self._seconds,
-            microseconds=self._microseconds,
-        )
+        return Duration._from_parts(self._months, self._days, self._nanoseconds, self._years)
 
     def to_json(self) -> str:
         """Convert to JSON string."""
@@ -513,51 +548,40 @@ class Duration:
 
     def _is_zero(self) -> bool:
         """Check if this is a zero duration."""
-        return all(
-            getattr(self, f"_{field}") == 0
-            for field in ["years", "months", "weeks", "days", "hours", "minutes", "seconds", "microseconds"]
-        )
+        return not (self._months or self._days or self._nanoseconds)
 
     @classmethod
     def from_string(cls, duration_string: str) -> "Duration":
         """Create Duration from ISO 8601 string."""
-        # ISO 8601 duration pattern
-        pattern = re.compile(
-            r"^P(?:(\d+)Y)?(?:(\d+)M)?(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?)?$"
-        )
-
-        match = pattern.match(duration_string.upper())
-        if not match:
+        fields = _parse_duration(duration_string.upper())
+        if fields is None:
             raise InvalidArgumentError(f"Invalid ISO 8601 duration format: {duration_string}")
+        return cls._from_fields(*fields)
 
-        years, months, weeks, days, hours, minutes, seconds = match.groups()
-
-        # Convert to integers/floats, defaulting to 0
-        years = int(years) if years else 0
-        months = int(months) if months else 0
-        weeks = int(weeks) if weeks else 0
-        days = int(days) if days else 0
-        hours = int(hours) if hours else 0
-        minutes = int(minutes) if minutes else 0
-
-        # Handle fractional seconds
-        if seconds:
-            seconds_float = float(seconds)
-            seconds_int = int(seconds_float)
-            microseconds = int((seconds_float - seconds_int) * 1000000)
-        else:
-            seconds_int = 0
-            microseconds = 0
+    @classmethod
+    def try_from_string(cls, duration_string: str) -> Optional["Duration"]:
+        """Create Duration from ISO 8601 string, or return None where ``from_string`` would raise."""
+        if not isinstance(duration_string, str):
+            return None
+        fields = _parse_duration(duration_string.upper())
+        if fields is None:
+            return None
+        return cls._from_fields(*fields)
 
-        return cls(years, months, weeks, days, hours, minutes, seconds_int, microseconds)
+    @staticmethod
+    def is_valid_string(duration_string: str) -> bool:
+        """Check whether ``from_string`` accepts a string, without creating a Duration."""
+        return isinstance(duration_string, str) and _DURATION_PATTERN.match(duration_string.upper()) is not None
 
     @staticmethod
-    def compare(a: "Duration", b: "Duration") -> int:
+    def compare(a: "Duration", b: "Duration", relative_to: object = None) -> int:
         """Compare two Duration objects.
 
         Args:
             a: First Duration
             b: Second Duration
+            relative_to: Optional PlainDate, PlainDateTime or ZonedDateTime; when given, the
+                durations are compared by the point each reaches when added to it
 
         Returns:
             -1 if a < b, 0 if a == b, 1 if a > b
@@ -565,21 +589,21 @@ class Duration:
         if not isinstance(a, Duration) or not isinstance(b, Duration):
             raise InvalidArgumentError("Both arguments must be Duration")
 
-        # Compare total seconds for time components
-        a_seconds = a.total_seconds()
-        b_seconds = b.total_seconds()
-
-        # For years and months, we need to be careful as they're not directly comparable
-        # We'll compare them separately
-        a_months_total = a._years * 12 + a._months
-        b_months_total = b._years * 12 + b._months
+        if relative_to is not None:
+            anchor = _relative_anchor(relative_to)
+            a_end = _shifted(anchor, a._months, a._days) + a._nanoseconds
+            b_end = _shifted(anchor, b._months, b._days) + b._nanoseconds
+            return (a_end > b_end) - (a_end < b_end)
 
-        if a_months_total != b_months_total:
-            return -1 if a_months_total < b_months_total else 1
+        # Years and months are not directly comparable with days, so compare them first
+        if a._months != b._months:
+            return -1 if a._months < b._months else 1
 
-        if a_seconds < b_seconds:
+        a_nanoseconds = a._total_nanoseconds()
+        b_nanoseconds = b._total_nanoseconds()
+        if a_nanoseconds < b_nanoseconds:
             return -1
-        elif a_seconds > b_seconds:
+        elif a_nanoseconds > b_nanoseconds:
             return 1
         else:
             return 0
@@ -602,3 +626,90 @@ class Duration:
             return cls(**value)
         else:
             raise InvalidArgumentError(f"Cannot create Duration from {type(value)}")
+
+
+# Slot setters for the constructors, cheaper than object.__setattr__
+_set_months = Duration.__dict__["_months"].__set__
+_set_days = Duration.__dict__["_days"].__set__
+_set_nanoseconds = Duration.__dict__["_nanoseconds"].__set__
+_set_years = Duration.__dict__["_years"].__set__
+
+
+def _assign(duration: Duration, months: int, days: int, nanoseconds: int, years: int = 0) -> None:
+    """Assign the slots, carrying whole days (toward zero) out of the nanosecond part."""
+    if nanoseconds >= NS_PER_DAY or nanoseconds <= -NS_PER_DAY:
+        carry = nanoseconds // NS_PER_DAY if nanoseconds > 0 else -(-nanoseconds // NS_PER_DAY)
+        days += carry
+        nanoseconds -= carry * NS_PER_DAY
+    _set_months(duration, months)
+    _set_days(duration, days)
+    _set_nanoseconds(duration, nanoseconds)
+    _set_years(duration, years)
+
+
+def _relative_anchor(relative_to: Any) -> Tuple[int, int, int, int, int, Optional["TransitionTable"]]:
+    """Get (year, month, day, nanosecond_of_day, start, table) for a ``relative_to`` anchor.
+
+    ``start`` is wall-clock nanoseconds since 1970-01-01T00:00 for plain types and
+    epoch nanoseconds for a ZonedDateTime, whose zone's transition table is included.
+    """
+    from .plain_date import PlainDate
+    from .plain_date_time import PlainDateTime
+    from .zoned_date_time import ZonedDateTime
+
+    if isinstance(relative_to, ZonedDateTime):
+        year, month, day, _, _, _, _, offset = relative_to._wall_fields()
+        start = relative_to._epoch_nanoseconds
+        return year, month, day, (start + offset) % NS_PER_DAY, start, relative_to._timezone.transition_table
+    if isinstance(relative_to, PlainDateTime):
+        year, month, day = relative_to._year, relative_to._month, relative_to._day
+        nanosecond_of_day = relative_to._nanosecond_of_day()
+        return year, month, day, nanosecond_of_day, days_from_civil(year, month, day) * NS_PER_DAY + nanosecond_of_day, None
+    if isinstance(relative_to, PlainDate):
+        return relative_to._year, relative_to._month, relative_to._day, 0, relative_to._epoch_days * NS_PER_DAY, None
+    raise InvalidArgumentError("relative_to must be a PlainDate, PlainDateTime or ZonedDateTime")
+
+
+def _shifted(anchor: Tuple[Any, ...], months: int, days: int) -> int:
+    """Get the position of an anchor moved by whole months (clamping the day) and then by days."""
+    year, month, day, nanosecond_of_day, start, table = anchor
+    if not months and not days:
+        return start
+    if months:
+        year, month, day = add_months(year, month, day, months)
+    local = (days_from_civil(year, month, day) + days) * NS_PER_DAY + nanosecond_of_day
+    if table is None:
+        return local
+
+    from .zoned_date_time import _resolve_local_nanoseconds
+
+    return _resolve_local_nanoseconds(local, table)
+
+
+def _count_calendar_units(anchor: Tuple[Any, ...], unit: str, start: int, end: int) -> float:
+    """Count the whole and fractional calendar units from an anchor's start to ``end``.
+
+    The whole count is estimated from the unit's average length and then corrected
+    by a step or two, so long spans cost the same as short ones.
+    """
+    step_months, step_days = _CALENDAR_UNIT_STEPS[unit]
+    numerator, denominator = _AVERAGE_UNIT_DAYS[unit]
+    count = (end - start) * denominator // (numerator * NS_PER_DAY)
+
+    def position(units: int) -> int:
+        return _shifted(anchor, units * step_months, units * step_days)
+
+    if end >= start:
+        while position(count) > end:
+            count -= 1
+        while position(count + 1) <= end:
+            count += 1
+        low = position(count)
+        return count + (end - low) / (position(count + 1) - low)
+
+    while position(count) < end:
+        count += 1
+    while position(count - 1) >= end:
+        count -= 1
+    high = position(count)
+    return count - (high - end) / (high - position(count - 1))
@@ -2,56 +2,140 @@
 Instant implementation for the Temporal API.
 """
 
+import math
+import time
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Optional, Union
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from .duration import Duration
-from .exceptions import InvalidArgumentError, RangeError
+from .exceptions import InvalidArgumentError, RangeError, TemporalError
+from .parse_cache import cached_parse
+from .utils import (
+    INSTANT_ROUNDING_UNITS,
+    NS_PER_DAY,
+    NS_PER_SECOND,
+    Immutable,
+    bucket_bounds,
+    bucket_unit,
+    civil_from_days,
+    could_be_isoformat,
+    datetime_to_epoch_nanoseconds,
+    format_nanoseconds,
+    parse_many,
+    round_half_even,
+    rounding_increment_nanoseconds,
+    split_iso_fraction,
+)
 
 if TYPE_CHECKING:
     from .plain_date_time import PlainDateTime
+    from .ranges import InstantRange
     from .zoned_date_time import ZonedDateTime
 
 
-class Instant:
-    """Represents an exact point in time."""
+def _to_epoch_nanoseconds(value: Union[int, float], name: str, scale: int) -> int:
+    """Convert an epoch value counted in units of ``scale`` nanoseconds to exact nanoseconds.
+
+    Floats are converted through their shortest decimal representation so that
+    e.g. ``1687438245.123456`` maps to ``...123456000`` ns rather than the
+    nearest binary neighbour.
+    """
+    if isinstance(value, int):
+        return value * scale
+    if not isinstance(value, float):
+        raise InvalidArgumentError(f"{name} must be a number")
+    if not math.isfinite(value):
+        raise RangeError(f"{name} must be finite")
+    return int((Decimal(repr(value)) * scale).to_integral_value(rounding=ROUND_HALF_EVEN))
+
+
+def _try_parse_epoch_nanoseconds(instant_string: Any) -> Optional[int]:
+    """Parse an ISO 8601 instant string to nanoseconds since the Unix epoch, or None if it is invalid."""
+    if not could_be_isoformat(instant_string):
+        return None
+    text, fraction = split_iso_fraction(instant_string)
+    try:
+        if text.endswith("Z"):
+            dt = datetime.fromisoformat(text[:-1] + "+00:00")
+        else:
+            dt = datetime.fromisoformat(text)
+    except (ValueError, OverflowError):
+        return None
+
+    # Strings without an offset are read as UTC
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return datetime_to_epoch_nanoseconds(dt) + fraction
+
+
+def _parse_epoch_nanoseconds(instant_string: str) -> int:
+    """Parse an ISO 8601 instant string to nanoseconds since the Unix epoch."""
+    nanoseconds = _try_parse_epoch_nanoseconds(instant_string)
+    if nanoseconds is None:
+        raise InvalidArgumentError(f"Invalid ISO instant format: {instant_string}")
+    return nanoseconds
+
 
-    def __init__(self, epoch_seconds: float):
+class Instant(Immutable):
+    """Represents an exact point in time.
+
+    The canonical state is a single integer count of nanoseconds since the
+    Unix epoch, so comparison, hashing and arithmetic are exact integer operations.
+    """
+
+    __slots__ = ("_epoch_nanoseconds",)
+
+    def __init__(self, epoch_seconds: Union[int, float]):
         """Initialize an Instant with seconds since Unix epoch."""
-        if not isinstance(epoch_seconds, (int, float)):
-            raise InvalidArgumentError("epoch_seconds must be a number")
+        _set_epoch_nanoseconds(self, _to_epoch_nanoseconds(epoch_seconds, "epoch_seconds", NS_PER_SECOND))
+
+    def __reduce__(self):
+        return (type(self).from_epoch_nanoseconds, (self._epoch_nanoseconds,))
 
-        self._epoch_seconds = float(epoch_seconds)
+    @classmethod
+    def _from_epoch_nanoseconds(cls, nanoseconds: int) -> "Instant":
+        """Create an Instant from an integer nanosecond count without validation."""
+        instant = object.__new__(cls)
+        _set_epoch_nanoseconds(instant, nanoseconds)
+        return instant
+
+    @classmethod
+    def _from_datetime(cls, dt: datetime) -> "Instant":
+        """Create an Instant from an aware datetime without going through float timestamps."""
+        return cls._from_epoch_nanoseconds(datetime_to_epoch_nanoseconds(dt))
 
     @property
     def epoch_seconds(self) -> float:
         """Get seconds since Unix epoch."""
-        return self._epoch_seconds
+        return self._epoch_nanoseconds / NS_PER_SECOND
 
     @property
     def epoch_milliseconds(self) -> float:
         """Get milliseconds since Unix epoch."""
-        return self._epoch_seconds * 1000
+        return self._epoch_nanoseconds / 1_000_000
 
     @property
     def epoch_microseconds(self) -> float:
         """Get microseconds since Unix epoch."""
-        return self._epoch_seconds * 1000000
+        return self._epoch_nanoseconds / 1000
+
+    @property
+    def epoch_nanoseconds(self) -> int:
+        """Get nanoseconds since Unix epoch as an exact integer."""
+        return self._epoch_nanoseconds
 
     def add(self, duration: Duration) -> "Instant":
         """Add a duration to this instant."""
         if not isinstance(duration, Duration):
             raise InvalidArgumentError("Expected Duration object")
 
-        # Convert duration to seconds
-        additional_seconds = duration.total_seconds()
-
         # Note: We ignore years and months for Instant arithmetic
         # as they are calendar-dependent
         if duration.years != 0 or duration.months != 0:
             raise InvalidArgumentError("Cannot add years or months to Instant")
 
-        return Instant(self._epoch_seconds + additional_seconds)
+        return Instant._from_epoch_nanoseconds(self._epoch_nanoseconds + duration._total_nanoseconds())
 
     def subtract(self, other: Union["Instant", Duration]) -> Union["Instant", Duration]:
         """Subtract another instant or duration from this instant."""
@@ -61,22 +145,7 @@ class Instant:
             return self.add(negated_duration)
         elif isinstance(other, Instant):
             # Subtract instant - return duration
-            diff_seconds = self._epoch_seconds - other._epoch_seconds
-
-            # Convert to duration components
-            total_seconds = abs(diff_seconds)
-            days = int(total_seconds // (24 * 3600))
-            remaining_seconds = total_seconds % (24 * 3600)
-            hours = int(remaining_seconds // 3600)
-            remaining_seconds %= 3600
-            minutes = int(remaining_seconds // 60)
-            seconds = int(remaining_seconds % 60)
-            microseconds = int((remaining_seconds % 1) * 1000000)
-
-            if diff_seconds < 0:
-                days, hours, minutes, seconds, microseconds = (-days, -hours, -minutes, -seconds, -microseconds)
-
-            return Duration(days=days, hours=hours, minutes=minutes, seconds=seconds, microseconds=microseconds)
+            return Duration._from_nanoseconds(self._epoch_nanoseconds - other._epoch_nanoseconds)
         else:
             raise InvalidArgumentError("Expected Instant or Duration object")
 
@@ -88,10 +157,7 @@ class Instant:
         if not isinstance(timezone, TimeZone):
             raise InvalidArgumentError("Expected TimeZone object")
 
-        # Create datetime in the specified timezone
-        dt = datetime.fromtimestamp(self._epoch_seconds, tz=timezone.zone_info)
-
-        return ZonedDateTime(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, dt.microsecond, timezone)
+        return ZonedDateTime._from_epoch_nanoseconds(self._epoch_nanoseconds, timezone)
 
     def to_plain_date_time(self, timezone) -> "PlainDateTime":
         """Convert to PlainDateTime in the given timezone."""
@@ -100,73 +166,115 @@ class Instant:
 
     def __str__(self) -> str:
         """Return ISO 8601 string representation."""
-        dt = datetime.fromtimestamp(self._epoch_seconds, tz=timezone.utc)
-        iso_string = dt.isoformat()
-        # Ensure Z suffix for UTC
-        if iso_string.endswith("+00:00"):
-            iso_string = iso_string[:-6] + "Z"
-        return iso_string
+        days, nanosecond_of_day = divmod(self._epoch_nanoseconds, NS_PER_DAY)
+        year, month, day = civil_from_days(days)
+        second_of_day, nanosecond = divmod(nanosecond_of_day, NS_PER_SECOND)
+        hour, remainder = divmod(second_of_day, 3600)
+        minute, second = divmod(remainder, 60)
+        return f"{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}{format_nanoseconds(nanosecond)}Z"
 
     def __repr__(self) -> str:
         """Return detailed string representation."""
-        return f"Instant({self._epoch_seconds})"
+        return f"Instant({self.epoch_seconds})"
 
     def __eq__(self, other) -> bool:
         """Check equality with another Instant."""
         if not isinstance(other, Instant):
             return False
-        # Use machine epsilon for better precision handling
-        import sys
-
-        epsilon = sys.float_info.epsilon * max(abs(self._epoch_seconds), abs(other._epoch_seconds), 1.0) * 10
-        return abs(self._epoch_seconds - other._epoch_seconds) <= epsilon
+        return self._epoch_nanoseconds == other._epoch_nanoseconds
 
     def __lt__(self, other) -> bool:
         """Check if this instant is less than another."""
         if not isinstance(other, Instant):
             raise InvalidArgumentError("Expected Instant object")
-        return self._epoch_seconds < other._epoch_seconds
+        return self._epoch_nanoseconds < other._epoch_nanoseconds
 
     def __le__(self, other) -> bool:
         """Check if this instant is less than or equal to another."""
-        return self == other or self < other
+        if not isinstance(other, Instant):
+            raise InvalidArgumentError("Expected Instant object")
+        return self._epoch_nanoseconds <= other._epoch_nanoseconds
 
     def __gt__(self, other) -> bool:
         """Check if this instant is greater than another."""
-        return not self <= other
+        if not isinstance(other, Instant):
+            raise InvalidArgumentError("Expected Instant object")
+        return self._epoch_nanoseconds > other._epoch_nanoseconds
 
     def __ge__(self, other) -> bool:
         """Check if this instant is greater than or equal to another."""
-        return not self < other
+        if not isinstance(other, Instant):
+            raise InvalidArgumentError("Expected Instant object")
+        return self._epoch_nanoseconds >= other._epoch_nanoseconds
 
     def __hash__(self) -> int:
         """Hash function for Instant."""
-        return hash(self._epoch_seconds)
+        return hash(self._epoch_nanoseconds)
 
     @classmethod
+    @cached_parse
     def from_string(cls, instant_string: str) -> "Instant":
         """Create Instant from ISO 8601 string."""
-        try:
-            # Parse ISO string
-            if instant_string.endswith("Z"):
-                dt = datetime.fromisoformat(instant_string[:-1] + "+00:00")
-            else:
-                dt = datetime.fromisoformat(instant_string)
-
-            # Convert to UTC if timezone-aware
-            if dt.tzinfo is not None:
-                dt = dt.astimezone(timezone.utc)
-            else:
-                dt = dt.replace(tzinfo=timezone.utc)
-
-            return cls(dt.timestamp())
-        except (ValueError, TypeError, OverflowError) as e:
-            raise InvalidArgumentError(f"Invalid ISO instant format: {instant_string}") from e
+        return cls._from_epoch_nanoseconds(_parse_epoch_nanoseconds(instant_string))
+
+    @classmethod
+    def try_from_string(cls, instant_string: str) -> Optional["Instant"]:
+        """Create Instant from ISO 8601 string, or return None where ``from_string`` would raise."""
+        nanoseconds = _try_parse_epoch_nanoseconds(instant_string)
+        if nanoseconds is None:
+            return None
+        return cls._from_epoch_nanoseconds(nanoseconds)
+
+    @staticmethod
+    def is_valid_string(instant_string: str) -> bool:
+        """Check whether ``from_string`` accepts a string, without creating an Instant."""
+        return _try_parse_epoch_nanoseconds(instant_string) is not None
+
+    @classmethod
+    def parse_many(
+        cls,
+        strings: Iterable[str],
+        *,
+        output: str = "objects",
+        errors: Optional[Dict[int, TemporalError]] = None,
+    ) -> Union[List[Optional["Instant"]], Any]:
+        """Parse many ISO 8601 instant strings in one call.
+
+        Args:
+            strings: The strings to parse
+            output: ``"objects"`` for a list of Instants, ``"array"`` for an ``array('q')`` of
+                epoch nanoseconds, or ``"numpy"`` for a NumPy int64 array of epoch nanoseconds
+            errors: If given, failed rows are recorded here as ``{index: error}`` and filled
+                with None (or ``MISSING_INT64`` in column outputs) instead of raising
+
+        Returns:
+            A list or column aligned with ``strings``
+        """
+        if output == "objects":
+            from_epoch_nanoseconds = cls._from_epoch_nanoseconds
+            return parse_many(strings, lambda text: from_epoch_nanoseconds(_parse_epoch_nanoseconds(text)), output, errors)
+        return parse_many(strings, _parse_epoch_nanoseconds, output, errors)
+
+    @classmethod
+    def range(cls, start: "Instant", stop: "Instant", step: Optional[Duration] = None) -> "InstantRange":
+        """Get a lazy range of Instant values from ``start`` up to, but not including, ``stop``.
+
+        Args:
+            start: The first value
+            stop: The exclusive end value
+            step: Step between values (defaults to 1 day); must be a fixed length of time, without years or months and may be negative
+
+        Returns:
+            A sequence supporting ``len()``, indexing, slicing, ``in`` and ``index()`` in constant time
+        """
+        from .ranges import InstantRange
+
+        return InstantRange(start, stop, step)
 
     @classmethod
     def now(cls) -> "Instant":
         """Get the current instant."""
-        return cls(datetime.now(timezone.utc).timestamp())
+        return cls._from_epoch_nanoseconds(time.time_ns())
 
     @classmethod
     def from_epoch_seconds(cls, seconds: float) -> "Instant":
@@ -176,12 +284,19 @@ class Instant:
     @classmethod
     def from_epoch_milliseconds(cls, milliseconds: float) -> "Instant":
         """Create Instant from epoch milliseconds."""
-        return cls(milliseconds / 1000)
+        return cls._from_epoch_nanoseconds(_to_epoch_nanoseconds(milliseconds, "milliseconds", 1_000_000))
 
     @classmethod
     def from_epoch_microseconds(cls, microseconds: float) -> "Instant":
         """Create Instant from epoch microseconds."""
-        return cls(microseconds / 1000000)
+        return cls._from_epoch_nanoseconds(_to_epoch_nanoseconds(microseconds, "microseconds", 1000))
+
+    @classmethod
+    def from_epoch_nanoseconds(cls, nanoseconds: int) -> "Instant":
+        """Create Instant from an exact integer count of epoch nanoseconds."""
+        if not isinstance(nanoseconds, int):
+            raise InvalidArgumentError("nanoseconds must be an integer")
+        return cls._from_epoch_nanoseconds(nanoseconds)
 
     def until(self, other: "Instant") -> Duration:
         """Calculate duration from this instant to another.
@@ -220,33 +335,53 @@ class Instant:
         Returns:
             A new rounded Instant
         """
-        if isinstance(options, str):
-            smallest_unit = options
-            rounding_increment = 1
-        elif isinstance(options, dict):
-            smallest_unit = options.get("smallestUnit", "nanoseconds")
-            rounding_increment = options.get("roundingIncrement", 1)
-        else:
-            raise InvalidArgumentError("Options must be string or dict")
-
-        # Convert to nanoseconds for precision
-        nanoseconds = self._epoch_seconds * 1_000_000_000
-
-        if smallest_unit == "seconds":
-            increment_ns = rounding_increment * 1_000_000_000
-        elif smallest_unit == "milliseconds":
-            increment_ns = rounding_increment * 1_000_000
-        elif smallest_unit == "microseconds":
-            increment_ns = rounding_increment * 1_000
-        elif smallest_unit == "nanoseconds":
-            increment_ns = rounding_increment
-        else:
-            raise InvalidArgumentError(f"Invalid unit: {smallest_unit}")
+        increment_ns = rounding_increment_nanoseconds(options, INSTANT_ROUNDING_UNITS, "nanoseconds")
 
         # Round to the nearest increment
-        rounded_ns = round(nanoseconds / increment_ns) * increment_ns
+        return Instant._from_epoch_nanoseconds(round_half_even(self._epoch_nanoseconds, increment_ns))
+
+    def _bucket_bounds(self, options: Union[str, dict]) -> Tuple[int, int]:
+        """Get the start and end, in epoch nanoseconds, of the UTC bucket containing this instant."""
+        unit, increment = bucket_unit(options)
+        return bucket_bounds(self._epoch_nanoseconds, unit, increment)
 
-        return Instant(rounded_ns / 1_000_000_000)
+    def floor(self, options: Union[str, dict]) -> "Instant":
+        """Round the instant down to the start of its bucket.
+
+        Fixed units are counted from the Unix epoch; calendar units (days, ISO
+        weeks, months, quarters and years) follow the UTC calendar.
+
+        Args:
+            options: Either a string unit name or dict with 'smallestUnit' and optional 'roundingIncrement'
+
+        Returns:
+            The latest bucket boundary at or before this instant
+        """
+        return Instant._from_epoch_nanoseconds(self._bucket_bounds(options)[0])
+
+    def ceil(self, options: Union[str, dict]) -> "Instant":
+        """Round the instant up to the next bucket boundary, or return it unchanged if it is on one.
+
+        Args:
+            options: Either a string unit name or dict with 'smallestUnit' and optional 'roundingIncrement'
+
+        Returns:
+            The earliest bucket boundary at or after this instant
+        """
+        start, end = self._bucket_bounds(options)
+        return self if start == self._epoch_nanoseconds else Instant._from_epoch_nanoseconds(end)
+
+    def bucket(self, options: Union[str, dict]) -> Tuple["Instant", "Instant"]:
+        """Get the bucket containing the instant.
+
+        Args:
+            options: Either a string unit name or dict with 'smallestUnit' and optional 'roundingIncrement'
+
+        Returns:
+            The half-open ``(start, end)`` interval of the bucket
+        """
+        start, end = self._bucket_bounds(options)
+        return Instant._from_epoch_nanoseconds(start), Instant._from_epoch_nanoseconds(end)
 
     def equals(self, other: "Instant") -> bool:
         """Check if this instant equals another.
@@ -282,9 +417,9 @@ class Instant:
         if not isinstance(a, Instant) or not isinstance(b, Instant):
             raise InvalidArgumentError("Both arguments must be Instant")
 
-        if a < b:
+        if a._epoch_nanoseconds < b._epoch_nanoseconds:
             return -1
-        elif a > b:
+        elif a._epoch_nanoseconds > b._epoch_nanoseconds:
             return 1
         else:
             return 0
@@ -307,3 +442,7 @@ class Instant:
             return cls(value)
         else:
             raise InvalidArgumentError(f"Cannot create Instant from {type(value)}")
+
+
+# Slot setter for the constructors, cheaper than object.__setattr__
+_set_epoch_nanoseconds = Instant.__dict__["_epoch_nanoseconds"].__set__
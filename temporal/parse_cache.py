@@ -0,0 +1,139 @@
+"""
+Opt-in LRU cache for ISO 8601 parsing.
+
+Log and CSV sources repeat the same timestamp strings many times over. While a
+cache is enabled, ``PlainDate``, ``PlainDateTime``, ``Instant`` and
+``ZonedDateTime.from_string`` look the string up before parsing it and hand
+back the previously built value on a hit; temporal values are immutable, so
+sharing one instance between callers is safe.
+"""
+
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Optional, TypeVar
+
+from .exceptions import InvalidArgumentError
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_MAXSIZE = 4096
+
+
+class ParseCache:
+    """Bounded least-recently-used mapping from parse arguments to parsed values.
+
+    Keys are the class, the input string and any further arguments (calendar,
+    timezone), so the same text parsed with different options never collides.
+    Failed parses are not cached; they raise again on every call.
+    """
+
+    __slots__ = ("_maxsize", "_entries", "hits", "misses")
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        """Create an empty cache holding at most ``maxsize`` values.
+
+        Args:
+            maxsize: Capacity; the least recently used value is evicted beyond it
+
+        Raises:
+            InvalidArgumentError: If maxsize is not a positive integer
+        """
+        if type(maxsize) is not int or maxsize < 1:
+            raise InvalidArgumentError("maxsize must be a positive integer")
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[tuple, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of cached values."""
+        return self._maxsize
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache, 0.0 before any lookup."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        """Number of cached values."""
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        """Representation of the cache and its counters."""
+        return f"ParseCache(maxsize={self._maxsize}, size={len(self._entries)}, hits={self.hits}, misses={self.misses})"
+
+    def clear(self) -> None:
+        """Drop every cached value and reset the hit and miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _store(self, key: tuple, value: Any) -> None:
+        entries = self._entries
+        entries[key] = value
+        if len(entries) > self._maxsize:
+            # Guarded because another thread may have emptied the cache meanwhile
+            try:
+                entries.popitem(last=False)
+            except KeyError:
+                pass
+
+
+_active: Optional[ParseCache] = None
+
+
+def enable_parse_cache(maxsize: int = DEFAULT_MAXSIZE) -> ParseCache:
+    """Install a new, empty parse cache and return it for inspection.
+
+    Any previously enabled cache is discarded.
+    """
+    global _active
+    _active = ParseCache(maxsize)
+    return _active
+
+
+def disable_parse_cache() -> None:
+    """Stop caching parse results and release the cached values."""
+    global _active
+    _active = None
+
+
+def get_parse_cache() -> Optional[ParseCache]:
+    """Return the enabled parse cache, or None when caching is off."""
+    return _active
+
+
+def cached_parse(from_string: F) -> F:
+    """Route a ``from_string(cls, text, ...)`` implementation through the enabled cache.
+
+    Non-string input bypasses the cache so it fails exactly as it would uncached.
+    """
+
+    @wraps(from_string)
+    def wrapper(cls: Any, text: Any, *args: Any, **kwargs: Any) -> Any:
+        cache = _active
+        if cache is None or type(text) is not str:
+            return from_string(cls, text, *args, **kwargs)
+        key = (cls, text, *args, *kwargs.items()) if kwargs else (cls, text, *args)
+        entries = cache._entries
+        try:
+            value = entries.get(key)
+        except TypeError:
+            # An unhashable option; let the parser report it
+            return from_string(cls, text, *args, **kwargs)
+        if value is not None:
+            cache.hits += 1
+            # Another thread may have evicted the key since the get
+            try:
+                entries.move_to_end(key)
+            except KeyError:
+                pass
+            return value
+        cache.misses += 1
+        value = from_string(cls, text, *args, **kwargs)
+        cache._store(key, value)
+        return value
+
+    return wrapper  # type: ignore[return-value]
@@ -3,31 +3,86 @@ PlainDate implementation for the Temporal API.
 """
 
 from datetime import date
-from typing import TYPE_CHECKING, Optional, Union
-
-from .calendar import Calendar
-from .exceptions import InvalidArgumentError, RangeError
-from .utils import get_days_in_month, pad_zero, parse_iso_date, validate_date_fields
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
+
+from .calendar import ISO_CALENDAR, Calendar
+from .exceptions import InvalidArgumentError, RangeError, TemporalError
+from .parse_cache import cached_parse
+from .utils import (
+    Immutable,
+    add_months,
+    civil_from_days,
+    days_from_civil,
+    is_leap_year,
+    pad_zero,
+    parse_iso_date,
+    parse_iso_epoch_days,
+    parse_many,
+    try_parse_iso_date,
+    validate_date_fields,
+)
 
 if TYPE_CHECKING:
     from .duration import Duration
     from .plain_date_time import PlainDateTime
     from .plain_month_day import PlainMonthDay
     from .plain_year_month import PlainYearMonth
+    from .ranges import PlainDateRange
     from .zoned_date_time import ZonedDateTime
 
+# Days before the first of each month in a common year, indexed by month (1-12)
+_DAYS_BEFORE_MONTH = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+
+def _iso_weeks_in_year(year: int) -> int:
+    """Get the number of ISO weeks (52 or 53) in a year."""
+    # A year has 53 weeks when it starts on a Thursday, or on a Wednesday in a leap year
+    jan1_weekday = (days_from_civil(year, 1, 1) + 3) % 7 + 1
+    return 53 if jan1_weekday == 4 or (jan1_weekday == 3 and is_leap_year(year)) else 52
+
 
-class PlainDate:
-    """Represents a date without time zone information."""
+class PlainDate(Immutable):
+    """Represents a date without time zone information.
+
+    Alongside its fields the date keeps a days-since-epoch ordinal, so day
+    arithmetic, differences, weekdays and comparisons are integer operations.
+    """
+
+    __slots__ = ("_year", "_month", "_day", "_calendar", "_epoch_days")
 
     def __init__(self, year: int, month: int, day: int, calendar: Optional[Calendar] = None):
         """Initialize a PlainDate with year, month, and day."""
         validate_date_fields(year, month, day)
 
-        self._year = year
-        self._month = month
-        self._day = day
-        self._calendar = calendar or Calendar()
+        _set_year(self, year)
+        _set_month(self, month)
+        _set_day(self, day)
+        _set_calendar(self, calendar or ISO_CALENDAR)
+        _set_epoch_days(self, days_from_civil(year, month, day))
+
+    @classmethod
+    def _from_fields(
+        cls, year: int, month: int, day: int, calendar: Calendar, epoch_days: Optional[int] = None
+    ) -> "PlainDate":
+        """Create a PlainDate from fields the library has already validated."""
+        date = object.__new__(cls)
+        _set_year(date, year)
+        _set_month(date, month)
+        _set_day(date, day)
+        _set_calendar(date, calendar)
+        _set_epoch_days(date, days_from_civil(year, month, day) if epoch_days is None else epoch_days)
+        return date
+
+    @classmethod
+    def _from_epoch_days(cls, epoch_days: int, calendar: Calendar) -> "PlainDate":
+        """Create a PlainDate from a days-since-epoch ordinal, checking only the year range."""
+        year, month, day = civil_from_days(epoch_days)
+        if year < 1 or year > 9999:
+            raise RangeError(f"Year {year} is out of range (1-9999)")
+        return cls._from_fields(year, month, day, calendar, epoch_days)
+
+    def __reduce__(self):
+        return (type(self), (self._year, self._month, self._day, self._calendar))
 
     @property
     def year(self) -> int:
@@ -52,21 +107,24 @@ class PlainDate:
     @property
     def day_of_week(self) -> int:
         """Get the day of the week (1=Monday, 7=Sunday)."""
-        # Use datetime to calculate day of week
-        dt = date(self._year, self._month, self._day)
-        return dt.isoweekday()
+        # 1970-01-01 was a Thursday
+        return (self._epoch_days + 3) % 7 + 1
 
     @property
     def day_of_year(self) -> int:
         """Get the day of the year (1-366)."""
-        dt = date(self._year, self._month, self._day)
-        return dt.timetuple().tm_yday
+        leap_day = 1 if self._month > 2 and is_leap_year(self._year) else 0
+        return _DAYS_BEFORE_MONTH[self._month] + leap_day + self._day
 
     @property
     def week_of_year(self) -> int:
         """Get the ISO week number."""
-        dt = date(self._year, self._month, self._day)
-        return dt.isocalendar()[1]
+        week = (self.day_of_year - self.day_of_week + 10) // 7
+        if week < 1:
+            return _iso_weeks_in_year(self._year - 1)
+        if week > _iso_weeks_in_year(self._year):
+            return 1
+        return week
 
     def add(self, duration) -> "PlainDate":
         """Add a duration to this date."""
@@ -75,43 +133,16 @@ class PlainDate:
         if not isinstance(duration, Duration):
             raise InvalidArgumentError("Expected Duration object")
 
-        new_year = self._year + duration.years
-        new_month = self._month + duration.months
-        new_day = self._day
-
-        # Handle month overflow/underflow
-        while new_month > 12:
-            new_year += 1
-            new_month -= 12
-        while new_month < 1:
-            new_year -= 1
-            new_month += 12
-
-        # Clamp day to valid range for the target month first
-        max_day = get_days_in_month(new_year, new_month)
-        if new_day > max_day:
-            new_day = max_day
-
-        # Now add the days
-        new_day += duration.days
-
-        # Handle day overflow by properly carrying to next month
-        while new_day > get_days_in_month(new_year, new_month):
-            new_day -= get_days_in_month(new_year, new_month)
-            new_month += 1
-            if new_month > 12:
-                new_year += 1
-                new_month = 1
-
-        # Handle day underflow
-        while new_day < 1:
-            new_month -= 1
-            if new_month < 1:
-                new_year -= 1
-                new_month = 12
-            new_day += get_days_in_month(new_year, new_month)
-
-        return PlainDate(new_year, new_month, new_day, self._calendar)
+        if duration.years or duration.months:
+            # Move by whole months first, clamping the day to the target month
+            epoch_days = days_from_civil(
+                *add_months(self._year, self._month, self._day, duration.years * 12 + duration.months)
+            )
+        else:
+            epoch_days = self._epoch_days
+
+        # Then add the days as a plain ordinal offset
+        return PlainDate._from_epoch_days(epoch_days + duration.days, self._calendar)
 
     def subtract(self, other) -> Union["PlainDate", "Duration"]:
         """Subtract another date or duration from this date."""
@@ -119,23 +150,10 @@ class PlainDate:
 
         if isinstance(other, Duration):
             # Subtract duration - negate and add
-            negated_duration = Duration(
-                -other.years,
-                -other.months,
-                -other.weeks,
-                -other.days,
-                -other.hours,
-                -other.minutes,
-                -other.seconds,
-                -other.microseconds,
-            )
-            return self.add(negated_duration)
+            return self.add(other.negated())
         elif isinstance(other, PlainDate):
             # Subtract date - return duration
-            dt1 = date(self._year, self._month, self._day)
-            dt2 = date(other._year, other._month, other._day)
-            delta = dt1 - dt2
-            return Duration(days=delta.days)
+            return Duration._from_fields(days=self._epoch_days - other._epoch_days)
         else:
             raise InvalidArgumentError("Expected PlainDate or Duration object")
 
@@ -161,11 +179,11 @@ class PlainDate:
         from .plain_time import PlainTime
 
         if time is None:
-            time = PlainTime(0, 0, 0)
+            return PlainDateTime._from_fields(self._year, self._month, self._day, 0, 0, 0, 0, self._calendar)
         elif not isinstance(time, PlainTime):
             raise InvalidArgumentError("Expected PlainTime object")
 
-        return PlainDateTime(
+        return PlainDateTime._from_fields(
             self._year, self._month, self._day, time.hour, time.minute, time.second, time.microsecond, self._calendar
         )
 
@@ -181,41 +199,107 @@ class PlainDate:
         """Check equality with another PlainDate."""
         if not isinstance(other, PlainDate):
             return False
-        return self._year == other._year and self._month == other._month and self._day == other._day
+        return self._epoch_days == other._epoch_days and (
+            self._calendar is other._calendar or self._calendar == other._calendar
+        )
 
     def __lt__(self, other) -> bool:
         """Check if this date is less than another."""
         if not isinstance(other, PlainDate):
             raise InvalidArgumentError("Expected PlainDate object")
-        return (self._year, self._month, self._day) < (other._year, other._month, other._day)
+        return self._epoch_days < other._epoch_days
 
     def __le__(self, other) -> bool:
         """Check if this date is less than or equal to another."""
-        return self == other or self < other
+        if not isinstance(other, PlainDate):
+            raise InvalidArgumentError("Expected PlainDate object")
+        return self._epoch_days <= other._epoch_days
 
     def __gt__(self, other) -> bool:
         """Check if this date is greater than another."""
-        return not self <= other
+        if not isinstance(other, PlainDate):
+            raise InvalidArgumentError("Expected PlainDate object")
+        return self._epoch_days > other._epoch_days
 
     def __ge__(self, other) -> bool:
         """Check if this date is greater than or equal to another."""
-        return not self < other
+        if not isinstance(other, PlainDate):
+            raise InvalidArgumentError("Expected PlainDate object")
+        return self._epoch_days >= other._epoch_days
 
     def __hash__(self) -> int:
         """Hash function for PlainDate."""
-        return hash((self._year, self._month, self._day))
+        return hash(self._epoch_days)
 
     @classmethod
+    @cached_parse
     def from_string(cls, date_string: str, calendar: Optional[Calendar] = None) -> "PlainDate":
         """Create PlainDate from ISO 8601 string."""
         year, month, day = parse_iso_date(date_string)
-        return cls(year, month, day, calendar)
+        return cls._from_fields(year, month, day, calendar or ISO_CALENDAR)
+
+    @classmethod
+    def try_from_string(cls, date_string: str, calendar: Optional[Calendar] = None) -> Optional["PlainDate"]:
+        """Create PlainDate from ISO 8601 string, or return None where ``from_string`` would raise."""
+        fields = try_parse_iso_date(date_string)
+        if fields is None:
+            return None
+        return cls._from_fields(fields[0], fields[1], fields[2], calendar or ISO_CALENDAR)
+
+    @staticmethod
+    def is_valid_string(date_string: str) -> bool:
+        """Check whether ``from_string`` accepts a string, without creating a PlainDate."""
+        return try_parse_iso_date(date_string) is not None
+
+    @classmethod
+    def parse_many(
+        cls,
+        strings: Iterable[str],
+        calendar: Optional[Calendar] = None,
+        *,
+        output: str = "objects",
+        errors: Optional[Dict[int, TemporalError]] = None,
+    ) -> Union[List[Optional["PlainDate"]], Any]:
+        """Parse many ISO 8601 date strings in one call.
+
+        Args:
+            strings: The strings to parse
+            calendar: Calendar for the created PlainDate (defaults to ISO)
+            output: ``"objects"`` for a list of PlainDates, ``"array"`` for an ``array('q')`` of
+                days since 1970-01-01, or ``"numpy"`` for a NumPy int64 array of days since 1970-01-01
+            errors: If given, failed rows are recorded here as ``{index: error}`` and filled
+                with None (or ``MISSING_INT64`` in column outputs) instead of raising
+
+        Returns:
+            A list or column aligned with ``strings``
+        """
+        if output == "objects":
+            calendar = calendar or ISO_CALENDAR
+            from_epoch_days = cls._from_epoch_days
+            return parse_many(strings, lambda text: from_epoch_days(parse_iso_epoch_days(text), calendar), output, errors)
+        return parse_many(strings, parse_iso_epoch_days, output, errors)
+
+    @classmethod
+    def range(cls, start: "PlainDate", stop: "PlainDate", step: Optional["Duration"] = None) -> "PlainDateRange":
+        """Get a lazy range of PlainDate values from ``start`` up to, but not including, ``stop``.
+
+        Args:
+            start: The first value
+            stop: The exclusive end value
+            step: Step between values (defaults to 1 day); must be a whole number of days and may be negative
+
+        Returns:
+            A sequence supporting ``len()``, indexing, slicing, ``in`` and ``index()`` in constant time
+        """
+        from .ranges import PlainDateRange
+
+        return PlainDateRange(start, stop, step)
 
     @classmethod
     def today(cls, calendar: Optional[Calendar] = None) -> "PlainDate":
         """Get today's date."""
         today = date.today()
-        return cls(today.year, today.month, today.day, calendar)
+        return cls._from_fields(today.year, today.month, today.day, calendar or ISO_CALENDAR)
 
     def until(self, other: "PlainDate") -> "Duration":
         """Calculate duration from this date to another.
@@ -253,7 +337,7 @@ class PlainDate:
         """
         from .plain_year_month import PlainYearMonth
 
-        return PlainYearMonth(self._year, self._month, self._calendar)
+        return PlainYearMonth._from_fields(self._year, self._month, self._calendar)
 
     def to_plain_month_day(self) -> "PlainMonthDay":
         """Convert to PlainMonthDay.
@@ -263,7 +347,7 @@ class PlainDate:
         """
         from .plain_month_day import PlainMonthDay
 
-        return PlainMonthDay(self._month, self._day, self._calendar)
+        return PlainMonthDay._from_fields(self._month, self._day, self._calendar)
 
     def to_zoned_date_time(self, timezone, time=None) -> "ZonedDateTime":
         """Convert to ZonedDateTime by adding timezone and optional time.
@@ -276,14 +360,18 @@ class PlainDate:
             A ZonedDateTime
         """
         from .plain_time import PlainTime
+        from .timezone import TimeZone
         from .zoned_date_time import ZonedDateTime
 
+        if not isinstance(timezone, TimeZone):
+            raise InvalidArgumentError("Expected TimeZone object")
+
         if time is None:
-            time = PlainTime(0, 0, 0)
+            return ZonedDateTime._from_wall_fields(self._year, self._month, self._day, 0, 0, 0, 0, timezone)
+        elif not isinstance(time, PlainTime):
+            raise InvalidArgumentError("Expected PlainTime object")
 
-        return ZonedDateTime(
-            self._year, self._month, self._day, time.hour, time.minute, time.second, time.microsecond, timezone
-        )
+        return ZonedDateTime._from_wall_fields(self._year, self._month, self._day, *time._fields(), timezone)
 
     def equals(self, other: "PlainDate") -> bool:
         """Check if this date equals another.
@@ -319,9 +407,9 @@ class PlainDate:
         if not isinstance(a, PlainDate) or not isinstance(b, PlainDate):
             raise InvalidArgumentError("Both arguments must be PlainDate")
 
-        if a < b:
+        if a._epoch_days < b._epoch_days:
             return -1
-        elif a > b:
+        elif a._epoch_days > b._epoch_days:
             return 1
         else:
             return 0
@@ -355,3 +443,12 @@ class PlainDate:
             return cls(year, month, day, calendar)
         else:
             raise InvalidArgumentError(f"Cannot create PlainDate from {type(value)}")
+
+
+# Slot setters for the constructors; calling the slot descriptors directly is
+# cheaper than going through object.__setattr__ for every field
+_set_year = PlainDate.__dict__["_year"].__set__
+_set_month = PlainDate.__dict__["_month"].__set__
+_set_day = PlainDate.__dict__["_day"].__set__
+_set_calendar = PlainDate.__dict__["_calendar"].__set__
+_set_epoch_days = PlainDate.__dict__["_epoch_days"].__set__
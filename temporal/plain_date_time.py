@@ -3,22 +3,47 @@ PlainDateTime implementation for the Temporal API.
 """
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional, Union
-
-from .calendar import Calendar
-from .exceptions import InvalidArgumentError
-from .utils import format_microseconds, pad_zero, parse_iso_datetime, validate_date_fields, validate_time_fields
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .calendar import ISO_CALENDAR, Calendar
+from .exceptions import InvalidArgumentError, RangeError, TemporalError
+from .parse_cache import cached_parse
+from .utils import (
+    NS_PER_DAY,
+    NS_PER_MICROSECOND,
+    NS_PER_SECOND,
+    TIME_ROUNDING_UNITS,
+    Immutable,
+    add_months,
+    bucket_bounds,
+    bucket_unit,
+    civil_from_days,
+    days_from_civil,
+    format_microseconds,
+    pad_zero,
+    parse_iso_datetime,
+    parse_iso_datetime_nanoseconds,
+    parse_many,
+    round_half_even,
+    rounding_increment_nanoseconds,
+    try_parse_iso_datetime,
+    validate_date_fields,
+    validate_time_fields,
+)
 
 if TYPE_CHECKING:
     from .duration import Duration
     from .plain_date import PlainDate
     from .plain_time import PlainTime
+    from .ranges import PlainDateTimeRange
     from .zoned_date_time import ZonedDateTime
 
 
-class PlainDateTime:
+class PlainDateTime(Immutable):
     """Represents a date and time without time zone information."""
 
+    __slots__ = ("_year", "_month", "_day", "_hour", "_minute", "_second", "_microsecond", "_calendar")
+
     def __init__(
         self,
         year: int,
@@ -34,14 +59,68 @@ class PlainDateTime:
         validate_date_fields(year, month, day)
         validate_time_fields(hour, minute, second, microsecond)
 
-        self._year = year
-        self._month = month
-        self._day = day
-        self._hour = hour
-        self._minute = minute
-        self._second = second
-        self._microsecond = microsecond
-        self._calendar = calendar or Calendar()
+        _set_year(self, year)
+        _set_month(self, month)
+        _set_day(self, day)
+        _set_hour(self, hour)
+        _set_minute(self, minute)
+        _set_second(self, second)
+        _set_microsecond(self, microsecond)
+        _set_calendar(self, calendar or ISO_CALENDAR)
+
+    @classmethod
+    def _from_fields(
+        cls,
+        year: int,
+        month: int,
+        day: int,
+        hour: int,
+        minute: int,
+        second: int,
+        microsecond: int,
+        calendar: Calendar,
+    ) -> "PlainDateTime":
+        """Create a PlainDateTime from fields the library has already validated."""
+        datetime_ = object.__new__(cls)
+        _set_year(datetime_, year)
+        _set_month(datetime_, month)
+        _set_day(datetime_, day)
+        _set_hour(datetime_, hour)
+        _set_minute(datetime_, minute)
+        _set_second(datetime_, second)
+        _set_microsecond(datetime_, microsecond)
+        _set_calendar(datetime_, calendar)
+        return datetime_
+
+    @classmethod
+    def _from_epoch_days_and_nanoseconds(cls, epoch_days: int, nanosecond_of_day: int, calendar: Calendar) -> "PlainDateTime":
+        """Create a PlainDateTime from a day ordinal and a nanosecond offset, carrying whole days into the date.
+
+        ``nanosecond_of_day`` may be negative or span several days; only the
+        resulting year is checked.
+        """
+        carry, nanosecond_of_day = divmod(nanosecond_of_day, NS_PER_DAY)
+        year, month, day = civil_from_days(epoch_days + carry)
+        if year < 1 or year > 9999:
+            raise RangeError(f"Year {year} is out of range (1-9999)")
+        second_of_day, nanosecond = divmod(nanosecond_of_day, NS_PER_SECOND)
+        minute_of_day, second = divmod(second_of_day, 60)
+        hour, minute = divmod(minute_of_day, 60)
+        return cls._from_fields(year, month, day, hour, minute, second, nanosecond // NS_PER_MICROSECOND, calendar)
+
+    def _nanosecond_of_day(self) -> int:
+        """Get the nanoseconds since midnight of the time part."""
+        return ((self._hour * 60 + self._minute) * 60 + self._second) * NS_PER_SECOND + self._microsecond * NS_PER_MICROSECOND
+
+    def _local_nanoseconds(self) -> int:
+        """Get the wall-clock nanoseconds since 1970-01-01T00:00."""
+        return days_from_civil(self._year, self._month, self._day) * NS_PER_DAY + self._nanosecond_of_day()
+
+    def __reduce__(self):
+        return (
+            type(self),
+            (self._year, self._month, self._day, self._hour, self._minute, self._second, self._microsecond, self._calendar),
+        )
 
     @property
     def year(self) -> int:
@@ -86,26 +165,30 @@ class PlainDateTime:
     @property
     def day_of_week(self) -> int:
         """Get the day of the week (1=Monday, 7=Sunday)."""
-        dt = datetime(self._year, self._month, self._day)
-        return dt.isoweekday()
+        # 1970-01-01 was a Thursday
+        return (days_from_civil(self._year, self._month, self._day) + 3) % 7 + 1
 
     def to_plain_date(self) -> "PlainDate":
         """Extract the date part."""
         from .plain_date import PlainDate
 
-        return PlainDate(self._year, self._month, self._day, self._calendar)
+        return PlainDate._from_fields(self._year, self._month, self._day, self._calendar)
 
     def to_plain_time(self) -> "PlainTime":
         """Extract the time part."""
         from .plain_time import PlainTime
 
-        return PlainTime(self._hour, self._minute, self._second, self._microsecond)
+        return PlainTime._from_fields(self._hour, self._minute, self._second, self._microsecond)
 
     def to_zoned_date_time(self, timezone) -> "ZonedDateTime":
         """Convert to ZonedDateTime with the given timezone."""
+        from .timezone import TimeZone
         from .zoned_date_time import ZonedDateTime
 
-        return ZonedDateTime(
+        if not isinstance(timezone, TimeZone):
+            raise InvalidArgumentError("Expected TimeZone object")
+
+        return ZonedDateTime._from_wall_fields(
             self._year,
             self._month,
             self._day,
@@ -124,21 +207,17 @@ class PlainDateTime:
         if not isinstance(duration, Duration):
             raise InvalidArgumentError("Expected Duration object")
 
-        # Add date components
-        date_part = self.to_plain_date().add(duration)
-
-        # Add time components
-        time_part = self.to_plain_time().add(duration)
+        if duration.years or duration.months:
+            # Move by whole months first, clamping the day to the target month
+            epoch_days = days_from_civil(
+                *add_months(self._year, self._month, self._day, duration.years * 12 + duration.months)
+            )
+        else:
+            epoch_days = days_from_civil(self._year, self._month, self._day)
 
-        return PlainDateTime(
-            date_part.year,
-            date_part.month,
-            date_part.day,
-            time_part.hour,
-            time_part.minute,
-            time_part.second,
-            time_part.microsecond,
-            self._calendar,
+        # Then add days and time exactly; overflow past midnight carries into the date
+        return PlainDateTime._from_epoch_days_and_nanoseconds(
+            epoch_days, self._nanosecond_of_day() + duration._total_nanoseconds(), self._calendar
         )
 
     def subtract(self, other) -> Union["PlainDateTime", "Duration"]:
@@ -147,26 +226,11 @@ class PlainDateTime:
 
         if isinstance(other, Duration):
             # Subtract duration - negate and add
-            negated_duration = Duration(
-                -other.years,
-                -other.months,
-                -other.weeks,
-                -other.days,
-                -other.hours,
-                -other.minutes,
-                -other.seconds,
-                -other.microseconds,
-            )
-            return self.add(negated_duration)
+            return self.add(other.negated())
         elif isinstance(other, PlainDateTime):
             # Subtract datetime - return duration
-            dt1 = datetime(self._year, self._month, self._day, self._hour, self._minute, self._second, self._microsecond)
-            dt2 = datetime(
-                other._year, other._month, other._day, other._hour, other._minute, other._second, other._microsecond
-            )
-            delta = dt1 - dt2
-
-            return Duration(days=delta.days, seconds=delta.seconds, microseconds=delta.microseconds)
+            days = days_from_civil(self._year, self._month, self._day) - days_from_civil(other._year, other._month, other._day)
+            return Duration._from_nanoseconds(days * NS_PER_DAY + self._nanosecond_of_day() - other._nanosecond_of_day())
         else:
             raise InvalidArgumentError("Expected PlainDateTime or Duration object")
 
@@ -221,6 +285,7 @@ class PlainDateTime:
             and self._minute == other._minute
             and self._second == other._second
             and self._microsecond == other._microsecond
+            and (self._calendar is other._calendar or self._calendar == other._calendar)
         )
 
     def __lt__(self, other) -> bool:
@@ -254,16 +319,75 @@ class PlainDateTime:
         return hash((self._year, self._month, self._day, self._hour, self._minute, self._second, self._microsecond))
 
     @classmethod
+    @cached_parse
     def from_string(cls, datetime_string: str, calendar: Optional[Calendar] = None) -> "PlainDateTime":
         """Create PlainDateTime from ISO 8601 string."""
         year, month, day, hour, minute, second, microsecond = parse_iso_datetime(datetime_string)
-        return cls(year, month, day, hour, minute, second, microsecond, calendar)
+        return cls._from_fields(year, month, day, hour, minute, second, microsecond, calendar or ISO_CALENDAR)
+
+    @classmethod
+    def try_from_string(cls, datetime_string: str, calendar: Optional[Calendar] = None) -> Optional["PlainDateTime"]:
+        """Create PlainDateTime from ISO 8601 string, or return None where ``from_string`` would raise."""
+        fields = try_parse_iso_datetime(datetime_string)
+        if fields is None:
+            return None
+        return cls._from_fields(*fields, calendar or ISO_CALENDAR)
+
+    @staticmethod
+    def is_valid_string(datetime_string: str) -> bool:
+        """Check whether ``from_string`` accepts a string, without creating a PlainDateTime."""
+        return try_parse_iso_datetime(datetime_string) is not None
+
+    @classmethod
+    def parse_many(
+        cls,
+        strings: Iterable[str],
+        calendar: Optional[Calendar] = None,
+        *,
+        output: str = "objects",
+        errors: Optional[Dict[int, TemporalError]] = None,
+    ) -> Union[List[Optional["PlainDateTime"]], Any]:
+        """Parse many ISO 8601 datetime strings in one call.
+
+        Args:
+            strings: The strings to parse
+            calendar: Calendar for the created PlainDateTime (defaults to ISO)
+            output: ``"objects"`` for a list of PlainDateTimes, ``"array"`` for an ``array('q')`` of
+                wall-clock nanoseconds since 1970-01-01T00:00, or ``"numpy"`` for a NumPy int64 array of wall-clock nanoseconds since 1970-01-01T00:00
+            errors: If given, failed rows are recorded here as ``{index: error}`` and filled
+                with None (or ``MISSING_INT64`` in column outputs) instead of raising
+
+        Returns:
+            A list or column aligned with ``strings``
+        """
+        if output == "objects":
+            calendar = calendar or ISO_CALENDAR
+            return parse_many(strings, lambda text: cls._from_fields(*parse_iso_datetime(text), calendar), output, errors)
+        return parse_many(strings, parse_iso_datetime_nanoseconds, output, errors)
+
+    @classmethod
+    def range(cls, start: "PlainDateTime", stop: "PlainDateTime", step: Optional["Duration"] = None) -> "PlainDateTimeRange":
+        """Get a lazy range of PlainDateTime values from ``start`` up to, but not including, ``stop``.
+
+        Args:
+            start: The first value
+            stop: The exclusive end value
+            step: Step between values (defaults to 1 day); must be a fixed length of time, without years or months and may be negative
+
+        Returns:
+            A sequence supporting ``len()``, indexing, slicing, ``in`` and ``index()`` in constant time
+        """
+        from .ranges import PlainDateTimeRange
+
+        return PlainDateTimeRange(start, stop, step)
 
     @classmethod
     def now(cls, calendar: Optional[Calendar] = None) -> "PlainDateTime":
         """Get the current datetime."""
         now = datetime.now()
-        return cls(now.year, now.month, now.day, now.hour, now.minute, now.second, now.microsecond, calendar)
+        return cls._from_fields(
+            now.year, now.month, now.day, now.hour, now.minute, now.second, now.microsecond, calendar or ISO_CALENDAR
+        )
 
     def until(self, other: "PlainDateTime") -> "Duration":
         """Calculate duration from this datetime to another.
@@ -309,36 +433,76 @@ class PlainDateTime:
         else:
             raise InvalidArgumentError("Options must be string or dict")
 
-        # For date units, delegate to PlainDate
-        if smallest_unit in ["years", "months", "days"]:
-            # For simplicity, we don't round date parts here
-            return self
-
-        # For time units, round the time part
-        from .plain_time import PlainTime
-
-        time_part = PlainTime(self._hour, self._minute, self._second, self._microsecond)
-        rounded_time = time_part.round(options)
+        if smallest_unit == "days":
+            increment_ns = NS_PER_DAY
+        elif smallest_unit in ("years", "months"):
+            # Months and years have no fixed length to round to the nearest of
+            raise InvalidArgumentError(f"Cannot round to {smallest_unit}; use floor(), ceil() or bucket()")
+        else:
+            increment_ns = rounding_increment_nanoseconds(options, TIME_ROUNDING_UNITS, "microseconds")
 
-        new_datetime = PlainDateTime(
-            self._year,
-            self._month,
-            self._day,
-            rounded_time.hour,
-            rounded_time.minute,
-            rounded_time.second,
-            rounded_time.microsecond,
+        # Round the time part; rounding up to midnight carries into the next day
+        return PlainDateTime._from_epoch_days_and_nanoseconds(
+            days_from_civil(self._year, self._month, self._day),
+            round_half_even(self._nanosecond_of_day(), increment_ns),
             self._calendar,
         )
 
-        # Handle case where rounding time caused day overflow
-        if rounded_time.hour == 0 and self._hour == 23:
-            # Time rounded to next day
-            from .duration import Duration
+    def _bucket_bounds(self, options: Union[str, dict]) -> Tuple[int, int]:
+        """Get the start and end, in wall-clock nanoseconds since 1970-01-01T00:00, of the bucket containing this datetime."""
+        unit, increment = bucket_unit(options)
+        if unit == "nanoseconds" and increment % NS_PER_MICROSECOND:
+            raise RangeError("PlainDateTime buckets must be a whole number of microseconds")
+        return bucket_bounds(self._local_nanoseconds(), unit, increment)
+
+    def floor(self, options: Union[str, dict]) -> "PlainDateTime":
+        """Round the datetime down to the start of its bucket.
+
+        Fixed units are counted from midnight; calendar units are days, ISO
+        weeks (from Monday), months, quarters and years.
+
+        Args:
+            options: Either a string unit name or dict with 'smallestUnit' and optional 'roundingIncrement'
+
+        Returns:
+            The latest bucket boundary at or before this datetime
+        """
+        return PlainDateTime._from_epoch_days_and_nanoseconds(0, self._bucket_bounds(options)[0], self._calendar)
+
+    def ceil(self, options: Union[str, dict]) -> "PlainDateTime":
+        """Round the datetime up to the next bucket boundary, or return it unchanged if it is on one.
+
+        Args:
+            options: Either a string unit name or dict with 'smallestUnit' and optional 'roundingIncrement'
+
+        Returns:
+            The earliest bucket boundary at or after this datetime
+
+        Raises:
+            RangeError: If the boundary is after year 9999
+        """
+        start, end = self._bucket_bounds(options)
+        if start == self._local_nanoseconds():
+            return self
+        return PlainDateTime._from_epoch_days_and_nanoseconds(0, end, self._calendar)
+
+    def bucket(self, options: Union[str, dict]) -> Tuple["PlainDateTime", "PlainDateTime"]:
+        """Get the bucket containing the datetime.
 
-            new_datetime = new_datetime.add(Duration(days=1))
+        Args:
+            options: Either a string unit name or dict with 'smallestUnit' and optional 'roundingIncrement'
 
-        return new_datetime
+        Returns:
+            The half-open ``(start, end)`` interval of the bucket
+
+        Raises:
+            RangeError: If the end is after year 9999
+        """
+        start, end = self._bucket_bounds(options)
+        return (
+            PlainDateTime._from_epoch_days_and_nanoseconds(0, start, self._calendar),
+            PlainDateTime._from_epoch_days_and_nanoseconds(0, end, self._calendar),
+        )
 
     def with_plain_time(self, time: "PlainTime") -> "PlainDateTime":
         """Replace the time part with a new time.
@@ -354,9 +518,7 @@ class PlainDateTime:
         if not isinstance(time, PlainTime):
             raise InvalidArgumentError("Expected PlainTime")
 
-        return PlainDateTime(
-            self._year, self._month, self._day, time.hour, time.minute, time.second, time.microsecond, self._calendar
-        )
+        return PlainDateTime._from_fields(self._year, self._month, self._day, *time._fields(), self._calendar)
 
     def with_calendar(self, calendar: Calendar) -> "PlainDateTime":
         """Replace the calendar with a new calendar.
@@ -370,7 +532,7 @@ class PlainDateTime:
         if not isinstance(calendar, Calendar):
             raise InvalidArgumentError("Expected Calendar")
 
-        return PlainDateTime(
+        return PlainDateTime._from_fields(
             self._year, self._month, self._day, self._hour, self._minute, self._second, self._microsecond, calendar
         )
 
@@ -448,3 +610,15 @@ class PlainDateTime:
             return cls(year, month, day, hour, minute, second, microsecond, calendar)
         else:
             raise InvalidArgumentError(f"Cannot create PlainDateTime from {type(value)}")
+
+
+# Slot setters for the constructors; calling the slot descriptors directly is
+# cheaper than going through object.__setattr__ for every field
+_set_year = PlainDateTime.__dict__["_year"].__set__
+_set_month = PlainDateTime.__dict__["_month"].__set__
+_set_day = PlainDateTime.__dict__["_day"].__set__
+_set_hour = PlainDateTime.__dict__["_hour"].__set__
+_set_minute = PlainDateTime.__dict__["_minute"].__set__
+_set_second = PlainDateTime.__dict__["_second"].__set__
+_set_microsecond = PlainDateTime.__dict__["_microsecond"].__set__
+_set_calendar = PlainDateTime.__dict__["_calendar"].__set__
@@ -5,24 +5,33 @@ Represents a month-day combination without a year.
 
 from __future__ import annotations
 
-import re
 from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
-from .calendar import Calendar
+from .calendar import ISO_CALENDAR, Calendar
 from .exceptions import InvalidArgumentError, RangeError, TemporalError
-from .utils import get_days_in_month, pad_zero, validate_date_fields
+from .utils import (
+    Immutable,
+    get_days_in_month,
+    is_valid_date,
+    pad_zero,
+    parse_iso_month_day,
+    try_parse_iso_month_day,
+    validate_date_fields,
+)
 
 if TYPE_CHECKING:
     from .plain_date import PlainDate
 
 
-class PlainMonthDay:
+class PlainMonthDay(Immutable):
     """
     PlainMonthDay represents a month-day combination without a year.
     It's useful for representing recurring dates like birthdays, anniversaries,
     or holidays that occur on the same month-day each year.
     """
 
+    __slots__ = ("_month", "_day", "_calendar")
+
     def __init__(self, month: int, day: int, calendar: Optional[Calendar] = None):
         """
         Initialize a PlainMonthDay.
@@ -45,9 +54,21 @@ class PlainMonthDay:
         elif day > get_days_in_month(2000, month):
             raise RangeError(f"Day {day} is invalid for month {month}")
 
-        self._month = month
-        self._day = day
-        self._calendar = calendar or Calendar.from_string("iso8601")
+        object.__setattr__(self, "_month", month)
+        object.__setattr__(self, "_day", day)
+        object.__setattr__(self, "_calendar", calendar or ISO_CALENDAR)
+
+    @classmethod
+    def _from_fields(cls, month: int, day: int, calendar: Calendar) -> PlainMonthDay:
+        """Create a PlainMonthDay from fields the library has already validated."""
+        month_day = object.__new__(cls)
+        object.__setattr__(month_day, "_month", month)
+        object.__setattr__(month_day, "_day", day)
+        object.__setattr__(month_day, "_calendar", calendar)
+        return month_day
+
+    def __reduce__(self):
+        return (type(self), (self._month, self._day, self._calendar))
 
     @property
     def month(self) -> int:
@@ -125,7 +146,11 @@ class PlainMonthDay:
         """
         if not isinstance(other, PlainMonthDay):
             return False
-        return self._month == other._month and self._day == other._day and self._calendar.id == other._calendar.id
+        return (
+            self._month == other._month
+            and self._day == other._day
+            and (self._calendar is other._calendar or self._calendar == other._calendar)
+        )
 
     def __str__(self) -> str:
         """String representation in ISO 8601 format (--MM-DD)."""
@@ -151,6 +176,9 @@ class PlainMonthDay:
     def __ne__(self, other) -> bool:
         return not self.equals(other)
 
+    def __hash__(self) -> int:
+        return hash((self._month, self._day))
+
     def __lt__(self, other) -> bool:
         if not isinstance(other, PlainMonthDay):
             return NotImplemented
@@ -182,17 +210,31 @@ class PlainMonthDay:
         Returns:
             A new PlainMonthDay
         """
-        # Match --MM-DD or MM-DD format
-        pattern = r"^(?:--)?(\d{1,2})-(\d{1,2})$"
-        match = re.match(pattern, month_day_string)
+        month, day = parse_iso_month_day(month_day_string)
+        return PlainMonthDay(month, day)
 
-        if not match:
-            raise InvalidArgumentError(f"Invalid PlainMonthDay string: {month_day_string}")
+    @staticmethod
+    def try_from_string(month_day_string: str) -> Optional[PlainMonthDay]:
+        """
+        Create a PlainMonthDay from an ISO 8601 string, or return None where from_string would raise.
 
-        month = int(match.group(1))
-        day = int(match.group(2))
+        Args:
+            month_day_string: String in format '--MM-DD' or 'MM-DD'
 
-        return PlainMonthDay(month, day)
+        Returns:
+            A new PlainMonthDay, or None
+        """
+        fields = try_parse_iso_month_day(month_day_string)
+        # Year 2000 is a leap year, so February 29 is accepted
+        if fields is None or not is_valid_date(2000, fields[0], fields[1]):
+            return None
+        return PlainMonthDay._from_fields(fields[0], fields[1], ISO_CALENDAR)
+
+    @staticmethod
+    def is_valid_string(month_day_string: str) -> bool:
+        """Check whether from_string accepts a string, without creating a PlainMonthDay."""
+        fields = try_parse_iso_month_day(month_day_string)
+        return fields is not None and is_valid_date(2000, fields[0], fields[1])
 
     @staticmethod
     def from_fields(fields: Dict[str, Any]) -> PlainMonthDay:
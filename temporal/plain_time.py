@@ -2,46 +2,93 @@
 PlainTime implementation for the Temporal API.
 """
 
-from typing import TYPE_CHECKING, Optional, Union
-
-from .exceptions import InvalidArgumentError, RangeError
-from .utils import format_microseconds, pad_zero, parse_iso_time, validate_time_fields
+from typing import TYPE_CHECKING, Optional, Tuple, Union
+
+from .exceptions import InvalidArgumentError
+from .utils import (
+    NS_PER_DAY,
+    NS_PER_MICROSECOND,
+    NS_PER_SECOND,
+    TIME_ROUNDING_UNITS,
+    Immutable,
+    format_microseconds,
+    pad_zero,
+    parse_iso_time,
+    round_half_even,
+    rounding_increment_nanoseconds,
+    try_parse_iso_time,
+    validate_time_fields,
+)
 
 if TYPE_CHECKING:
     from .duration import Duration
 
+NS_PER_MINUTE = 60 * NS_PER_SECOND
+NS_PER_HOUR = 60 * NS_PER_MINUTE
+
+
+class PlainTime(Immutable):
+    """Represents a time without date or time zone information.
 
-class PlainTime:
-    """Represents a time without date or time zone information."""
+    The canonical state is a single integer count of nanoseconds since
+    midnight; the individual fields are derived from it on access.
+    """
+
+    __slots__ = ("_nanosecond_of_day",)
 
     def __init__(self, hour: int = 0, minute: int = 0, second: int = 0, microsecond: int = 0):
         """Initialize a PlainTime with hour, minute, second, and microsecond."""
         validate_time_fields(hour, minute, second, microsecond)
 
-        self._hour = hour
-        self._minute = minute
-        self._second = second
-        self._microsecond = microsecond
+        _set_nanosecond_of_day(
+            self, hour * NS_PER_HOUR + minute * NS_PER_MINUTE + second * NS_PER_SECOND + microsecond * NS_PER_MICROSECOND
+        )
+
+    @classmethod
+    def _from_nanosecond_of_day(cls, nanosecond_of_day: int) -> "PlainTime":
+        """Create a PlainTime from nanoseconds since midnight (0 <= value < 24h) without validation."""
+        time = object.__new__(cls)
+        _set_nanosecond_of_day(time, nanosecond_of_day)
+        return time
+
+    @classmethod
+    def _from_fields(cls, hour: int, minute: int, second: int, microsecond: int) -> "PlainTime":
+        """Create a PlainTime from fields the library has already validated."""
+        time = object.__new__(cls)
+        _set_nanosecond_of_day(
+            time, hour * NS_PER_HOUR + minute * NS_PER_MINUTE + second * NS_PER_SECOND + microsecond * NS_PER_MICROSECOND
+        )
+        return time
+
+    def __reduce__(self):
+        return (type(self)._from_nanosecond_of_day, (self._nanosecond_of_day,))
 
     @property
     def hour(self) -> int:
         """Get the hour (0-23)."""
-        return self._hour
+        return self._nanosecond_of_day // NS_PER_HOUR
 
     @property
     def minute(self) -> int:
         """Get the minute (0-59)."""
-        return self._minute
+        return self._nanosecond_of_day // NS_PER_MINUTE % 60
 
     @property
     def second(self) -> int:
         """Get the second (0-59)."""
-        return self._second
+        return self._nanosecond_of_day // NS_PER_SECOND % 60
 
     @property
     def microsecond(self) -> int:
         """Get the microsecond (0-999999)."""
-        return self._microsecond
+        return self._nanosecond_of_day // NS_PER_MICROSECOND % 1_000_000
+
+    def _fields(self) -> Tuple[int, int, int, int]:
+        """Get (hour, minute, second, microsecond) in one pass."""
+        second_of_day, nanosecond = divmod(self._nanosecond_of_day, NS_PER_SECOND)
+        minute_of_day, second = divmod(second_of_day, 60)
+        hour, minute = divmod(minute_of_day, 60)
+        return hour, minute, second, nanosecond // NS_PER_MICROSECOND
 
     def add(self, duration) -> "PlainTime":
         """Add a duration to this time."""
@@ -50,57 +97,19 @@ class PlainTime:
         if not isinstance(duration, Duration):
             raise InvalidArgumentError("Expected Duration object")
 
-        # Convert everything to microseconds for calculation
-        total_microseconds = (
-            self._hour * 3600 * 1000000
-            + self._minute * 60 * 1000000
-            + self._second * 1000000
-            + self._microsecond
-            + duration.hours * 3600 * 1000000
-            + duration.minutes * 60 * 1000000
-            + duration.seconds * 1000000
-            + duration.microseconds
-        )
-
-        # Handle day overflow/underflow by taking modulo
-        total_microseconds = total_microseconds % (24 * 3600 * 1000000)
-        if total_microseconds < 0:
-            total_microseconds += 24 * 3600 * 1000000
-
-        # Convert back to time components
-        total_seconds, microsecond = divmod(total_microseconds, 1000000)
-        total_minutes, second = divmod(total_seconds, 60)
-        hour, minute = divmod(total_minutes, 60)
-
-        return PlainTime(int(hour), int(minute), int(second), int(microsecond))
+        # Whole days in the duration wrap around, so only the time part matters
+        return PlainTime._from_nanosecond_of_day((self._nanosecond_of_day + duration._total_nanoseconds()) % NS_PER_DAY)
 
     def subtract(self, other) -> Union["PlainTime", "Duration"]:
         """Subtract another time or duration from this time."""
         from .duration import Duration
 
         if isinstance(other, Duration):
-            # Subtract duration - negate and add
-            negated_duration = Duration(
-                -other.years,
-                -other.months,
-                -other.weeks,
-                -other.days,
-                -other.hours,
-                -other.minutes,
-                -other.seconds,
-                -other.microseconds,
-            )
-            return self.add(negated_duration)
+            # Subtract duration - only the time part matters, as in add()
+            return PlainTime._from_nanosecond_of_day((self._nanosecond_of_day - other._total_nanoseconds()) % NS_PER_DAY)
         elif isinstance(other, PlainTime):
             # Subtract time - return duration
-            self_microseconds = (
-                self._hour * 3600 * 1000000 + self._minute * 60 * 1000000 + self._second * 1000000 + self._microsecond
-            )
-            other_microseconds = (
-                other._hour * 3600 * 1000000 + other._minute * 60 * 1000000 + other._second * 1000000 + other._microsecond
-            )
-
-            diff_microseconds = self_microseconds - other_microseconds
+            diff_microseconds = (self._nanosecond_of_day - other._nanosecond_of_day) // NS_PER_MICROSECOND
 
             # Convert to duration components
             total_seconds, microseconds = divmod(abs(diff_microseconds), 1000000)
@@ -110,7 +119,7 @@ class PlainTime:
             if diff_microseconds < 0:
                 hours, minutes, seconds, microseconds = -hours, -minutes, -seconds, -microseconds
 
-            return Duration(hours=int(hours), minutes=int(minutes), seconds=int(seconds), microseconds=int(microseconds))
+            return Duration._from_fields(hours=hours, minutes=minutes, seconds=seconds, microseconds=microseconds)
         else:
             raise InvalidArgumentError("Expected PlainTime or Duration object")
 
@@ -123,67 +132,79 @@ class PlainTime:
         microsecond: Optional[int] = None,
     ) -> "PlainTime":
         """Return a new PlainTime with specified fields replaced."""
-        new_hour = hour if hour is not None else self._hour
-        new_minute = minute if minute is not None else self._minute
-        new_second = second if second is not None else self._second
-        new_microsecond = microsecond if microsecond is not None else self._microsecond
+        current_hour, current_minute, current_second, current_microsecond = self._fields()
+        new_hour = hour if hour is not None else current_hour
+        new_minute = minute if minute is not None else current_minute
+        new_second = second if second is not None else current_second
+        new_microsecond = microsecond if microsecond is not None else current_microsecond
 
         return PlainTime(new_hour, new_minute, new_second, new_microsecond)
 
     def __str__(self) -> str:
         """Return ISO 8601 string representation."""
-        base = f"{pad_zero(self._hour)}:{pad_zero(self._minute)}:{pad_zero(self._second)}"
-        if self._microsecond:
-            base += format_microseconds(self._microsecond)
+        hour, minute, second, microsecond = self._fields()
+        base = f"{pad_zero(hour)}:{pad_zero(minute)}:{pad_zero(second)}"
+        if microsecond:
+            base += format_microseconds(microsecond)
         return base
 
     def __repr__(self) -> str:
         """Return detailed string representation."""
-        return f"PlainTime({self._hour}, {self._minute}, {self._second}, {self._microsecond})"
+        hour, minute, second, microsecond = self._fields()
+        return f"PlainTime({hour}, {minute}, {second}, {microsecond})"
 
     def __eq__(self, other) -> bool:
         """Check equality with another PlainTime."""
         if not isinstance(other, PlainTime):
             return False
-        return (
-            self._hour == other._hour
-            and self._minute == other._minute
-            and self._second == other._second
-            and self._microsecond == other._microsecond
-        )
+        return self._nanosecond_of_day == other._nanosecond_of_day
 
     def __lt__(self, other) -> bool:
         """Check if this time is less than another."""
         if not isinstance(other, PlainTime):
             raise InvalidArgumentError("Expected PlainTime object")
-        return (self._hour, self._minute, self._second, self._microsecond) < (
-            other._hour,
-            other._minute,
-            other._second,
-            other._microsecond,
-        )
+        return self._nanosecond_of_day < other._nanosecond_of_day
 
     def __le__(self, other) -> bool:
         """Check if this time is less than or equal to another."""
-        return self == other or self < other
+        if not isinstance(other, PlainTime):
+            raise InvalidArgumentError("Expected PlainTime object")
+        return self._nanosecond_of_day <= other._nanosecond_of_day
 
     def __gt__(self, other) -> bool:
         """Check if this time is greater than another."""
-        return not self <= other
+        if not isinstance(other, PlainTime):
+            raise InvalidArgumentError("Expected PlainTime object")
+        return self._nanosecond_of_day > other._nanosecond_of_day
 
     def __ge__(self, other) -> bool:
         """Check if this time is greater than or equal to another."""
-        return not self < other
+        if not isinstance(other, PlainTime):
+            raise InvalidArgumentError("Expected PlainTime object")
+        return self._nanosecond_of_day >= other._nanosecond_of_day
 
     def __hash__(self) -> int:
         """Hash function for PlainTime."""
-        return hash((self._hour, self._minute, self._second, self._microsecond))
+        return hash(self._nanosecond_of_day)
 
     @classmethod
     def from_string(cls, time_string: str) -> "PlainTime":
         """Create PlainTime from ISO 8601 string."""
         hour, minute, second, microsecond = parse_iso_time(time_string)
-        return cls(hour, minute, second, microsecond)
+        return cls._from_fields(hour, minute, second, microsecond)
+
+    @classmethod
+    def try_from_string(cls, time_string: str) -> Optional["PlainTime"]:
+        """Create PlainTime from ISO 8601 string, or return None where ``from_string`` would raise."""
+        fields = try_parse_iso_time(time_string)
+        if fields is None:
+            return None
+        return cls._from_fields(*fields)
+
+    @staticmethod
+    def is_valid_string(time_string: str) -> bool:
+        """Check whether ``from_string`` accepts a string, without creating a PlainTime."""
+        return try_parse_iso_time(time_string) is not None
 
     def until(self, other: "PlainTime") -> "Duration":
         """Calculate duration from this time to another.
@@ -222,45 +243,10 @@ class PlainTime:
         Returns:
             A new rounded PlainTime
         """
-        if isinstance(options, str):
-            smallest_unit = options
-            rounding_increment = 1
-        elif isinstance(options, dict):
-            smallest_unit = options.get("smallestUnit", "microseconds")
-            rounding_increment = options.get("roundingIncrement", 1)
-        else:
-            raise InvalidArgumentError("Options must be string or dict")
+        increment_ns = rounding_increment_nanoseconds(options, TIME_ROUNDING_UNITS, "microseconds")
 
-        # Convert to total microseconds
-        total_microseconds = (
-            self._hour * 3600 * 1000000 + self._minute * 60 * 1000000 + self._second * 1000000 + self._microsecond
-        )
-
-        if smallest_unit == "hours":
-            increment_us = rounding_increment * 3600 * 1000000
-        elif smallest_unit == "minutes":
-            increment_us = rounding_increment * 60 * 1000000
-        elif smallest_unit == "seconds":
-            increment_us = rounding_increment * 1000000
-        elif smallest_unit == "milliseconds":
-            increment_us = rounding_increment * 1000
-        elif smallest_unit == "microseconds":
-            increment_us = rounding_increment
-        else:
-            raise InvalidArgumentError(f"Invalid unit: {smallest_unit}")
-
-        # Round to the nearest increment
-        rounded_us = round(total_microseconds / increment_us) * increment_us
-
-        # Convert back to time components
-        total_seconds, microsecond = divmod(rounded_us, 1000000)
-        total_minutes, second = divmod(total_seconds, 60)
-        hour, minute = divmod(total_minutes, 60)
-
-        # Handle 24-hour wraparound
-        hour = hour % 24
-
-        return PlainTime(int(hour), int(minute), int(second), int(microsecond))
+        # Round to the nearest increment, handling 24-hour wraparound
+        return PlainTime._from_nanosecond_of_day(round_half_even(self._nanosecond_of_day, increment_ns) % NS_PER_DAY)
 
     def equals(self, other: "PlainTime") -> bool:
         """Check if this time equals another.
@@ -296,9 +282,9 @@ class PlainTime:
         if not isinstance(a, PlainTime) or not isinstance(b, PlainTime):
             raise InvalidArgumentError("Both arguments must be PlainTime")
 
-        if a < b:
+        if a._nanosecond_of_day < b._nanosecond_of_day:
             return -1
-        elif a > b:
+        elif a._nanosecond_of_day > b._nanosecond_of_day:
             return 1
         else:
             return 0
@@ -326,3 +312,7 @@ class PlainTime:
             return cls(hour, minute, second, microsecond)
         else:
             raise InvalidArgumentError(f"Cannot create PlainTime from {type(value)}")
+
+
+# Slot setter for the constructors, cheaper than object.__setattr__
+_set_nanosecond_of_day = PlainTime.__dict__["_nanosecond_of_day"].__set__
@@ -5,25 +5,36 @@ Represents a year-month combination without a specific day.
 
 from __future__ import annotations
 
-import re
 from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
-from .calendar import Calendar
+from .calendar import ISO_CALENDAR, Calendar
 from .duration import Duration
 from .exceptions import InvalidArgumentError, RangeError, TemporalError
-from .utils import get_days_in_month, is_leap_year, pad_zero, validate_date_fields
+from .utils import (
+    Immutable,
+    get_days_in_month,
+    is_leap_year,
+    is_valid_date,
+    pad_zero,
+    parse_iso_year_month,
+    try_parse_iso_year_month,
+    validate_date_fields,
+)
 
 if TYPE_CHECKING:
     from .plain_date import PlainDate
+    from .ranges import PlainYearMonthRange
 
 
-class PlainYearMonth:
+class PlainYearMonth(Immutable):
     """
     PlainYearMonth represents a year-month combination without a specific day.
     It's useful for representing things like "February 2023" or for date calculations
     that don't need a specific day.
     """
 
+    __slots__ = ("_year", "_month", "_calendar")
+
     def __init__(self, year: int, month: int, calendar: Optional[Calendar] = None):
         """
         Initialize a PlainYearMonth.
@@ -35,9 +46,21 @@ class PlainYearMonth:
         """
         validate_date_fields(year, month, 1)  # Use day=1 for validation
 
-        self._year = year
-        self._month = month
-        self._calendar = calendar or Calendar.from_string("iso8601")
+        object.__setattr__(self, "_year", year)
+        object.__setattr__(self, "_month", month)
+        object.__setattr__(self, "_calendar", calendar or ISO_CALENDAR)
+
+    @classmethod
+    def _from_fields(cls, year: int, month: int, calendar: Calendar) -> PlainYearMonth:
+        """Create a PlainYearMonth from fields the library has already validated."""
+        year_month = object.__new__(cls)
+        object.__setattr__(year_month, "_year", year)
+        object.__setattr__(year_month, "_month", month)
+        object.__setattr__(year_month, "_calendar", calendar)
+        return year_month
+
+    def __reduce__(self):
+        return (type(self), (self._year, self._month, self._calendar))
 
     @property
     def year(self) -> int:
@@ -110,7 +133,10 @@ class PlainYearMonth:
         if any([duration.days, duration.hours, duration.minutes, duration.seconds, duration.microseconds]):
             raise InvalidArgumentError("Cannot add time units to PlainYearMonth")
 
-        return PlainYearMonth(new_year, new_month, self._calendar)
+        # The month is normalized above, so only the year can leave the supported range
+        if new_year < 1 or new_year > 9999:
+            raise RangeError(f"Year {new_year} is out of range (1-9999)")
+        return PlainYearMonth._from_fields(new_year, new_month, self._calendar)
 
     def subtract(self, other: Union[Duration, PlainYearMonth]) -> Union[PlainYearMonth, Duration]:
         """
@@ -160,7 +186,7 @@ class PlainYearMonth:
                 final_years -= 1
                 final_months = 12 + final_months
 
-        return Duration(years=final_years, months=final_months)
+        return Duration._from_fields(years=final_years, months=final_months)
 
     def since(self, other: PlainYearMonth) -> Duration:
         """
@@ -216,7 +242,11 @@ class PlainYearMonth:
         """
         if not isinstance(other, PlainYearMonth):
             return False
-        return self._year == other._year and self._month == other._month and self._calendar.id == other._calendar.id
+        return (
+            self._year == other._year
+            and self._month == other._month
+            and (self._calendar is other._calendar or self._calendar == other._calendar)
+        )
 
     def __str__(self) -> str:
         """String representation in ISO 8601 format (YYYY-MM)."""
@@ -242,6 +272,9 @@ class PlainYearMonth:
     def __ne__(self, other) -> bool:
         return not self.equals(other)
 
+    def __hash__(self) -> int:
+        return hash((self._year, self._month))
+
     def __lt__(self, other) -> bool:
         if not isinstance(other, PlainYearMonth):
             return NotImplemented
@@ -273,17 +306,30 @@ class PlainYearMonth:
         Returns:
             A new PlainYearMonth
         """
-        # Match YYYY-MM format
-        pattern = r"^(\d{4})-(\d{2})$"
-        match = re.match(pattern, year_month_string)
+        year, month = parse_iso_year_month(year_month_string)
+        return PlainYearMonth(year, month)
 
-        if not match:
-            raise InvalidArgumentError(f"Invalid PlainYearMonth string: {year_month_string}")
+    @staticmethod
+    def try_from_string(year_month_string: str) -> Optional[PlainYearMonth]:
+        """
+        Create a PlainYearMonth from an ISO 8601 string, or return None where from_string would raise.
 
-        year = int(match.group(1))
-        month = int(match.group(2))
+        Args:
+            year_month_string: String in format 'YYYY-MM'
 
-        return PlainYearMonth(year, month)
+        Returns:
+            A new PlainYearMonth, or None
+        """
+        fields = try_parse_iso_year_month(year_month_string)
+        if fields is None or not is_valid_date(fields[0], fields[1], 1):
+            return None
+        return PlainYearMonth._from_fields(fields[0], fields[1], ISO_CALENDAR)
+
+    @staticmethod
+    def is_valid_string(year_month_string: str) -> bool:
+        """Check whether from_string accepts a string, without creating a PlainYearMonth."""
+        fields = try_parse_iso_year_month(year_month_string)
+        return fields is not None and is_valid_date(fields[0], fields[1], 1)
 
     @staticmethod
     def from_fields(fields: Dict[str, Any]) -> PlainYearMonth:
@@ -343,6 +389,22 @@ class PlainYearMonth:
         else:
             return 0
 
+    @classmethod
+    def range(cls, start: PlainYearMonth, stop: PlainYearMonth, step: Optional[Duration] = None) -> PlainYearMonthRange:
+        """Get a lazy range of PlainYearMonth values from ``start`` up to, but not including, ``stop``.
+
+        Args:
+            start: The first value
+            stop: The exclusive end value
+            step: Step between values (defaults to 1 month); must be a whole number of months and may be negative
+
+        Returns:
+            A sequence supporting ``len()``, indexing, slicing, ``in`` and ``index()`` in constant time
+        """
+        from .ranges import PlainYearMonthRange
+
+        return PlainYearMonthRange(start, stop, step)
+
     @classmethod
     def from_any(cls, value: Union[str, dict, PlainYearMonth]) -> PlainYearMonth:
         """
@@ -0,0 +1,303 @@
+"""
+Lazy range sequences of temporal values.
+
+A range stores only an integer ``range`` over each type's ordinal (epoch days,
+epoch or wall-clock nanoseconds, or month index), so length, indexing, slicing,
+membership and ``index()`` are constant-time and values are created on access.
+"""
+
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import Any, Iterator, Optional, Union, overload
+
+from .calendar import ISO_CALENDAR, Calendar
+from .duration import Duration
+from .exceptions import InvalidArgumentError, RangeError
+from .instant import Instant
+from .plain_date import PlainDate
+from .plain_date_time import PlainDateTime
+from .plain_year_month import PlainYearMonth
+from .utils import NS_PER_DAY, Immutable, days_from_civil
+
+
+class TemporalRange(Immutable, Sequence):
+    """An immutable arithmetic sequence of temporal values, like the built-in ``range``.
+
+    The stop value is exclusive and the step may be negative. Subclasses map
+    values to and from the integer ordinals the underlying ``range`` holds.
+    """
+
+    __slots__ = ("_range", "_calendar")
+
+    # Concrete element type, and the name used in error messages
+    _type: Any = None
+
+    def __init__(self, start: Any, stop: Any, step: Optional[Duration] = None):
+        """Initialize a range from ``start`` up to, but not including, ``stop``."""
+        if not isinstance(start, self._type) or not isinstance(stop, self._type):
+            raise InvalidArgumentError(f"start and stop must be {self._type.__name__} objects")
+        if step is None:
+            step_key = self._default_step()
+        elif isinstance(step, Duration):
+            step_key = self._step_key(step)
+        else:
+            raise InvalidArgumentError("Expected Duration object for step")
+        if step_key == 0:
+            raise InvalidArgumentError("step must not be zero")
+
+        object.__setattr__(self, "_range", range(self._key(start), self._key(stop), step_key))
+        object.__setattr__(self, "_calendar", getattr(start, "_calendar", ISO_CALENDAR))
+
+    @classmethod
+    def _from_range(cls, keys: range, calendar: Calendar) -> "TemporalRange":
+        """Create a range of the same kind over already-computed ordinals."""
+        value_range = cls.__new__(cls)
+        object.__setattr__(value_range, "_range", keys)
+        object.__setattr__(value_range, "_calendar", calendar)
+        return value_range
+
+    def __reduce__(self):
+        return (type(self)._from_range, (self._range, self._calendar))
+
+    @classmethod
+    @abstractmethod
+    def _default_step(cls) -> int:
+        """Get the ordinal step used when no step is given."""
+
+    @classmethod
+    @abstractmethod
+    def _step_key(cls, step: Duration) -> int:
+        """Get the ordinal step for a Duration, rejecting steps without a fixed length."""
+
+    @classmethod
+    @abstractmethod
+    def _step_duration(cls, step_key: int) -> Duration:
+        """Get the Duration for an ordinal step."""
+
+    @classmethod
+    @abstractmethod
+    def _key(cls, value: Any) -> int:
+        """Get the integer ordinal of a value."""
+
+    @abstractmethod
+    def _value(self, key: int) -> Any:
+        """Create the value at an integer ordinal."""
+
+    @property
+    def start(self) -> Any:
+        """Get the first value of the range (or the value it would start at, if empty)."""
+        return self._value(self._range.start)
+
+    @property
+    def step(self) -> Duration:
+        """Get the step between consecutive values."""
+        return self._step_duration(self._range.step)
+
+    def __len__(self) -> int:
+        """Get the number of values in the range."""
+        return len(self._range)
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "TemporalRange": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """Get the value at an index, or a lazy sub-range for a slice."""
+        if isinstance(index, slice):
+            return self._from_range(self._range[index], self._calendar)
+        return self._value(self._range[index])
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the values, creating each on demand."""
+        return map(self._value, self._range)
+
+    def __reversed__(self) -> Iterator[Any]:
+        """Iterate over the values from last to first."""
+        return map(self._value, reversed(self._range))
+
+    def _member_key(self, value: Any) -> Optional[int]:
+        """Get the ordinal of a value of this range's type and calendar, or None."""
+        if not isinstance(value, self._type) or getattr(value, "_calendar", self._calendar) != self._calendar:
+            return None
+        return self._key(value)
+
+    def __contains__(self, value: object) -> bool:
+        """Check whether a value is one of the range's values."""
+        key = self._member_key(value)
+        return key is not None and key in self._range
+
+    def index(self, value: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        """Get the position of a value in the range.
+
+        Raises:
+            ValueError: If the value is not in the range
+        """
+        key = self._member_key(value)
+        if key is None or key not in self._range:
+            raise ValueError(f"{value} is not in range")
+        position = self._range.index(key)
+        # Negative bounds count from the end and out-of-range bounds are clipped, as for list.index
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if position < start or position >= stop:
+            raise ValueError(f"{value} is not in range")
+        return position
+
+    def count(self, value: Any) -> int:
+        """Get the number of times a value occurs in the range (0 or 1)."""
+        return int(value in self)
+
+    def bisect_left(self, value: Any) -> int:
+        """Get the position where a value would be inserted, before any equal value, to keep an ascending range sorted."""
+        return self._bisect(value, 0)
+
+    def bisect_right(self, value: Any) -> int:
+        """Get the position where a value would be inserted, after any equal value, to keep an ascending range sorted."""
+        return self._bisect(value, 1)
+
+    def _bisect(self, value: Any, after_equal: int) -> int:
+        """Compute an insertion point arithmetically from the value's ordinal."""
+        if not isinstance(value, self._type):
+            raise InvalidArgumentError(f"Expected {self._type.__name__} object")
+        if self._range.step < 0:
+            raise InvalidArgumentError("bisect needs an ascending range")
+        offset = self._key(value) - self._range.start + after_equal
+        # Number of values whose ordinal is below start + offset, i.e. ceil(offset / step) clamped to the length
+        position = -(-offset // self._range.step)
+        return min(max(position, 0), len(self._range))
+
+    def __eq__(self, other: object) -> bool:
+        """Check whether two ranges produce the same values."""
+        if not isinstance(other, TemporalRange) or type(other) is not type(self):
+            return False
+        return self._range == other._range and self._calendar == other._calendar
+
+    def __hash__(self) -> int:
+        """Hash function for ranges."""
+        return hash((type(self), self._range))
+
+    def __repr__(self) -> str:
+        """Return detailed string representation."""
+        if not self._range:
+            return f"{type(self).__name__}(empty, step={self.step})"
+        return f"{type(self).__name__}({self[0]}, ..., {self[-1]}, step={self.step}, len={len(self)})"
+
+
+class PlainDateRange(TemporalRange):
+    """A lazy range of PlainDate values, stepping by whole days."""
+
+    __slots__ = ()
+
+    _type = PlainDate
+
+    @classmethod
+    def _default_step(cls) -> int:
+        return 1
+
+    @classmethod
+    def _step_key(cls, step: Duration) -> int:
+        if step._months or step._nanoseconds:
+            raise InvalidArgumentError("PlainDate ranges need a step of whole days or weeks")
+        return step._days
+
+    @classmethod
+    def _step_duration(cls, step_key: int) -> Duration:
+        return Duration._from_parts(0, step_key, 0)
+
+    @classmethod
+    def _key(cls, value: PlainDate) -> int:
+        return value._epoch_days
+
+    def _value(self, key: int) -> PlainDate:
+        return PlainDate._from_epoch_days(key, self._calendar)
+
+
+class PlainDateTimeRange(TemporalRange):
+    """A lazy range of PlainDateTime values, stepping by a fixed length of time."""
+
+    __slots__ = ()
+
+    _type = PlainDateTime
+
+    @classmethod
+    def _default_step(cls) -> int:
+        return NS_PER_DAY
+
+    @classmethod
+    def _step_key(cls, step: Duration) -> int:
+        if step._months:
+            raise InvalidArgumentError("PlainDateTime ranges need a step without years or months")
+        return step._total_nanoseconds()
+
+    @classmethod
+    def _step_duration(cls, step_key: int) -> Duration:
+        return Duration._from_parts(0, 0, step_key)
+
+    @classmethod
+    def _key(cls, value: PlainDateTime) -> int:
+        return days_from_civil(value._year, value._month, value._day) * NS_PER_DAY + value._nanosecond_of_day()
+
+    def _value(self, key: int) -> PlainDateTime:
+        return PlainDateTime._from_epoch_days_and_nanoseconds(0, key, self._calendar)
+
+
+class InstantRange(TemporalRange):
+    """A lazy range of Instant values, stepping by a fixed length of time."""
+
+    __slots__ = ()
+
+    _type = Instant
+
+    @classmethod
+    def _default_step(cls) -> int:
+        return NS_PER_DAY
+
+    @classmethod
+    def _step_key(cls, step: Duration) -> int:
+        if step._months:
+            raise InvalidArgumentError("Instant ranges need a step without years or months")
+        return step._total_nanoseconds()
+
+    @classmethod
+    def _step_duration(cls, step_key: int) -> Duration:
+        return Duration._from_parts(0, 0, step_key)
+
+    @classmethod
+    def _key(cls, value: Instant) -> int:
+        return value._epoch_nanoseconds
+
+    def _value(self, key: int) -> Instant:
+        return Instant._from_epoch_nanoseconds(key)
+
+
+class PlainYearMonthRange(TemporalRange):
+    """A lazy range of PlainYearMonth values, stepping by whole months."""
+
+    __slots__ = ()
+
+    _type = PlainYearMonth
+
+    @classmethod
+    def _default_step(cls) -> int:
+        return 1
+
+    @classmethod
+    def _step_key(cls, step: Duration) -> int:
+        if step._days or step._nanoseconds:
+            raise InvalidArgumentError("PlainYearMonth ranges need a step of whole months or years")
+        return step._months
+
+    @classmethod
+    def _step_duration(cls, step_key: int) -> Duration:
+        return Duration._from_parts(step_key, 0, 0)
+
+    @classmethod
+    def _key(cls, value: PlainYearMonth) -> int:
+        return value._year * 12 + value._month - 1
+
+    def _value(self, key: int) -> PlainYearMonth:
+        year, month = divmod(key, 12)
+        if year < 1 or year > 9999:
+            raise RangeError(f"Year {year} is out of range (1-9999)")
+        return PlainYearMonth._from_fields(year, month + 1, self._calendar)
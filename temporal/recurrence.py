@@ -0,0 +1,656 @@
+"""
+RFC 5545 recurrence rules for the Temporal API.
+"""
+
+from itertools import count as count_from
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .exceptions import InvalidArgumentError
+from .instant import Instant
+from .plain_date import PlainDate
+from .plain_date_time import PlainDateTime
+from .timezone import TimeZone
+from .utils import (
+    MAX_EPOCH_DAYS,
+    NS_PER_DAY,
+    NS_PER_SECOND,
+    Immutable,
+    civil_from_days,
+    days_from_civil,
+    get_days_in_month,
+    is_leap_year,
+)
+from .zoned_date_time import ZonedDateTime, _resolve_local_nanoseconds
+
+if TYPE_CHECKING:
+    from .tzif import TransitionTable
+
+FREQUENCIES = ("YEARLY", "MONTHLY", "WEEKLY", "DAILY", "HOURLY", "MINUTELY", "SECONDLY")
+
+WEEKDAY_CODES = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+# Wall-clock step of the sub-daily frequencies
+_STEP_NANOSECONDS = {"HOURLY": 3600 * NS_PER_SECOND, "MINUTELY": 60 * NS_PER_SECOND, "SECONDLY": NS_PER_SECOND}
+
+# Periods after which a frequency's calendar pattern repeats: the Gregorian calendar repeats every
+# 400 years (146097 days, exactly 20871 weeks). A rule with no instance in a full cycle has none at all.
+_CYCLE_PERIODS = {"YEARLY": 400, "MONTHLY": 4800, "WEEKLY": 20871, "DAILY": 146097}
+
+Temporal = Union[PlainDate, PlainDateTime, ZonedDateTime]
+
+
+def _weekday(epoch_days: int) -> int:
+    """Get the ISO day of the week (1=Monday, 7=Sunday) of a day since 1970-01-01."""
+    return (epoch_days + 3) % 7 + 1
+
+
+def _parse_weekday(value: Union[str, int, Tuple[int, int]]) -> Tuple[int, int]:
+    """Parse a BYDAY entry ("MO", "-1FR", an ISO weekday number or an (ordinal, weekday) pair)."""
+    if isinstance(value, tuple) and len(value) == 2:
+        ordinal, weekday = value
+    elif type(value) is int:
+        ordinal, weekday = 0, value
+    elif isinstance(value, str) and len(value) >= 2 and value[-2:].upper() in WEEKDAY_CODES:
+        weekday = WEEKDAY_CODES.index(value[-2:].upper()) + 1
+        try:
+            ordinal = int(value[:-2]) if value[:-2] else 0
+        except ValueError:
+            raise InvalidArgumentError(f"Invalid BYDAY value: {value!r}") from None
+    else:
+        raise InvalidArgumentError(f"Invalid BYDAY value: {value!r}")
+    if type(weekday) is not int or not 1 <= weekday <= 7:
+        raise InvalidArgumentError(f"Invalid BYDAY weekday: {value!r}")
+    if type(ordinal) is not int or not -53 <= ordinal <= 53:
+        raise InvalidArgumentError(f"Invalid BYDAY ordinal: {value!r}")
+    return ordinal, weekday
+
+
+def _int_list(name: str, values: Optional[Iterable[int]], low: int, high: int, signed: bool) -> Tuple[int, ...]:
+    """Validate a BYxxx list of integers in ``low..high`` (or ``-high..-low`` when signed)."""
+    if values is None:
+        return ()
+    result = []
+    for value in values:
+        if type(value) is not int or not (low <= value <= high or (signed and -high <= value <= -low)):
+            raise InvalidArgumentError(f"Invalid {name} value: {value!r}")
+        result.append(value)
+    return tuple(sorted(set(result)))
+
+
+def _select_positions(values: List[int], positions: Tuple[int, ...]) -> List[int]:
+    """Apply BYSETPOS: keep the values at 1-based positions (negative from the end) of a sorted list."""
+    size = len(values)
+    return sorted({values[position - 1 if position > 0 else position] for position in positions if -size <= position <= size})
+
+
+def _parse_until(text: str) -> Union[PlainDate, PlainDateTime, Instant]:
+    """Parse an RFC 5545 DATE or DATE-TIME (``20241231``, ``20241231T090000`` or ``20241231T090000Z``)."""
+    try:
+        year, month, day = int(text[0:4]), int(text[4:6]), int(text[6:8])
+        if len(text) == 8:
+            return PlainDate(year, month, day)
+        if len(text) in (15, 16) and text[8] == "T":
+            wall = PlainDateTime(year, month, day, int(text[9:11]), int(text[11:13]), int(text[13:15]))
+            if len(text) == 15:
+                return wall
+            if text[15] == "Z":
+                return Instant.from_epoch_nanoseconds(
+                    days_from_civil(year, month, day) * NS_PER_DAY + wall._nanosecond_of_day()
+                )
+    except ValueError:
+        pass
+    raise InvalidArgumentError(f"Invalid UNTIL value: {text!r}")
+
+
+def _format_until(until: Union[PlainDate, PlainDateTime, ZonedDateTime, Instant]) -> str:
+    """Format an UNTIL value in RFC 5545 basic form."""
+    if isinstance(until, ZonedDateTime):
+        until = until.to_instant()
+    if isinstance(until, Instant):
+        days, nanosecond_of_day = divmod(until.epoch_nanoseconds, NS_PER_DAY)
+        year, month, day = civil_from_days(days)
+        second_of_day = nanosecond_of_day // NS_PER_SECOND
+        return f"{year:04d}{month:02d}{day:02d}T{second_of_day // 3600:02d}{second_of_day // 60 % 60:02d}{second_of_day % 60:02d}Z"
+    if isinstance(until, PlainDateTime):
+        return f"{until.year:04d}{until.month:02d}{until.day:02d}T{until.hour:02d}{until.minute:02d}{until.second:02d}"
+    return f"{until.year:04d}{until.month:02d}{until.day:02d}"
+
+
+class RecurrenceRule(Immutable):
+    """A recurrence rule (RFC 5545 RRULE) producing lazy occurrence iterators.
+
+    Instances are computed on the wall clock of the start value, period by
+    period (a year, month, week, day or sub-daily step), so an iterator can
+    begin at the period containing an arbitrary point instead of replaying the
+    series from its start. Rules with COUNT are replayed, which costs at most
+    COUNT instances. With a ZonedDateTime start, HOURLY, MINUTELY and SECONDLY
+    steps are exact durations instead, so DST transitions neither repeat nor
+    drop an instance.
+    """
+
+    __slots__ = (
+        "_freq",
+        "_interval",
+        "_count",
+        "_until",
+        "_by_day",
+        "_by_month_day",
+        "_by_month",
+        "_by_set_pos",
+        "_week_start",
+    )
+
+    def __init__(
+        self,
+        freq: str,
+        *,
+        interval: int = 1,
+        count: Optional[int] = None,
+        until: Optional[Union[PlainDate, PlainDateTime, ZonedDateTime, Instant]] = None,
+        by_day: Optional[Iterable[Union[str, int, Tuple[int, int]]]] = None,
+        by_month_day: Optional[Iterable[int]] = None,
+        by_month: Optional[Iterable[int]] = None,
+        by_set_pos: Optional[Iterable[int]] = None,
+        week_start: Union[str, int] = "MO",
+    ):
+        """Initialize a recurrence rule.
+
+        Args:
+            freq: One of ``FREQUENCIES`` (case-insensitive)
+            interval: Number of periods between repetitions
+            count: Total number of instances, counted from the start
+            until: Last allowed instance, inclusive (a date, datetime, zoned datetime or instant)
+            by_day: Weekdays as codes (``"MO"``), ordinal codes (``"-1FR"``, the last Friday of the
+                month or year) or ISO weekday numbers; ordinals need a monthly or yearly rule
+            by_month_day: Days of the month, negative counting from the month's end
+            by_month: Months of the year
+            by_set_pos: Positions (1-based, negative from the end) to keep within each period's instances
+            week_start: First day of the week for weekly rules
+        """
+        freq = freq.upper() if isinstance(freq, str) else freq
+        if freq not in FREQUENCIES:
+            raise InvalidArgumentError(f"Invalid FREQ: {freq!r}")
+        if type(interval) is not int or interval < 1:
+            raise InvalidArgumentError("interval must be a positive integer")
+        if count is not None and (type(count) is not int or count < 0):
+            raise InvalidArgumentError("count must be a non-negative integer")
+        if count is not None and until is not None:
+            raise InvalidArgumentError("count and until cannot both be set")
+        if until is not None and not isinstance(until, (PlainDate, PlainDateTime, ZonedDateTime, Instant)):
+            raise InvalidArgumentError("until must be a PlainDate, PlainDateTime, ZonedDateTime or Instant")
+
+        days = tuple(sorted(set(_parse_weekday(value) for value in by_day))) if by_day is not None else ()
+        if any(ordinal for ordinal, _ in days) and freq not in ("YEARLY", "MONTHLY"):
+            raise InvalidArgumentError("BYDAY ordinals are only allowed in MONTHLY and YEARLY rules")
+        month_days = _int_list("BYMONTHDAY", by_month_day, 1, 31, True)
+        if month_days and freq == "WEEKLY":
+            raise InvalidArgumentError("BYMONTHDAY is not allowed in WEEKLY rules")
+
+        object.__setattr__(self, "_freq", freq)
+        object.__setattr__(self, "_interval", interval)
+        object.__setattr__(self, "_count", count)
+        object.__setattr__(self, "_until", until)
+        object.__setattr__(self, "_by_day", days)
+        object.__setattr__(self, "_by_month_day", month_days)
+        object.__setattr__(self, "_by_month", _int_list("BYMONTH", by_month, 1, 12, False))
+        object.__setattr__(self, "_by_set_pos", _int_list("BYSETPOS", by_set_pos, 1, 366, True))
+        object.__setattr__(self, "_week_start", _parse_weekday(week_start)[1])
+
+    @classmethod
+    def from_string(cls, rule: str) -> "RecurrenceRule":
+        """Create a RecurrenceRule from an RRULE value such as ``"FREQ=MONTHLY;BYDAY=-1FR;COUNT=12"``."""
+        if not isinstance(rule, str):
+            raise InvalidArgumentError("Expected string")
+        text = rule.strip()
+        if text.upper().startswith("RRULE:"):
+            text = text[6:]
+        options: dict = {}
+        try:
+            for part in text.split(";"):
+                name, value = part.split("=", 1)
+                name = name.strip().upper()
+                values = [item.strip() for item in value.split(",")]
+                if name == "FREQ":
+                    options["freq"] = value
+                elif name == "INTERVAL":
+                    options["interval"] = int(value)
+                elif name == "COUNT":
+                    options["count"] = int(value)
+                elif name == "UNTIL":
+                    options["until"] = _parse_until(value.strip())
+                elif name == "BYDAY":
+                    options["by_day"] = values
+                elif name == "BYMONTHDAY":
+                    options["by_month_day"] = [int(item) for item in values]
+                elif name == "BYMONTH":
+                    options["by_month"] = [int(item) for item in values]
+                elif name == "BYSETPOS":
+                    options["by_set_pos"] = [int(item) for item in values]
+                elif name == "WKST":
+                    options["week_start"] = value
+                else:
+                    raise InvalidArgumentError(f"Unsupported RRULE part: {name}")
+        except ValueError:
+            raise InvalidArgumentError(f"Invalid RRULE: {rule!r}") from None
+        if "freq" not in options:
+            raise InvalidArgumentError(f"RRULE needs FREQ: {rule!r}")
+        return cls(options.pop("freq"), **options)
+
+    @property
+    def freq(self) -> str:
+        """Get the frequency."""
+        return self._freq
+
+    @property
+    def interval(self) -> int:
+        """Get the number of periods between repetitions."""
+        return self._interval
+
+    @property
+    def count(self) -> Optional[int]:
+        """Get the total number of instances, if limited by count."""
+        return self._count
+
+    @property
+    def until(self) -> Optional[Union[PlainDate, PlainDateTime, ZonedDateTime, Instant]]:
+        """Get the inclusive end of the rule, if limited by date."""
+        return self._until
+
+    def occurrences(
+        self,
+        start: Temporal,
+        *,
+        after: Optional[Union[Temporal, Instant]] = None,
+        inclusive: bool = False,
+        exdates: Iterable[Union[Temporal, Instant]] = (),
+    ) -> Iterator[Temporal]:
+        """Get a lazy iterator over the rule's occurrences.
+
+        Args:
+            start: DTSTART; a PlainDate, PlainDateTime or ZonedDateTime that also sets the type,
+                time of day, time zone and default day fields of the occurrences
+            after: If given, only occurrences after this point are produced, and generation
+                starts at the period containing it
+            inclusive: Whether an occurrence equal to ``after`` is produced
+            exdates: Occurrences to leave out (EXDATE); they still count towards COUNT
+
+        Returns:
+            An iterator of values of the same type as ``start``, in order
+        """
+        if isinstance(start, ZonedDateTime):
+            timezone, table = start._timezone, start._timezone.transition_table
+            start_wall = start._epoch_nanoseconds + table.offset_nanoseconds_at(start._epoch_nanoseconds)
+        elif isinstance(start, PlainDateTime):
+            timezone = table = None
+            start_wall = days_from_civil(start._year, start._month, start._day) * NS_PER_DAY + start._nanosecond_of_day()
+        elif isinstance(start, PlainDate):
+            if self._freq in _STEP_NANOSECONDS:
+                raise InvalidArgumentError(f"{self._freq} rules need a PlainDateTime or ZonedDateTime start")
+            timezone = table = None
+            start_wall = start._epoch_days * NS_PER_DAY
+        else:
+            raise InvalidArgumentError("Expected PlainDate, PlainDateTime or ZonedDateTime for start")
+
+        def point(value: Any) -> Tuple[int, int]:
+            """Get (comparison key, wall-clock nanoseconds) for a bound, in the start's terms."""
+            if isinstance(value, (ZonedDateTime, Instant)):
+                if table is None:
+                    raise InvalidArgumentError("Exact times can only bound a ZonedDateTime series")
+                exact = value._epoch_nanoseconds
+                return exact, exact + table.offset_nanoseconds_at(exact)
+            if isinstance(value, PlainDateTime):
+                wall = days_from_civil(value._year, value._month, value._day) * NS_PER_DAY + value._nanosecond_of_day()
+            elif isinstance(value, PlainDate):
+                wall = value._epoch_days * NS_PER_DAY
+            else:
+                raise InvalidArgumentError("Expected PlainDate, PlainDateTime, ZonedDateTime or Instant")
+            return (wall if table is None else _resolve_local_nanoseconds(wall, table)), wall
+
+        # Wall-clock order and exact order can differ around DST transitions, so in a zone the
+        # generation bounds get a day of slack and the exact bounds filter each instance
+        slack = 0 if table is None else NS_PER_DAY
+        until_key = stop_wall = None
+        if self._until is not None:
+            until_key, until_wall = point(self._until)
+            stop_wall = until_wall + slack
+        # Sub-daily steps in a zone are exact durations, so DST gaps and repeated hours
+        # neither duplicate nor drop an instance
+        exact_steps = table is not None and self._freq in _STEP_NANOSECONDS
+        after_key = None
+        first_period = 0
+        if after is not None:
+            after_key, after_wall = point(after)
+            if self._count is None:
+                if exact_steps:
+                    step = _STEP_NANOSECONDS[self._freq] * self._interval
+                    first_period = max(0, (after_key - start._epoch_nanoseconds) // step)
+                else:
+                    first_period = self._period_containing(start_wall, after_wall - slack)
+        excluded = {point(value)[0] for value in exdates}
+
+        if exact_steps:
+            instances = self._exact_sub_daily_instances(start._epoch_nanoseconds, first_period, table)
+        else:
+            instances = self._wall_instances(start_wall, first_period, table)
+        make = self._factory(start, timezone)
+        return self._iterate(instances, make, after_key, inclusive, until_key, stop_wall, excluded)
+
+    def _iterate(
+        self,
+        instances: Iterator[Tuple[int, int]],
+        make: Callable[[int], Temporal],
+        after_key: Optional[int],
+        inclusive: bool,
+        until_key: Optional[int],
+        stop_wall: Optional[int],
+        excluded: set,
+    ) -> Iterator[Temporal]:
+        """Filter the (wall-clock, comparison key) instances against COUNT, UNTIL, ``after`` and EXDATE."""
+        remaining = self._count
+        for wall, key in instances:
+            if stop_wall is not None and wall > stop_wall:
+                return
+            if remaining is not None:
+                if remaining == 0:
+                    return
+                remaining -= 1
+            if until_key is not None and key > until_key:
+                continue
+            if after_key is not None and (key < after_key or (key == after_key and not inclusive)):
+                continue
+            if key in excluded:
+                continue
+            yield make(key)
+
+    def _wall_instances(
+        self, start_wall: int, first_period: int, table: Optional["TransitionTable"]
+    ) -> Iterator[Tuple[int, int]]:
+        """Pair each wall-clock instance from the start onwards with its comparison key."""
+        for wall in self._walls(start_wall, first_period):
+            if wall >= start_wall:
+                yield wall, (wall if table is None else _resolve_local_nanoseconds(wall, table))
+
+    def _factory(self, start: Temporal, timezone: Optional[TimeZone]) -> Callable[[int], Temporal]:
+        """Get the function that builds an occurrence of the start's type from its comparison key.
+
+        The key is the exact time in a zone and the wall-clock nanoseconds otherwise.
+        """
+        calendar = start._calendar
+        if timezone is not None:
+
+            def make(exact: int) -> Temporal:
+                return ZonedDateTime._from_epoch_nanoseconds(exact, timezone, calendar)
+
+        elif isinstance(start, PlainDateTime):
+
+            def make(wall: int) -> Temporal:
+                return PlainDateTime._from_epoch_days_and_nanoseconds(0, wall, calendar)
+
+        else:
+
+            def make(wall: int) -> Temporal:
+                return PlainDate._from_epoch_days(wall // NS_PER_DAY, calendar)
+
+        return make
+
+    def _period_containing(self, start_wall: int, wall: int) -> int:
+        """Get the index of the rule period (counted from the start's period) that contains a wall-clock time."""
+        freq = self._freq
+        if wall <= start_wall:
+            return 0
+        if freq in _STEP_NANOSECONDS:
+            return (wall - start_wall) // (_STEP_NANOSECONDS[freq] * self._interval)
+        start_day, day = start_wall // NS_PER_DAY, wall // NS_PER_DAY
+        if freq == "DAILY":
+            units = day - start_day
+        elif freq == "WEEKLY":
+            units = (day - self._week_of(start_day)) // 7
+        else:
+            start_year, start_month, _ = civil_from_days(start_day)
+            year, month, _ = civil_from_days(day)
+            units = year - start_year if freq == "YEARLY" else (year - start_year) * 12 + month - start_month
+        return units // self._interval
+
+    def _week_of(self, epoch_days: int) -> int:
+        """Get the first day of the week (starting on the rule's week start) containing a day."""
+        return epoch_days - (_weekday(epoch_days) - self._week_start) % 7
+
+    def _walls(self, start_wall: int, first_period: int) -> Iterator[int]:
+        """Generate every instance of the rule, in order, from a period onwards, ignoring the start bound."""
+        freq = self._freq
+        set_pos = self._by_set_pos
+        if freq in _STEP_NANOSECONDS:
+            yield from self._sub_daily_walls(start_wall, first_period)
+            return
+
+        start_day, time_of_day = divmod(start_wall, NS_PER_DAY)
+        start_year, start_month, start_date = civil_from_days(start_day)
+        interval = self._interval
+        empty_limit = _CYCLE_PERIODS[freq]
+        empty = 0
+        for period in count_from(first_period):
+            if freq == "YEARLY":
+                year = start_year + period * interval
+                if year > 9999:
+                    return
+                days = self._year_days(year, start_month, start_date)
+            elif freq == "MONTHLY":
+                year, month_index = divmod(start_month - 1 + period * interval, 12)
+                year += start_year
+                if year > 9999:
+                    return
+                days = self._month_days(year, month_index + 1, start_date) if self._month_allowed(month_index + 1) else []
+            elif freq == "WEEKLY":
+                week = self._week_of(start_day) + 7 * period * interval
+                if week > MAX_EPOCH_DAYS:
+                    return
+                days = self._week_days(week, _weekday(start_day))
+                if period == 0:
+                    # The first week starts at the start day, so BYSETPOS counts from it (as python-dateutil does)
+                    days = [day for day in days if day >= start_day]
+            else:
+                day = start_day + period * interval
+                if day > MAX_EPOCH_DAYS:
+                    return
+                days = [day] if self._day_matches(day) else []
+
+            if set_pos and days:
+                days = _select_positions(days, set_pos)
+            if not days:
+                empty += 1
+                if empty > empty_limit:
+                    return
+                continue
+            empty = 0
+            for day in days:
+                if day > MAX_EPOCH_DAYS:
+                    return
+                yield day * NS_PER_DAY + time_of_day
+
+    def _set_pos_keeps_single(self) -> bool:
+        """Check whether BYSETPOS keeps the single instance of a sub-daily period."""
+        set_pos = self._by_set_pos
+        return not set_pos or 1 in set_pos or -1 in set_pos
+
+    def _sub_daily_walls(self, start_wall: int, first_period: int) -> Iterator[int]:
+        """Generate HOURLY, MINUTELY and SECONDLY instances, skipping whole days the BYxxx parts exclude."""
+        if not self._set_pos_keeps_single():
+            return
+        step = _STEP_NANOSECONDS[self._freq] * self._interval
+        period = first_period
+        skipped_days = 0
+        end = (MAX_EPOCH_DAYS + 1) * NS_PER_DAY
+        while True:
+            wall = start_wall + period * step
+            if wall >= end:
+                return
+            day = wall // NS_PER_DAY
+            if self._day_matches(day):
+                skipped_days = 0
+                yield wall
+                period += 1
+                continue
+            skipped_days += 1
+            if skipped_days > _CYCLE_PERIODS["DAILY"]:
+                return
+            # Jump to the first period of the next day
+            period = -(-((day + 1) * NS_PER_DAY - start_wall) // step)
+
+    def _exact_sub_daily_instances(
+        self, start_exact: int, first_period: int, table: "TransitionTable"
+    ) -> Iterator[Tuple[int, int]]:
+        """Generate (wall-clock, exact) sub-daily instances in a zone, stepping in exact time."""
+        if not self._set_pos_keeps_single():
+            return
+        step = _STEP_NANOSECONDS[self._freq] * self._interval
+        period = first_period
+        skipped_days = 0
+        end = (MAX_EPOCH_DAYS + 1) * NS_PER_DAY
+        while True:
+            exact = start_exact + period * step
+            wall = exact + table.offset_nanoseconds_at(exact)
+            if wall >= end:
+                return
+            day = wall // NS_PER_DAY
+            if self._day_matches(day):
+                skipped_days = 0
+                yield wall, exact
+                period += 1
+                continue
+            skipped_days += 1
+            if skipped_days > _CYCLE_PERIODS["DAILY"]:
+                return
+            # Jump to the first period at or after the next local midnight
+            next_day = _resolve_local_nanoseconds((day + 1) * NS_PER_DAY, table)
+            period = max(period + 1, -(-(next_day - start_exact) // step))
+
+    def _month_allowed(self, month: int) -> bool:
+        """Check a month against BYMONTH."""
+        return not self._by_month or month in self._by_month
+
+    def _day_matches(self, epoch_days: int) -> bool:
+        """Check a day against BYMONTH, BYMONTHDAY and BYDAY used as limits."""
+        if not (self._by_month or self._by_month_day or self._by_day):
+            return True
+        year, month, day = civil_from_days(epoch_days)
+        if not self._month_allowed(month):
+            return False
+        if self._by_month_day:
+            length = get_days_in_month(year, month)
+            if not any(day == (value if value > 0 else length + 1 + value) for value in self._by_month_day):
+                return False
+        if self._by_day:
+            weekday = _weekday(epoch_days)
+            if not any(weekday == rule_weekday for _, rule_weekday in self._by_day):
+                return False
+        return True
+
+    def _weekdays_in(self, first: int, length: int) -> List[int]:
+        """Expand BYDAY over the ``length`` days from ``first``, with ordinals counted within that span."""
+        days = []
+        first_weekday = _weekday(first)
+        for ordinal, weekday in self._by_day:
+            matches = range(first + (weekday - first_weekday) % 7, first + length, 7)
+            if ordinal == 0:
+                days.extend(matches)
+            elif -len(matches) <= ordinal <= len(matches):
+                days.append(matches[ordinal - 1 if ordinal > 0 else ordinal])
+        return days
+
+    def _month_days(self, year: int, month: int, start_date: int) -> List[int]:
+        """Expand one month's days: BYMONTHDAY and BYDAY (intersected when both are set), else the start's day."""
+        first = days_from_civil(year, month, 1)
+        length = get_days_in_month(year, month)
+        month_days = set(self._month_days_only(year, month)) if self._by_month_day else None
+        if self._by_day:
+            weekdays = set(self._weekdays_in(first, length))
+            return sorted(weekdays & month_days if month_days is not None else weekdays)
+        if month_days is not None:
+            return sorted(month_days)
+        return [first + start_date - 1] if start_date <= length else []
+
+    def _year_days(self, year: int, start_month: int, start_date: int) -> List[int]:
+        """Expand one year's days following the RFC 5545 YEARLY rules."""
+        if self._by_month:
+            days = []
+            for month in self._by_month:
+                days.extend(self._month_days(year, month, start_date))
+            return days
+        if self._by_day:
+            # Without BYMONTH, BYDAY ordinals count within the whole year
+            first = days_from_civil(year, 1, 1)
+            weekdays = set(self._weekdays_in(first, 366 if is_leap_year(year) else 365))
+            if self._by_month_day:
+                month_days = set()
+                for month in range(1, 13):
+                    month_days.update(self._month_days_only(year, month))
+                weekdays &= month_days
+            return sorted(weekdays)
+        if self._by_month_day:
+            days = []
+            for month in range(1, 13):
+                days.extend(self._month_days(year, month, start_date))
+            return days
+        return self._month_days(year, start_month, start_date)
+
+    def _month_days_only(self, year: int, month: int) -> List[int]:
+        """Expand BYMONTHDAY alone over one month."""
+        first = days_from_civil(year, month, 1)
+        length = get_days_in_month(year, month)
+        resolved = (value if value > 0 else length + 1 + value for value in self._by_month_day)
+        return [first + value - 1 for value in resolved if 1 <= value <= length]
+
+    def _week_days(self, week: int, start_weekday: int) -> List[int]:
+        """Expand one week's days from BYDAY (or the start's weekday), limited by BYMONTH."""
+        weekdays = [weekday for _, weekday in self._by_day] if self._by_day else [start_weekday]
+        days = sorted(week + (weekday - self._week_start) % 7 for weekday in set(weekdays))
+        if self._by_month:
+            days = [day for day in days if civil_from_days(day)[1] in self._by_month]
+        return days
+
+    def __eq__(self, other: object) -> bool:
+        """Check equality with another rule."""
+        if not isinstance(other, RecurrenceRule):
+            return False
+        return str(self) == str(other) and self._until == other._until
+
+    def __hash__(self) -> int:
+        """Hash function for RecurrenceRule."""
+        return hash(str(self))
+
+    def __reduce__(self):
+        return (_restore_rule, tuple(getattr(self, name) for name in self.__slots__))
+
+    def __str__(self) -> str:
+        """Return the RRULE value."""
+        parts = [f"FREQ={self._freq}"]
+        if self._interval != 1:
+            parts.append(f"INTERVAL={self._interval}")
+        if self._count is not None:
+            parts.append(f"COUNT={self._count}")
+        if self._until is not None:
+            parts.append(f"UNTIL={_format_until(self._until)}")
+        if self._by_month:
+            parts.append("BYMONTH=" + ",".join(map(str, self._by_month)))
+        if self._by_month_day:
+            parts.append("BYMONTHDAY=" + ",".join(map(str, self._by_month_day)))
+        if self._by_day:
+            codes = (f"{ordinal or ''}{WEEKDAY_CODES[weekday - 1]}" for ordinal, weekday in self._by_day)
+            parts.append("BYDAY=" + ",".join(codes))
+        if self._by_set_pos:
+            parts.append("BYSETPOS=" + ",".join(map(str, self._by_set_pos)))
+        if self._week_start != 1:
+            parts.append(f"WKST={WEEKDAY_CODES[self._week_start - 1]}")
+        return ";".join(parts)
+
+    def __repr__(self) -> str:
+        """Return detailed string representation."""
+        return f"RecurrenceRule({str(self)!r})"
+
+
+def _restore_rule(*state: Any) -> RecurrenceRule:
+    """Rebuild a pickled RecurrenceRule from its slot values."""
+    rule = object.__new__(RecurrenceRule)
+    for name, value in zip(RecurrenceRule.__slots__, state):
+        object.__setattr__(rule, name, value)
+    return rule
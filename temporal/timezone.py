@@ -2,10 +2,17 @@
 TimeZone implementation for the Temporal API.
 """
 
+import re
 import sys
-from typing import Optional, Union
+import threading
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Union
 
-from .exceptions import InvalidArgumentError
+from .exceptions import InvalidArgumentError, RangeError
+from .instant import Instant
+from .plain_date_time import PlainDateTime
+from .tzif import TransitionTable, load_transition_table
+from .utils import MISSING_INT64, NS_PER_DAY, NS_PER_MICROSECOND, NS_PER_SECOND, Immutable, days_from_civil, import_numpy
 
 # Import zoneinfo for Python 3.9+, fallback to backports.zoneinfo for older versions
 try:
@@ -17,57 +24,118 @@ except ImportError:
         raise ImportError("zoneinfo is required. Install backports.zoneinfo for Python < 3.9")
 
 # Import datetime timezone for basic UTC support as fallback
+from datetime import timedelta
 from datetime import timezone as dt_timezone
 
+# Match patterns like +05:00, -08:00, +0530, etc.
+OFFSET_PATTERN = re.compile(r"^([+-])(\d{1,2}):?(\d{2})$")
 
-class TimeZone:
-    """Represents a time zone."""
+# Ways to pick an instant for a wall-clock time that a transition skipped or repeated
+DISAMBIGUATIONS = ("compatible", "earlier", "later", "reject")
 
-    def __init__(self, identifier: str):
-        """Initialize a TimeZone with the given identifier."""
-        try:
-            self._zone_info = ZoneInfo(identifier)
-            self._identifier = identifier
-        except Exception as e:
-            # Fallback for Windows when tzdata is not available
-            if identifier.upper() == "UTC":
-                self._zone_info = dt_timezone.utc
-                self._identifier = identifier
-            else:
-                # Try to handle common timezone abbreviations as UTC offsets
-                if self._try_parse_offset(identifier):
-                    return
-                raise InvalidArgumentError(
-                    f"Invalid timezone identifier: {identifier}. On Windows, install tzdata package for full timezone support."
-                ) from e
+# Process-wide registry of canonical TimeZone instances, keyed by identifier
+_registry: Dict[str, "TimeZone"] = {}
+_registry_lock = threading.Lock()
 
-    def _try_parse_offset(self, identifier: str) -> bool:
-        """Try to parse timezone as UTC offset (e.g., '+05:00', '-08:00')."""
-        import re
 
-        # Match patterns like +05:00, -08:00, +0530, etc.
-        offset_pattern = r"^([+-])(\d{1,2}):?(\d{2})$"
-        match = re.match(offset_pattern, identifier)
+def _parse_offset(identifier: str) -> Optional[dt_timezone]:
+    """Try to parse timezone as UTC offset (e.g., '+05:00', '-08:00')."""
+    match = OFFSET_PATTERN.match(identifier)
+    if not match:
+        return None
 
-        if match:
-            sign, hours_str, minutes_str = match.groups()
-            hours = int(hours_str)
-            minutes = int(minutes_str)
+    sign, hours_str, minutes_str = match.groups()
+    hours = int(hours_str)
+    minutes = int(minutes_str)
 
-            if hours > 23 or minutes > 59:
-                return False
+    if hours > 23 or minutes > 59:
+        return None
 
-            total_minutes = hours * 60 + minutes
-            if sign == "-":
-                total_minutes = -total_minutes
+    total_minutes = hours * 60 + minutes
+    if sign == "-":
+        total_minutes = -total_minutes
 
-            from datetime import timedelta
+    return dt_timezone(timedelta(minutes=total_minutes))
 
-            self._zone_info = dt_timezone(timedelta(minutes=total_minutes))
-            self._identifier = identifier
-            return True
 
-        return False
+def _resolve_zone_info(identifier: str):
+    """Resolve an identifier to a ZoneInfo, UTC or fixed-offset tzinfo."""
+    try:
+        return ZoneInfo(identifier)
+    except Exception as e:
+        # Fallback for Windows when tzdata is not available
+        if identifier.upper() == "UTC":
+            return dt_timezone.utc
+        # Try to handle common timezone abbreviations as UTC offsets
+        zone_info = _parse_offset(identifier)
+        if zone_info is not None:
+            return zone_info
+        raise InvalidArgumentError(
+            f"Invalid timezone identifier: {identifier}. On Windows, install tzdata package for full timezone support."
+        ) from e
+
+
+class TimeZone(Immutable):
+    """Represents a time zone.
+
+    Instances are interned: constructing a TimeZone for an identifier that has
+    already been resolved returns the same shared, immutable instance, so the
+    underlying tz database lookup happens once per identifier per process.
+    Offset lookups use a transition table compiled on first use.
+    """
+
+    __slots__ = ("_identifier", "_zone_info", "_transition_table")
+
+    def __new__(cls, identifier: str) -> "TimeZone":
+        """Return the canonical TimeZone for the given identifier."""
+        if not isinstance(identifier, str):
+            raise InvalidArgumentError("Timezone identifier must be a string")
+
+        instance = _registry.get(identifier)
+        if instance is not None:
+            return instance
+
+        zone_info = _resolve_zone_info(identifier)
+        with _registry_lock:
+            instance = _registry.get(identifier)
+            if instance is None:
+                instance = super().__new__(cls)
+                object.__setattr__(instance, "_identifier", identifier)
+                object.__setattr__(instance, "_zone_info", zone_info)
+                object.__setattr__(instance, "_transition_table", None)
+                _registry[identifier] = instance
+        return instance
+
+    def __reduce__(self):
+        return (TimeZone, (self._identifier,))
+
+    @classmethod
+    def preload(cls, identifiers: Iterable[str]) -> List["TimeZone"]:
+        """Resolve and intern a collection of time zones ahead of time.
+
+        Args:
+            identifiers: Timezone identifiers to resolve (e.g. at process startup)
+
+        Returns:
+            The canonical TimeZone instances, in input order
+        """
+        return [cls(identifier) for identifier in identifiers]
+
+    @classmethod
+    def _from_tzinfo(cls, tzinfo) -> "TimeZone":
+        """Return the canonical TimeZone for a ZoneInfo or fixed-offset tzinfo."""
+        key = getattr(tzinfo, "key", None)
+        if key is not None:
+            return cls(key)
+
+        offset = tzinfo.utcoffset(None)
+        if not offset:
+            return cls("UTC")
+
+        total_minutes = int(offset.total_seconds()) // 60
+        sign = "+" if total_minutes >= 0 else "-"
+        hours, minutes = divmod(abs(total_minutes), 60)
+        return cls(f"{sign}{hours:02d}:{minutes:02d}")
 
     @property
     def id(self) -> str:
@@ -84,6 +152,8 @@ class TimeZone:
 
     def __eq__(self, other: object) -> bool:
         """Check equality with another timezone."""
+        if self is other:
+            return True
         if not isinstance(other, TimeZone):
             return False
         return self._identifier == other._identifier
@@ -101,3 +171,161 @@ class TimeZone:
     def zone_info(self):
         """Get the underlying timezone object (ZoneInfo or datetime.timezone)."""
         return self._zone_info
+
+    @property
+    def transition_table(self) -> TransitionTable:
+        """Get the compiled UTC-offset transition table, building it on first use."""
+        table = self._transition_table
+        if table is None:
+            # Racing threads build equal tables; whichever is stored last wins
+            table = load_transition_table(self._zone_info)
+            object.__setattr__(self, "_transition_table", table)
+        return table
+
+    def get_offset_nanoseconds_for(self, instant: Instant) -> int:
+        """Get the UTC offset in nanoseconds at the given instant."""
+        if not isinstance(instant, Instant):
+            raise InvalidArgumentError("Expected Instant")
+        return self.transition_table.offset_nanoseconds_at(instant.epoch_nanoseconds)
+
+    def get_possible_instants_for(self, plain_date_time: PlainDateTime) -> List[Instant]:
+        """Get the instants at which the wall clock in this zone shows the given datetime.
+
+        Args:
+            plain_date_time: The wall-clock datetime
+
+        Returns:
+            An empty list inside a DST gap, two instants (earlier first) inside a fold,
+            otherwise a single instant
+        """
+        if not isinstance(plain_date_time, PlainDateTime):
+            raise InvalidArgumentError("Expected PlainDateTime")
+
+        dt = plain_date_time
+        seconds = (dt.hour * 60 + dt.minute) * 60 + dt.second
+        local_nanoseconds = (
+            days_from_civil(dt.year, dt.month, dt.day) * NS_PER_DAY
+            + seconds * NS_PER_SECOND
+            + dt.microsecond * NS_PER_MICROSECOND
+        )
+        return [
+            Instant._from_epoch_nanoseconds(epoch_nanoseconds)
+            for epoch_nanoseconds in self.transition_table.possible_epoch_nanoseconds(local_nanoseconds)
+        ]
+
+    def _int64_columns(self, numpy: Any) -> Any:
+        """Get the transition table's int64-range transitions and offsets as NumPy arrays."""
+        transitions, offsets = self.transition_table.int64_columns()
+        return numpy.array(transitions, dtype=numpy.int64), numpy.array(offsets, dtype=numpy.int64)
+
+    def to_local_many(self, epoch_nanoseconds: Any) -> Any:
+        """Convert a column of instants to wall-clock times in this zone.
+
+        One sorted search over the zone's transitions finds every row's offset;
+        no datetime or ZonedDateTime is created.
+
+        Args:
+            epoch_nanoseconds: Nanoseconds since the Unix epoch, as a NumPy int64 array,
+                an ``array('q')`` or a sequence of integers; MISSING_INT64 rows stay missing
+
+        Returns:
+            Wall-clock nanoseconds since 1970-01-01T00:00, as a NumPy int64 array when the
+            input is a NumPy array and as an ``array('q')`` otherwise
+        """
+        numpy = import_numpy("TimeZone.to_local_many")
+        values, missing = _int64_rows(numpy, epoch_nanoseconds)
+        transitions, offsets = self._int64_columns(numpy)
+        local = values + offsets[numpy.searchsorted(transitions, values, side="right")]
+        if missing is not None:
+            local[missing] = MISSING_INT64
+        return _int64_result(numpy, local, epoch_nanoseconds)
+
+    def to_utc_many(self, local_nanoseconds: Any, disambiguation: str = "compatible") -> Any:
+        """Convert a column of wall-clock times in this zone to instants.
+
+        Args:
+            local_nanoseconds: Wall-clock nanoseconds since 1970-01-01T00:00, as a NumPy int64
+                array, an ``array('q')`` or a sequence of integers; MISSING_INT64 rows stay missing
+            disambiguation: For times repeated by a backward transition, ``"compatible"`` and
+                ``"earlier"`` pick the earlier instant and ``"later"`` the later one; for times
+                skipped by a forward transition, ``"compatible"`` and ``"later"`` move forward
+                by the length of the gap and ``"earlier"`` backward; ``"reject"`` raises for both
+
+        Returns:
+            Nanoseconds since the Unix epoch, as a NumPy int64 array when the input is a NumPy
+            array and as an ``array('q')`` otherwise
+
+        Raises:
+            RangeError: With ``disambiguation="reject"``, if any time is skipped or repeated
+        """
+        if disambiguation not in DISAMBIGUATIONS:
+            raise InvalidArgumentError(f"disambiguation must be one of {', '.join(DISAMBIGUATIONS)}")
+        numpy = import_numpy("TimeZone.to_utc_many")
+        values, missing = _int64_rows(numpy, local_nanoseconds)
+        transitions, offsets = self._int64_columns(numpy)
+
+        # The same candidates as TransitionTable.possible_epoch_nanoseconds, for every row at once:
+        # offsets change at most once within a day either side of any wall-clock time
+        before = offsets[numpy.searchsorted(transitions, values - NS_PER_DAY, side="right")]
+        after = offsets[numpy.searchsorted(transitions, values + NS_PER_DAY, side="right")]
+        result = values - before
+        # Only rows within a day of a transition can be skipped or repeated
+        near = before != after
+        if missing is not None:
+            near &= ~missing
+        rows = numpy.flatnonzero(near)
+        if rows.size:
+            before, after = before[rows], after[rows]
+            earlier = result[rows]
+            later = values[rows] - after
+            earlier_valid = offsets[numpy.searchsorted(transitions, earlier, side="right")] == before
+            later_valid = offsets[numpy.searchsorted(transitions, later, side="right")] == after
+            if disambiguation == "reject":
+                skipped = ~(earlier_valid | later_valid)
+                repeated = earlier_valid & later_valid
+                if skipped.any() or repeated.any():
+                    index = int(numpy.flatnonzero(skipped | repeated)[0])
+                    kind = "skipped" if skipped[index] else "repeated"
+                    raise RangeError(f"Wall-clock time at row {int(rows[index])} is {kind} by a time zone transition")
+            # A skipped time keeps the offset from before the gap, except with "earlier"
+            skipped_result = later if disambiguation == "earlier" else earlier
+            if disambiguation == "later":
+                result[rows] = numpy.where(later_valid, later, numpy.where(earlier_valid, earlier, skipped_result))
+            else:
+                result[rows] = numpy.where(earlier_valid, earlier, numpy.where(later_valid, later, skipped_result))
+        if missing is not None:
+            result[missing] = MISSING_INT64
+        return _int64_result(numpy, result, local_nanoseconds)
+
+
+def _int64_rows(numpy: Any, values: Any) -> Any:
+    """Get integer column input as a NumPy int64 array with missing rows set to 0, and the missing mask.
+
+    The mask is None when no row is missing.
+    """
+    if isinstance(values, array):
+        if values.typecode != "q":
+            raise InvalidArgumentError("Expected array('q')")
+        rows = numpy.frombuffer(values, dtype=numpy.int64)
+    else:
+        rows = numpy.asarray(values)
+        if rows.size == 0:
+            rows = rows.astype(numpy.int64)
+        elif rows.dtype.kind not in "iu":
+            raise InvalidArgumentError(f"Expected integer nanoseconds, got dtype {rows.dtype}")
+        rows = rows.astype(numpy.int64, copy=False)
+    if rows.ndim != 1:
+        raise InvalidArgumentError("Expected a one-dimensional column")
+    missing = rows == MISSING_INT64
+    if not missing.any():
+        return rows, None
+    return numpy.where(missing, 0, rows), missing
+
+
+def _int64_result(numpy: Any, result: Any, values: Any) -> Any:
+    """Return a NumPy int64 result in the input's container kind: NumPy stays NumPy, anything else is ``array('q')``."""
+    if isinstance(values, numpy.ndarray):
+        return result
+    column = array("q")
+    column.frombytes(result.tobytes())
+    return column
@@ -0,0 +1,359 @@
+"""
+Compiled UTC-offset transition tables for the Temporal API.
+
+A TZif file (RFC 8536) is read once into sorted integer arrays of UTC
+transition instants and the offsets in effect between them. Instants past the
+last transition are resolved with the POSIX TZ rule stored in the file footer,
+so offset lookups are a bisect plus a little integer arithmetic and never
+allocate a datetime.
+"""
+
+import os
+import re
+import struct
+from bisect import bisect_right
+from importlib import resources
+from typing import Dict, List, Optional, Tuple
+
+from .exceptions import InvalidArgumentError
+from .utils import NS_PER_DAY, NS_PER_SECOND, civil_from_days, days_from_civil, get_days_in_month, is_leap_year
+
+try:
+    import zoneinfo
+except ImportError:
+    from backports import zoneinfo  # type: ignore[no-redef]
+
+# TZif header: magic, version, 15 reserved bytes and six counts
+_HEADER = struct.Struct(">4sc15x6l")
+_TTINFO = struct.Struct(">lBB")
+
+# POSIX TZ string, e.g. "EST5EDT,M3.2.0,M11.1.0" or "<+0330>-3:30"
+_POSIX_OFFSET = r"[+-]?\d{1,3}(?::\d{2}){0,2}"
+_POSIX_PATTERN = re.compile(
+    rf"^(?:<[^>]+>|[A-Za-z]{{3,}})(?P<std_offset>{_POSIX_OFFSET})"
+    rf"(?:(?P<dst><[^>]+>|[A-Za-z]{{3,}})(?P<dst_offset>{_POSIX_OFFSET})?"
+    rf"(?:,(?P<start>[^,/]+)(?:/(?P<start_time>{_POSIX_OFFSET}))?"
+    rf",(?P<end>[^,/]+)(?:/(?P<end_time>{_POSIX_OFFSET}))?)?)?$"
+)
+_POSIX_DATE_PATTERN = re.compile(r"^(?:M(\d{1,2})\.(\d)\.(\d)|J(\d{1,3})|(\d{1,3}))$")
+
+# POSIX default DST rule when a zone names a DST abbreviation without dates
+_DEFAULT_DST_RULE = ("M3.2.0", "M11.1.0")
+
+# Bounds of the instants an int64 of epoch nanoseconds can hold
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+_INT64_MIN_SECONDS = _INT64_MIN // NS_PER_SECOND
+_INT64_MAX_YEAR = 2262
+
+
+def _posix_seconds(text: str) -> int:
+    """Convert a POSIX ``[+-]hh[:mm[:ss]]`` value to seconds."""
+    sign = -1 if text.startswith("-") else 1
+    parts = [int(part) for part in text.lstrip("+-").split(":")]
+    parts += [0] * (3 - len(parts))
+    return sign * (parts[0] * 3600 + parts[1] * 60 + parts[2])
+
+
+class PosixRule:
+    """A POSIX TZ rule giving the UTC offset for any instant after the last transition."""
+
+    __slots__ = ("_std_offset", "_dst_offset", "_start", "_end", "_cache")
+
+    def __init__(self, rule: str):
+        """Parse a POSIX TZ string such as ``CET-1CEST,M3.5.0,M10.5.0/3``."""
+        match = _POSIX_PATTERN.match(rule)
+        if not match:
+            raise InvalidArgumentError(f"Invalid POSIX TZ rule: {rule}")
+
+        # POSIX offsets count hours west of Greenwich, the opposite of UTC offsets
+        self._std_offset = -_posix_seconds(match.group("std_offset"))
+        self._dst_offset: Optional[int] = None
+        self._start: Optional[Tuple[Tuple[int, ...], int]] = None
+        self._end: Optional[Tuple[Tuple[int, ...], int]] = None
+        self._cache: Dict[int, Tuple[int, int]] = {}
+
+        if match.group("dst") is not None:
+            # Daylight time defaults to one hour ahead of standard time
+            dst_offset = match.group("dst_offset")
+            self._dst_offset = -_posix_seconds(dst_offset) if dst_offset else self._std_offset + 3600
+            start, end = match.group("start"), match.group("end")
+            if start is None:
+                start, end = _DEFAULT_DST_RULE
+            self._start = (self._parse_date(start), _posix_seconds(match.group("start_time") or "2"))
+            self._end = (self._parse_date(end), _posix_seconds(match.group("end_time") or "2"))
+
+    @staticmethod
+    def _parse_date(text: str) -> Tuple[int, ...]:
+        """Parse a ``Mm.w.d``, ``Jn`` or ``n`` rule date."""
+        match = _POSIX_DATE_PATTERN.match(text)
+        if not match:
+            raise InvalidArgumentError(f"Invalid POSIX TZ date: {text}")
+        month, week, weekday, julian, zero_based = match.groups()
+        if month is not None:
+            return (0, int(month), int(week), int(weekday))
+        if julian is not None:
+            return (1, int(julian))
+        return (2, int(zero_based))
+
+    @staticmethod
+    def _epoch_days(rule_date: Tuple[int, ...], year: int) -> int:
+        """Get the epoch day on which a rule date falls in the given year."""
+        kind = rule_date[0]
+        if kind == 0:
+            _, month, week, weekday = rule_date
+            first = days_from_civil(year, month, 1)
+            # 1970-01-01 was a Thursday; POSIX counts Sunday as weekday 0
+            day = first + (weekday - (first + 4) % 7) % 7 + (week - 1) * 7
+            last = first + get_days_in_month(year, month) - 1
+            while day > last:
+                day -= 7
+            return day
+        if kind == 1:
+            # Jn counts 1-365 and never includes February 29
+            day_of_year = rule_date[1] - 1
+            if is_leap_year(year) and day_of_year >= 59:
+                day_of_year += 1
+            return days_from_civil(year, 1, 1) + day_of_year
+        return days_from_civil(year, 1, 1) + rule_date[1]
+
+    def _transitions_for(self, year: int) -> Tuple[int, int]:
+        """Get the UTC epoch seconds at which DST starts and ends in the given year."""
+        transitions = self._cache.get(year)
+        if transitions is None:
+            (start_date, start_time), (end_date, end_time) = self._start, self._end  # type: ignore[misc]
+            # The start is given in local standard time, the end in local daylight time
+            start = self._epoch_days(start_date, year) * 86_400 + start_time - self._std_offset
+            end = self._epoch_days(end_date, year) * 86_400 + end_time - self._dst_offset  # type: ignore[operator]
+            transitions = (start, end)
+            self._cache[year] = transitions
+        return transitions
+
+    def offset_at(self, epoch_seconds: int) -> int:
+        """Get the UTC offset in seconds at the given epoch second."""
+        if self._dst_offset is None:
+            return self._std_offset
+
+        year = civil_from_days((epoch_seconds + self._std_offset) // 86_400)[0]
+        start, end = self._transitions_for(year)
+        if start < end:
+            in_dst = start <= epoch_seconds < end
+        else:
+            # Southern hemisphere: DST spans the turn of the year
+            in_dst = not end <= epoch_seconds < start
+        return self._dst_offset if in_dst else self._std_offset  # type: ignore[return-value]
+
+    def transitions_between(self, start_year: int, end_year: int) -> List[Tuple[int, int]]:
+        """Get the ``(epoch_seconds, new_offset)`` transitions of years ``start_year`` to ``end_year``, in order."""
+        if self._dst_offset is None:
+            return []
+        events = []
+        for year in range(start_year, end_year + 1):
+            start, end = self._transitions_for(year)
+            events.append((start, self._dst_offset))
+            events.append((end, self._std_offset))
+        events.sort()
+        return events
+
+
+class TransitionTable:
+    """Sorted UTC transition instants and the offsets in effect between them.
+
+    ``offsets[i]`` applies before ``transitions[i]``, and ``offsets[-1]`` after
+    the last transition unless a POSIX rule takes over from there. All values
+    are integer nanoseconds.
+    """
+
+    __slots__ = ("_transitions", "_offsets", "_rule", "_int64_columns")
+
+    def __init__(self, transitions: List[int], offsets: List[int], rule: Optional[PosixRule] = None):
+        """Initialize a table from epoch-nanosecond transitions and nanosecond offsets."""
+        if len(offsets) != len(transitions) + 1:
+            raise InvalidArgumentError("A transition table needs exactly one more offset than transitions")
+        self._transitions = transitions
+        self._offsets = offsets
+        self._rule = rule
+        self._int64_columns: Optional[Tuple[List[int], List[int]]] = None
+
+    @classmethod
+    def fixed(cls, offset_nanoseconds: int) -> "TransitionTable":
+        """Create a table for a zone with a single constant offset."""
+        return cls([], [offset_nanoseconds])
+
+    @classmethod
+    def from_tzif(cls, data: bytes) -> "TransitionTable":
+        """Compile a table from the contents of a TZif file."""
+        transitions, offsets, footer = _parse_tzif(data)
+
+        # Drop transitions that only change the abbreviation or DST flag
+        compact_transitions: List[int] = []
+        compact_offsets = [offsets[0] * NS_PER_SECOND]
+        for transition, offset in zip(transitions, offsets[1:]):
+            offset *= NS_PER_SECOND
+            if offset != compact_offsets[-1]:
+                compact_transitions.append(transition * NS_PER_SECOND)
+                compact_offsets.append(offset)
+
+        return cls(compact_transitions, compact_offsets, PosixRule(footer) if footer else None)
+
+    @property
+    def transitions(self) -> List[int]:
+        """Get the UTC transition instants in epoch nanoseconds."""
+        return list(self._transitions)
+
+    def offset_nanoseconds_at(self, epoch_nanoseconds: int) -> int:
+        """Get the UTC offset in nanoseconds at the given epoch nanosecond."""
+        index = bisect_right(self._transitions, epoch_nanoseconds)
+        if index == len(self._transitions) and self._rule is not None:
+            return self._rule.offset_at(epoch_nanoseconds // NS_PER_SECOND) * NS_PER_SECOND
+        return self._offsets[index]
+
+    def transition_bounds(self, epoch_nanoseconds: int) -> Tuple[Optional[int], Optional[int]]:
+        """Get the transitions around an instant: the last one at or before it and the first one after it.
+
+        Either is None when the offset never changes in that direction.
+        """
+        transitions = self._transitions
+        index = bisect_right(transitions, epoch_nanoseconds)
+        previous = transitions[index - 1] if index else None
+        if index < len(transitions):
+            return previous, transitions[index]
+        following = None
+        if self._rule is not None:
+            # A rule changes the offset twice a year, so the neighbouring years hold both bounds
+            last = previous
+            year = civil_from_days(epoch_nanoseconds // NS_PER_DAY)[0]
+            for epoch_seconds, _ in self._rule.transitions_between(year - 1, year + 1):
+                transition = epoch_seconds * NS_PER_SECOND
+                # The rule only governs after the last listed transition
+                if last is not None and transition <= last:
+                    continue
+                if transition <= epoch_nanoseconds:
+                    previous = transition
+                elif following is None:
+                    following = transition
+        return previous, following
+
+    def int64_columns(self) -> Tuple[List[int], List[int]]:
+        """Get transitions and offsets covering every instant an int64 of epoch nanoseconds can hold.
+
+        The POSIX rule is unrolled into explicit transitions through the end of
+        the int64 range (year 2262), so one sorted search finds the offset of
+        any such instant: ``offsets[i]`` applies before ``transitions[i]``.
+        """
+        columns = self._int64_columns
+        if columns is None:
+            transitions = list(self._transitions)
+            offsets = list(self._offsets)
+            rule = self._rule
+            if rule is not None:
+                # The rule governs from the last transition on, or everywhere in a table without transitions
+                start = transitions[-1] // NS_PER_SECOND if transitions else _INT64_MIN_SECONDS
+                offsets[-1] = rule.offset_at(start) * NS_PER_SECOND
+                start_year = civil_from_days(start // 86_400)[0] - 1
+                for epoch_seconds, offset in rule.transitions_between(start_year, _INT64_MAX_YEAR):
+                    offset *= NS_PER_SECOND
+                    if epoch_seconds > start and offset != offsets[-1]:
+                        transitions.append(epoch_seconds * NS_PER_SECOND)
+                        offsets.append(offset)
+            # Drop transitions outside the int64 range, with the offsets no int64 instant sees
+            low = bisect_right(transitions, _INT64_MIN)
+            high = bisect_right(transitions, _INT64_MAX)
+            columns = (transitions[low:high], offsets[low : high + 1])
+            self._int64_columns = columns
+        return columns
+
+    def possible_epoch_nanoseconds(self, local_nanoseconds: int) -> List[int]:
+        """Get every epoch nanosecond whose local wall-clock time is ``local_nanoseconds``.
+
+        Args:
+            local_nanoseconds: Wall-clock nanoseconds since 1970-01-01T00:00
+
+        Returns:
+            No instants inside a gap, two inside a fold (earlier first), otherwise one
+        """
+        # Offsets change at most once within a day either side of any wall-clock time
+        before = self.offset_nanoseconds_at(local_nanoseconds - NS_PER_DAY)
+        after = self.offset_nanoseconds_at(local_nanoseconds + NS_PER_DAY)
+        if before == after:
+            return [local_nanoseconds - before]
+
+        candidates = []
+        for offset in (before, after):
+            epoch_nanoseconds = local_nanoseconds - offset
+            if self.offset_nanoseconds_at(epoch_nanoseconds) == offset:
+                candidates.append(epoch_nanoseconds)
+        return candidates
+
+
+def _parse_tzif(data: bytes) -> Tuple[List[int], List[int], Optional[str]]:
+    """Read transition times, offsets and the footer rule from TZif data.
+
+    Returns:
+        Epoch-second transitions, offsets in seconds (one more than transitions,
+        starting with the offset before the first transition) and the POSIX rule
+    """
+    if len(data) < _HEADER.size or data[:4] != b"TZif":
+        raise InvalidArgumentError("Invalid TZif data")
+
+    magic, version, isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = _HEADER.unpack_from(data, 0)
+    position = _HEADER.size
+    time_format = ">%dl"
+    time_size = 4
+    if version >= b"2":
+        # Skip the 32-bit block; the 64-bit block and footer follow it
+        position += timecnt * 5 + typecnt * 6 + charcnt + leapcnt * 8 + isstdcnt + isutcnt
+        magic, version, isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = _HEADER.unpack_from(data, position)
+        position += _HEADER.size
+        time_format = ">%dq"
+        time_size = 8
+
+    transitions = list(struct.unpack_from(time_format % timecnt, data, position))
+    position += timecnt * time_size
+    indices = data[position : position + timecnt]
+    position += timecnt
+    utoffs = [_TTINFO.unpack_from(data, position + 6 * i)[0] for i in range(typecnt)]
+    position += typecnt * 6 + charcnt + leapcnt * (time_size + 4) + isstdcnt + isutcnt
+
+    footer = None
+    if time_size == 8:
+        lines = data[position:].split(b"\n")
+        if len(lines) >= 2 and lines[1]:
+            footer = lines[1].decode("ascii")
+
+    # RFC 8536: local time type 0 applies before the first transition
+    offsets = [utoffs[0]] + [utoffs[index] for index in indices]
+    return transitions, offsets, footer
+
+
+def _read_tzif(key: str) -> Optional[bytes]:
+    """Find the TZif data for a zone key on the tz search path or in the tzdata package."""
+    for root in zoneinfo.TZPATH:
+        path = os.path.join(root, key)
+        if os.path.isfile(path):
+            with open(path, "rb") as f:
+                return f.read()
+
+    package, _, name = f"tzdata.zoneinfo/{key}".rpartition("/")
+    package = package.replace("/", ".")
+    try:
+        if hasattr(resources, "files"):
+            return resources.files(package).joinpath(name).read_bytes()
+        # importlib.resources.files arrived in Python 3.9
+        return resources.read_binary(package, name)
+    except (ImportError, FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        # tzdata is not installed, or has no such zone
+        return None
+
+
+def load_transition_table(zone_info) -> TransitionTable:
+    """Compile the transition table for a ZoneInfo or fixed-offset tzinfo."""
+    key = getattr(zone_info, "key", None)
+    if key is None:
+        offset = zone_info.utcoffset(None)
+        return TransitionTable.fixed((offset.days * 86_400 + offset.seconds) * NS_PER_SECOND)
+
+    data = _read_tzif(key)
+    if data is None:
+        raise InvalidArgumentError(f"No tz database file found for {key}")
+    return TransitionTable.from_tzif(data)
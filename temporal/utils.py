@@ -3,9 +3,16 @@ Utility functions for the Temporal API.
 """
 
 import re
-from typing import Any, Dict, Optional, Tuple
+from array import array
+from datetime import date, datetime, time, timezone
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
 
-from .exceptions import InvalidArgumentError, RangeError
+from .exceptions import InvalidArgumentError, RangeError, TemporalError
+
+# Nanosecond unit sizes
+NS_PER_MICROSECOND = 1000
+NS_PER_SECOND = 1_000_000_000
+NS_PER_DAY = 86_400 * NS_PER_SECOND
 
 # ISO 8601 regex patterns
 ISO_DATE_PATTERN = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
@@ -14,11 +21,38 @@ ISO_TIME_PATTERN = re.compile(r"^(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,9}))?$")
 
 ISO_DATETIME_PATTERN = re.compile(r"^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,9}))?$")
 
+ISO_YEAR_MONTH_PATTERN = re.compile(r"^(\d{4})-(\d{2})$")
+
+ISO_MONTH_DAY_PATTERN = re.compile(r"^(?:--)?(\d{1,2})-(\d{1,2})$")
+
 ISO_DURATION_PATTERN = re.compile(
     r"^P(?:(\d+)Y)?(?:(\d+)M)?(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?)?$"
 )
 
 
+class Immutable:
+    """Mixin for slotted value types whose state is assigned once during construction.
+
+    Subclasses declare ``__slots__`` and assign them with ``object.__setattr__``
+    (or, on hot construction paths, the slot descriptors' ``__set__``); any later
+    assignment or deletion raises ``AttributeError``.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]):
+        return self
+
+
 def validate_date_fields(year: int, month: int, day: int) -> None:
     """Validate date field values."""
     if not isinstance(year, int):
@@ -28,6 +62,11 @@ def validate_date_fields(year: int, month: int, day: int) -> None:
     if not isinstance(day, int):
         raise InvalidArgumentError("Day must be an integer")
 
+    check_date_range(year, month, day)
+
+
+def check_date_range(year: int, month: int, day: int) -> None:
+    """Validate the ranges of integer date fields."""
     if year < 1 or year > 9999:
         raise RangeError(f"Year {year} is out of range (1-9999)")
     if month < 1 or month > 12:
@@ -52,6 +91,11 @@ def validate_time_fields(hour: int, minute: int, second: int, microsecond: int =
     if not isinstance(microsecond, int):
         raise InvalidArgumentError("Microsecond must be an integer")
 
+    check_time_range(hour, minute, second, microsecond)
+
+
+def check_time_range(hour: int, minute: int, second: int, microsecond: int = 0) -> None:
+    """Validate the ranges of integer time fields."""
     if hour < 0 or hour > 23:
         raise RangeError(f"Hour {hour} is out of range (0-23)")
     if minute < 0 or minute > 59:
@@ -62,6 +106,16 @@ def validate_time_fields(hour: int, minute: int, second: int, microsecond: int =
         raise RangeError(f"Microsecond {microsecond} is out of range (0-999999)")
 
 
+def is_valid_date(year: int, month: int, day: int) -> bool:
+    """Check the ranges of integer date fields without raising."""
+    return 1 <= year <= 9999 and 1 <= month <= 12 and 1 <= day <= get_days_in_month(year, month)
+
+
+def is_valid_time(hour: int, minute: int, second: int, microsecond: int = 0) -> bool:
+    """Check the ranges of integer time fields without raising."""
+    return 0 <= hour <= 23 and 0 <= minute <= 59 and 0 <= second <= 59 and 0 <= microsecond <= 999999
+
+
 def is_leap_year(year: int) -> bool:
     """Check if a year is a leap year."""
     return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
@@ -76,54 +130,382 @@ def get_days_in_month(year: int, month: int) -> int:
     return days
 
 
-def parse_iso_date(date_string: str) -> Tuple[int, int, int]:
-    """Parse an ISO 8601 date string."""
-    match = ISO_DATE_PATTERN.match(date_string)
-    if not match:
-        raise InvalidArgumentError(f"Invalid ISO date format: {date_string}")
+def days_from_civil(year: int, month: int, day: int) -> int:
+    """Convert a proleptic Gregorian date to days since 1970-01-01.
+
+    Closed-form conversion (H. Hinnant, "chrono-Compatible Low-Level Date
+    Algorithms") using eras of 400 years that start on March 1st.
+    """
+    year -= month <= 2
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def civil_from_days(days: int) -> Tuple[int, int, int]:
+    """Convert days since 1970-01-01 to a proleptic Gregorian (year, month, day)."""
+    days += 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    month = shifted_month + 3 if shifted_month < 10 else shifted_month - 9
+    return year_of_era + era * 400 + (month <= 2), month, day
+
+
+def add_months(year: int, month: int, day: int, months: int) -> Tuple[int, int, int]:
+    """Move a date by whole months, clamping the day to the end of the target month."""
+    new_year, new_month = divmod(year * 12 + month - 1 + months, 12)
+    new_month += 1
+    if new_year < 1 or new_year > 9999:
+        raise RangeError(f"Year {new_year} is out of range (1-9999)")
+    return new_year, new_month, min(day, get_days_in_month(new_year, new_month))
+
+
+# Supported epoch-day range (0001-01-01 through 9999-12-31)
+MIN_EPOCH_DAYS = days_from_civil(1, 1, 1)
+MAX_EPOCH_DAYS = days_from_civil(9999, 12, 31)
+
+# Reference points for converting stdlib values to epoch counts
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+# Scale factors that turn a fraction of 1-6 digits into microseconds
+_FRACTION_SCALE = (0, 100000, 10000, 1000, 100, 10, 1)
+
+
+def _fraction_to_microseconds(fraction: str) -> int:
+    """Convert 1-9 fractional-second digits to microseconds, truncating extra digits."""
+    digits = min(len(fraction), 6)
+    return int(fraction[:digits]) * _FRACTION_SCALE[digits]
+
+
+# The fast paths below check the fixed-width layout by hand and let the C-level
+# ``fromisoformat`` convert the digits and check field ranges. Anything they do
+# not accept (other layouts, out-of-range fields, non-ASCII digits) goes
+# through the general regex grammar, which also produces the error messages.
+
+
+def _fast_date(text: str) -> Optional[Tuple[int, int, int]]:
+    """Fast path for ``YYYY-MM-DD``; returns None if the layout or values do not fit."""
+    if len(text) != 10 or text[4] != "-" or text[7] != "-":
+        return None
+    try:
+        value = date.fromisoformat(text)
+    except ValueError:
+        return None
+    return value.year, value.month, value.day
+
+
+def _fast_time(text: str) -> Optional[Tuple[int, int, int, int]]:
+    """Fast path for ``HH:MM:SS[.fffffffff]``; returns None if the layout or values do not fit."""
+    length = len(text)
+    if length < 8 or length == 9 or length > 18 or text[2] != ":" or text[5] != ":" or text[:2] == "24":
+        return None
+    if length > 8 and (text[8] != "." or not text[9:].isdecimal()):
+        return None
+    try:
+        value = time.fromisoformat(text)
+    except ValueError:
+        return None
+    return value.hour, value.minute, value.second, value.microsecond
+
+
+def _fast_datetime(text: str) -> Optional[Tuple[int, int, int, int, int, int, int]]:
+    """Fast path for ``YYYY-MM-DDTHH:MM:SS[.fffffffff]``; returns None if the layout or values do not fit."""
+    length = len(text)
+    if length < 19 or length == 20 or length > 29 or text[10] != "T" or text[11:13] == "24":
+        return None
+    if text[4] != "-" or text[7] != "-" or text[13] != ":" or text[16] != ":":
+        return None
+    if length > 19 and (text[19] != "." or not text[20:].isdecimal()):
+        return None
+    try:
+        value = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    return value.year, value.month, value.day, value.hour, value.minute, value.second, value.microsecond
+
+
+def _regex_date(text: str) -> Optional[Tuple[int, int, int]]:
+    """General-grammar date parse used when the fast path does not apply; returns None if it does not match."""
+    match = ISO_DATE_PATTERN.match(text)
+    if match is None:
+        return None
+    year, month, day = match.groups()
+    return int(year), int(month), int(day)
+
+
+def _regex_time(text: str) -> Optional[Tuple[int, int, int, int]]:
+    """General-grammar time parse used when the fast path does not apply; returns None if it does not match."""
+    match = ISO_TIME_PATTERN.match(text)
+    if match is None:
+        return None
+    hour, minute, second, fraction = match.groups()
+    return int(hour), int(minute), int(second), _fraction_to_microseconds(fraction) if fraction else 0
 
-    year, month, day = map(int, match.groups())
-    validate_date_fields(year, month, day)
-    return year, month, day
 
+def _regex_datetime(text: str) -> Optional[Tuple[int, int, int, int, int, int, int]]:
+    """General-grammar datetime parse used when the fast path does not apply; returns None if it does not match."""
+    match = ISO_DATETIME_PATTERN.match(text)
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction = match.groups()
+    microsecond = _fraction_to_microseconds(fraction) if fraction else 0
+    return int(year), int(month), int(day), int(hour), int(minute), int(second), microsecond
 
-def parse_iso_time(time_string: str) -> Tuple[int, int, int, int]:
-    """Parse an ISO 8601 time string."""
-    match = ISO_TIME_PATTERN.match(time_string)
-    if not match:
-        raise InvalidArgumentError(f"Invalid ISO time format: {time_string}")
 
-    hour, minute, second, fraction = match.groups()
-    hour, minute, second = int(hour), int(minute), int(second)
+def parse_iso_date(date_string: str) -> Tuple[int, int, int]:
+    """Parse an ISO 8601 date string."""
+    fields = _fast_date(date_string)
+    if fields is None:
+        fields = _regex_date(date_string)
+        if fields is None:
+            raise InvalidArgumentError(f"Invalid ISO date format: {date_string}")
+        check_date_range(*fields)
+    return fields
 
-    microsecond = 0
-    if fraction:
-        # Pad or truncate to 6 digits for microseconds
-        fraction = fraction.ljust(6, "0")[:6]
-        microsecond = int(fraction)
 
-    validate_time_fields(hour, minute, second, microsecond)
-    return hour, minute, second, microsecond
+def parse_iso_time(time_string: str) -> Tuple[int, int, int, int]:
+    """Parse an ISO 8601 time string."""
+    fields = _fast_time(time_string)
+    if fields is None:
+        fields = _regex_time(time_string)
+        if fields is None:
+            raise InvalidArgumentError(f"Invalid ISO time format: {time_string}")
+        check_time_range(*fields)
+    return fields
 
 
 def parse_iso_datetime(datetime_string: str) -> Tuple[int, int, int, int, int, int, int]:
     """Parse an ISO 8601 datetime string."""
-    match = ISO_DATETIME_PATTERN.match(datetime_string)
-    if not match:
-        raise InvalidArgumentError(f"Invalid ISO datetime format: {datetime_string}")
-
-    year, month, day, hour, minute, second, fraction = match.groups()
-    year, month, day = int(year), int(month), int(day)
-    hour, minute, second = int(hour), int(minute), int(second)
-
-    microsecond = 0
-    if fraction:
-        fraction = fraction.ljust(6, "0")[:6]
-        microsecond = int(fraction)
-
-    validate_date_fields(year, month, day)
-    validate_time_fields(hour, minute, second, microsecond)
-    return year, month, day, hour, minute, second, microsecond
+    fields = _fast_datetime(datetime_string)
+    if fields is None:
+        fields = _regex_datetime(datetime_string)
+        if fields is None:
+            raise InvalidArgumentError(f"Invalid ISO datetime format: {datetime_string}")
+        check_date_range(fields[0], fields[1], fields[2])
+        check_time_range(fields[3], fields[4], fields[5], fields[6])
+    return fields
+
+
+# The try_parse_* functions accept exactly what their parse_* counterparts do,
+# but return None for anything else. They check ranges with comparisons rather
+# than by catching errors, so rejecting a row costs no more than accepting one.
+
+
+def try_parse_iso_date(date_string: Any) -> Optional[Tuple[int, int, int]]:
+    """Parse an ISO 8601 date string like ``parse_iso_date``, returning None instead of raising."""
+    if not isinstance(date_string, str):
+        return None
+    fields = _fast_date(date_string)
+    if fields is None:
+        fields = _regex_date(date_string)
+        if fields is None or not is_valid_date(*fields):
+            return None
+    return fields
+
+
+def try_parse_iso_time(time_string: Any) -> Optional[Tuple[int, int, int, int]]:
+    """Parse an ISO 8601 time string like ``parse_iso_time``, returning None instead of raising."""
+    if not isinstance(time_string, str):
+        return None
+    fields = _fast_time(time_string)
+    if fields is None:
+        fields = _regex_time(time_string)
+        if fields is None or not is_valid_time(*fields):
+            return None
+    return fields
+
+
+def try_parse_iso_datetime(datetime_string: Any) -> Optional[Tuple[int, int, int, int, int, int, int]]:
+    """Parse an ISO 8601 datetime string like ``parse_iso_datetime``, returning None instead of raising."""
+    if not isinstance(datetime_string, str):
+        return None
+    fields = _fast_datetime(datetime_string)
+    if fields is None:
+        fields = _regex_datetime(datetime_string)
+        if fields is None or not (is_valid_date(*fields[:3]) and is_valid_time(*fields[3:])):
+            return None
+    return fields
+
+
+def could_be_isoformat(text: Any) -> bool:
+    """Check cheaply whether ``datetime.fromisoformat`` might accept ``text``.
+
+    Every string it accepts starts with a four-digit ASCII year and has at least
+    seven characters, so most malformed input is rejected here without calling it.
+    """
+    return isinstance(text, str) and len(text) >= 7 and text[:4].isdigit() and text[:4].isascii()
+
+
+def try_parse_iso_year_month(year_month_string: Any) -> Optional[Tuple[int, int]]:
+    """Parse an ISO 8601 ``YYYY-MM`` string like ``parse_iso_year_month``, returning None instead of raising."""
+    if not isinstance(year_month_string, str):
+        return None
+    text = year_month_string
+    if len(text) == 7 and text[4] == "-" and text[:4].isdecimal() and text[5:].isdecimal():
+        return int(text[:4]), int(text[5:])
+
+    match = ISO_YEAR_MONTH_PATTERN.match(text)
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def parse_iso_year_month(year_month_string: str) -> Tuple[int, int]:
+    """Parse an ISO 8601 ``YYYY-MM`` string; range checks are left to the caller."""
+    fields = try_parse_iso_year_month(year_month_string)
+    if fields is None:
+        raise InvalidArgumentError(f"Invalid PlainYearMonth string: {year_month_string}")
+    return fields
+
+
+def try_parse_iso_month_day(month_day_string: Any) -> Optional[Tuple[int, int]]:
+    """Parse an ISO 8601 ``--MM-DD`` (or ``MM-DD``) string like ``parse_iso_month_day``, returning None instead of raising."""
+    if not isinstance(month_day_string, str):
+        return None
+    text = month_day_string
+    if len(text) == 7 and text[:2] == "--" and text[4] == "-" and text[2:4].isdecimal() and text[5:].isdecimal():
+        return int(text[2:4]), int(text[5:])
+
+    match = ISO_MONTH_DAY_PATTERN.match(text)
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def parse_iso_month_day(month_day_string: str) -> Tuple[int, int]:
+    """Parse an ISO 8601 ``--MM-DD`` (or ``MM-DD``) string; range checks are left to the caller."""
+    fields = try_parse_iso_month_day(month_day_string)
+    if fields is None:
+        raise InvalidArgumentError(f"Invalid PlainMonthDay string: {month_day_string}")
+    return fields
+
+
+def parse_iso_epoch_days(date_string: str) -> int:
+    """Parse an ISO 8601 date string straight to days since 1970-01-01."""
+    text = date_string
+    if len(text) == 10 and text[4] == "-" and text[7] == "-":
+        try:
+            return date.fromisoformat(text).toordinal() - _UNIX_EPOCH_ORDINAL
+        except ValueError:
+            pass
+    return days_from_civil(*parse_iso_date(date_string))
+
+
+def parse_iso_datetime_nanoseconds(datetime_string: str) -> int:
+    """Parse an ISO 8601 datetime string to wall-clock nanoseconds since 1970-01-01T00:00."""
+    year, month, day, hour, minute, second, microsecond = parse_iso_datetime(datetime_string)
+    seconds = days_from_civil(year, month, day) * 86_400 + hour * 3600 + minute * 60 + second
+    return seconds * NS_PER_SECOND + microsecond * NS_PER_MICROSECOND
+
+
+def split_iso_fraction(text: str) -> Tuple[str, int]:
+    """Split the fractional seconds off an ISO 8601 date-time string, as nanoseconds.
+
+    ``datetime.fromisoformat`` keeps at most microseconds, and before Python 3.11
+    accepts only 3 or 6 fraction digits, so exact parsers hand it the rest of the
+    string and add the returned nanoseconds. Digits past the ninth are truncated;
+    text that has no seconds fraction is returned unchanged for it to judge.
+    """
+    dot = text.find(".")
+    if dot < 0:
+        dot = text.find(",")
+        if dot < 0:
+            return text, 0
+    # The fraction must follow the seconds of an HH:MM:SS time, not sit inside an offset
+    if (
+        dot < 16
+        or text[dot - 3] != ":"
+        or text[dot - 6] != ":"
+        or text.find("+", 10, dot) >= 0
+        or text.find("-", 10, dot) >= 0
+    ):
+        return text, 0
+    end = dot + 1
+    length = len(text)
+    while end < length and "0" <= text[end] <= "9":
+        end += 1
+    if end == dot + 1:
+        return text, 0
+    return text[:dot] + text[end:], int(text[dot + 1 : min(end, dot + 10)].ljust(9, "0"))
+
+
+def datetime_to_epoch_nanoseconds(dt: datetime) -> int:
+    """Get the exact nanoseconds since the Unix epoch for an aware datetime."""
+    delta = dt - _UNIX_EPOCH
+    return ((delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds) * NS_PER_MICROSECOND
+
+
+# Output kinds accepted by the ``parse_many`` batch constructors
+BATCH_OUTPUTS = ("objects", "array", "numpy")
+
+# Placeholder for failed rows in column outputs (the int64 minimum, like NumPy's NaT)
+MISSING_INT64 = -(2**63)
+
+
+def import_numpy(feature: str = "output='numpy'") -> Any:
+    """Import NumPy for ``feature``, with a clear error when it is not installed."""
+    try:
+        import numpy
+    except ImportError as e:  # pragma: no cover - depends on the environment
+        raise ImportError(f"{feature} requires NumPy to be installed") from e
+    return numpy
+
+
+def check_batch_output(output: str) -> None:
+    """Check a batch ``output`` argument, and that NumPy is available when it is requested."""
+    if output not in BATCH_OUTPUTS:
+        raise InvalidArgumentError(f"output must be one of {', '.join(BATCH_OUTPUTS)}")
+    if output == "numpy":
+        import_numpy()
+
+
+def parse_many(
+    strings: Iterable[Any],
+    parse: Callable[[str], Any],
+    output: str = "objects",
+    errors: Optional[Dict[int, TemporalError]] = None,
+) -> Any:
+    """Apply a single-string parser to every row of a batch.
+
+    Args:
+        strings: The strings to parse
+        parse: Returns an object for ``output="objects"`` and an int64 column value otherwise
+        output: ``"objects"`` for a list, ``"array"`` for ``array('q')``, ``"numpy"`` for a NumPy int64 array
+        errors: If given, failed rows are recorded here as ``{index: error}`` and filled with None
+            (or MISSING_INT64 in column outputs) instead of raising
+
+    Returns:
+        A list or column aligned with the input rows
+    """
+    check_batch_output(output)
+
+    columnar = output != "objects"
+    values: Any = array("q") if columnar else []
+    missing = MISSING_INT64 if columnar else None
+    append = values.append
+    for index, text in enumerate(strings):
+        try:
+            if not isinstance(text, str):
+                raise InvalidArgumentError(f"Expected string, got {type(text).__name__}")
+            append(parse(text))
+        except TemporalError as e:
+            if errors is None:
+                raise
+            errors[index] = e
+            append(missing)
+
+    if output == "numpy":
+        numpy = import_numpy()
+        return numpy.frombuffer(values, dtype=numpy.int64)
+    return values
 
 
 def pad_zero(value: int, width: int = 2) -> str:
@@ -136,3 +518,137 @@ def format_microseconds(microsecond: int) -> str:
     if microsecond == 0:
         return ""
     return f".{microsecond:06d}".rstrip("0")
+
+
+def round_half_even(value: int, increment: int) -> int:
+    """Round an integer to the nearest multiple of ``increment``, ties to even."""
+    quotient, remainder = divmod(value, increment)
+    if remainder * 2 > increment or (remainder * 2 == increment and quotient % 2):
+        quotient += 1
+    return quotient * increment
+
+
+# Fixed-length units; anything longer is a calendar unit
+_TIME_UNIT_NANOSECONDS = {
+    "hours": 3600 * NS_PER_SECOND,
+    "minutes": 60 * NS_PER_SECOND,
+    "seconds": NS_PER_SECOND,
+    "milliseconds": 1_000_000,
+    "microseconds": NS_PER_MICROSECOND,
+    "nanoseconds": 1,
+}
+
+# Units accepted by round(): wall-clock types stop at microseconds, Instant is limited to seconds and smaller
+TIME_ROUNDING_UNITS = ("hours", "minutes", "seconds", "milliseconds", "microseconds")
+INSTANT_ROUNDING_UNITS = ("seconds", "milliseconds", "microseconds", "nanoseconds")
+
+
+def rounding_increment_nanoseconds(options: Union[str, dict], units: Tuple[str, ...], default_unit: str) -> int:
+    """Get the ``round()`` increment in nanoseconds for a unit name or options dict.
+
+    Args:
+        options: A unit name, or a dict with optional 'smallestUnit' and 'roundingIncrement'
+        units: The units the calling type accepts
+        default_unit: The unit used when a dict gives no 'smallestUnit'
+    """
+    if isinstance(options, str):
+        smallest_unit = options
+        rounding_increment = 1
+    elif isinstance(options, dict):
+        smallest_unit = options.get("smallestUnit", default_unit)
+        rounding_increment = options.get("roundingIncrement", 1)
+    else:
+        raise InvalidArgumentError("Options must be string or dict")
+
+    if not isinstance(rounding_increment, int) or rounding_increment < 1:
+        raise RangeError("roundingIncrement must be a positive integer")
+
+    if smallest_unit not in units:
+        raise InvalidArgumentError(f"Invalid unit: {smallest_unit}")
+    return rounding_increment * _TIME_UNIT_NANOSECONDS[smallest_unit]
+
+
+def bucket_unit(options: Union[str, dict]) -> Tuple[str, int]:
+    """Get the ``(unit, increment)`` of ``floor()``, ``ceil()`` and ``bucket()`` options.
+
+    Fixed-length units come back as ``("nanoseconds", increment)``, with an
+    increment that divides a day evenly so that buckets line up with midnight.
+    Calendar units are ``"days"``, ``"weeks"`` (ISO weeks, from Monday),
+    ``"months"`` and ``"years"``; ``"quarters"`` comes back as three months.
+    """
+    if isinstance(options, str):
+        unit = options
+        increment = 1
+    elif isinstance(options, dict):
+        unit = options.get("smallestUnit")
+        increment = options.get("roundingIncrement", 1)
+        if unit is None:
+            raise InvalidArgumentError("smallestUnit is required")
+    else:
+        raise InvalidArgumentError("Options must be string or dict")
+
+    if not isinstance(increment, int) or isinstance(increment, bool) or increment < 1:
+        raise RangeError("roundingIncrement must be a positive integer")
+
+    if unit in _TIME_UNIT_NANOSECONDS:
+        increment *= _TIME_UNIT_NANOSECONDS[unit]
+        if NS_PER_DAY % increment:
+            raise RangeError(f"roundingIncrement of {unit} must divide a day evenly")
+        return "nanoseconds", increment
+    if unit == "quarters":
+        unit = "months"
+        increment *= 3
+    if unit == "months":
+        if 12 % increment:
+            raise RangeError("roundingIncrement of months must divide a year evenly")
+    elif unit in ("days", "weeks"):
+        if increment != 1:
+            raise RangeError(f"roundingIncrement of {unit} must be 1")
+    elif unit != "years":
+        raise InvalidArgumentError(f"Invalid unit: {unit}")
+    return unit, increment
+
+
+def calendar_bucket(epoch_days: int, unit: str, increment: int) -> Tuple[int, int]:
+    """Get the first day of the calendar bucket containing ``epoch_days`` and the first day of the next one.
+
+    Month and year buckets of several units are aligned to multiples of the
+    increment counted from year 0, so 3 months are quarters and 10 years are decades.
+    """
+    if unit == "days":
+        return epoch_days, epoch_days + 1
+    if unit == "weeks":
+        # 1970-01-01 was a Thursday
+        start = epoch_days - (epoch_days + 3) % 7
+        return start, start + 7
+    year, month, _ = civil_from_days(epoch_days)
+    if unit == "years":
+        year -= year % increment
+        return days_from_civil(year, 1, 1), days_from_civil(year + increment, 1, 1)
+    month_index = year * 12 + month - 1
+    month_index -= month_index % increment
+    end_index = month_index + increment
+    return (
+        days_from_civil(month_index // 12, month_index % 12 + 1, 1),
+        days_from_civil(end_index // 12, end_index % 12 + 1, 1),
+    )
+
+
+def bucket_bounds(nanoseconds: int, unit: str, increment: int) -> Tuple[int, int]:
+    """Get the start and end of the bucket containing nanoseconds since 1970-01-01T00:00, on the same scale.
+
+    ``unit`` and ``increment`` are as returned by ``bucket_unit``; the bucket is
+    the half-open interval ``[start, end)``.
+    """
+    if unit == "nanoseconds":
+        start = nanoseconds - nanoseconds % increment
+        return start, start + increment
+    start, end = calendar_bucket(nanoseconds // NS_PER_DAY, unit, increment)
+    return start * NS_PER_DAY, end * NS_PER_DAY
+
+
+def format_nanoseconds(nanosecond: int) -> str:
+    """Format a sub-second nanosecond count, removing trailing zeros."""
+    if nanosecond == 0:
+        return ""
+    return f".{nanosecond:09d}".rstrip("0")
@@ -2,13 +2,32 @@
 ZonedDateTime implementation for the Temporal API.
 """
 
+import time
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
 
-from .calendar import Calendar
-from .exceptions import InvalidArgumentError
+from .calendar import ISO_CALENDAR, Calendar
+from .exceptions import InvalidArgumentError, TemporalError
+from .parse_cache import cached_parse
 from .timezone import TimeZone
-from .utils import format_microseconds, pad_zero, validate_date_fields, validate_time_fields
+from .utils import (
+    NS_PER_DAY,
+    NS_PER_MICROSECOND,
+    NS_PER_SECOND,
+    Immutable,
+    bucket_bounds,
+    bucket_unit,
+    civil_from_days,
+    could_be_isoformat,
+    datetime_to_epoch_nanoseconds,
+    days_from_civil,
+    format_nanoseconds,
+    pad_zero,
+    parse_many,
+    split_iso_fraction,
+    validate_date_fields,
+    validate_time_fields,
+)
 
 if TYPE_CHECKING:
     from .duration import Duration
@@ -16,10 +35,93 @@ if TYPE_CHECKING:
     from .plain_date import PlainDate
     from .plain_date_time import PlainDateTime
     from .plain_time import PlainTime
-
-
-class ZonedDateTime:
-    """Represents a date and time with time zone information."""
+    from .tzif import TransitionTable
+
+
+def _try_parse_zoned(datetime_string: Any, timezone: Optional[TimeZone]) -> Optional[Tuple[int, TimeZone]]:
+    """Parse an ISO 8601 string into epoch nanoseconds and the TimeZone it belongs to, or None if it is invalid."""
+    if not could_be_isoformat(datetime_string):
+        return None
+    text, fraction = split_iso_fraction(datetime_string)
+    if text.endswith("Z"):
+        # Before Python 3.11, fromisoformat does not read the UTC designator that __str__ writes
+        text = text[:-1] + "+00:00"
+    try:
+        dt = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+    if dt.tzinfo is None:
+        # Without an offset in the string, the provided timezone is required
+        if timezone is None:
+            return None
+        dt = dt.replace(tzinfo=timezone.zone_info)
+    elif timezone is None:
+        # Look up the canonical TimeZone for the datetime's offset or zone
+        timezone = TimeZone._from_tzinfo(dt.tzinfo)
+    else:
+        try:
+            # Convert to the specified timezone
+            dt = dt.astimezone(timezone.zone_info)
+        except OverflowError:
+            return None
+    # Transitions fall on whole seconds, so the fraction is added after resolving the offset
+    return datetime_to_epoch_nanoseconds(dt) + fraction, timezone
+
+
+def _parse_zoned(datetime_string: str, timezone: Optional[TimeZone]) -> Tuple[int, TimeZone]:
+    """Parse an ISO 8601 string into epoch nanoseconds and the TimeZone it belongs to."""
+    if timezone is not None and not isinstance(timezone, TimeZone):
+        raise InvalidArgumentError("Expected TimeZone object")
+    parsed = _try_parse_zoned(datetime_string, timezone)
+    if parsed is None:
+        raise InvalidArgumentError(f"Invalid ISO zoned datetime format: {datetime_string}")
+    return parsed
+
+
+def _resolve_wall_time(
+    year: int, month: int, day: int, hour: int, minute: int, second: int, microsecond: int, table: "TransitionTable"
+) -> int:
+    """Get the epoch nanoseconds for a wall-clock time, taking the earlier instant when it is ambiguous."""
+    local = (
+        days_from_civil(year, month, day) * NS_PER_DAY
+        + ((hour * 60 + minute) * 60 + second) * NS_PER_SECOND
+        + microsecond * NS_PER_MICROSECOND
+    )
+    return _resolve_local_nanoseconds(local, table)
+
+
+def _resolve_local_nanoseconds(local: int, table: "TransitionTable") -> int:
+    """Get the epoch nanoseconds for wall-clock nanoseconds since 1970-01-01T00:00 in a zone."""
+    candidates = table.possible_epoch_nanoseconds(local)
+    if candidates:
+        return candidates[0]
+    # In a gap, use the offset from before the transition
+    return local - table.offset_nanoseconds_at(local - NS_PER_DAY)
+
+
+def _start_of_local_day(local: int, table: "TransitionTable") -> int:
+    """Get the first instant of the wall-clock day whose midnight is ``local``.
+
+    That is the earlier instant at midnight, or the end of the gap when
+    midnight is skipped.
+    """
+    epoch_nanoseconds = _resolve_local_nanoseconds(local, table)
+    if epoch_nanoseconds + table.offset_nanoseconds_at(epoch_nanoseconds) != local:
+        epoch_nanoseconds = table.transition_bounds(epoch_nanoseconds)[0]  # type: ignore[assignment]
+    return epoch_nanoseconds
+
+
+class ZonedDateTime(Immutable):
+    """Represents a date and time with time zone information.
+
+    The canonical state is an exact instant (nanoseconds since the Unix epoch)
+    plus a TimeZone, so comparison and hashing are integer operations. Wall-clock
+    fields and the UTC offset are computed from the zone's transition table the
+    first time they are needed and then cached.
+    """
+
+    __slots__ = ("_epoch_nanoseconds", "_timezone", "_calendar", "_fields")
 
     def __init__(
         self,
@@ -33,7 +135,11 @@ class ZonedDateTime:
         timezone: Optional[TimeZone] = None,
         calendar: Optional[Calendar] = None,
     ):
-        """Initialize a ZonedDateTime with date, time, and timezone components."""
+        """Initialize a ZonedDateTime with date, time, and timezone components.
+
+        Ambiguous wall-clock times resolve to the earlier instant, and times
+        skipped by a forward transition move forward by the length of the gap.
+        """
         validate_date_fields(year, month, day)
         validate_time_fields(hour, minute, second, microsecond)
 
@@ -42,56 +148,112 @@ class ZonedDateTime:
         if not isinstance(timezone, TimeZone):
             raise InvalidArgumentError("Expected TimeZone object")
 
-        self._year = year
-        self._month = month
-        self._day = day
-        self._hour = hour
-        self._minute = minute
-        self._second = second
-        self._microsecond = microsecond
-        self._timezone = timezone
-        self._calendar = calendar or Calendar()
-
-        # Validate the datetime exists in the timezone
-        try:
-            self._datetime = datetime(year, month, day, hour, minute, second, microsecond, tzinfo=timezone.zone_info)
-        except Exception as e:
-            raise InvalidArgumentError(f"Invalid datetime for timezone: {e}")
+        _set_epoch_nanoseconds(
+            self, _resolve_wall_time(year, month, day, hour, minute, second, microsecond, timezone.transition_table)
+        )
+        _set_timezone(self, timezone)
+        _set_calendar(self, calendar or ISO_CALENDAR)
+        _set_fields(self, None)
+
+    @classmethod
+    def _from_epoch_nanoseconds(
+        cls, epoch_nanoseconds: int, timezone: TimeZone, calendar: Optional[Calendar] = None
+    ) -> "ZonedDateTime":
+        """Create a ZonedDateTime from an exact instant without validation; fields are computed lazily."""
+        zoned = object.__new__(cls)
+        _set_epoch_nanoseconds(zoned, epoch_nanoseconds)
+        _set_timezone(zoned, timezone)
+        _set_calendar(zoned, calendar or ISO_CALENDAR)
+        _set_fields(zoned, None)
+        return zoned
+
+    @classmethod
+    def _from_wall_fields(
+        cls,
+        year: int,
+        month: int,
+        day: int,
+        hour: int,
+        minute: int,
+        second: int,
+        microsecond: int,
+        timezone: TimeZone,
+        calendar: Optional[Calendar] = None,
+    ) -> "ZonedDateTime":
+        """Create a ZonedDateTime from wall-clock fields the library has already validated."""
+        return cls._from_epoch_nanoseconds(
+            _resolve_wall_time(year, month, day, hour, minute, second, microsecond, timezone.transition_table),
+            timezone,
+            calendar,
+        )
+
+    @classmethod
+    def from_epoch_nanoseconds(
+        cls, epoch_nanoseconds: int, timezone: TimeZone, calendar: Optional[Calendar] = None
+    ) -> "ZonedDateTime":
+        """Create a ZonedDateTime for an exact instant in the given timezone."""
+        if not isinstance(epoch_nanoseconds, int) or isinstance(epoch_nanoseconds, bool):
+            raise InvalidArgumentError("epoch_nanoseconds must be an integer")
+        if not isinstance(timezone, TimeZone):
+            raise InvalidArgumentError("Expected TimeZone object")
+        return cls._from_epoch_nanoseconds(epoch_nanoseconds, timezone, calendar)
+
+    def __reduce__(self):
+        return (type(self).from_epoch_nanoseconds, (self._epoch_nanoseconds, self._timezone, self._calendar))
+
+    def _wall_fields(self) -> Tuple[int, ...]:
+        """Get (year, month, day, hour, minute, second, microsecond, offset_ns), computing it on first use."""
+        fields = self._fields
+        if fields is None:
+            offset = self._timezone.transition_table.offset_nanoseconds_at(self._epoch_nanoseconds)
+            days, nanosecond_of_day = divmod(self._epoch_nanoseconds + offset, NS_PER_DAY)
+            year, month, day = civil_from_days(days)
+            second_of_day, nanosecond = divmod(nanosecond_of_day, NS_PER_SECOND)
+            hour, remainder = divmod(second_of_day, 3600)
+            minute, second = divmod(remainder, 60)
+            fields = (year, month, day, hour, minute, second, nanosecond // NS_PER_MICROSECOND, offset)
+            _set_fields(self, fields)
+        return fields
 
     @property
     def year(self) -> int:
         """Get the year."""
-        return self._year
+        return self._wall_fields()[0]
 
     @property
     def month(self) -> int:
         """Get the month (1-12)."""
-        return self._month
+        return self._wall_fields()[1]
 
     @property
     def day(self) -> int:
         """Get the day of the month."""
-        return self._day
+        return self._wall_fields()[2]
 
     @property
     def hour(self) -> int:
         """Get the hour (0-23)."""
-        return self._hour
+        return self._wall_fields()[3]
 
     @property
     def minute(self) -> int:
         """Get the minute (0-59)."""
-        return self._minute
+        return self._wall_fields()[4]
 
     @property
     def second(self) -> int:
         """Get the second (0-59)."""
-        return self._second
+        return self._wall_fields()[5]
 
     @property
     def microsecond(self) -> int:
         """Get the microsecond (0-999999)."""
-        return self._microsecond
+        return self._wall_fields()[6]
+
+    @property
+    def epoch_nanoseconds(self) -> int:
+        """Get the exact nanoseconds since the Unix epoch."""
+        return self._epoch_nanoseconds
 
     @property
     def timezone(self) -> TimeZone:
@@ -106,13 +268,17 @@ class ZonedDateTime:
     @property
     def offset_seconds(self) -> int:
         """Get the UTC offset in seconds."""
-        return int(self._datetime.utcoffset().total_seconds())  # type: ignore[union-attr]
+        return self._wall_fields()[7] // NS_PER_SECOND
+
+    @property
+    def offset_nanoseconds(self) -> int:
+        """Get the UTC offset in nanoseconds."""
+        return self._wall_fields()[7]
 
     @property
     def offset_string(self) -> str:
         """Get the UTC offset as a string (e.g., '+05:00')."""
-        offset = self._datetime.utcoffset()
-        total_seconds = int(offset.total_seconds())  # type: ignore[union-attr]
+        total_seconds = self.offset_seconds
 
         if total_seconds == 0:
             return "Z"
@@ -128,47 +294,35 @@ class ZonedDateTime:
         """Convert to Instant."""
         from .instant import Instant
 
-        return Instant(self._datetime.timestamp())
+        return Instant._from_epoch_nanoseconds(self._epoch_nanoseconds)
 
     def to_plain_date_time(self) -> "PlainDateTime":
         """Convert to PlainDateTime by removing timezone information."""
         from .plain_date_time import PlainDateTime
 
-        return PlainDateTime(
-            self._year, self._month, self._day, self._hour, self._minute, self._second, self._microsecond, self._calendar
-        )
+        year, month, day, hour, minute, second, microsecond, _ = self._wall_fields()
+        return PlainDateTime._from_fields(year, month, day, hour, minute, second, microsecond, self._calendar)
 
     def to_plain_date(self) -> "PlainDate":
         """Extract the date part."""
         from .plain_date import PlainDate
 
-        return PlainDate(self._year, self._month, self._day, self._calendar)
+        year, month, day = self._wall_fields()[:3]
+        return PlainDate._from_fields(year, month, day, self._calendar)
 
     def to_plain_time(self) -> "PlainTime":
         """Extract the time part."""
         from .plain_time import PlainTime
 
-        return PlainTime(self._hour, self._minute, self._second, self._microsecond)
+        hour, minute, second, microsecond = self._wall_fields()[3:7]
+        return PlainTime._from_fields(hour, minute, second, microsecond)
 
     def with_timezone(self, timezone: TimeZone) -> "ZonedDateTime":
         """Convert to the same instant in a different timezone."""
         if not isinstance(timezone, TimeZone):
             raise InvalidArgumentError("Expected TimeZone object")
 
-        # Convert to the new timezone
-        new_dt = self._datetime.astimezone(timezone.zone_info)
-
-        return ZonedDateTime(
-            new_dt.year,
-            new_dt.month,
-            new_dt.day,
-            new_dt.hour,
-            new_dt.minute,
-            new_dt.second,
-            new_dt.microsecond,
-            timezone,
-            self._calendar,
-        )
+        return ZonedDateTime._from_epoch_nanoseconds(self._epoch_nanoseconds, timezone, self._calendar)
 
     def add(self, duration) -> "ZonedDateTime":
         """Add a duration to this zoned datetime."""
@@ -177,10 +331,9 @@ class ZonedDateTime:
         if not isinstance(duration, Duration):
             raise InvalidArgumentError("Expected Duration object")
 
-        # Convert to instant, add duration, convert back
-        instant = self.to_instant()
-        new_instant = instant.add(duration)
-        return new_instant.to_zoned_date_time(self._timezone)
+        # Add on the exact timeline and keep the zone and calendar
+        new_instant = self.to_instant().add(duration)
+        return ZonedDateTime._from_epoch_nanoseconds(new_instant.epoch_nanoseconds, self._timezone, self._calendar)
 
     def subtract(self, other) -> Union["ZonedDateTime", "Duration"]:
         """Subtract another zoned datetime or duration from this one."""
@@ -212,13 +365,14 @@ class ZonedDateTime:
         calendar: Optional[Calendar] = None,
     ) -> "ZonedDateTime":
         """Return a new ZonedDateTime with specified fields replaced."""
-        new_year = year if year is not None else self._year
-        new_month = month if month is not None else self._month
-        new_day = day if day is not None else self._day
-        new_hour = hour if hour is not None else self._hour
-        new_minute = minute if minute is not None else self._minute
-        new_second = second if second is not None else self._second
-        new_microsecond = microsecond if microsecond is not None else self._microsecond
+        fields = self._wall_fields()
+        new_year = year if year is not None else fields[0]
+        new_month = month if month is not None else fields[1]
+        new_day = day if day is not None else fields[2]
+        new_hour = hour if hour is not None else fields[3]
+        new_minute = minute if minute is not None else fields[4]
+        new_second = second if second is not None else fields[5]
+        new_microsecond = microsecond if microsecond is not None else fields[6]
         new_timezone = timezone if timezone is not None else self._timezone
         new_calendar = calendar if calendar is not None else self._calendar
 
@@ -228,18 +382,18 @@ class ZonedDateTime:
 
     def __str__(self) -> str:
         """Return ISO 8601 string representation with timezone."""
-        date_str = f"{self._year:04d}-{pad_zero(self._month)}-{pad_zero(self._day)}"
-        time_str = f"{pad_zero(self._hour)}:{pad_zero(self._minute)}:{pad_zero(self._second)}"
-        if self._microsecond:
-            time_str += format_microseconds(self._microsecond)
+        year, month, day, hour, minute, second, _, offset = self._wall_fields()
+        date_str = f"{year:04d}-{pad_zero(month)}-{pad_zero(day)}"
+        time_str = f"{pad_zero(hour)}:{pad_zero(minute)}:{pad_zero(second)}"
+        time_str += format_nanoseconds((self._epoch_nanoseconds + offset) % NS_PER_SECOND)
 
         return f"{date_str}T{time_str}{self.offset_string}"
 
     def __repr__(self) -> str:
         """Return detailed string representation."""
+        year, month, day, hour, minute, second, microsecond, _ = self._wall_fields()
         return (
-            f"ZonedDateTime({self._year}, {self._month}, {self._day}, "
-            f"{self._hour}, {self._minute}, {self._second}, {self._microsecond}, "
+            f"ZonedDateTime({year}, {month}, {day}, {hour}, {minute}, {second}, {microsecond}, "
             f"TimeZone('{self._timezone.id}'))"
         )
 
@@ -248,59 +402,97 @@ class ZonedDateTime:
         if not isinstance(other, ZonedDateTime):
             return False
 
-        # Compare instants for equality
-        return self.to_instant() == other.to_instant()
+        # Equal when they denote the same instant, whatever the zone
+        return self._epoch_nanoseconds == other._epoch_nanoseconds
 
     def __lt__(self, other) -> bool:
         """Check if this zoned datetime is less than another."""
         if not isinstance(other, ZonedDateTime):
             raise InvalidArgumentError("Expected ZonedDateTime object")
-
-        return self.to_instant() < other.to_instant()
+        return self._epoch_nanoseconds < other._epoch_nanoseconds
 
     def __le__(self, other) -> bool:
         """Check if this zoned datetime is less than or equal to another."""
-        return self == other or self < other
+        if not isinstance(other, ZonedDateTime):
+            raise InvalidArgumentError("Expected ZonedDateTime object")
+        return self._epoch_nanoseconds <= other._epoch_nanoseconds
 
     def __gt__(self, other) -> bool:
         """Check if this zoned datetime is greater than another."""
-        return not self <= other
+        if not isinstance(other, ZonedDateTime):
+            raise InvalidArgumentError("Expected ZonedDateTime object")
+        return self._epoch_nanoseconds > other._epoch_nanoseconds
 
     def __ge__(self, other) -> bool:
         """Check if this zoned datetime is greater than or equal to another."""
-        return not self < other
+        if not isinstance(other, ZonedDateTime):
+            raise InvalidArgumentError("Expected ZonedDateTime object")
+        return self._epoch_nanoseconds >= other._epoch_nanoseconds
 
     def __hash__(self) -> int:
         """Hash function for ZonedDateTime."""
-        return hash(self.to_instant().epoch_seconds)
+        return hash(self._epoch_nanoseconds)
 
     @classmethod
+    @cached_parse
     def from_string(
         cls, datetime_string: str, timezone: Optional[TimeZone] = None, calendar: Optional[Calendar] = None
     ) -> "ZonedDateTime":
         """Create ZonedDateTime from ISO 8601 string with timezone."""
-        try:
-            # Parse the datetime string
-            dt = datetime.fromisoformat(datetime_string)
-
-            # If no timezone in string and none provided, raise error
-            if dt.tzinfo is None and timezone is None:
-                raise InvalidArgumentError("Timezone is required")
-
-            # Use provided timezone if datetime has no timezone info
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.zone_info)  # type: ignore[union-attr]
-            elif timezone is not None:
-                # Convert to the specified timezone
-                dt = dt.astimezone(timezone.zone_info)
-                timezone = TimeZone(str(dt.tzinfo))
-            else:
-                # Create TimeZone from the datetime's timezone
-                timezone = TimeZone(str(dt.tzinfo))
-
-            return cls(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, dt.microsecond, timezone, calendar)
-        except Exception as e:
-            raise InvalidArgumentError(f"Invalid ISO zoned datetime format: {datetime_string}") from e
+        epoch_nanoseconds, timezone = _parse_zoned(datetime_string, timezone)
+        return cls._from_epoch_nanoseconds(epoch_nanoseconds, timezone, calendar)
+
+    @classmethod
+    def try_from_string(
+        cls, datetime_string: str, timezone: Optional[TimeZone] = None, calendar: Optional[Calendar] = None
+    ) -> Optional["ZonedDateTime"]:
+        """Create ZonedDateTime from ISO 8601 string, or return None where ``from_string`` would raise for the string."""
+        if timezone is not None and not isinstance(timezone, TimeZone):
+            raise InvalidArgumentError("Expected TimeZone object")
+        parsed = _try_parse_zoned(datetime_string, timezone)
+        if parsed is None:
+            return None
+        return cls._from_epoch_nanoseconds(parsed[0], parsed[1], calendar)
+
+    @staticmethod
+    def is_valid_string(datetime_string: str, timezone: Optional[TimeZone] = None) -> bool:
+        """Check whether ``from_string`` accepts a string, without creating a ZonedDateTime."""
+        if timezone is not None and not isinstance(timezone, TimeZone):
+            raise InvalidArgumentError("Expected TimeZone object")
+        return _try_parse_zoned(datetime_string, timezone) is not None
+
+    @classmethod
+    def parse_many(
+        cls,
+        strings: Iterable[str],
+        timezone: Optional[TimeZone] = None,
+        calendar: Optional[Calendar] = None,
+        *,
+        output: str = "objects",
+        errors: Optional[Dict[int, TemporalError]] = None,
+    ) -> Union[List[Optional["ZonedDateTime"]], Any]:
+        """Parse many ISO 8601 zoned datetime strings in one call.
+
+        Args:
+            strings: The strings to parse
+            timezone: Zone for strings without an offset, and the zone every row is converted to
+            calendar: Calendar for the created ZonedDateTimes (defaults to ISO)
+            output: ``"objects"`` for a list of ZonedDateTimes, ``"array"`` for an ``array('q')`` of
+                epoch nanoseconds, or ``"numpy"`` for a NumPy int64 array of epoch nanoseconds
+            errors: If given, failed rows are recorded here as ``{index: error}`` and filled
+                with None (or ``MISSING_INT64`` in column outputs) instead of raising
+
+        Returns:
+            A list or column aligned with ``strings``
+        """
+        if output != "objects":
+            return parse_many(strings, lambda text: _parse_zoned(text, timezone)[0], output, errors)
+
+        def parse(text: str) -> "ZonedDateTime":
+            epoch_nanoseconds, zone = _parse_zoned(text, timezone)
+            return cls._from_epoch_nanoseconds(epoch_nanoseconds, zone, calendar)
+
+        return parse_many(strings, parse, output, errors)
 
     @classmethod
     def now(cls, timezone: TimeZone, calendar: Optional[Calendar] = None) -> "ZonedDateTime":
@@ -308,8 +500,8 @@ class ZonedDateTime:
         if not isinstance(timezone, TimeZone):
             raise InvalidArgumentError("Expected TimeZone object")
 
-        now = datetime.now(timezone.zone_info)
-        return cls(now.year, now.month, now.day, now.hour, now.minute, now.second, now.microsecond, timezone, calendar)
+        now = time.time_ns()
+        return cls._from_epoch_nanoseconds(now - now % NS_PER_MICROSECOND, timezone, calendar)
 
     def until(self, other: "ZonedDateTime") -> "Duration":
         """Calculate duration from this zoned datetime to another.
@@ -348,10 +540,78 @@ class ZonedDateTime:
         Returns:
             A new rounded ZonedDateTime
         """
-        # Convert to instant, round, then convert back
-        instant = self.to_instant()
-        rounded_instant = instant.round(options)
-        return rounded_instant.to_zoned_date_time(self._timezone)
+        rounded_instant = self.to_instant().round(options)
+        return ZonedDateTime._from_epoch_nanoseconds(rounded_instant.epoch_nanoseconds, self._timezone, self._calendar)
+
+    def _bucket_bounds(self, options: Union[str, dict]) -> Tuple[int, int]:
+        """Get the start and end, in epoch nanoseconds, of the bucket containing this datetime.
+
+        Calendar buckets run from the start of one local day to the start of
+        another, so a day bucket is 23 or 25 hours long across a DST change.
+        Fixed buckets follow the wall clock at the current offset, and are cut
+        short at offset transitions so that repeated and skipped hours never
+        overlap or leave holes.
+        """
+        unit, increment = bucket_unit(options)
+        table = self._timezone.transition_table
+        offset = self._wall_fields()[7]
+        start, end = bucket_bounds(self._epoch_nanoseconds + offset, unit, increment)
+        if unit != "nanoseconds":
+            return _start_of_local_day(start, table), _start_of_local_day(end, table)
+
+        start -= offset
+        end -= offset
+        previous, following = table.transition_bounds(self._epoch_nanoseconds)
+        if previous is not None and start < previous:
+            start = previous
+        if following is not None and end > following:
+            end = following
+        return start, end
+
+    def floor(self, options: Union[str, dict]) -> "ZonedDateTime":
+        """Round the zoned datetime down to the start of its bucket.
+
+        Fixed units are counted from local midnight; calendar units are days,
+        ISO weeks (from Monday), months, quarters and years, starting at the
+        first instant of their first local day.
+
+        Args:
+            options: Either a string unit name or dict with 'smallestUnit' and optional 'roundingIncrement'
+
+        Returns:
+            The latest bucket boundary at or before this datetime
+        """
+        start = self._bucket_bounds(options)[0]
+        return ZonedDateTime._from_epoch_nanoseconds(start, self._timezone, self._calendar)
+
+    def ceil(self, options: Union[str, dict]) -> "ZonedDateTime":
+        """Round the zoned datetime up to the next bucket boundary, or return it unchanged if it is on one.
+
+        Args:
+            options: Either a string unit name or dict with 'smallestUnit' and optional 'roundingIncrement'
+
+        Returns:
+            The earliest bucket boundary at or after this datetime
+        """
+        start, end = self._bucket_bounds(options)
+        if start == self._epoch_nanoseconds:
+            return self
+        return ZonedDateTime._from_epoch_nanoseconds(end, self._timezone, self._calendar)
+
+    def bucket(self, options: Union[str, dict]) -> Tuple["ZonedDateTime", "ZonedDateTime"]:
+        """Get the bucket containing the zoned datetime.
+
+        Args:
+            options: Either a string unit name or dict with 'smallestUnit' and optional 'roundingIncrement'
+
+        Returns:
+            The half-open ``(start, end)`` interval of the bucket
+        """
+        start, end = self._bucket_bounds(options)
+        return (
+            ZonedDateTime._from_epoch_nanoseconds(start, self._timezone, self._calendar),
+            ZonedDateTime._from_epoch_nanoseconds(end, self._timezone, self._calendar),
+        )
 
     def with_plain_time(self, time: "PlainTime") -> "ZonedDateTime":
         """Replace the time part with a new time.
@@ -367,17 +627,8 @@ class ZonedDateTime:
         if not isinstance(time, PlainTime):
             raise InvalidArgumentError("Expected PlainTime")
 
-        return ZonedDateTime(
-            self._year,
-            self._month,
-            self._day,
-            time.hour,
-            time.minute,
-            time.second,
-            time.microsecond,
-            self._timezone,
-            self._calendar,
-        )
+        year, month, day = self._wall_fields()[:3]
+        return ZonedDateTime._from_wall_fields(year, month, day, *time._fields(), self._timezone, self._calendar)
 
     def with_calendar(self, calendar: Calendar) -> "ZonedDateTime":
         """Replace the calendar with a new calendar.
@@ -391,17 +642,7 @@ class ZonedDateTime:
         if not isinstance(calendar, Calendar):
             raise InvalidArgumentError("Expected Calendar")
 
-        return ZonedDateTime(
-            self._year,
-            self._month,
-            self._day,
-            self._hour,
-            self._minute,
-            self._second,
-            self._microsecond,
-            self._timezone,
-            calendar,
-        )
+        return ZonedDateTime._from_epoch_nanoseconds(self._epoch_nanoseconds, self._timezone, calendar)
 
     def start_of_day(self) -> "ZonedDateTime":
         """Get the start of the day (00:00:00) for this date in this timezone.
@@ -409,7 +650,8 @@ class ZonedDateTime:
         Returns:
             A new ZonedDateTime representing the start of the day
         """
-        return ZonedDateTime(self._year, self._month, self._day, 0, 0, 0, 0, self._timezone, self._calendar)
+        year, month, day = self._wall_fields()[:3]
+        return ZonedDateTime._from_wall_fields(year, month, day, 0, 0, 0, 0, self._timezone, self._calendar)
 
     def equals(self, other: "ZonedDateTime") -> bool:
         """Check if this zoned datetime equals another.
@@ -491,3 +733,11 @@ class ZonedDateTime:
             return cls(year, month, day, hour, minute, second, microsecond, timezone, calendar)
         else:
             raise InvalidArgumentError(f"Cannot create ZonedDateTime from {type(value)}")
+
+
+# Slot setters for the constructors; calling the slot descriptors directly is
+# cheaper than going through object.__setattr__ for every field
+_set_epoch_nanoseconds = ZonedDateTime.__dict__["_epoch_nanoseconds"].__set__
+_set_timezone = ZonedDateTime.__dict__["_timezone"].__set__
+_set_calendar = ZonedDateTime.__dict__["_calendar"].__set__
+_set_fields = ZonedDateTime.__dict__["_fields"].__set__
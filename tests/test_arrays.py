@@ -0,0 +1,229 @@
+"""
+Tests for InstantArray and PlainDateArray.
+"""
+
+import pickle
+
+import pytest
+
+from temporal import Duration, Instant, PlainDate, TimeZone, ZonedDateTime
+from temporal.exceptions import InvalidArgumentError, RangeError
+from temporal.utils import MISSING_INT64
+
+numpy = pytest.importorskip("numpy")
+
+from temporal.arrays import MISSING_INT32, InstantArray, PlainDateArray, _TemporalArray  # noqa: E402
+
+STRINGS = ["2024-03-10T06:59:59.5Z", "1970-01-01T00:00:00Z", "2023-06-15T14:30:45.123456Z", "1969-12-31T23:59:59.999Z"]
+
+
+class TestInstantArray:
+    def test_construction(self):
+        """Test building arrays from integers, datetime64, instants and strings."""
+        instants = [Instant.from_string(text) for text in STRINGS]
+        array = InstantArray.from_strings(STRINGS)
+        assert len(array) == 4
+        assert array.to_instants() == instants
+        assert InstantArray.from_instants(instants).equals(array)
+        assert InstantArray([instant.epoch_nanoseconds for instant in instants]).equals(array)
+        assert InstantArray(array.epoch_nanoseconds.view("datetime64[ns]").astype("datetime64[us]")).equals(array)
+        assert InstantArray([]).to_instants() == []
+        assert pickle.loads(pickle.dumps(array)).equals(array)
+        with pytest.raises(InvalidArgumentError):
+            InstantArray([1.5])
+        with pytest.raises(InvalidArgumentError):
+            InstantArray([[1, 2]])
+        with pytest.raises(InvalidArgumentError):
+            InstantArray.from_instants(["2024-01-01T00:00:00Z"])
+
+    def test_immutable(self):
+        """Test that the array and its values cannot be modified."""
+        source = numpy.array([1, 2, 3])
+        array = InstantArray(source)
+        source[0] = 99
+        assert array[0] == Instant.from_epoch_nanoseconds(1)
+        with pytest.raises(ValueError):
+            array.epoch_nanoseconds[0] = 5
+        with pytest.raises(AttributeError):
+            array._values = None
+
+    def test_to_strings(self):
+        """Test bulk formatting against str(Instant)."""
+        array = InstantArray.from_strings(STRINGS)
+        assert array.to_strings() == [str(instant) for instant in array]
+        assert array.to_strings()[0] == "2024-03-10T06:59:59.5Z"
+        assert repr(array[:1]) == "InstantArray(['2024-03-10T06:59:59.5Z'])"
+
+    def test_arithmetic(self):
+        """Test adding and subtracting durations against the scalar API."""
+        array = InstantArray.from_strings(STRINGS)
+        duration = Duration(days=1, hours=2, microseconds=5)
+        assert array.add(duration).to_instants() == [instant.add(duration) for instant in array]
+        assert array.subtract(duration).to_instants() == [instant.subtract(duration) for instant in array]
+        with pytest.raises(InvalidArgumentError):
+            array.add(Duration(months=1))
+        with pytest.raises(RangeError):
+            InstantArray([2**63 - 10]).add(Duration(microseconds=1))
+        # The widest valid shift spans more than int64 in one step
+        edge = InstantArray([9_223_372_036_854_775_000])
+        shifted = edge.subtract(Duration(microseconds=18_446_744_073_709_550))
+        assert shifted.epoch_nanoseconds[0] == -9_223_372_036_854_775_000
+
+    def test_round(self):
+        """Test rounding against Instant.round, including ties and negative values."""
+        values = [-1_500_000_000, -500_000_000, 500_000_000, 1_500_000_000, 2_499_999_999, 123_456_789]
+        array = InstantArray(values)
+        for options in ["seconds", "milliseconds", {"smallestUnit": "seconds", "roundingIncrement": 15}]:
+            assert array.round(options).to_instants() == [instant.round(options) for instant in array]
+        # Only seconds and smaller, as for Instant.round; the dict form defaults to nanoseconds
+        for unit in ["days", "minutes"]:
+            with pytest.raises(InvalidArgumentError):
+                array.round(unit)
+            with pytest.raises(InvalidArgumentError):
+                Instant(0).round(unit)
+        assert array.round({}) is array
+        with pytest.raises(RangeError):
+            array.round({"smallestUnit": "seconds", "roundingIncrement": 0})
+
+    def test_floor_ceil_bucket(self):
+        """Test bucketing against the scalar methods, in UTC and across DST in a zone."""
+        hour = 3_600_000_000_000
+        fall_back = Instant.from_string("2024-11-03T05:00:00Z").epoch_nanoseconds
+        values = [fall_back + step * hour // 2 for step in range(-4, 8)] + [-1, 0, MISSING_INT64]
+        array = InstantArray(values)
+        tz = TimeZone("America/New_York")
+        options = ["hours", "days", "weeks", "quarters", {"smallestUnit": "minutes", "roundingIncrement": 15}]
+        for unit in options:
+            starts, ends = array.bucket(unit)
+            assert starts.to_instants()[:-1] == [instant.floor(unit) for instant in array[:-1]]
+            assert ends.to_instants()[:-1] == [instant.bucket(unit)[1] for instant in array[:-1]]
+            assert array.ceil(unit).to_instants()[:-1] == [instant.ceil(unit) for instant in array[:-1]]
+            zoned = [ZonedDateTime.from_epoch_nanoseconds(value, tz) for value in values[:-1]]
+            starts, ends = array.bucket(unit, tz)
+            assert starts.epoch_nanoseconds[:-1].tolist() == [value.floor(unit).epoch_nanoseconds for value in zoned]
+            assert ends.epoch_nanoseconds[:-1].tolist() == [value.bucket(unit)[1].epoch_nanoseconds for value in zoned]
+            assert array.ceil(unit, tz).epoch_nanoseconds[:-1].tolist() == [
+                value.ceil(unit).epoch_nanoseconds for value in zoned
+            ]
+            assert starts[-1] is None and ends[-1] is None
+        # The zoned day containing the fall-back transition is 25 hours long
+        starts, ends = array.bucket("days", tz)
+        assert int(ends.epoch_nanoseconds[4] - starts.epoch_nanoseconds[4]) == 25 * hour
+        with pytest.raises(RangeError):
+            InstantArray([2**63 - 1]).ceil("years")
+        with pytest.raises(InvalidArgumentError):
+            array.floor("days", "America/New_York")
+
+    def test_comparisons(self):
+        """Test elementwise comparisons with an Instant and another array."""
+        array = InstantArray.from_strings(STRINGS)
+        pivot = Instant.from_string("2000-01-01T00:00:00Z")
+        assert (array > pivot).tolist() == [True, False, True, False]
+        assert (array <= pivot).tolist() == [False, True, False, True]
+        assert (array == array).all()
+        assert (array.add(Duration(seconds=1)) > array).all()
+        with pytest.raises(InvalidArgumentError):
+            array < array[:2]
+        with pytest.raises(TypeError):
+            hash(array)
+
+    def test_ordering(self):
+        """Test min, max, argsort and sort."""
+        array = InstantArray.from_strings(STRINGS)
+        assert array.min() == Instant.from_string("1969-12-31T23:59:59.999Z")
+        assert array.max() == Instant.from_string("2024-03-10T06:59:59.5Z")
+        assert array.argsort().tolist() == [3, 1, 2, 0]
+        assert array.sort().to_instants() == sorted(array.to_instants())
+        assert array[array.argsort()].equals(array.sort())
+        with pytest.raises(InvalidArgumentError):
+            InstantArray([]).min()
+
+    def test_missing(self):
+        """Test that missing rows survive operations and are ignored by min and max."""
+        errors = {}
+        array = InstantArray.from_strings(["2024-01-01T00:00:00Z", "not a date", "1999-01-01T00:00:00Z"], errors)
+        assert list(errors) == [1]
+        assert array.has_missing()
+        assert array.epoch_nanoseconds[1] == MISSING_INT64
+        assert array[1] is None
+        assert array.to_strings()[1] is None
+        assert array.add(Duration(hours=1))[1] is None
+        assert array.round("seconds")[1] is None
+        assert (array == array).tolist() == [True, False, True]
+        assert array.min() == array[2]
+        assert array.argsort().tolist() == [2, 0, 1]
+
+
+class TestPlainDateArray:
+    def test_construction(self):
+        """Test building arrays from integers, datetime64, dates and strings."""
+        dates = [PlainDate(2024, 2, 29), PlainDate(1, 1, 1), PlainDate(9999, 12, 31), PlainDate(1969, 12, 31)]
+        array = PlainDateArray.from_dates(dates)
+        assert array.epoch_days.dtype == numpy.int32
+        assert array.to_dates() == dates
+        assert PlainDateArray.from_strings([str(date) for date in dates]).equals(array)
+        assert PlainDateArray([date._epoch_days for date in dates]).equals(array)
+        assert PlainDateArray(numpy.array(["2024-02-29", "1969-12-31"], dtype="datetime64[D]")).to_dates() == [
+            dates[0],
+            dates[3],
+        ]
+        assert pickle.loads(pickle.dumps(array)).equals(array)
+        assert array.to_strings() == ["2024-02-29", "0001-01-01", "9999-12-31", "1969-12-31"]
+        with pytest.raises(RangeError):
+            PlainDateArray([dates[2]._epoch_days + 1])
+        with pytest.raises(InvalidArgumentError):
+            PlainDateArray.from_dates([Instant(0)])
+
+    def test_fields(self):
+        """Test vectorized fields against PlainDate across leap years and ISO week edges."""
+        array = PlainDate.range(PlainDate(1999, 12, 20), PlainDate(2005, 1, 10))
+        dates = list(array) + [PlainDate(1, 1, 1), PlainDate(9999, 12, 31), PlainDate(2100, 2, 28), PlainDate(2000, 2, 29)]
+        array = PlainDateArray.from_dates(dates)
+        for field in ["year", "month", "day", "day_of_week", "day_of_year", "week_of_year"]:
+            values = getattr(array, field)
+            assert values.dtype == numpy.int32
+            assert values.tolist() == [getattr(date, field) for date in dates], field
+
+    def test_add(self):
+        """Test month clamping and day offsets against PlainDate.add."""
+        dates = list(PlainDate.range(PlainDate(2023, 12, 25), PlainDate(2024, 3, 5)))
+        array = PlainDateArray.from_dates(dates)
+        for duration in [Duration(months=1), Duration(years=1), Duration(months=-13, days=3), Duration(weeks=2)]:
+            assert array.add(duration).to_dates() == [date.add(duration) for date in dates]
+            assert array.subtract(duration).to_dates() == [date.subtract(duration) for date in dates]
+        assert PlainDateArray.from_dates([PlainDate(2024, 1, 31)]).add(Duration(months=1))[0] == PlainDate(2024, 2, 29)
+        with pytest.raises(RangeError):
+            PlainDateArray.from_dates([PlainDate(9999, 12, 1)]).add(Duration(months=1))
+        with pytest.raises(RangeError):
+            PlainDateArray.from_dates([PlainDate(1, 1, 1)]).subtract(Duration(days=1))
+        with pytest.raises(InvalidArgumentError):
+            array.add(3)
+
+    def test_comparisons_and_ordering(self):
+        """Test elementwise comparisons, min, max and sorting."""
+        array = PlainDateArray.from_strings(["2024-03-01", "2023-01-01", "2024-01-01"])
+        assert (array >= PlainDate(2024, 1, 1)).tolist() == [True, False, True]
+        assert (array == array.sort()).tolist() == [False, False, False]
+        assert array.min() == PlainDate(2023, 1, 1)
+        assert array.max() == PlainDate(2024, 3, 1)
+        assert array.argsort().tolist() == [1, 2, 0]
+        with pytest.raises(InvalidArgumentError):
+            array.equals(InstantArray([0, 1, 2]))
+
+    def test_missing(self):
+        """Test that missing rows have zero fields and survive arithmetic."""
+        errors = {}
+        array = PlainDateArray.from_strings(["2024-01-31", "2024-13-01", "2023-06-15"], errors)
+        assert list(errors) == [1]
+        assert array.epoch_days[1] == MISSING_INT32
+        assert array.month.tolist() == [1, 0, 6]
+        assert array.week_of_year.tolist() == [5, 0, 24]
+        assert array.add(Duration(months=1)).to_dates() == [PlainDate(2024, 2, 29), None, PlainDate(2023, 7, 15)]
+        assert (array != PlainDate(2024, 1, 31)).tolist() == [False, True, True]
+        assert array.sort().to_strings() == ["2023-06-15", "2024-01-31", None]
+        assert PlainDateArray([MISSING_INT64, 0])[0] is None
+
+    def test_base_class_is_abstract(self):
+        """Test that the shared array base class cannot be instantiated."""
+        with pytest.raises(TypeError):
+            _TemporalArray._from_values(numpy.zeros(3, dtype=numpy.int64))
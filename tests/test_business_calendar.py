@@ -0,0 +1,113 @@
+"""
+Tests for BusinessCalendar class.
+"""
+
+import pickle
+
+import pytest
+
+from temporal import BusinessCalendar, PlainDate
+from temporal.exceptions import InvalidArgumentError, RangeError
+
+HOLIDAYS = [PlainDate(2024, 12, 25), PlainDate(2024, 12, 26), PlainDate(2025, 1, 1), PlainDate(2024, 12, 28)]
+
+
+def step_business_days(calendar: BusinessCalendar, date: PlainDate, days: int) -> PlainDate:
+    """Reference implementation that steps one day at a time."""
+    step = 1 if days > 0 else -1
+    while days:
+        date = PlainDate._from_epoch_days(date._epoch_days + step, date._calendar)
+        if calendar.is_business_day(date):
+            days -= step
+    return date
+
+
+class TestBusinessCalendar:
+    def test_is_business_day(self):
+        """Test weekends and holidays."""
+        calendar = BusinessCalendar(holidays=HOLIDAYS)
+        assert calendar.is_business_day(PlainDate(2024, 12, 24))
+        assert not calendar.is_business_day(PlainDate(2024, 12, 25))
+        assert not calendar.is_business_day(PlainDate(2024, 12, 21))
+        assert not calendar.is_business_day(PlainDate(2024, 12, 22))
+
+    def test_add_business_days(self):
+        """Test moving forward and backward over a holiday week."""
+        calendar = BusinessCalendar(holidays=HOLIDAYS)
+        tuesday = PlainDate(2024, 12, 24)
+        assert calendar.add_business_days(tuesday, 1) == PlainDate(2024, 12, 27)
+        assert calendar.add_business_days(tuesday, 2) == PlainDate(2024, 12, 30)
+        assert calendar.add_business_days(tuesday, 4) == PlainDate(2025, 1, 2)
+        assert calendar.add_business_days(PlainDate(2025, 1, 2), -4) == tuesday
+        assert calendar.add_business_days(tuesday, 0) == tuesday
+        # Zero rolls a holiday or weekend forward
+        assert calendar.add_business_days(PlainDate(2024, 12, 25), 0) == PlainDate(2024, 12, 27)
+        # Counting starts from the next business day when starting on a weekend
+        assert calendar.add_business_days(PlainDate(2024, 12, 21), 1) == PlainDate(2024, 12, 23)
+        assert calendar.add_business_days(PlainDate(2024, 12, 21), -1) == PlainDate(2024, 12, 20)
+
+    def test_matches_stepping(self):
+        """Test O(1) arithmetic against day-by-day stepping for several weekend masks."""
+        for weekend in [(6, 7), (5, 6), (7,), (), (1, 3, 5, 6, 7)]:
+            calendar = BusinessCalendar(weekend, HOLIDAYS)
+            for start in PlainDate.range(PlainDate(2024, 12, 15), PlainDate(2025, 1, 10)):
+                for days in range(-12, 13):
+                    if days == 0:
+                        continue
+                    expected = step_business_days(calendar, start, days)
+                    assert calendar.add_business_days(start, days) == expected
+                    # The half-open span [start, expected) includes start only when it is a business day
+                    count = days - 1 + calendar.is_business_day(start) if days > 0 else days
+                    assert calendar.business_days_between(start, expected) == count
+
+    def test_long_holiday_run(self):
+        """Test arithmetic across a long run of consecutive holidays."""
+        calendar = BusinessCalendar(holidays=PlainDate.range(PlainDate(2024, 1, 1), PlainDate(2026, 1, 3)))
+        assert calendar.add_business_days(PlainDate(2023, 12, 29), 1) == PlainDate(2026, 1, 5)
+        assert calendar.add_business_days(PlainDate(2026, 1, 5), -1) == PlainDate(2023, 12, 29)
+        for days in (-3, 2, 7):
+            start = PlainDate(2025, 6, 1)
+            assert calendar.add_business_days(start, days) == step_business_days(calendar, start, days)
+
+    def test_business_days_between(self):
+        """Test half-open counting and negative spans."""
+        calendar = BusinessCalendar(holidays=HOLIDAYS)
+        start, end = PlainDate(2024, 12, 23), PlainDate(2025, 1, 6)
+        expected = sum(calendar.is_business_day(date) for date in PlainDate.range(start, end))
+        assert expected == 7
+        assert calendar.business_days_between(start, end) == 7
+        assert calendar.business_days_between(end, start) == -7
+        assert calendar.business_days_between(start, start) == 0
+        assert calendar.business_days_between(PlainDate(2000, 1, 1), PlainDate(2100, 1, 1)) == 26_086
+
+    def test_next_and_previous(self):
+        """Test next and previous business day helpers."""
+        calendar = BusinessCalendar(holidays=HOLIDAYS)
+        assert calendar.next_business_day(PlainDate(2024, 12, 24)) == PlainDate(2024, 12, 27)
+        assert calendar.previous_business_day(PlainDate(2024, 12, 27)) == PlainDate(2024, 12, 24)
+        assert calendar.next_business_day(PlainDate(2024, 12, 31)) == PlainDate(2025, 1, 2)
+
+    def test_year_limits(self):
+        """Test results at and beyond the supported year range."""
+        calendar = BusinessCalendar()
+        assert calendar.add_business_days(PlainDate(9999, 12, 30), 1) == PlainDate(9999, 12, 31)
+        with pytest.raises(RangeError):
+            calendar.add_business_days(PlainDate(9999, 12, 31), 1)
+        assert calendar.business_days_between(PlainDate(1, 1, 1), PlainDate(9999, 12, 31)) == 2_608_614
+
+    def test_construction(self):
+        """Test argument validation and value semantics."""
+        calendar = BusinessCalendar(weekend=[7, 6], holidays=["2024-12-25", PlainDate(2024, 12, 28)])
+        assert calendar.weekend == (6, 7)
+        # Holidays on weekend days are dropped
+        assert calendar.holidays == (PlainDate(2024, 12, 25),)
+        assert calendar == BusinessCalendar(holidays=[PlainDate(2024, 12, 25)])
+        assert pickle.loads(pickle.dumps(calendar)) == calendar
+        with pytest.raises(InvalidArgumentError):
+            BusinessCalendar(weekend=(0,))
+        with pytest.raises(InvalidArgumentError):
+            BusinessCalendar(weekend=range(1, 8))
+        with pytest.raises(InvalidArgumentError):
+            BusinessCalendar(holidays=[20241225])
+        with pytest.raises(InvalidArgumentError):
+            calendar.add_business_days(PlainDate(2024, 1, 1), 1.5)
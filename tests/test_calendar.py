@@ -0,0 +1,49 @@
+"""
+Tests for Calendar class.
+"""
+
+import pickle
+import unittest
+
+from temporal import Calendar, PlainDate, PlainDateTime, PlainMonthDay, PlainYearMonth
+from temporal.exceptions import InvalidArgumentError
+
+
+class TestCalendar(unittest.TestCase):
+    def test_singleton(self):
+        """Test that the ISO calendar is a shared instance."""
+        self.assertIs(Calendar(), Calendar("iso8601"))
+        self.assertIs(Calendar.from_string("iso8601"), Calendar())
+        self.assertIs(pickle.loads(pickle.dumps(Calendar())), Calendar())
+
+    def test_unsupported(self):
+        """Test that unsupported calendars are rejected."""
+        with self.assertRaises(InvalidArgumentError):
+            Calendar("gregory")
+
+    def test_non_string_identifier(self):
+        """Test that non-string identifiers, including unhashable ones, are rejected."""
+        for identifier in (["iso8601"], {"iso8601": 1}, 8601, None):
+            with self.assertRaises(InvalidArgumentError):
+                Calendar(identifier)
+
+    def test_immutable(self):
+        """Test that the shared calendar cannot be mutated."""
+        with self.assertRaises(AttributeError):
+            Calendar()._identifier = "gregory"
+
+    def test_value_types_share_calendar(self):
+        """Test that value types reference the singleton instead of allocating."""
+        self.assertIs(PlainDate(2023, 6, 15).calendar, Calendar())
+        self.assertIs(PlainDateTime(2023, 6, 15).calendar, Calendar())
+        self.assertIs(PlainYearMonth(2023, 6).calendar, Calendar())
+        self.assertIs(PlainMonthDay(6, 15).calendar, Calendar())
+
+    def test_year_month_and_month_day_hashable(self):
+        """Test hashing of calendar-carrying partial dates."""
+        self.assertEqual(len({PlainYearMonth(2023, 6), PlainYearMonth(2023, 6), PlainYearMonth(2023, 7)}), 2)
+        self.assertEqual(len({PlainMonthDay(6, 15), PlainMonthDay(6, 15)}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
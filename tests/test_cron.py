@@ -0,0 +1,112 @@
+"""
+Tests for CronExpression class.
+"""
+
+import pickle
+from array import array
+
+import pytest
+
+from temporal import CronExpression, PlainDateTime, TimeZone, ZonedDateTime
+from temporal.exceptions import InvalidArgumentError
+from temporal.utils import MISSING_INT64
+
+
+class TestCronExpression:
+    def test_parse(self):
+        """Test field syntax, names and validation."""
+        cron = CronExpression("  */15   9-17 * JAN,jul MON-FRI ")
+        assert str(cron) == "*/15 9-17 * JAN,jul MON-FRI"
+        assert cron == CronExpression("*/15 9-17 * JAN,jul MON-FRI")
+        assert pickle.loads(pickle.dumps(cron)) == cron
+        for bad in ["* * * *", "60 * * * *", "* 24 * * *", "* * 0 * *", "* * * 13 *", "* * * * 8", "5-1 * * * *", "x * * * *"]:
+            with pytest.raises(InvalidArgumentError):
+                CronExpression(bad)
+
+    def test_next_after(self):
+        """Test carrying from seconds up to years."""
+        start = PlainDateTime(2024, 12, 31, 23, 59, 30)
+        assert CronExpression("* * * * *").next_after(start) == PlainDateTime(2025, 1, 1)
+        assert CronExpression("*/20 * * * * *").next_after(start) == PlainDateTime(2024, 12, 31, 23, 59, 40)
+        assert CronExpression("30 9 * * MON-FRI").next_after(start) == PlainDateTime(2025, 1, 1, 9, 30)
+        assert CronExpression("0 0 29 2 *").next_after(start) == PlainDateTime(2028, 2, 29)
+        # Strictly after: an exact fire time moves on to the next one
+        assert CronExpression("0 12 * * *").next_after(PlainDateTime(2024, 1, 1, 12)) == PlainDateTime(2024, 1, 2, 12)
+        assert CronExpression("0 0 30 2 *").next_after(start) is None
+
+    def test_previous_before(self):
+        """Test borrowing from larger units."""
+        start = PlainDateTime(2025, 1, 1, 0, 0, 0, 500)
+        assert CronExpression("* * * * *").previous_before(start) == PlainDateTime(2025, 1, 1)
+        assert CronExpression("30 9 * * MON-FRI").previous_before(start) == PlainDateTime(2024, 12, 31, 9, 30)
+        assert CronExpression("0 0 29 2 *").previous_before(start) == PlainDateTime(2024, 2, 29)
+        assert CronExpression("0 0 L * *").previous_before(PlainDateTime(2024, 3, 1)) == PlainDateTime(2024, 2, 29)
+
+    def test_day_extensions(self):
+        """Test L, W and # in the day fields."""
+        start = PlainDateTime(2024, 1, 1)
+        assert CronExpression("0 0 L * *").next_after(start) == PlainDateTime(2024, 1, 31)
+        # 2024-06-01 is a Saturday: the nearest weekday in the month is Monday the 3rd
+        assert CronExpression("0 0 1W 6 *").next_after(start) == PlainDateTime(2024, 6, 3)
+        # 2024-06-30 is a Sunday: the last weekday is Friday the 28th
+        assert CronExpression("0 0 LW 6 *").next_after(start) == PlainDateTime(2024, 6, 28)
+        assert CronExpression("0 0 * * 5L").next_after(start) == PlainDateTime(2024, 1, 26)
+        assert CronExpression("0 0 * * FRI#2").next_after(start) == PlainDateTime(2024, 1, 12)
+        assert CronExpression("0 0 * * 3#5").next_after(start) == PlainDateTime(2024, 1, 31)
+
+    def test_day_fields_combine(self):
+        """Test Vixie cron's OR of two restricted day fields and AND when one starts with '*'."""
+        start = PlainDateTime(2024, 1, 1)
+        # Friday the 13th or any Friday
+        assert CronExpression("0 0 13 * FRI").next_after(start) == PlainDateTime(2024, 1, 5)
+        assert CronExpression("0 0 */13 * FRI").next_after(start) == PlainDateTime(2024, 3, 1)
+
+    def test_zoned_dst(self):
+        """Test fire times around daylight saving transitions."""
+        tz = TimeZone("America/New_York")
+        daily = CronExpression("30 2 * * *")
+        # The skipped 02:30 fires at 03:30 after the gap
+        fired = daily.next_after(ZonedDateTime(2024, 3, 9, 12, timezone=tz))
+        assert str(fired) == "2024-03-10T03:30:00-04:00"
+        assert str(daily.next_after(fired)) == "2024-03-11T02:30:00-04:00"
+        assert daily.previous_before(ZonedDateTime(2024, 3, 11, timezone=tz)) == fired
+        # A fixed-time job fires once in the repeated 01:00-02:00 hour
+        nightly = CronExpression("30 1 * * *")
+        fired = nightly.next_after(ZonedDateTime(2024, 11, 3, timezone=tz))
+        assert str(fired) == "2024-11-03T01:30:00-04:00"
+        assert str(nightly.next_after(fired)) == "2024-11-04T01:30:00-05:00"
+        assert str(nightly.previous_before(ZonedDateTime(2024, 11, 3, 12, timezone=tz))) == "2024-11-03T01:30:00-04:00"
+        # Interval jobs keep firing through both passes of the hour
+        for expression in ("*/15 * * * *", "*/15 1 * * *"):
+            every_15 = CronExpression(expression)
+            fired = []
+            value = ZonedDateTime(2024, 11, 3, 1, 40, timezone=tz)
+            for _ in range(3):
+                value = every_15.next_after(value)
+                fired.append(str(value))
+            assert fired == [
+                "2024-11-03T01:45:00-04:00",
+                "2024-11-03T01:00:00-05:00",
+                "2024-11-03T01:15:00-05:00",
+            ]
+            for expected in reversed(fired[:-1]):
+                value = every_15.previous_before(value)
+                assert str(value) == expected
+            assert str(every_15.previous_before(value)) == "2024-11-03T01:30:00-04:00"
+
+    def test_many(self):
+        """Test batch evaluation against one value."""
+        tz = TimeZone("Europe/Paris")
+        value = ZonedDateTime(2024, 6, 1, 12, timezone=tz)
+        expressions = ["0 13 * * *", CronExpression("0 0 1 1 *"), "0 0 30 2 *"]
+        results = CronExpression.next_after_many(expressions, value)
+        assert results[0] == ZonedDateTime(2024, 6, 1, 13, timezone=tz)
+        assert results[1] == ZonedDateTime(2025, 1, 1, timezone=tz)
+        assert results[2] is None
+        column = CronExpression.next_after_many(expressions, value, output="array")
+        assert isinstance(column, array)
+        assert list(column) == [results[0].epoch_nanoseconds, results[1].epoch_nanoseconds, MISSING_INT64]
+        previous = CronExpression.previous_before_many(expressions, value)
+        assert previous[0] == ZonedDateTime(2024, 5, 31, 13, timezone=tz)
+        with pytest.raises(InvalidArgumentError):
+            CronExpression.next_after_many(expressions, value, output="pandas")
@@ -4,7 +4,7 @@ Tests for Duration class.
 
 import unittest
 
-from temporal import Duration
+from temporal import Duration, PlainDate, PlainDateTime, TimeZone, ZonedDateTime
 from temporal.exceptions import InvalidArgumentError
 
 
@@ -102,6 +102,14 @@ class TestDuration(unittest.TestCase):
         self.assertEqual(duration.minutes, 30)
         self.assertEqual(duration.seconds, 45)
 
+    def test_try_from_string(self):
+        """Test parsing that returns None instead of raising."""
+        self.assertEqual(Duration.try_from_string("p1dt2h"), Duration(days=1, hours=2))
+        for text in ["1 day", "P1H", "", None]:
+            self.assertIsNone(Duration.try_from_string(text))
+            self.assertFalse(Duration.is_valid_string(text))
+        self.assertTrue(Duration.is_valid_string("PT1.5S"))
+
     def test_from_string_fractional_seconds(self):
         """Test creating duration from string with fractional seconds."""
         duration = Duration.from_string("PT1.5S")
@@ -126,9 +134,11 @@ class TestDuration(unittest.TestCase):
         self.assertEqual(added.hours, 1)
         self.assertEqual(added.minutes, 30)
 
+        # Fields are balanced from the exact length, so 1h - 30m reads as 30 minutes
         subtracted = duration1 - duration2
-        self.assertEqual(subtracted.hours, 1)
-        self.assertEqual(subtracted.minutes, -30)
+        self.assertEqual(subtracted.hours, 0)
+        self.assertEqual(subtracted.minutes, 30)
+        self.assertEqual(subtracted, Duration(minutes=30))
 
         negated = -duration1
         self.assertEqual(negated.hours, -1)
@@ -136,6 +146,108 @@ class TestDuration(unittest.TestCase):
         abs_negated = abs(negated)
         self.assertEqual(abs_negated.hours, 1)
 
+    def test_balancing(self):
+        """Test that fields are balanced from months, days and exact nanoseconds."""
+        self.assertEqual(Duration(hours=24), Duration(days=1))
+        self.assertEqual(Duration(hours=-25).days, -1)
+        self.assertEqual(Duration(hours=-25).hours, -1)
+        self.assertEqual(Duration(microseconds=-1_500_000).seconds, -1)
+        self.assertEqual(Duration(microseconds=-1_500_000).microseconds, -500000)
+        # Months are never balanced into years without a relative_to
+        self.assertEqual(Duration(months=14).years, 0)
+        self.assertEqual(Duration(months=14).months, 14)
+        self.assertEqual(str(Duration(months=14)), "P14M")
+        self.assertEqual(str(Duration(years=1, months=2)), "P1Y2M")
+        self.assertEqual(str(Duration(years=1).add(Duration(months=13))), "P1Y13M")
+        self.assertEqual(Duration(years=-1, months=-1).months, -1)
+        self.assertEqual(Duration(weeks=2).days, 14)
+        self.assertEqual(Duration(days=1, hours=-1).hours, -1)
+        self.assertEqual(str(Duration(months=14, hours=-1)), "P14MT-1H")
+
+    def test_sign_blank_and_compare(self):
+        """Test sign, blank and compare on the integer representation."""
+        self.assertEqual(Duration(hours=2).sign, 1)
+        self.assertEqual(Duration(hours=-2).sign, -1)
+        self.assertEqual(Duration(hours=1).subtract(Duration(minutes=60)).sign, 0)
+        self.assertTrue(Duration(days=1).add(Duration(hours=-24)).blank)
+        self.assertFalse(Duration(microseconds=1).blank)
+        self.assertEqual(Duration.compare(Duration(hours=25), Duration(days=1)), 1)
+        self.assertEqual(Duration.compare(Duration(days=1), Duration(hours=24)), 0)
+        self.assertEqual(Duration.compare(Duration(months=1), Duration(days=400)), 1)
+
+    def test_total_without_relative_to(self):
+        """Test exact totals in units that do not need a calendar."""
+        duration = Duration(days=1, hours=2, minutes=30)
+        self.assertEqual(duration.total("hours"), 26.5)
+        self.assertEqual(duration.total("minutes"), 1590)
+        self.assertEqual(Duration(weeks=3, days=7).total("weeks"), 4)
+        with self.assertRaises(InvalidArgumentError):
+            duration.total("months")
+        with self.assertRaises(InvalidArgumentError):
+            duration.total("fortnights")
+
+    def test_total_relative_to_plain_date(self):
+        """Test that month and year totals use the real lengths of the months crossed."""
+        self.assertEqual(Duration(months=1).total("months", PlainDate(2024, 1, 31)), 1)
+        self.assertEqual(Duration(days=45).total("months", PlainDate(2024, 1, 1)), 1 + 14 / 29)
+        self.assertEqual(Duration(days=45).total("months", PlainDate(2023, 1, 1)), 1 + 14 / 28)
+        self.assertEqual(Duration(days=-45).total("months", PlainDate(2024, 3, 1)), -1 - 16 / 31)
+        self.assertEqual(Duration(years=1).total("days", PlainDate(2024, 1, 1)), 366)
+        self.assertEqual(Duration(years=3, days=10).total("years", PlainDate(2024, 2, 29)), 3 + 10 / 366)
+        self.assertEqual(Duration(years=-2, months=-3).total("months", PlainDate(2024, 5, 31)), -27)
+        self.assertEqual(Duration(years=400).total("months", PlainDate(2000, 1, 1)), 4800)
+        with self.assertRaises(InvalidArgumentError):
+            Duration(days=1).total("months", "2024-01-01")
+
+    def test_total_relative_to_datetimes(self):
+        """Test totals against PlainDateTime and ZonedDateTime anchors."""
+        self.assertEqual(Duration(months=1).total("hours", PlainDateTime(2023, 2, 1, 12)), 672)
+        self.assertEqual(Duration(hours=12).total("days", PlainDateTime(2023, 2, 1, 18)), 0.5)
+
+        # The spring-forward day in New York is 23 hours long
+        start = ZonedDateTime(2023, 3, 11, 12, timezone=TimeZone("America/New_York"))
+        self.assertEqual(Duration(days=1).total("hours", start), 23)
+        self.assertEqual(Duration(days=1).total("days", start), 1)
+        self.assertEqual(Duration(days=2, hours=12).total("days", start), 2.5)
+        self.assertEqual(Duration(months=1).total("days", start), 31)
+
+    def test_compare_relative_to(self):
+        """Test comparing durations by where they land from an anchor."""
+        self.assertEqual(Duration.compare(Duration(days=30), Duration(months=1), PlainDate(2023, 2, 1)), 1)
+        self.assertEqual(Duration.compare(Duration(days=30), Duration(months=1), PlainDate(2023, 3, 1)), -1)
+        self.assertEqual(Duration.compare(Duration(days=31), Duration(months=1), PlainDate(2023, 3, 1)), 0)
+        self.assertEqual(Duration.compare(Duration(days=30), Duration(months=1)), -1)
+
+    def test_total_many(self):
+        """Test totals of one duration against many anchors."""
+        anchors = [PlainDate(2023, 1, 1), PlainDate(2023, 2, 1), PlainDate(2024, 2, 1)]
+        duration = Duration(days=40)
+        self.assertEqual(duration.total_many("months", anchors), [duration.total("months", a) for a in anchors])
+        column = Duration(hours=36).total_many("days", anchors, output="array")
+        self.assertEqual(column.typecode, "d")
+        self.assertEqual(list(column), [1.5, 1.5, 1.5])
+        self.assertEqual(Duration(days=1).total_many("hours", []), [])
+        with self.assertRaises(InvalidArgumentError):
+            duration.total_many("months", anchors, output="frame")
+        with self.assertRaises(InvalidArgumentError):
+            duration.total_many("months", [None])
+
+    def test_float_arguments(self):
+        """Test that float arguments are truncated with a warning when precision is lost."""
+        self.assertEqual(Duration(hours=2.0), Duration(hours=2))
+        with self.assertWarns(UserWarning):
+            self.assertEqual(Duration(hours=1.5).hours, 1)
+
+    def test_internal_constructor_normalizes(self):
+        """Test that the internal constructor normalizes like the public one."""
+        self.assertEqual(
+            Duration._from_fields(weeks=1, hours=25, seconds=61, microseconds=1_500_000),
+            Duration(weeks=1, hours=25, seconds=61, microseconds=1_500_000),
+        )
+        self.assertEqual(Duration._from_fields(), Duration())
+        with self.assertRaises(InvalidArgumentError):
+            Duration(hours="1")
+
 
 if __name__ == "__main__":
     unittest.main()
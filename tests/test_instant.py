@@ -5,7 +5,7 @@ Tests for Instant class.
 import unittest
 
 from temporal import Duration, Instant, TimeZone
-from temporal.exceptions import InvalidArgumentError
+from temporal.exceptions import InvalidArgumentError, RangeError
 
 
 class TestInstant(unittest.TestCase):
@@ -75,6 +75,17 @@ class TestInstant(unittest.TestCase):
         self.assertIsInstance(instant, Instant)
         self.assertGreater(instant.epoch_seconds, 0)
 
+    def test_string_round_trip_nanoseconds(self):
+        """Test that str() and from_string() round-trip exactly, to the nanosecond."""
+        for nanoseconds in (1_687_438_245_123_456_789, -1, 999, 1_687_438_245_000_000_001, -123_456_789_012_345_678):
+            instant = Instant.from_epoch_nanoseconds(nanoseconds)
+            self.assertEqual(Instant.from_string(str(instant)), instant)
+        instant = Instant.from_string("2023-06-22T14:30:45.123456789+02:00")
+        self.assertEqual(instant.epoch_nanoseconds % 10**9, 123_456_789)
+        # Fractions of any length up to nine digits, with either separator
+        self.assertEqual(Instant.from_string("2023-06-22T14:30:45,5Z").epoch_nanoseconds % 10**9, 500_000_000)
+        self.assertEqual(Instant.from_string("2023-06-22T14:30:45.0001Z").epoch_nanoseconds % 10**9, 100_000)
+
     def test_now(self):
         """Test now method."""
         now = Instant.now()
@@ -102,6 +113,91 @@ class TestInstant(unittest.TestCase):
         self.assertEqual(zdt.timezone, tz)
         self.assertEqual(zdt.to_instant().epoch_seconds, instant.epoch_seconds)
 
+    def test_epoch_nanoseconds(self):
+        """Test exact integer epoch nanoseconds."""
+        instant = Instant.from_epoch_nanoseconds(1687438245123456789)
+        self.assertEqual(instant.epoch_nanoseconds, 1687438245123456789)
+        self.assertEqual(Instant(1687438245.123456).epoch_nanoseconds, 1687438245123456000)
+        self.assertEqual(Instant.from_epoch_milliseconds(1687438245123).epoch_nanoseconds, 1687438245123000000)
+        with self.assertRaises(InvalidArgumentError):
+            Instant.from_epoch_nanoseconds(1.5)
+
+    def test_nanosecond_precision_arithmetic(self):
+        """Test that arithmetic keeps nanoseconds far from the epoch."""
+        instant = Instant.from_epoch_nanoseconds(1687438245123456789)
+        later = instant.add(Duration(days=365, microseconds=1))
+        self.assertEqual(later.epoch_nanoseconds - instant.epoch_nanoseconds, 365 * 86400 * 10**9 + 1000)
+        self.assertEqual(later.subtract(Duration(days=365, microseconds=1)), instant)
+        self.assertEqual(str(instant), "2023-06-22T12:50:45.123456789Z")
+
+    def test_hash_consistent_with_equality(self):
+        """Test that equal instants hash equally and distinct ones do not collapse."""
+        a = Instant.from_epoch_nanoseconds(1687438245000000000)
+        b = Instant(1687438245)
+        c = Instant.from_epoch_nanoseconds(1687438245000000001)
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertNotEqual(a, c)
+        self.assertEqual(len({a, b, c}), 2)
+
+    def test_round(self):
+        """Test rounding with integer arithmetic."""
+        instant = Instant.from_epoch_nanoseconds(1687438245123456789)
+        self.assertEqual(instant.round("microseconds").epoch_nanoseconds, 1687438245123457000)
+        self.assertEqual(instant.round("seconds").epoch_nanoseconds, 1687438245000000000)
+        rounded = instant.round({"smallestUnit": "milliseconds", "roundingIncrement": 10})
+        self.assertEqual(rounded.epoch_nanoseconds, 1687438245120000000)
+
+    def test_floor_ceil_bucket(self):
+        """Test truncating to fixed increments and UTC calendar units."""
+        instant = Instant.from_string("2024-05-17T13:47:12.5Z")
+        self.assertEqual(str(instant.floor({"smallestUnit": "minutes", "roundingIncrement": 15})), "2024-05-17T13:45:00Z")
+        self.assertEqual(str(instant.ceil("hours")), "2024-05-17T14:00:00Z")
+        self.assertEqual(str(instant.floor("weeks")), "2024-05-13T00:00:00Z")
+        start, end = instant.bucket("quarters")
+        self.assertEqual((str(start), str(end)), ("2024-04-01T00:00:00Z", "2024-07-01T00:00:00Z"))
+        on_boundary = Instant.from_string("2024-01-01T00:00:00Z")
+        self.assertIs(on_boundary.ceil("years"), on_boundary)
+        self.assertEqual(on_boundary.floor("years"), on_boundary)
+        self.assertEqual(str(Instant.from_epoch_nanoseconds(-1).floor("days")), "1969-12-31T00:00:00Z")
+        with self.assertRaises(RangeError):
+            instant.floor({"smallestUnit": "hours", "roundingIncrement": 5})
+        with self.assertRaises(RangeError):
+            instant.floor({"smallestUnit": "months", "roundingIncrement": 5})
+        with self.assertRaises(InvalidArgumentError):
+            instant.floor("fortnights")
+
+    def test_try_from_string(self):
+        """Test parsing that returns None instead of raising."""
+        self.assertEqual(Instant.try_from_string("2024-05-17T13:47:12Z"), Instant.from_string("2024-05-17T13:47:12Z"))
+        for text in ["1715953632", "2024-13-01T00:00:00Z", "N/A", "", None, 1715953632]:
+            self.assertIsNone(Instant.try_from_string(text))
+            self.assertFalse(Instant.is_valid_string(text))
+            with self.assertRaises(InvalidArgumentError):
+                Instant.from_string(text)
+        self.assertTrue(Instant.is_valid_string("2024-05-17T13:47:12+05:30"))
+
+    def test_parse_many(self):
+        strings = ["1970-01-01T00:00:01Z", "2023-06-22T12:30:45.5+02:00", "garbage"]
+        errors = {}
+        instants = Instant.parse_many(strings, errors=errors)
+        self.assertEqual(instants[0].epoch_nanoseconds, 1_000_000_000)
+        self.assertEqual(instants[1], Instant.from_string(strings[1]))
+        self.assertIsNone(instants[2])
+        self.assertEqual(list(errors), [2])
+
+        errors = {}
+        column = Instant.parse_many(strings, output="array", errors=errors)
+        self.assertEqual(list(column[:2]), [1_000_000_000, Instant.from_string(strings[1]).epoch_nanoseconds])
+        self.assertEqual(column[2], -(2**63))
+
+        with self.assertRaises(InvalidArgumentError):
+            Instant.parse_many(strings)
+
+        # Column outputs keep every nanosecond digit
+        column = Instant.parse_many(["1970-01-01T00:00:00.123456789Z", "1969-12-31T23:59:59.999999999Z"], output="array")
+        self.assertEqual(list(column), [123_456_789, -1])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,99 @@
+"""
+Tests for the slotted, immutable memory layout of the value types.
+"""
+
+import copy
+import pickle
+import tracemalloc
+import unittest
+
+from temporal import (
+    Duration,
+    Instant,
+    PlainDate,
+    PlainDateTime,
+    PlainMonthDay,
+    PlainTime,
+    PlainYearMonth,
+    TimeZone,
+    ZonedDateTime,
+)
+
+UTC = TimeZone("UTC")
+
+FACTORIES = {
+    PlainDate: lambda: PlainDate(2023, 6, 15),
+    PlainTime: lambda: PlainTime(14, 30, 45, 123456),
+    PlainDateTime: lambda: PlainDateTime(2023, 6, 15, 14, 30, 45, 123456),
+    ZonedDateTime: lambda: ZonedDateTime(2023, 6, 15, 14, 30, 45, 123456, UTC),
+    Duration: lambda: Duration(days=3, hours=4),
+    Instant: lambda: Instant(1687438245),
+    PlainYearMonth: lambda: PlainYearMonth(2023, 6),
+    PlainMonthDay: lambda: PlainMonthDay(6, 15),
+}
+
+# Upper bounds on traced bytes per instance, including the list slot that holds it.
+MAX_BYTES_PER_INSTANCE = {
+    PlainDate: 120,
+    PlainTime: 88,
+    PlainDateTime: 112,
+    ZonedDateTime: 120,
+    Duration: 112,
+    Instant: 96,
+    PlainYearMonth: 72,
+    PlainMonthDay: 72,
+}
+
+
+def bytes_per_instance(factory, count=2000):
+    """Measure the average traced allocation size of ``count`` instances."""
+    factory()  # warm up caches before tracing
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        instances = [factory() for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del instances
+    return (after - before) / count
+
+
+class TestMemoryLayout(unittest.TestCase):
+    def test_no_instance_dict(self):
+        """Test that value types are slotted and carry no __dict__."""
+        for cls, factory in FACTORIES.items():
+            with self.subTest(cls=cls.__name__):
+                self.assertFalse(hasattr(factory(), "__dict__"))
+
+    def test_immutable(self):
+        """Test that attributes cannot be set or deleted after construction."""
+        for cls, factory in FACTORIES.items():
+            with self.subTest(cls=cls.__name__):
+                value = factory()
+                slot = cls.__slots__[0]
+                with self.assertRaises(AttributeError):
+                    setattr(value, slot, 1)
+                with self.assertRaises(AttributeError):
+                    delattr(value, slot)
+                with self.assertRaises(AttributeError):
+                    value.extra = 1
+
+    def test_pickle_and_copy(self):
+        """Test that immutable values survive pickling and copying."""
+        for cls, factory in FACTORIES.items():
+            with self.subTest(cls=cls.__name__):
+                value = factory()
+                self.assertEqual(pickle.loads(pickle.dumps(value)), value)
+                self.assertIs(copy.copy(value), value)
+                self.assertIs(copy.deepcopy(value), value)
+
+    def test_bytes_per_instance(self):
+        """Test per-instance memory footprint measured with tracemalloc."""
+        for cls, factory in FACTORIES.items():
+            with self.subTest(cls=cls.__name__):
+                self.assertLessEqual(bytes_per_instance(factory), MAX_BYTES_PER_INSTANCE[cls])
+
+
+if __name__ == "__main__":
+    unittest.main()
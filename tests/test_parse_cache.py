@@ -0,0 +1,93 @@
+"""
+Tests for the opt-in parse cache.
+"""
+
+import pytest
+
+from temporal import (
+    Instant,
+    ParseCache,
+    PlainDate,
+    PlainDateTime,
+    TimeZone,
+    ZonedDateTime,
+    disable_parse_cache,
+    enable_parse_cache,
+    get_parse_cache,
+)
+from temporal.exceptions import InvalidArgumentError, RangeError
+
+
+@pytest.fixture(autouse=True)
+def no_cache_afterwards():
+    yield
+    disable_parse_cache()
+
+
+class TestParseCache:
+    def test_disabled_by_default(self):
+        """Test that parsing does not cache until a cache is enabled."""
+        assert get_parse_cache() is None
+        assert PlainDate.from_string("2024-05-17") is not PlainDate.from_string("2024-05-17")
+
+    def test_hits_and_misses(self):
+        """Test that repeated strings return the cached value and are counted."""
+        cache = enable_parse_cache(maxsize=8)
+        assert get_parse_cache() is cache
+        first = PlainDate.from_string("2024-05-17")
+        assert PlainDate.from_string("2024-05-17") is first
+        assert PlainDateTime.from_string("2024-05-17T13:47:12") == PlainDateTime(2024, 5, 17, 13, 47, 12)
+        instant = Instant.from_string("2024-05-17T13:47:12Z")
+        assert Instant.from_string("2024-05-17T13:47:12Z") is instant
+        assert (cache.hits, cache.misses, len(cache)) == (2, 3, 3)
+        assert cache.hit_rate == pytest.approx(0.4)
+        cache.clear()
+        assert (cache.hits, cache.misses, len(cache), cache.hit_rate) == (0, 0, 0, 0.0)
+        assert PlainDate.from_string("2024-05-17") is not first
+
+    def test_options_are_part_of_the_key(self):
+        """Test that the class, calendar and timezone select separate entries."""
+        enable_parse_cache()
+        text = "2024-05-17T13:47:12"
+        assert type(PlainDateTime.from_string(text)) is PlainDateTime
+        assert type(PlainDate.from_string(text[:10])) is PlainDate
+        paris = ZonedDateTime.from_string(text, TimeZone("Europe/Paris"))
+        tokyo = ZonedDateTime.from_string(text, timezone=TimeZone("Asia/Tokyo"))
+        assert paris.offset_string == "+02:00"
+        assert tokyo.offset_string == "+09:00"
+        assert ZonedDateTime.from_string(text, timezone=TimeZone("Europe/Paris")) == paris
+
+    def test_least_recently_used_evicted(self):
+        """Test that the cache stays within its capacity, evicting the oldest use."""
+        cache = enable_parse_cache(maxsize=2)
+        first = PlainDate.from_string("2024-01-01")
+        PlainDate.from_string("2024-01-02")
+        assert PlainDate.from_string("2024-01-01") is first
+        PlainDate.from_string("2024-01-03")
+        assert len(cache) == 2
+        assert PlainDate.from_string("2024-01-01") is first
+        assert cache.misses == 3
+        PlainDate.from_string("2024-01-02")
+        assert cache.misses == 4
+
+    def test_errors_not_cached(self):
+        """Test that invalid input raises on every call and is not stored."""
+        cache = enable_parse_cache()
+        for _ in range(2):
+            with pytest.raises(RangeError):
+                PlainDate.from_string("2024-02-30")
+            with pytest.raises(InvalidArgumentError):
+                ZonedDateTime.from_string("2024-05-17T13:47:12", "Europe/Paris")
+        with pytest.raises(InvalidArgumentError):
+            ZonedDateTime.from_string("2024-05-17T13:47:12", timezone=["Europe/Paris"])
+        with pytest.raises(InvalidArgumentError):
+            Instant.from_string(None)
+        assert len(cache) == 0
+
+    def test_invalid_maxsize(self):
+        """Test rejected capacities."""
+        with pytest.raises(InvalidArgumentError):
+            ParseCache(0)
+        with pytest.raises(InvalidArgumentError):
+            enable_parse_cache(maxsize=1.5)
+        assert ParseCache().maxsize == 4096
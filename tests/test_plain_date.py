@@ -4,7 +4,7 @@ Tests for PlainDate class.
 
 import unittest
 
-from temporal import Calendar, Duration, PlainDate
+from temporal import Calendar, Duration, PlainDate, TimeZone
 from temporal.exceptions import InvalidArgumentError, RangeError
 
 
@@ -93,12 +93,91 @@ class TestPlainDate(unittest.TestCase):
         self.assertEqual(date.month, 6)
         self.assertEqual(date.day, 15)
 
+    def test_try_from_string(self):
+        """Test parsing that returns None instead of raising."""
+        self.assertEqual(PlainDate.try_from_string("2024-02-29"), PlainDate(2024, 2, 29))
+        for text in ["2023-02-29", "2024-13-01", "17/05/2024", "", None, 20240517]:
+            self.assertIsNone(PlainDate.try_from_string(text))
+            self.assertFalse(PlainDate.is_valid_string(text))
+        self.assertTrue(PlainDate.is_valid_string("2024-05-17"))
+
+    def test_add_large_day_count(self):
+        """Test adding many days in one step."""
+        date = PlainDate(2000, 1, 1)
+        self.assertEqual(date.add(Duration(days=36500)), PlainDate(2099, 12, 7))
+        self.assertEqual(date.add(Duration(days=-36500)), PlainDate(1900, 1, 25))
+        self.assertEqual(PlainDate(2099, 12, 7).subtract(date).days, 36500)
+
+    def test_add_months_clamps_day(self):
+        """Test that month arithmetic clamps to the end of the target month."""
+        self.assertEqual(PlainDate(2024, 1, 31).add(Duration(months=1)), PlainDate(2024, 2, 29))
+        self.assertEqual(PlainDate(2024, 3, 31).add(Duration(months=-1, days=1)), PlainDate(2024, 3, 1))
+        self.assertEqual(PlainDate(2023, 12, 15).add(Duration(years=1, months=2)), PlainDate(2025, 2, 15))
+
+    def test_add_out_of_range(self):
+        """Test that arithmetic past the supported range raises RangeError."""
+        with self.assertRaises(RangeError):
+            PlainDate(9999, 12, 31).add(Duration(days=1))
+        with self.assertRaises(RangeError):
+            PlainDate(1, 1, 1).add(Duration(months=-1))
+
+    def test_week_of_year(self):
+        """Test ISO week numbers around year boundaries."""
+        self.assertEqual(PlainDate(2023, 6, 15).week_of_year, 24)
+        self.assertEqual(PlainDate(2021, 1, 3).week_of_year, 53)
+        self.assertEqual(PlainDate(2024, 12, 30).week_of_year, 1)
+        self.assertEqual(PlainDate(2020, 12, 31).week_of_year, 53)
+
+    def test_hash_and_ordering(self):
+        """Test hashing and ordering across month and year boundaries."""
+        self.assertLess(PlainDate(2022, 12, 31), PlainDate(2023, 1, 1))
+        self.assertEqual(len({PlainDate(2023, 6, 15), PlainDate.from_string("2023-06-15")}), 1)
+
     def test_today(self):
         """Test today method."""
         today = PlainDate.today()
         self.assertIsInstance(today, PlainDate)
         self.assertGreaterEqual(today.year, 2023)
 
+    def test_parse_many(self):
+        """Test batch parsing into objects and epoch-day columns."""
+        strings = ["2023-06-15", "1970-01-01", "2023-02-30", "nope", "1969-12-31"]
+        errors = {}
+        dates = PlainDate.parse_many(strings, errors=errors)
+        self.assertEqual(dates[0], PlainDate(2023, 6, 15))
+        self.assertIsNone(dates[2])
+        self.assertEqual(sorted(errors), [2, 3])
+        self.assertIsInstance(errors[2], RangeError)
+        self.assertIsInstance(errors[3], InvalidArgumentError)
+
+        column = PlainDate.parse_many(strings, output="array", errors={})
+        self.assertEqual(column.typecode, "q")
+        self.assertEqual(column[1], 0)
+        self.assertEqual(column[4], -1)
+        self.assertEqual(column[0], PlainDate(2023, 6, 15).subtract(PlainDate(1970, 1, 1)).days)
+
+        with self.assertRaises(RangeError):
+            PlainDate.parse_many(strings)
+        with self.assertRaises(InvalidArgumentError):
+            PlainDate.parse_many(strings, output="frame")
+
+    def test_derived_values_match_public_constructors(self):
+        """Test that values built on internal paths match ones built with full validation."""
+        date = PlainDate(2024, 2, 29)
+        self.assertEqual(PlainDate._from_fields(2024, 2, 29, date.calendar), date)
+        self.assertEqual(date.to_plain_year_month().to_plain_date(29), date)
+        self.assertEqual(date.to_plain_month_day().to_plain_date(2024), date)
+        self.assertEqual(date.to_plain_datetime().to_plain_date(), date)
+        self.assertEqual(date.subtract(Duration(years=1)), PlainDate(2023, 2, 28))
+
+    def test_to_zoned_date_time_validates_arguments(self):
+        """Test that user-supplied arguments to conversions are still checked."""
+        date = PlainDate(2023, 6, 15)
+        with self.assertRaises(InvalidArgumentError):
+            date.to_zoned_date_time("UTC")
+        with self.assertRaises(InvalidArgumentError):
+            date.to_zoned_date_time(TimeZone("UTC"), "12:00:00")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -71,6 +71,60 @@ class TestPlainDateTime(unittest.TestCase):
         self.assertEqual(duration.minutes, 15)
         self.assertEqual(duration.seconds, 15)
 
+    def test_add_carries_days(self):
+        """Test that time overflow past midnight carries into the date in both directions."""
+        self.assertEqual(PlainDateTime(2024, 1, 1, 23).add(Duration(hours=2)), PlainDateTime(2024, 1, 2, 1))
+        self.assertEqual(PlainDateTime(2024, 12, 31, 23, 30).add(Duration(minutes=45)), PlainDateTime(2025, 1, 1, 0, 15))
+        self.assertEqual(PlainDateTime(2024, 3, 1, 0, 30).subtract(Duration(hours=1)), PlainDateTime(2024, 2, 29, 23, 30))
+        self.assertEqual(PlainDateTime(2024, 1, 1, 12).add(Duration(hours=-60)), PlainDateTime(2023, 12, 30))
+        self.assertEqual(PlainDateTime(2024, 1, 31, 22).add(Duration(months=1, hours=3)), PlainDateTime(2024, 3, 1, 1))
+        with self.assertRaises(RangeError):
+            PlainDateTime(9999, 12, 31, 23).add(Duration(hours=1))
+        with self.assertRaises(RangeError):
+            PlainDateTime(1, 1, 1).subtract(Duration(microseconds=1))
+
+    def test_subtract_datetime_negative(self):
+        """Test that a negative difference gives a duration whose fields are all negative."""
+        duration = PlainDateTime(2023, 6, 15, 12).subtract(PlainDateTime(2023, 6, 16, 13, 30))
+        self.assertEqual(duration, Duration(days=-1, hours=-1, minutes=-30))
+
+    def test_round_carries_days(self):
+        """Test that rounding up to midnight moves to the next day."""
+        dt = PlainDateTime(2023, 12, 31, 23, 59, 59, 600000)
+        self.assertEqual(dt.round("seconds"), PlainDateTime(2024, 1, 1))
+        self.assertEqual(dt.round({"smallestUnit": "hours", "roundingIncrement": 6}), PlainDateTime(2024, 1, 1))
+        self.assertEqual(PlainDateTime(2023, 6, 15, 14, 29).round("hours"), PlainDateTime(2023, 6, 15, 14))
+
+    def test_round_date_units(self):
+        """Test rounding to days, and that months and years are refused instead of ignored."""
+        self.assertEqual(PlainDateTime(2023, 6, 15, 12, 0, 1).round("days"), PlainDateTime(2023, 6, 16))
+        self.assertEqual(PlainDateTime(2023, 6, 15, 11, 59).round("days"), PlainDateTime(2023, 6, 15))
+        with self.assertRaises(InvalidArgumentError):
+            PlainDateTime(2023, 6, 15).round("months")
+
+    def test_try_from_string(self):
+        """Test parsing that returns None instead of raising."""
+        self.assertEqual(PlainDateTime.try_from_string("2024-05-17T13:47:12"), PlainDateTime(2024, 5, 17, 13, 47, 12))
+        for text in ["2024-05-17T25:00:00", "2024-02-30T00:00:00", "2024-05-17", "null", None]:
+            self.assertIsNone(PlainDateTime.try_from_string(text))
+            self.assertFalse(PlainDateTime.is_valid_string(text))
+
+    def test_floor_ceil_bucket(self):
+        """Test truncating to fixed increments and calendar units."""
+        dt = PlainDateTime(2024, 5, 17, 13, 47, 12)
+        self.assertEqual(dt.floor({"smallestUnit": "minutes", "roundingIncrement": 15}), PlainDateTime(2024, 5, 17, 13, 45))
+        self.assertEqual(dt.ceil("days"), PlainDateTime(2024, 5, 18))
+        self.assertEqual(dt.floor("weeks"), PlainDateTime(2024, 5, 13))
+        self.assertEqual(dt.bucket("months"), (PlainDateTime(2024, 5, 1), PlainDateTime(2024, 6, 1)))
+        self.assertEqual(dt.bucket("quarters"), (PlainDateTime(2024, 4, 1), PlainDateTime(2024, 7, 1)))
+        self.assertEqual(dt.floor({"smallestUnit": "years", "roundingIncrement": 10}), PlainDateTime(2020, 1, 1))
+        new_year = PlainDateTime(2024, 1, 1)
+        self.assertIs(new_year.ceil("years"), new_year)
+        with self.assertRaises(RangeError):
+            PlainDateTime(9999, 12, 31, 12).ceil("days")
+        with self.assertRaises(RangeError):
+            dt.floor("nanoseconds")
+
     def test_with_fields(self):
         """Test with_fields method."""
         dt = PlainDateTime(2023, 6, 15, 14, 30, 45)
@@ -113,6 +167,36 @@ class TestPlainDateTime(unittest.TestCase):
         self.assertIsInstance(now, PlainDateTime)
         self.assertGreaterEqual(now.year, 2023)
 
+    def test_from_string_fraction_lengths(self):
+        """Test parsing fractional seconds of every supported length."""
+        self.assertEqual(PlainDateTime.from_string("2023-06-15T14:30:45.1").microsecond, 100000)
+        self.assertEqual(PlainDateTime.from_string("2023-06-15T14:30:45.123456789").microsecond, 123456)
+
+    def test_from_string_invalid(self):
+        """Test that malformed and out-of-range strings are rejected."""
+        for text in [
+            "2023-06-15T24:00:00",
+            "2023-02-30T00:00:00",
+            "2023-06-15 14:30",
+            "2023-06-15T14:30",
+            "2023-06-15T14:30:45.",
+            "x",
+        ]:
+            with self.assertRaises((InvalidArgumentError, RangeError)):
+                PlainDateTime.from_string(text)
+
+    def test_parse_many(self):
+        """Test batch parsing into objects and wall-clock nanosecond columns."""
+        strings = ["1970-01-02T00:00:01.5", "2023-06-15T14:30:45", None]
+        errors = {}
+        values = PlainDateTime.parse_many(strings, errors=errors)
+        self.assertEqual(values[1], PlainDateTime(2023, 6, 15, 14, 30, 45))
+        self.assertIsNone(values[2])
+        self.assertIsInstance(errors[2], InvalidArgumentError)
+
+        column = PlainDateTime.parse_many(strings[:2], output="array")
+        self.assertEqual(column[0], 86_401_500_000_000)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -51,6 +51,13 @@ class TestPlainMonthDay:
         with pytest.raises(InvalidArgumentError):
             PlainMonthDay.from_string("invalid")
 
+    def test_try_from_string(self):
+        """Test parsing that returns None instead of raising."""
+        assert PlainMonthDay.try_from_string("--02-29") == PlainMonthDay(2, 29)
+        for text in ["--02-30", "13-01", "Feb 29", None]:
+            assert PlainMonthDay.try_from_string(text) is None
+            assert not PlainMonthDay.is_valid_string(text)
+
     def test_with_fields(self):
         """Test with_fields method."""
         md = PlainMonthDay(8, 24)
@@ -169,3 +176,15 @@ class TestPlainMonthDay:
 
         with pytest.raises(InvalidArgumentError):
             PlainMonthDay.from_any(123)
+
+    def test_from_string_formats(self):
+        md = PlainMonthDay.from_string("02-29")
+        assert (md.month, md.day) == (2, 29)
+        assert PlainMonthDay.from_string("--2-9") == PlainMonthDay(2, 9)
+
+        for text in ["--002-29", "--02/29", "2023-02-29", ""]:
+            with pytest.raises(InvalidArgumentError):
+                PlainMonthDay.from_string(text)
+
+        with pytest.raises(RangeError):
+            PlainMonthDay.from_string("--02-30")
@@ -107,6 +107,33 @@ class TestPlainTime(unittest.TestCase):
         time_with_micro = PlainTime.from_string("14:30:45.123456")
         self.assertEqual(time_with_micro.microsecond, 123456)
 
+    def test_try_from_string(self):
+        """Test parsing that returns None instead of raising."""
+        self.assertEqual(PlainTime.try_from_string("14:30:45.5"), PlainTime(14, 30, 45, 500000))
+        for text in ["24:00:00", "14:60:00", "2pm", None]:
+            self.assertIsNone(PlainTime.try_from_string(text))
+            self.assertFalse(PlainTime.is_valid_string(text))
+        self.assertTrue(PlainTime.is_valid_string("00:00:00"))
+
+    def test_add_wraps_around_midnight(self):
+        """Test that adding past midnight wraps within the day."""
+        time = PlainTime(23, 30, 0, 500000)
+        self.assertEqual(time.add(Duration(hours=1, microseconds=600000)), PlainTime(0, 30, 1, 100000))
+        self.assertEqual(PlainTime(0, 15).add(Duration(minutes=-30)), PlainTime(23, 45))
+        self.assertEqual(time.add(Duration(days=3)), time)
+
+    def test_round(self):
+        """Test rounding to units and increments."""
+        time = PlainTime(14, 37, 29, 999999)
+        self.assertEqual(time.round("minutes"), PlainTime(14, 37))
+        self.assertEqual(time.round({"smallestUnit": "minutes", "roundingIncrement": 15}), PlainTime(14, 30))
+        self.assertEqual(PlainTime(23, 59, 59, 600000).round("seconds"), PlainTime(0, 0, 0))
+
+    def test_hash(self):
+        """Test that equal times hash equally."""
+        self.assertEqual(hash(PlainTime(14, 30, 45, 1)), hash(PlainTime.from_string("14:30:45.000001")))
+        self.assertEqual(len({PlainTime(1), PlainTime(1, 0), PlainTime(2)}), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -42,6 +42,13 @@ class TestPlainYearMonth:
         with pytest.raises(InvalidArgumentError):
             PlainYearMonth.from_string("invalid")
 
+    def test_try_from_string(self):
+        """Test parsing that returns None instead of raising."""
+        assert PlainYearMonth.try_from_string("2023-06") == PlainYearMonth(2023, 6)
+        for text in ["2023-13", "0000-01", "06/2023", None]:
+            assert PlainYearMonth.try_from_string(text) is None
+            assert not PlainYearMonth.is_valid_string(text)
+
     def test_add_duration(self):
         """Test adding duration to PlainYearMonth."""
         ym = PlainYearMonth(2023, 6)
@@ -65,6 +72,10 @@ class TestPlainYearMonth:
         with pytest.raises(InvalidArgumentError):
             ym.add(Duration(days=1))
 
+        # Cannot leave the supported year range
+        with pytest.raises(RangeError):
+            PlainYearMonth(9999, 12).add(Duration(months=1))
+
     def test_subtract(self):
         """Test subtracting from PlainYearMonth."""
         ym1 = PlainYearMonth(2023, 6)
@@ -0,0 +1,152 @@
+"""
+Tests for lazy temporal ranges.
+"""
+
+import bisect
+import pickle
+
+import pytest
+
+from temporal import Duration, Instant, PlainDate, PlainDateRange, PlainDateTime, PlainYearMonth, TemporalRange
+from temporal.exceptions import InvalidArgumentError
+
+
+class TestPlainDateRange:
+    def test_len_and_indexing(self):
+        """Test length and indexing of a date range."""
+        days = PlainDate.range(PlainDate(2024, 1, 1), PlainDate(2025, 1, 1))
+        assert isinstance(days, PlainDateRange)
+        assert len(days) == 366
+        assert days[0] == PlainDate(2024, 1, 1)
+        assert days[59] == PlainDate(2024, 2, 29)
+        assert days[-1] == PlainDate(2024, 12, 31)
+        with pytest.raises(IndexError):
+            days[366]
+
+    def test_step_and_reverse(self):
+        """Test week steps, negative steps and reversed()."""
+        weeks = PlainDate.range(PlainDate(2024, 1, 1), PlainDate(2024, 2, 1), Duration(weeks=1))
+        assert list(weeks) == [PlainDate(2024, 1, d) for d in (1, 8, 15, 22, 29)]
+        assert list(reversed(weeks)) == list(weeks)[::-1]
+        assert weeks.step == Duration(days=7)
+        backwards = PlainDate.range(PlainDate(2024, 1, 10), PlainDate(2024, 1, 1), Duration(days=-3))
+        assert list(backwards) == [PlainDate(2024, 1, d) for d in (10, 7, 4)]
+
+    def test_slicing(self):
+        """Test that slices are lazy ranges of the same kind."""
+        days = PlainDate.range(PlainDate(2024, 1, 1), PlainDate(2024, 2, 1))
+        sliced = days[10:20:2]
+        assert isinstance(sliced, PlainDateRange)
+        assert list(sliced) == [PlainDate(2024, 1, d) for d in (11, 13, 15, 17, 19)]
+        assert sliced == PlainDate.range(PlainDate(2024, 1, 11), PlainDate(2024, 1, 20), Duration(days=2))
+        assert list(days[::-1])[0] == PlainDate(2024, 1, 31)
+
+    def test_contains_and_index(self):
+        """Test membership and index() lookups."""
+        weeks = PlainDate.range(PlainDate(2024, 1, 1), PlainDate(2024, 12, 31), Duration(days=7))
+        assert PlainDate(2024, 1, 8) in weeks
+        assert PlainDate(2024, 1, 9) not in weeks
+        assert PlainDate(2025, 1, 6) not in weeks
+        assert "2024-01-08" not in weeks
+        assert weeks.index(PlainDate(2024, 1, 15)) == 2
+        assert weeks.count(PlainDate(2024, 1, 15)) == 1
+        with pytest.raises(ValueError):
+            weeks.index(PlainDate(2024, 1, 16))
+
+    def test_index_bounds(self):
+        """Test that index() start and stop behave like list.index, including negative bounds."""
+        weeks = PlainDate.range(PlainDate(2024, 1, 1), PlainDate(2024, 3, 1), Duration(days=7))
+        values = list(weeks)
+        for value in (values[0], values[4], values[-1]):
+            for start in (-100, -9, -5, -1, 0, 3, 4, 5, 100):
+                for stop in (None, -100, -5, -4, -1, 0, 5, 100):
+                    bounds = (start,) if stop is None else (start, stop)
+                    try:
+                        expected = values.index(value, *bounds)
+                    except ValueError:
+                        with pytest.raises(ValueError):
+                            weeks.index(value, *bounds)
+                    else:
+                        assert weeks.index(value, *bounds) == expected
+
+    def test_bisect(self):
+        """Test arithmetic insertion points against the bisect module."""
+        weeks = PlainDate.range(PlainDate(2024, 1, 1), PlainDate(2024, 3, 1), Duration(days=7))
+        values = list(weeks)
+        for probe in PlainDate.range(PlainDate(2023, 12, 25), PlainDate(2024, 3, 10)):
+            assert weeks.bisect_left(probe) == bisect.bisect_left(values, probe)
+            assert weeks.bisect_right(probe) == bisect.bisect_right(values, probe)
+
+    def test_empty(self):
+        """Test ranges whose stop is not past the start."""
+        empty = PlainDate.range(PlainDate(2024, 1, 1), PlainDate(2024, 1, 1))
+        assert len(empty) == 0
+        assert list(empty) == []
+        assert PlainDate(2024, 1, 1) not in empty
+
+    def test_invalid_step(self):
+        """Test steps that do not fit dates."""
+        start, stop = PlainDate(2024, 1, 1), PlainDate(2024, 2, 1)
+        with pytest.raises(InvalidArgumentError):
+            PlainDate.range(start, stop, Duration(hours=12))
+        with pytest.raises(InvalidArgumentError):
+            PlainDate.range(start, stop, Duration(months=1))
+        with pytest.raises(InvalidArgumentError):
+            PlainDate.range(start, stop, Duration())
+        with pytest.raises(InvalidArgumentError):
+            PlainDate.range(start, "2024-02-01")
+
+    def test_pickle_and_hash(self):
+        """Test that ranges pickle and hash like values."""
+        days = PlainDate.range(PlainDate(2024, 1, 1), PlainDate(2024, 2, 1))
+        assert pickle.loads(pickle.dumps(days)) == days
+        assert hash(days) == hash(PlainDate.range(PlainDate(2024, 1, 1), PlainDate(2024, 2, 1)))
+
+
+class TestOtherRanges:
+    def test_plain_date_time(self):
+        """Test a datetime range crossing midnight."""
+        hours = PlainDateTime.range(PlainDateTime(2024, 1, 1, 20), PlainDateTime(2024, 1, 2, 4), Duration(hours=3))
+        assert list(hours) == [
+            PlainDateTime(2024, 1, 1, 20),
+            PlainDateTime(2024, 1, 1, 23),
+            PlainDateTime(2024, 1, 2, 2),
+        ]
+        assert PlainDateTime(2024, 1, 2, 2) in hours
+        assert PlainDateTime(2024, 1, 2, 2, 0, 1) not in hours
+        assert hours.index(PlainDateTime(2024, 1, 1, 23)) == 1
+        with pytest.raises(InvalidArgumentError):
+            PlainDateTime.range(PlainDateTime(2024, 1, 1), PlainDateTime(2024, 6, 1), Duration(months=1))
+
+    def test_instant(self):
+        """Test an instant range with sub-second steps."""
+        start = Instant.from_epoch_seconds(0)
+        ticks = Instant.range(start, Instant.from_epoch_seconds(1), Duration(microseconds=250_000))
+        assert len(ticks) == 4
+        assert ticks[3] == Instant.from_epoch_milliseconds(750)
+        assert ticks.bisect_left(Instant.from_epoch_milliseconds(300)) == 2
+        assert len(Instant.range(start, Instant.from_epoch_seconds(86_400 * 365))) == 365
+
+    def test_plain_year_month(self):
+        """Test month and year steps for year-month ranges."""
+        months = PlainYearMonth.range(PlainYearMonth(2023, 11), PlainYearMonth(2024, 3))
+        assert [str(ym) for ym in months] == ["2023-11", "2023-12", "2024-01", "2024-02"]
+        quarters = PlainYearMonth.range(PlainYearMonth(2024, 1), PlainYearMonth(2026, 1), Duration(months=3))
+        assert len(quarters) == 8
+        assert quarters.index(PlainYearMonth(2025, 4)) == 5
+        assert PlainYearMonth(2025, 5) not in quarters
+        with pytest.raises(InvalidArgumentError):
+            PlainYearMonth.range(PlainYearMonth(2024, 1), PlainYearMonth(2025, 1), Duration(days=30))
+
+    def test_year_limits(self):
+        """Test ranges reaching the ends of the supported years."""
+        months = PlainYearMonth.range(PlainYearMonth(9999, 11), PlainYearMonth(9999, 12))
+        assert list(months) == [PlainYearMonth(9999, 11)]
+        days = PlainDate.range(PlainDate(9999, 12, 30), PlainDate(1, 1, 1), Duration(days=-1))
+        assert len(days) == 3_652_057
+        assert days[-1] == PlainDate(1, 1, 2)
+
+    def test_base_class_is_abstract(self):
+        """Test that the TemporalRange base class cannot be instantiated."""
+        with pytest.raises(TypeError):
+            TemporalRange(PlainDate(2024, 1, 1), PlainDate(2024, 2, 1))
@@ -0,0 +1,223 @@
+"""
+Tests for RecurrenceRule class.
+"""
+
+import pickle
+from itertools import islice
+
+import pytest
+
+from temporal import Instant, PlainDate, PlainDateTime, RecurrenceRule, TimeZone, ZonedDateTime
+from temporal.exceptions import InvalidArgumentError
+
+
+def take(iterator, count=10):
+    return list(islice(iterator, count))
+
+
+class TestRecurrenceRule:
+    def test_from_string_round_trip(self):
+        """Test parsing and formatting RRULE values."""
+        rule = RecurrenceRule.from_string("RRULE:FREQ=monthly;INTERVAL=2;BYDAY=-1FR,MO;COUNT=5;WKST=SU")
+        assert rule.freq == "MONTHLY"
+        assert rule.interval == 2
+        assert rule.count == 5
+        assert str(rule) == "FREQ=MONTHLY;INTERVAL=2;COUNT=5;BYDAY=-1FR,MO;WKST=SU"
+        assert RecurrenceRule.from_string(str(rule)) == rule
+        assert pickle.loads(pickle.dumps(rule)) == rule
+        assert isinstance(RecurrenceRule.from_string("FREQ=DAILY;UNTIL=20241231T235959Z").until, Instant)
+
+    def test_invalid_rules(self):
+        """Test rejected rule parts."""
+        with pytest.raises(InvalidArgumentError):
+            RecurrenceRule.from_string("INTERVAL=2")
+        with pytest.raises(InvalidArgumentError):
+            RecurrenceRule.from_string("FREQ=FORTNIGHTLY")
+        with pytest.raises(InvalidArgumentError):
+            RecurrenceRule.from_string("FREQ=DAILY;BYHOUR=9")
+        with pytest.raises(InvalidArgumentError):
+            RecurrenceRule.from_string("FREQ=DAILY;COUNT=3;UNTIL=20240101")
+        with pytest.raises(InvalidArgumentError):
+            RecurrenceRule("WEEKLY", by_day=["1MO"])
+        with pytest.raises(InvalidArgumentError):
+            RecurrenceRule("WEEKLY", by_month_day=[1])
+        with pytest.raises(InvalidArgumentError):
+            RecurrenceRule("MONTHLY", by_month_day=[32])
+        with pytest.raises(InvalidArgumentError):
+            RecurrenceRule("HOURLY").occurrences(PlainDate(2024, 1, 1))
+
+    def test_daily_and_weekly(self):
+        """Test simple frequencies with intervals and BYDAY."""
+        rule = RecurrenceRule("DAILY", interval=3, count=3)
+        assert list(rule.occurrences(PlainDate(2024, 2, 27))) == [
+            PlainDate(2024, 2, 27),
+            PlainDate(2024, 3, 1),
+            PlainDate(2024, 3, 4),
+        ]
+        rule = RecurrenceRule("WEEKLY", interval=2, by_day=["TU", "TH"], count=4)
+        assert list(rule.occurrences(PlainDate(2024, 1, 2))) == [
+            PlainDate(2024, 1, 2),
+            PlainDate(2024, 1, 4),
+            PlainDate(2024, 1, 16),
+            PlainDate(2024, 1, 18),
+        ]
+
+    def test_monthly(self):
+        """Test month-day expansion, skipped months and ordinal weekdays."""
+        rule = RecurrenceRule("MONTHLY", count=4)
+        assert list(rule.occurrences(PlainDate(2024, 1, 31))) == [
+            PlainDate(2024, 1, 31),
+            PlainDate(2024, 3, 31),
+            PlainDate(2024, 5, 31),
+            PlainDate(2024, 7, 31),
+        ]
+        rule = RecurrenceRule.from_string("FREQ=MONTHLY;BYMONTHDAY=-1")
+        assert take(rule.occurrences(PlainDate(2024, 1, 1)), 3) == [
+            PlainDate(2024, 1, 31),
+            PlainDate(2024, 2, 29),
+            PlainDate(2024, 3, 31),
+        ]
+        rule = RecurrenceRule.from_string("FREQ=MONTHLY;BYDAY=FR;BYMONTHDAY=13")
+        assert take(rule.occurrences(PlainDate(2024, 1, 1)), 3) == [
+            PlainDate(2024, 9, 13),
+            PlainDate(2024, 12, 13),
+            PlainDate(2025, 6, 13),
+        ]
+
+    def test_set_pos(self):
+        """Test BYSETPOS selecting the last working day of each month."""
+        rule = RecurrenceRule.from_string("FREQ=MONTHLY;BYDAY=MO,TU,WE,TH,FR;BYSETPOS=-1;COUNT=3")
+        assert list(rule.occurrences(PlainDate(2024, 8, 1))) == [
+            PlainDate(2024, 8, 30),
+            PlainDate(2024, 9, 30),
+            PlainDate(2024, 10, 31),
+        ]
+
+    def test_yearly(self):
+        """Test yearly rules with months, year-scoped ordinals and leap days."""
+        rule = RecurrenceRule.from_string("FREQ=YEARLY;BYMONTH=11;BYDAY=4TH")
+        assert take(rule.occurrences(PlainDate(2024, 1, 1)), 2) == [PlainDate(2024, 11, 28), PlainDate(2025, 11, 27)]
+        rule = RecurrenceRule.from_string("FREQ=YEARLY;BYDAY=20MO")
+        assert take(rule.occurrences(PlainDate(2024, 1, 1)), 1) == [PlainDate(2024, 5, 13)]
+        rule = RecurrenceRule("YEARLY", count=3)
+        assert list(rule.occurrences(PlainDate(2024, 2, 29))) == [
+            PlainDate(2024, 2, 29),
+            PlainDate(2028, 2, 29),
+            PlainDate(2032, 2, 29),
+        ]
+
+    def test_impossible_rule_ends(self):
+        """Test that a rule with no instances stops instead of looping."""
+        rule = RecurrenceRule.from_string("FREQ=MONTHLY;BYMONTH=2;BYMONTHDAY=30")
+        assert list(rule.occurrences(PlainDate(2024, 1, 1))) == []
+
+    def test_after_skips_ahead(self):
+        """Test starting at the period containing an arbitrary point."""
+        start = PlainDateTime(2000, 1, 3, 9)
+        rule = RecurrenceRule.from_string("FREQ=WEEKLY;BYDAY=MO,WE")
+        after = PlainDateTime(2024, 12, 23, 9)
+        assert take(rule.occurrences(start, after=after), 3) == [
+            PlainDateTime(2024, 12, 25, 9),
+            PlainDateTime(2024, 12, 30, 9),
+            PlainDateTime(2025, 1, 1, 9),
+        ]
+        assert take(rule.occurrences(start, after=after, inclusive=True), 1) == [after]
+        assert take(rule.occurrences(start, after=PlainDate(1999, 1, 1)), 1) == [start]
+        # Matches replaying the series from its start
+        replayed = [value for value in take(rule.occurrences(start), 2700) if value > after][:3]
+        assert take(rule.occurrences(start, after=after), 3) == replayed
+
+    def test_count_with_after(self):
+        """Test that COUNT still counts instances before the after point."""
+        rule = RecurrenceRule("DAILY", count=10)
+        start = PlainDate(2024, 1, 1)
+        assert list(rule.occurrences(start, after=PlainDate(2024, 1, 8))) == [PlainDate(2024, 1, 9), PlainDate(2024, 1, 10)]
+
+    def test_until_and_exdates(self):
+        """Test the inclusive UNTIL bound and EXDATE removal."""
+        rule = RecurrenceRule("DAILY", until=PlainDate(2024, 1, 5))
+        start = PlainDateTime(2024, 1, 1, 12)
+        assert len(list(rule.occurrences(start))) == 4
+        assert list(rule.occurrences(start, exdates=[PlainDateTime(2024, 1, 2, 12)]))[1] == PlainDateTime(2024, 1, 3, 12)
+        rule = RecurrenceRule("DAILY", count=3)
+        assert list(rule.occurrences(PlainDate(2024, 1, 1), exdates=[PlainDate(2024, 1, 2)])) == [
+            PlainDate(2024, 1, 1),
+            PlainDate(2024, 1, 3),
+        ]
+
+    def test_sub_daily(self):
+        """Test hourly rules limited to certain days."""
+        rule = RecurrenceRule.from_string("FREQ=HOURLY;INTERVAL=5;BYDAY=SA")
+        values = take(rule.occurrences(PlainDateTime(2024, 1, 5, 23)), 6)
+        assert values == [
+            PlainDateTime(2024, 1, 6, 4),
+            PlainDateTime(2024, 1, 6, 9),
+            PlainDateTime(2024, 1, 6, 14),
+            PlainDateTime(2024, 1, 6, 19),
+            PlainDateTime(2024, 1, 13, 1),
+            PlainDateTime(2024, 1, 13, 6),
+        ]
+
+    def test_zoned(self):
+        """Test wall-clock recurrence across a DST transition."""
+        tz = TimeZone("America/New_York")
+        rule = RecurrenceRule("DAILY", count=3)
+        values = list(rule.occurrences(ZonedDateTime(2024, 3, 9, 9, timezone=tz)))
+        assert [value.hour for value in values] == [9, 9, 9]
+        assert [value.offset_string for value in values] == ["-05:00", "-04:00", "-04:00"]
+        # A wall time inside the gap moves forward by the gap's length
+        values = list(rule.occurrences(ZonedDateTime(2024, 3, 9, 2, 30, timezone=tz)))
+        assert str(values[1]) == "2024-03-10T03:30:00-04:00"
+        rule = RecurrenceRule.from_string("FREQ=DAILY;UNTIL=20240312T130000Z")
+        after = Instant.from_string("2024-03-10T12:00:00Z")
+        assert [str(value) for value in rule.occurrences(ZonedDateTime(2024, 3, 1, 9, timezone=tz), after=after)] == [
+            "2024-03-10T09:00:00-04:00",
+            "2024-03-11T09:00:00-04:00",
+            "2024-03-12T09:00:00-04:00",
+        ]
+        with pytest.raises(InvalidArgumentError):
+            rule.occurrences(PlainDate(2024, 3, 1))
+
+    def test_sub_daily_set_pos_without_single_instance(self):
+        """Test that sub-daily BYSETPOS that cannot select the period's only instance yields nothing."""
+        assert list(RecurrenceRule("HOURLY", by_set_pos=[2]).occurrences(PlainDateTime(2024, 1, 1))) == []
+        tz = TimeZone("Europe/Paris")
+        assert list(RecurrenceRule("MINUTELY", by_set_pos=[-2, 3]).occurrences(ZonedDateTime(2024, 1, 1, timezone=tz))) == []
+        assert take(RecurrenceRule("HOURLY", by_set_pos=[-1]).occurrences(PlainDateTime(2024, 1, 1)), 2) == [
+            PlainDateTime(2024, 1, 1, 0),
+            PlainDateTime(2024, 1, 1, 1),
+        ]
+
+    def test_sub_daily_zoned_steps_exact_time(self):
+        """Test HOURLY and MINUTELY across DST transitions without repeated or dropped instances."""
+        tz = TimeZone("America/New_York")
+        rule = RecurrenceRule("HOURLY")
+        values = take(rule.occurrences(ZonedDateTime(2024, 3, 10, 0, 30, timezone=tz)), 4)
+        assert [str(value) for value in values] == [
+            "2024-03-10T00:30:00-05:00",
+            "2024-03-10T01:30:00-05:00",
+            "2024-03-10T03:30:00-04:00",
+            "2024-03-10T04:30:00-04:00",
+        ]
+        values = take(rule.occurrences(ZonedDateTime(2024, 11, 3, 0, 30, timezone=tz)), 4)
+        assert [str(value) for value in values] == [
+            "2024-11-03T00:30:00-04:00",
+            "2024-11-03T01:30:00-04:00",
+            "2024-11-03T01:30:00-05:00",
+            "2024-11-03T02:30:00-05:00",
+        ]
+        rule = RecurrenceRule("MINUTELY", interval=30)
+        values = take(rule.occurrences(ZonedDateTime(2024, 11, 3, 1, 0, timezone=tz)), 5)
+        assert [str(value) for value in values] == [
+            "2024-11-03T01:00:00-04:00",
+            "2024-11-03T01:30:00-04:00",
+            "2024-11-03T01:00:00-05:00",
+            "2024-11-03T01:30:00-05:00",
+            "2024-11-03T02:00:00-05:00",
+        ]
+        # Skipping ahead agrees with replaying the series
+        rule = RecurrenceRule.from_string("FREQ=HOURLY;INTERVAL=7;BYDAY=SU")
+        start = ZonedDateTime(2024, 1, 1, 0, 30, timezone=tz)
+        replayed = take(rule.occurrences(start), 400)
+        after = replayed[300]
+        assert take(rule.occurrences(start, after=after), 3) == replayed[301:304]
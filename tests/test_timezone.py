@@ -0,0 +1,178 @@
+"""
+Tests for TimeZone class.
+"""
+
+import pickle
+import threading
+import unittest
+from array import array
+
+from temporal import Instant, PlainDateTime, TimeZone, ZonedDateTime
+from temporal.exceptions import InvalidArgumentError, RangeError
+from temporal.utils import MISSING_INT64
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - depends on the environment
+    numpy = None
+
+HOUR = 3600 * 10**9
+
+
+class TestTimeZone(unittest.TestCase):
+    def test_interned(self):
+        """Test that the same identifier yields the same instance."""
+        self.assertIs(TimeZone("Europe/Berlin"), TimeZone("Europe/Berlin"))
+        self.assertIs(TimeZone.from_string("UTC"), TimeZone("UTC"))
+        self.assertIsNot(TimeZone("Europe/Berlin"), TimeZone("Europe/Paris"))
+
+    def test_offset_identifiers(self):
+        """Test fixed UTC offset identifiers."""
+        tz = TimeZone("+05:30")
+        self.assertEqual(tz.id, "+05:30")
+        self.assertEqual(tz.zone_info.utcoffset(None).total_seconds(), 5.5 * 3600)
+        self.assertIs(TimeZone("+05:30"), tz)
+
+    def test_invalid_identifier(self):
+        """Test invalid identifiers raise and are not interned."""
+        with self.assertRaises(InvalidArgumentError):
+            TimeZone("Not/AZone")
+        with self.assertRaises(InvalidArgumentError):
+            TimeZone("+25:00")
+        # Unhashable and non-string identifiers get the library's error, not a TypeError
+        for identifier in (["UTC"], None, 0):
+            with self.assertRaises(InvalidArgumentError):
+                TimeZone(identifier)
+
+    def test_immutable(self):
+        """Test that shared instances cannot be mutated."""
+        with self.assertRaises(AttributeError):
+            TimeZone("UTC")._identifier = "Europe/Berlin"
+
+    def test_preload(self):
+        """Test preloading a list of zones."""
+        zones = TimeZone.preload(["America/New_York", "Asia/Tokyo"])
+        self.assertEqual([tz.id for tz in zones], ["America/New_York", "Asia/Tokyo"])
+        self.assertIs(zones[1], TimeZone("Asia/Tokyo"))
+
+    def test_thread_safe_interning(self):
+        """Test concurrent construction resolves to a single instance."""
+        results = []
+
+        def worker():
+            results.append(TimeZone("Australia/Lord_Howe"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(tz) for tz in results}), 1)
+
+    def test_pickle_returns_interned_instance(self):
+        """Test that unpickling yields the canonical instance."""
+        tz = TimeZone("Europe/Berlin")
+        self.assertIs(pickle.loads(pickle.dumps(tz)), tz)
+
+    def test_zoned_from_string_reuses_zone(self):
+        """Test that parsed offsets map onto interned zones."""
+        a = ZonedDateTime.from_string("2023-06-15T14:30:45+05:00")
+        b = ZonedDateTime.from_string("2023-06-16T09:00:00+05:00")
+        self.assertIs(a.timezone, b.timezone)
+        self.assertEqual(a.timezone.id, "+05:00")
+        self.assertEqual(a.offset_seconds, 5 * 3600)
+
+    def test_get_offset_nanoseconds_for(self):
+        """Test offset lookups through the compiled table."""
+        tz = TimeZone("America/New_York")
+        summer = Instant.from_string("2023-06-15T12:00:00Z")
+        winter = Instant.from_string("2023-01-15T12:00:00Z")
+        self.assertEqual(tz.get_offset_nanoseconds_for(summer), -4 * 3600 * 10**9)
+        self.assertEqual(tz.get_offset_nanoseconds_for(winter), -5 * 3600 * 10**9)
+        self.assertEqual(TimeZone("+05:30").get_offset_nanoseconds_for(summer), 19800 * 10**9)
+        self.assertIs(tz.transition_table, tz.transition_table)
+        with self.assertRaises(InvalidArgumentError):
+            tz.get_offset_nanoseconds_for(0)
+
+    def test_get_possible_instants_for(self):
+        """Test wall-clock resolution in gaps, folds and ordinary times."""
+        tz = TimeZone("America/New_York")
+        self.assertEqual(tz.get_possible_instants_for(PlainDateTime(2023, 3, 12, 2, 30)), [])
+
+        fold = tz.get_possible_instants_for(PlainDateTime(2023, 11, 5, 1, 30))
+        self.assertEqual([str(instant) for instant in fold], ["2023-11-05T05:30:00Z", "2023-11-05T06:30:00Z"])
+
+        (instant,) = tz.get_possible_instants_for(PlainDateTime(2023, 6, 15, 8, 0, 0, 250))
+        self.assertEqual(instant, Instant.from_string("2023-06-15T12:00:00.00025Z"))
+        with self.assertRaises(InvalidArgumentError):
+            tz.get_possible_instants_for("2023-06-15T08:00")
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestTimeZoneColumns(unittest.TestCase):
+    def local(self, *fields):
+        """Get wall-clock nanoseconds since 1970-01-01T00:00 for a PlainDateTime."""
+        return PlainDateTime(*fields).to_zoned_date_time(TimeZone("UTC")).epoch_nanoseconds
+
+    def test_to_local_many_matches_scalar(self):
+        """Test column localization against the scalar offset lookup, past the last tzdata transition."""
+        values = numpy.random.default_rng(0).integers(-(2**62), 2**62, 5000)
+        for identifier in ["America/New_York", "Australia/Lord_Howe", "Europe/Dublin", "Asia/Kolkata", "+05:30"]:
+            tz = TimeZone(identifier)
+            local = tz.to_local_many(values)
+            self.assertEqual(local.dtype, numpy.int64)
+            expected = [value + tz.transition_table.offset_nanoseconds_at(value) for value in values.tolist()]
+            self.assertEqual(local.tolist(), expected, identifier)
+
+    def test_to_utc_many_disambiguation(self):
+        """Test gaps, folds and ordinary times for each disambiguation."""
+        tz = TimeZone("America/New_York")
+        gap = self.local(2023, 3, 12, 2, 30)
+        fold = self.local(2023, 11, 5, 1, 30)
+        ordinary = self.local(2023, 6, 15, 12)
+        values = numpy.array([gap, fold, ordinary, MISSING_INT64])
+        self.assertEqual(
+            tz.to_utc_many(values).tolist(), [gap + 5 * HOUR, fold + 4 * HOUR, ordinary + 4 * HOUR, MISSING_INT64]
+        )
+        self.assertEqual(tz.to_utc_many(values, "earlier").tolist()[:2], [gap + 4 * HOUR, fold + 4 * HOUR])
+        self.assertEqual(tz.to_utc_many(values, "later").tolist()[:2], [gap + 5 * HOUR, fold + 5 * HOUR])
+        self.assertEqual(tz.to_utc_many(values[2:], "reject").tolist(), [ordinary + 4 * HOUR, MISSING_INT64])
+        with self.assertRaisesRegex(RangeError, "row 1 is repeated"):
+            tz.to_utc_many(values[[2, 1]], "reject")
+        with self.assertRaisesRegex(RangeError, "row 0 is skipped"):
+            tz.to_utc_many(values, "reject")
+        with self.assertRaises(InvalidArgumentError):
+            tz.to_utc_many(values, "nearest")
+
+    def test_round_trip_matches_zoned_date_time(self):
+        """Test that localizing then resolving agrees with ZonedDateTime."""
+        tz = TimeZone("Europe/London")
+        instants = [
+            Instant.from_string(text) for text in ["2024-03-31T00:59:59Z", "2024-03-31T01:00:00Z", "2024-10-27T01:30:00Z"]
+        ]
+        local = tz.to_local_many([instant.epoch_nanoseconds for instant in instants])
+        self.assertIsInstance(local, array)
+        for instant, wall in zip(instants, local):
+            zoned = instant.to_zoned_date_time(tz)
+            self.assertEqual(wall, self.local(zoned.year, zoned.month, zoned.day, zoned.hour, zoned.minute, zoned.second))
+        # The fold's later instant resolves to the earlier one under "compatible"
+        self.assertEqual(
+            list(tz.to_utc_many(local)),
+            [instants[0].epoch_nanoseconds, instants[1].epoch_nanoseconds, instants[2].epoch_nanoseconds - HOUR],
+        )
+
+    def test_column_inputs(self):
+        """Test array('q') and sequence inputs and invalid columns."""
+        tz = TimeZone("Asia/Kolkata")
+        result = tz.to_local_many(array("q", [0, MISSING_INT64]))
+        self.assertEqual(result, array("q", [19800 * 10**9, MISSING_INT64]))
+        self.assertEqual(len(tz.to_utc_many([])), 0)
+        with self.assertRaises(InvalidArgumentError):
+            tz.to_local_many([0.5])
+        with self.assertRaises(InvalidArgumentError):
+            tz.to_local_many(array("d", [0.5]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Tests for compiled timezone transition tables.
+"""
+
+import importlib.util
+import unittest
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from temporal.exceptions import InvalidArgumentError
+from temporal import tzif
+from temporal.tzif import PosixRule, TransitionTable, load_transition_table
+from temporal.utils import NS_PER_SECOND
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    from backports.zoneinfo import ZoneInfo
+
+HOUR = 3600 * NS_PER_SECOND
+
+
+def epoch_nanoseconds(*fields):
+    """Get epoch nanoseconds for a UTC wall-clock time."""
+    delta = datetime(*fields, tzinfo=timezone.utc) - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return (delta.days * 86_400 + delta.seconds) * NS_PER_SECOND
+
+
+class TestPosixRule(unittest.TestCase):
+    def test_standard_only(self):
+        """Test a rule without daylight saving time."""
+        rule = PosixRule("<+0530>-5:30")
+        self.assertEqual(rule.offset_at(0), 19800)
+        self.assertEqual(rule.offset_at(4_000_000_000), 19800)
+
+    def test_northern_hemisphere(self):
+        """Test US rules switch at 02:00 local time."""
+        rule = PosixRule("EST5EDT,M3.2.0,M11.1.0")
+        second = NS_PER_SECOND
+        # 2050-03-13 is the second Sunday of March; 02:00 EST is 07:00 UTC
+        self.assertEqual(rule.offset_at(epoch_nanoseconds(2050, 3, 13, 6, 59, 59) // second), -5 * 3600)
+        self.assertEqual(rule.offset_at(epoch_nanoseconds(2050, 3, 13, 7) // second), -4 * 3600)
+        # 2050-11-06 is the first Sunday of November; 02:00 EDT is 06:00 UTC
+        self.assertEqual(rule.offset_at(epoch_nanoseconds(2050, 11, 6, 5, 59, 59) // second), -4 * 3600)
+        self.assertEqual(rule.offset_at(epoch_nanoseconds(2050, 11, 6, 6) // second), -5 * 3600)
+
+    def test_southern_hemisphere(self):
+        """Test a rule whose daylight time spans the new year."""
+        rule = PosixRule("AEST-10AEDT,M10.1.0,M4.1.0/3")
+        self.assertEqual(rule.offset_at(epoch_nanoseconds(2050, 1, 15) // NS_PER_SECOND), 11 * 3600)
+        self.assertEqual(rule.offset_at(epoch_nanoseconds(2050, 7, 15) // NS_PER_SECOND), 10 * 3600)
+
+    def test_julian_dates(self):
+        """Test Jn dates skip February 29 and n dates count it."""
+        self.assertEqual(PosixRule._epoch_days((1, 60), 2048), PosixRule._epoch_days((2, 60), 2048))
+        self.assertEqual(PosixRule._epoch_days((1, 59), 2048), PosixRule._epoch_days((2, 58), 2048))
+
+    def test_invalid(self):
+        """Test malformed rules are rejected."""
+        with self.assertRaises(InvalidArgumentError):
+            PosixRule("not a rule")
+        with self.assertRaises(InvalidArgumentError):
+            PosixRule("EST5EDT,X3,M11.1.0")
+
+
+class TestTransitionTable(unittest.TestCase):
+    def test_fixed(self):
+        """Test a constant-offset table."""
+        table = TransitionTable.fixed(-8 * HOUR)
+        self.assertEqual(table.offset_nanoseconds_at(0), -8 * HOUR)
+        self.assertEqual(table.possible_epoch_nanoseconds(0), [8 * HOUR])
+        self.assertEqual(table.transitions, [])
+
+    def test_mismatched_lengths(self):
+        """Test the offsets must bracket the transitions."""
+        with self.assertRaises(InvalidArgumentError):
+            TransitionTable([0], [0])
+
+    def test_matches_zoneinfo(self):
+        """Test offsets agree with zoneinfo across history and the POSIX rule range."""
+        for key in ["America/New_York", "Europe/Dublin", "Australia/Lord_Howe", "Asia/Kolkata", "Pacific/Apia"]:
+            zone = ZoneInfo(key)
+            table = load_transition_table(zone)
+            moment = datetime(1900, 1, 1, tzinfo=timezone.utc)
+            while moment.year < 2100:
+                nanoseconds = epoch_nanoseconds(moment.year, moment.month, moment.day, moment.hour)
+                expected = moment.astimezone(zone).utcoffset() // timedelta(microseconds=1) * 1000
+                self.assertEqual(table.offset_nanoseconds_at(nanoseconds), expected, f"{key} {moment}")
+                moment += timedelta(days=13, hours=7)
+
+    def test_gap_and_fold(self):
+        """Test possible instants around New York DST changes."""
+        table = load_transition_table(ZoneInfo("America/New_York"))
+        gap = epoch_nanoseconds(2023, 3, 12, 2, 30)
+        self.assertEqual(table.possible_epoch_nanoseconds(gap), [])
+
+        fold = epoch_nanoseconds(2023, 11, 5, 1, 30)
+        self.assertEqual(table.possible_epoch_nanoseconds(fold), [fold + 4 * HOUR, fold + 5 * HOUR])
+
+        ordinary = epoch_nanoseconds(2023, 6, 15, 12)
+        self.assertEqual(table.possible_epoch_nanoseconds(ordinary), [ordinary + 4 * HOUR])
+
+    def test_int64_columns(self):
+        """Test the unrolled columns agree with table lookups through year 2262."""
+        for key in ["America/New_York", "Australia/Sydney", "Asia/Kolkata"]:
+            table = load_transition_table(ZoneInfo(key))
+            transitions, offsets = table.int64_columns()
+            self.assertEqual(len(offsets), len(transitions) + 1)
+            for nanoseconds in [-(2**63), epoch_nanoseconds(1950, 6, 1), epoch_nanoseconds(2200, 7, 1), 2**63 - 1]:
+                index = bisect_right(transitions, nanoseconds)
+                self.assertEqual(offsets[index], table.offset_nanoseconds_at(nanoseconds), key)
+        # The POSIX rule is unrolled up to the end of the int64 range
+        transitions, _ = load_transition_table(ZoneInfo("America/New_York")).int64_columns()
+        self.assertGreater(transitions[-1], epoch_nanoseconds(2262, 3, 1))
+
+    def test_transition_bounds(self):
+        """Test the transitions around an instant, from the table and from the POSIX rule."""
+        table = load_transition_table(ZoneInfo("America/New_York"))
+        start, end = epoch_nanoseconds(2023, 3, 12, 7), epoch_nanoseconds(2023, 11, 5, 6)
+        self.assertEqual(table.transition_bounds(epoch_nanoseconds(2023, 6, 15)), (start, end))
+        self.assertEqual(table.transition_bounds(start), (start, end))
+        # Far past the listed transitions, the rule supplies both bounds
+        start, end = epoch_nanoseconds(2100, 3, 14, 7), epoch_nanoseconds(2100, 11, 7, 6)
+        self.assertEqual(table.transition_bounds(epoch_nanoseconds(2100, 6, 15)), (start, end))
+        self.assertEqual(table.transition_bounds(end - 1), (start, end))
+        self.assertEqual(TransitionTable.fixed(HOUR).transition_bounds(0), (None, None))
+
+    def test_load_fixed_offset(self):
+        """Test fixed-offset tzinfo objects compile to constant tables."""
+        table = load_transition_table(timezone(timedelta(hours=5, minutes=30)))
+        self.assertEqual(table.offset_nanoseconds_at(10**18), 19800 * NS_PER_SECOND)
+
+    def test_read_tzif_from_tzdata_package(self):
+        """Test the tzdata package fallback used when no system tz files exist."""
+        with mock.patch.object(tzif.zoneinfo, "TZPATH", ()):
+            data = tzif._read_tzif("America/New_York")
+            self.assertIsNone(tzif._read_tzif("Not/AZone"))
+        if importlib.util.find_spec("tzdata") is None:
+            self.assertIsNone(data)
+        else:
+            self.assertEqual(data[:4], b"TZif")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@ Tests for ZonedDateTime class.
 
 import unittest
 
-from temporal import Calendar, Duration, TimeZone, ZonedDateTime
+from temporal import Calendar, Duration, Instant, TimeZone, ZonedDateTime
 from temporal.exceptions import InvalidArgumentError
 
 
@@ -48,6 +48,17 @@ class TestZonedDateTime(unittest.TestCase):
         self.assertEqual(plain_dt.year, 2023)
         self.assertEqual(plain_dt.hour, 14)
 
+    def test_wall_field_conversions_match_constructor(self):
+        """Test that conversions resolving wall-clock fields agree with the public constructor."""
+        tz = TimeZone("America/New_York")
+        dt = ZonedDateTime(2023, 3, 12, 12, 0, 0, timezone=tz)
+        self.assertEqual(dt.start_of_day(), ZonedDateTime(2023, 3, 12, timezone=tz))
+        self.assertEqual(dt.to_plain_date_time().to_zoned_date_time(tz), dt)
+        self.assertEqual(dt.to_plain_date().to_zoned_date_time(tz, dt.to_plain_time()), dt)
+        self.assertEqual(dt.with_plain_time(dt.to_plain_time().with_fields(hour=2, minute=30)).hour, 3)
+        with self.assertRaises(InvalidArgumentError):
+            dt.to_plain_date_time().to_zoned_date_time(None)
+
     def test_with_timezone(self):
         """Test timezone conversion."""
         utc_tz = TimeZone("UTC")
@@ -110,6 +121,18 @@ class TestZonedDateTime(unittest.TestCase):
         dt_str = str(dt)
         self.assertTrue("Z" in dt_str or "+00:00" in dt_str)
 
+    def test_string_round_trip_nanoseconds(self):
+        """Test that str() and from_string() round-trip exactly, to the nanosecond."""
+        for zone in ("UTC", "America/New_York", "Asia/Kolkata"):
+            tz = TimeZone(zone)
+            for nanoseconds in (1_686_839_445_123_456_789, -1, 1_699_000_200_000_000_001):
+                zdt = ZonedDateTime.from_epoch_nanoseconds(nanoseconds, tz)
+                self.assertEqual(ZonedDateTime.from_string(str(zdt), tz), zdt)
+                self.assertEqual(ZonedDateTime.from_string(str(zdt)).epoch_nanoseconds, nanoseconds)
+        tz = TimeZone("America/New_York")
+        zdt = ZonedDateTime.from_string("2023-06-15T10:30:45.123456789", tz)
+        self.assertEqual(zdt.epoch_nanoseconds, 1_686_839_445_123_456_789)
+
     def test_now(self):
         """Test now method."""
         tz = TimeZone("UTC")
@@ -117,6 +140,116 @@ class TestZonedDateTime(unittest.TestCase):
         self.assertIsInstance(now, ZonedDateTime)
         self.assertEqual(now.timezone, tz)
 
+    def test_parse_many(self):
+        tz = TimeZone("America/New_York")
+        strings = ["2023-06-15T14:30:45", "2023-06-15T18:30:45+00:00", "bad"]
+        errors = {}
+        values = ZonedDateTime.parse_many(strings, tz, errors=errors)
+        self.assertEqual(values[0], values[1])
+        self.assertEqual(values[0].timezone, tz)
+        self.assertIsNone(values[2])
+        self.assertIsInstance(errors[2], InvalidArgumentError)
+
+        column = ZonedDateTime.parse_many(strings[:2], tz, output="array")
+        self.assertEqual(list(column), [values[0].to_instant().epoch_nanoseconds] * 2)
+
+        with self.assertRaises(InvalidArgumentError):
+            ZonedDateTime.parse_many(["2023-06-15T14:30:45"])
+
+        # Column outputs keep every nanosecond digit
+        column = ZonedDateTime.parse_many(
+            ["2023-06-15T14:30:45.123456789", "2023-06-15T18:30:45.000000001+00:00"], tz, output="array"
+        )
+        self.assertEqual(list(column), [1_686_853_845_123_456_789, 1_686_853_845_000_000_001])
+
+    def test_from_epoch_nanoseconds(self):
+        tz = TimeZone("America/New_York")
+        zdt = ZonedDateTime.from_epoch_nanoseconds(1_686_839_445_123_456_000, tz)
+        self.assertEqual(zdt.epoch_nanoseconds, 1_686_839_445_123_456_000)
+        self.assertEqual((zdt.hour, zdt.minute, zdt.microsecond), (10, 30, 123456))
+        self.assertEqual(zdt.offset_nanoseconds, -4 * 3600 * 10**9)
+        self.assertEqual(str(zdt), "2023-06-15T10:30:45.123456-04:00")
+        with self.assertRaises(InvalidArgumentError):
+            ZonedDateTime.from_epoch_nanoseconds(1.5, tz)
+        with self.assertRaises(InvalidArgumentError):
+            ZonedDateTime.from_epoch_nanoseconds(0, "UTC")
+
+    def test_comparisons_do_not_compute_fields(self):
+        tz = TimeZone("Europe/Berlin")
+        values = [ZonedDateTime.from_epoch_nanoseconds(n * 10**12, tz) for n in (5, 3, 9, 1)]
+        ordered = sorted(values)
+        self.assertEqual([v.epoch_nanoseconds for v in ordered], [n * 10**12 for n in (1, 3, 5, 9)])
+        self.assertEqual(len(set(values)), 4)
+        self.assertTrue(all(v._fields is None for v in values))
+
+    def test_try_from_string(self):
+        """Test parsing that returns None instead of raising."""
+        tz = TimeZone("Europe/Paris")
+        text = "2024-05-17T13:47:12+02:00"
+        self.assertEqual(ZonedDateTime.try_from_string(text), ZonedDateTime.from_string(text))
+        self.assertEqual(
+            ZonedDateTime.try_from_string("2024-05-17T13:47:12", tz), ZonedDateTime(2024, 5, 17, 13, 47, 12, 0, tz)
+        )
+        # Without an offset in the string, a timezone is required
+        for text in ["2024-05-17T13:47:12", "2024-05-17T25:00:00+02:00", "N/A", None]:
+            self.assertIsNone(ZonedDateTime.try_from_string(text))
+            self.assertFalse(ZonedDateTime.is_valid_string(text))
+            with self.assertRaises(InvalidArgumentError):
+                ZonedDateTime.from_string(text)
+        with self.assertRaises(InvalidArgumentError):
+            ZonedDateTime.try_from_string(text, "Europe/Paris")
+
+    def test_disambiguation(self):
+        tz = TimeZone("America/New_York")
+        # Ambiguous wall-clock time resolves to the earlier instant
+        fold = ZonedDateTime(2023, 11, 5, 1, 30, 0, 0, tz)
+        self.assertEqual(str(fold), "2023-11-05T01:30:00-04:00")
+        # Skipped wall-clock time moves forward by the length of the gap
+        gap = ZonedDateTime(2023, 3, 12, 2, 30, 0, 0, tz)
+        self.assertEqual(str(gap), "2023-03-12T03:30:00-04:00")
+        self.assertEqual(str(gap.to_instant()), "2023-03-12T07:30:00Z")
+
+    def test_instant_round_trip_is_exact(self):
+        instant = Instant.from_epoch_nanoseconds(1_686_839_445_123_456_789)
+        zdt = instant.to_zoned_date_time(TimeZone("Asia/Kolkata"))
+        self.assertEqual(zdt.to_instant(), instant)
+        self.assertEqual(zdt.microsecond, 123456)
+        self.assertEqual(str(zdt), "2023-06-15T20:00:45.123456789+05:30")
+        self.assertEqual(zdt.with_timezone(TimeZone("UTC")).epoch_nanoseconds, instant.epoch_nanoseconds)
+
+    def test_bucket_across_dst(self):
+        """Test that local-midnight buckets are 23 or 25 hours long and fold hours do not overlap."""
+        tz = TimeZone("America/New_York")
+        start, end = ZonedDateTime(2024, 3, 10, 12, 0, 0, 0, tz).bucket("days")
+        self.assertEqual((str(start), str(end)), ("2024-03-10T00:00:00-05:00", "2024-03-11T00:00:00-04:00"))
+        self.assertEqual(end.epoch_nanoseconds - start.epoch_nanoseconds, 23 * 3600 * 10**9)
+        start, end = ZonedDateTime(2024, 11, 3, 12, 0, 0, 0, tz).bucket("days")
+        self.assertEqual(end.epoch_nanoseconds - start.epoch_nanoseconds, 25 * 3600 * 10**9)
+        self.assertEqual(str(ZonedDateTime(2024, 11, 20, 9, 0, 0, 0, tz).floor("months")), "2024-11-01T00:00:00-04:00")
+
+        # The repeated 01:00 hour is two buckets, one per offset
+        first = ZonedDateTime(2024, 11, 3, 1, 30, 0, 0, tz)
+        second = ZonedDateTime.from_epoch_nanoseconds(first.epoch_nanoseconds + 3600 * 10**9, tz)
+        self.assertEqual(
+            [str(value) for value in first.bucket("hours")], ["2024-11-03T01:00:00-04:00", "2024-11-03T01:00:00-05:00"]
+        )
+        self.assertEqual(
+            [str(value) for value in second.bucket("hours")], ["2024-11-03T01:00:00-05:00", "2024-11-03T02:00:00-05:00"]
+        )
+        # A bucket spanning a transition is cut short at it
+        two_hours = {"smallestUnit": "hours", "roundingIncrement": 2}
+        self.assertEqual(str(ZonedDateTime(2024, 3, 10, 3, 30, 0, 0, tz).floor(two_hours)), "2024-03-10T03:00:00-04:00")
+        self.assertEqual(str(ZonedDateTime(2024, 3, 10, 1, 30, 0, 0, tz).ceil(two_hours)), "2024-03-10T03:00:00-04:00")
+
+    def test_bucket_skipped_midnight(self):
+        """Test that a day whose midnight is skipped starts at the transition."""
+        tz = TimeZone("America/Santiago")
+        day = ZonedDateTime(2024, 9, 8, 12, 0, 0, 0, tz).floor("days")
+        self.assertEqual(str(day), "2024-09-08T01:00:00-03:00")
+        # Fixed units count from the wall clock, not from the Unix epoch
+        kolkata = ZonedDateTime(2024, 5, 17, 13, 47, 0, 0, TimeZone("Asia/Kolkata"))
+        self.assertEqual(str(kolkata.floor("hours")), "2024-05-17T13:00:00+05:30")
+
 
 if __name__ == "__main__":
     unittest.main()